@@ -9,16 +9,28 @@ YAML files instead of introducing a second website-only mapping.
 from __future__ import annotations
 
 import argparse
+import base64
+import gzip
 import json
 import re
 import sys
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import jsonschema
-import referencing
-import referencing.jsonschema
 import yaml
-from jsonschema import Draft7Validator
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+if TYPE_CHECKING:
+    # jsonschema and referencing are imported where the output schema is first
+    # used, so importing this module (as the pre-commit hook does) stays cheap.
+    import referencing
+    from jsonschema import Draft7Validator
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
@@ -27,10 +39,18 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from scripts.hooks._artifact_writer import digest, write_if_changed, write_json_if_changed  # noqa: E402
+from scripts.hooks._identifiers import humanize_identifier  # noqa: E402
 from scripts.hooks._sentinel_expansion import (  # noqa: E402
+    Sentinel,
+    build_intra_lookup,
+    check_sentinels,
     expand_sentinels_to_items,
     expand_sentinels_to_text,
+    iter_prose_strings,
+    parse_prose,
 )
+from scripts.hooks._sentinel_expansion import build_ref_lookup as _build_ref_lookup  # noqa: E402
 
 DEFAULT_PERSONAS_PATH = REPO_ROOT / "risk-map" / "yaml" / "personas.yaml"
 DEFAULT_RISKS_PATH = REPO_ROOT / "risk-map" / "yaml" / "risks.yaml"
@@ -38,7 +58,34 @@ DEFAULT_CONTROLS_PATH = REPO_ROOT / "risk-map" / "yaml" / "controls.yaml"
 DEFAULT_COMPONENTS_PATH = REPO_ROOT / "risk-map" / "yaml" / "components.yaml"
 DEFAULT_SITE_DIR = REPO_ROOT / "site"
 DEFAULT_OUTPUT_NAME = "persona-site-data.json"
+MANIFEST_NAME = "persona-site-manifest.json"
+SHARD_DIR_NAME = "persona-site-shards"
+# Record arrays the front end loads on demand, one shard per category.
+SHARDED_KEYS = ("risks", "controls")
+# Precompressed copies written next to every hashed file, for static hosts that
+# serve them in place of the original (nginx gzip_static / brotli_static and
+# similar). brotli is pinned in requirements.txt so the hook, local builds and CI
+# publish the same set; without it (e.g. a bare test environment) only .gz is written.
+PRECOMPRESSED_SUFFIXES = (".br", ".gz") if brotli is not None else (".gz",)
 GUIDED_QUESTION_THRESHOLD = 5
+# Prose fields each record type expands with normalize_text_entries(); persona
+# identificationQuestions are expanded to plain text on top of these.
+RECORD_PROSE_FIELDS = {
+    "risks": ("shortDescription", "longDescription", "examples"),
+    "controls": ("description",),
+    "personas": ("description", "responsibilities"),
+}
+# Search index fields and the weight a term scores per occurrence in each, so
+# that a match in a title outranks one in the body text.
+SEARCH_FIELD_WEIGHTS = {
+    "risks": {"title": 8, "shortDescription": 4, "longDescription": 1, "examples": 1},
+    "controls": {"title": 8, "description": 2},
+}
+# site/assets/search.mjs tokenizes queries the same way.
+SEARCH_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it its of on or that the their this to with".split()
+)
 
 SCHEMAS_DIR = REPO_ROOT / "risk-map" / "schemas"
 PERSONA_SITE_DATA_SCHEMA_PATH = SCHEMAS_DIR / "persona-site-data.schema.json"
@@ -48,9 +95,13 @@ def _make_schema_registry(schemas_dir: Path) -> referencing.Registry:
     """Build a referencing.Registry that resolves bare-filename $refs against schemas_dir.
 
     The persona-site-data schema $refs external-references.schema.json by
-    relative URI; this registry retrieves and registers it on demand.
+    relative URI; this registry retrieves and registers it on demand. Each
+    file is read once: a validator resolves the same $ref for every record.
     """
+    import referencing
+    import referencing.jsonschema
 
+    @cache
     def retrieve(uri: str) -> referencing.Resource:
         # Extract the bare filename from the URI — all $refs in this repo are
         # bare filenames (e.g. "external-references.schema.json"), not full paths.
@@ -62,15 +113,31 @@ def _make_schema_registry(schemas_dir: Path) -> referencing.Registry:
     return referencing.Registry(retrieve=retrieve)
 
 
+@cache
 def _load_output_schema() -> tuple[dict, referencing.Registry]:
-    """Load the persona site data output schema and its $ref registry."""
+    """Load the persona site data output schema and its $ref registry, once per process."""
     with PERSONA_SITE_DATA_SCHEMA_PATH.open("r", encoding="utf-8") as handle:
         schema = json.load(handle)
     registry = _make_schema_registry(SCHEMAS_DIR)
     return schema, registry
 
 
-_OUTPUT_SCHEMA, _OUTPUT_SCHEMA_REGISTRY = _load_output_schema()
+@cache
+def _output_validator() -> Draft7Validator:
+    """Return the compiled output-schema validator, built on first use and reused by every write."""
+    from jsonschema import Draft7Validator
+
+    # Use Draft7Validator with the registry so cross-schema $refs (e.g.
+    # external-references.schema.json) resolve from disk on demand.
+    schema, registry = _load_output_schema()
+    return Draft7Validator(schema, registry=registry)
+
+
+@cache
+def _record_validator(key: str) -> Draft7Validator:
+    """Return the validator for one item of the top-level array ``key``; $refs resolve as in the whole schema."""
+    validator = _output_validator()
+    return validator.evolve(schema=validator.schema["properties"][key]["items"])
 
 
 def load_yaml(path: Path) -> dict:
@@ -189,12 +256,6 @@ def normalize_text_entries(value, *, intra_lookup=None, ref_lookup=None, field_p
     return result
 
 
-def humanize_identifier(identifier: str, prefix: str = "") -> str:
-    """Convert schema-like identifiers into simple display labels."""
-    trimmed = identifier[len(prefix) :] if prefix and identifier.startswith(prefix) else identifier
-    return re.sub(r"(?<!^)(?=[A-Z])", " ", trimmed.replace("-", " ")).strip()
-
-
 def normalize_control_risk_ids(raw_risks, all_risk_ids: list[str]) -> list[str]:
     """Expand control risk links into explicit IDs for easier client-side filtering."""
     if raw_risks == "all":
@@ -225,32 +286,174 @@ def _build_intra_lookup(
     Returns:
         Dict mapping every entity id to its title.
     """
-    lookup: dict[str, str] = {}
-    for persona in personas_data.get("personas", []):
-        lookup[persona["id"]] = persona["title"]
-    for risk in risks_data.get("risks", []):
-        lookup[risk["id"]] = risk["title"]
-    for control in controls_data.get("controls", []):
-        lookup[control["id"]] = control["title"]
     # components.yaml has a flat top-level "components" list alongside "categories".
-    for component in components_data.get("components", []):
-        lookup[component["id"]] = component["title"]
-    return lookup
+    return build_intra_lookup(
+        {
+            "personas": personas_data.get("personas"),
+            "risks": risks_data.get("risks"),
+            "controls": controls_data.get("controls"),
+            "components": components_data.get("components"),
+        }
+    )
 
 
-def _build_ref_lookup(entry: dict) -> dict[str, dict]:
-    """Build a ref-id->entry map from a single entity's externalReferences.
+def _normalize_prose(kind: str, entity: dict, field_prefix: str, intra_lookup: dict[str, str]) -> dict:
+    """Expand the prose of one risk, control or persona into its site data record fields."""
+    ref_lookup = _build_ref_lookup(entity)
+    prose = {
+        field: normalize_text_entries(
+            entity.get(field),
+            intra_lookup=intra_lookup,
+            ref_lookup=ref_lookup,
+            field_path=f"{field_prefix}.{field}",
+        )
+        for field in RECORD_PROSE_FIELDS[kind]
+    }
+    if kind == "personas":
+        # identificationQuestions schema is string[] (matchmaker prompts), so sentinels
+        # expand to plain text rather than structured ref/link items. Mirrors the
+        # markdown side (PersonaFullDetailTableGenerator); ADR-016 D5 hard-fail applies.
+        # Strip each question first to drop trailing newlines from PyYAML block
+        # scalars; the legacy normalize_text_entries path stripped at the same
+        # point, and the markdown side strips downstream in format_list.
+        prose["identificationQuestions"] = [
+            expand_sentinels_to_text(
+                q.strip(),
+                intra_lookup=intra_lookup,
+                ref_lookup=ref_lookup,
+                field_path=f"{field_prefix}.identificationQuestions[{q_idx}]",
+            )
+            for q_idx, q in enumerate(entity.get("identificationQuestions") or [])
+            if q.strip()
+        ]
+    return prose
 
-    Per-entry scoping ensures {{ref:foo}} only resolves against the entry that
-    declares "foo" in its own externalReferences — not a corpus-wide pool.
 
-    Args:
-        entry: a single risk, control, or persona dict from YAML.
+def _record_cache_fingerprint() -> str:
+    """Digest of the code that expands prose; a change invalidates the record cache."""
+    sources = (
+        Path(__file__),
+        REPO_ROOT / "scripts" / "hooks" / "_sentinel_expansion.py",
+        REPO_ROOT / "scripts" / "hooks" / "precommit" / "_prose_tokens.py",
+    )
+    return digest(b"".join(path.read_bytes() for path in sources))
 
-    Returns:
-        Dict mapping ref-id -> {"title": str, "url": str}.
+
+def _entity_digest(entity: dict) -> str:
+    return digest(json.dumps(entity, sort_keys=True, default=str).encode())
+
+
+def _referenced_titles(kind: str, entity: dict, intra_lookup: dict[str, str]) -> dict[str, str]:
+    """Titles of the entities that ``entity``'s prose links to with {{<entity-id>}} sentinels."""
+    return {
+        segment.key: intra_lookup[segment.key]
+        for _, text, _ in iter_prose_strings(kind, [entity])
+        for segment in parse_prose(text)
+        if isinstance(segment, Sentinel) and not segment.is_ref and segment.key in intra_lookup
+    }
+
+
+def _load_record_cache(record_cache: Path, fingerprint: str) -> dict[str, dict]:
+    """Return the prose entries a previous build cached, or nothing if the cache is stale or unreadable."""
+    try:
+        cached = json.loads(record_cache.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get("code") != fingerprint:
+        return {}
+    records = cached.get("records")
+    return records if isinstance(records, dict) else {}
+
+
+def _is_cache_entry(entry, kind: str) -> bool:
+    """Whether ``entry`` has the shape expand_prose() stores for an entity of ``kind``."""
+    if not isinstance(entry, dict):
+        return False
+    prose = entry.get("prose")
+    prose_fields = RECORD_PROSE_FIELDS[kind] + (("identificationQuestions",) if kind == "personas" else ())
+    return (
+        isinstance(entry.get("input"), str)
+        and isinstance(entry.get("refs"), dict)
+        and isinstance(prose, dict)
+        and all(isinstance(prose.get(field), list) for field in prose_fields)
+    )
+
+
+def _reusable_entry(
+    entries: dict[str, dict], kind: str, entity: dict, intra_lookup: dict[str, str]
+) -> dict | None:
+    """
+    The cache entry of ``entity`` if neither it nor a title its prose links to has changed.
+
+    A malformed entry counts as a miss, like a stale one.
+    """
+    entry = entries.get(f"{kind}:{entity['id']}")
+    if not _is_cache_entry(entry, kind) or entry["input"] != _entity_digest(entity):
+        return None
+    if any(intra_lookup.get(entity_id) != title for entity_id, title in entry["refs"].items()):
+        return None
+    return entry
+
+
+def encode_mask(ordinals: Iterable[int], size: int) -> str:
+    """Base64-encode a bitmask of ``size`` bits with the given ordinals set (byte i // 8, bit i % 8, LSB first)."""
+    mask = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        mask[ordinal >> 3] |= 1 << (ordinal & 7)
+    return base64.b64encode(mask).decode("ascii")
+
+
+def decode_mask(encoded: str) -> list[int]:
+    """Return the ordinals set in a mask from encode_mask(), ascending."""
+    return [
+        index * 8 + bit
+        for index, byte in enumerate(base64.b64decode(encoded))
+        for bit in range(8)
+        if byte >> bit & 1
+    ]
+
+
+def build_relation_index(personas: list[dict], risks: list[dict], controls: list[dict]) -> dict:
     """
-    return {ref["id"]: {"title": ref["title"], "url": ref["url"]} for ref in entry.get("externalReferences", [])}
+    Build the dense persona/risk/control link index shipped as site data ``relations``.
+
+    Risks, controls and personas get ordinals from their order in the site
+    data. Each persona gets a mask of its risks and one of its controls; each
+    risk and control gets a mask of its personas. The client unions persona
+    selections with OR and filters a record's personas with AND instead of
+    rebuilding ID lists and lookups on every render.
+
+    Raises:
+        ValueError: If a decoded mask disagrees with the ID list it was built from
+    """
+    persona_ids = [persona["id"] for persona in personas]
+    persona_ordinals = {persona_id: ordinal for ordinal, persona_id in enumerate(persona_ids)}
+    index: dict = {
+        "personaIds": persona_ids,
+        "riskIds": [risk["id"] for risk in risks],
+        "controlIds": [control["id"] for control in controls],
+    }
+    for key, records, record_key in (("Risk", risks, "riskIds"), ("Control", controls, "controlIds")):
+        record_ordinals = {record["id"]: ordinal for ordinal, record in enumerate(records)}
+        index[f"persona{key}Masks"] = [
+            encode_mask((record_ordinals[record_id] for record_id in persona[record_key]), len(records))
+            for persona in personas
+        ]
+        index[f"{key.lower()}PersonaMasks"] = [
+            encode_mask((persona_ordinals[persona_id] for persona_id in record["personaIds"]), len(personas))
+            for record in records
+        ]
+
+        # The masks replace list lookups on the client, so they must give the same answers.
+        for persona, mask in zip(personas, index[f"persona{key}Masks"]):
+            if [records[ordinal]["id"] for ordinal in decode_mask(mask)] != list(
+                dict.fromkeys(persona[record_key])
+            ):
+                raise ValueError(f"{key.lower()} mask of {persona['id']} does not match its {record_key}")
+        for record, mask in zip(records, index[f"{key.lower()}PersonaMasks"]):
+            if {persona_ids[ordinal] for ordinal in decode_mask(mask)} != set(record["personaIds"]):
+                raise ValueError(f"persona mask of {record['id']} does not match its personaIds")
+    return index
 
 
 def build_site_data(
@@ -258,9 +461,20 @@ def build_site_data(
     risks_data: dict,
     controls_data: dict,
     components_data: dict | None = None,
+    record_cache: Path | None = None,
 ) -> dict:
     """Build the JSON structure consumed by the static persona site.
 
+    Expanding prose (tokenizing plus sentinel expansion) is the per-entity
+    part of the build. With ``record_cache``, the expanded prose of every risk,
+    control and persona is stored with a digest of the entity's YAML and the
+    titles its {{<entity-id>}} sentinels resolve to. A later build reuses the
+    prose of an entity when both are unchanged, skipping its sentinel check
+    and expansion: editing one risk re-expands that risk, plus any entity
+    whose prose links to it if its title changed. External references are
+    part of the entity's own YAML. A change to the expansion code discards
+    the cache.
+
     Args:
         personas_data: parsed personas YAML dict.
         risks_data: parsed risks YAML dict.
@@ -268,9 +482,16 @@ def build_site_data(
         components_data: parsed components YAML dict, or None to load from
             DEFAULT_COMPONENTS_PATH. Providing it explicitly lets callers
             supply synthetic data in tests without touching disk.
+        record_cache: Optional JSON file of expanded prose per entity, read
+            and then rewritten with the entries of the current entities.
 
     Returns:
         Dict conforming to persona-site-data.schema.json.
+
+    Raises:
+        UnresolvedSentinelsError: listing every unresolved sentinel in the
+            prose of the risks, controls and active personas, before any
+            record is built.
     """
     if components_data is None:
         components_data = load_yaml(DEFAULT_COMPONENTS_PATH)
@@ -281,6 +502,38 @@ def build_site_data(
     active_personas = [persona for persona in personas_data["personas"] if not persona.get("deprecated")]
     active_persona_ids = {persona["id"] for persona in active_personas}
 
+    entities = {"risks": risks_data["risks"], "controls": controls_data["controls"], "personas": active_personas}
+    fingerprint = _record_cache_fingerprint() if record_cache is not None else ""
+    cached_entries = _load_record_cache(record_cache, fingerprint) if record_cache is not None else {}
+    reused = {
+        kind: [_reusable_entry(cached_entries, kind, entity, intra_lookup) for entity in entities[kind]]
+        for kind in entities
+    }
+    cache_entries: dict[str, dict] = {}
+
+    # Resolve every sentinel up front so all failures are reported together; field
+    # paths index personas by their position among the active ones, as below.
+    # Reused entities resolved when they were cached and still do; None leaves
+    # them out while keeping the positions of the others.
+    check_sentinels(
+        {
+            kind: [None if entry else entity for entity, entry in zip(entities[kind], reused[kind])]
+            for kind in entities
+        },
+        intra_lookup,
+    )
+
+    def expand_prose(kind: str, idx: int, entity: dict) -> dict:
+        entry = reused[kind][idx]
+        if entry is None:
+            entry = {
+                "input": _entity_digest(entity),
+                "refs": _referenced_titles(kind, entity, intra_lookup),
+                "prose": _normalize_prose(kind, entity, f"{kind}[{idx}]", intra_lookup),
+            }
+        cache_entries[f"{kind}:{entity['id']}"] = entry
+        return entry["prose"]
+
     risk_categories = []
     seen_risk_categories = set()
     normalized_risks = []
@@ -291,31 +544,15 @@ def build_site_data(
             risk_categories.append({"id": category_id, "title": humanize_identifier(category_id, "risks")})
             seen_risk_categories.add(category_id)
 
-        ref_lookup = _build_ref_lookup(raw_risk)
-        risk_field = f"risks[{idx}]"
+        prose = expand_prose("risks", idx, raw_risk)
 
         risk_record: dict = {
             "id": raw_risk["id"],
             "title": raw_risk["title"],
             "category": category_id,
-            "shortDescription": normalize_text_entries(
-                raw_risk.get("shortDescription"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{risk_field}.shortDescription",
-            ),
-            "longDescription": normalize_text_entries(
-                raw_risk.get("longDescription"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{risk_field}.longDescription",
-            ),
-            "examples": normalize_text_entries(
-                raw_risk.get("examples"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{risk_field}.examples",
-            ),
+            "shortDescription": prose["shortDescription"],
+            "longDescription": prose["longDescription"],
+            "examples": prose["examples"],
             "controlIds": list(raw_risk.get("controls", [])),
             "personaIds": [
                 persona_id for persona_id in raw_risk.get("personas", []) if persona_id in active_persona_ids
@@ -330,19 +567,13 @@ def build_site_data(
     normalized_controls = []
 
     for idx, raw_control in enumerate(controls_data["controls"]):
-        ref_lookup = _build_ref_lookup(raw_control)
-        control_field = f"controls[{idx}]"
+        prose = expand_prose("controls", idx, raw_control)
 
         control_record: dict = {
             "id": raw_control["id"],
             "title": raw_control["title"],
             "category": raw_control["category"],
-            "description": normalize_text_entries(
-                raw_control.get("description"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{control_field}.description",
-            ),
+            "description": prose["description"],
             "personaIds": [
                 persona_id for persona_id in raw_control.get("personas", []) if persona_id in active_persona_ids
             ],
@@ -369,24 +600,8 @@ def build_site_data(
     manual_fallback_persona_ids = []
 
     for idx, persona in enumerate(active_personas):
-        # identificationQuestions schema is string[] (matchmaker prompts), so sentinels
-        # expand to plain text rather than structured ref/link items. Mirrors the
-        # markdown side (PersonaFullDetailTableGenerator); ADR-016 D5 hard-fail applies.
-        persona_ref_lookup = _build_ref_lookup(persona)
-        raw_questions = persona.get("identificationQuestions") or []
-        # Strip each question first to drop trailing newlines from PyYAML block
-        # scalars; the legacy normalize_text_entries path stripped at the same
-        # point, and the markdown side strips downstream in format_list.
-        question_prompts = [
-            expand_sentinels_to_text(
-                q.strip(),
-                intra_lookup=intra_lookup,
-                ref_lookup=persona_ref_lookup,
-                field_path=f"personas[{idx}].identificationQuestions[{q_idx}]",
-            )
-            for q_idx, q in enumerate(raw_questions)
-            if q.strip()
-        ]
+        prose = expand_prose("personas", idx, persona)
+        question_prompts = prose["identificationQuestions"]
         match_mode = "guided" if len(question_prompts) >= GUIDED_QUESTION_THRESHOLD else "manual"
 
         question_ids = []
@@ -405,24 +620,11 @@ def build_site_data(
         if match_mode == "manual":
             manual_fallback_persona_ids.append(persona["id"])
 
-        ref_lookup = _build_ref_lookup(persona)
-        persona_field = f"personas[{idx}]"
-
         persona_record: dict = {
             "id": persona["id"],
             "title": persona["title"],
-            "description": normalize_text_entries(
-                persona.get("description"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{persona_field}.description",
-            ),
-            "responsibilities": normalize_text_entries(
-                persona.get("responsibilities"),
-                intra_lookup=intra_lookup,
-                ref_lookup=ref_lookup,
-                field_path=f"{persona_field}.responsibilities",
-            ),
+            "description": prose["description"],
+            "responsibilities": prose["responsibilities"],
             "identificationQuestions": question_prompts,
             "questionIds": question_ids,
             "questionCount": len(question_ids),
@@ -437,6 +639,10 @@ def build_site_data(
 
         persona_records.append(persona_record)
 
+    if record_cache is not None:
+        record_cache.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(record_cache, json.dumps({"code": fingerprint, "records": cache_entries}) + "\n")
+
     return {
         "personas": persona_records,
         "questions": question_records,
@@ -445,6 +651,7 @@ def build_site_data(
         "controlCategories": list(controls_data["categories"]),
         "risks": normalized_risks,
         "controls": normalized_controls,
+        "relations": build_relation_index(persona_records, normalized_risks, normalized_controls),
     }
 
 
@@ -456,21 +663,272 @@ def resolve_output_path(site_dir: Path, output_path: Path | None) -> Path:
     return site_dir / "generated" / DEFAULT_OUTPUT_NAME
 
 
-def write_site_data(data: dict, output_path: Path) -> None:
-    """Write site data JSON with stable formatting, validating against the output schema first."""
+def _schema_fingerprint() -> str:
+    """Digest of every schema file the output schema can $ref; a change invalidates the validation cache."""
+    return digest(b"".join(path.read_bytes() for path in sorted(SCHEMAS_DIR.glob("*.json"))))
+
+
+def _record_digest(key: str, record) -> str:
+    """Digest an item of the top-level array ``key``."""
+    return digest(f"{key}:{json.dumps(record, sort_keys=True)}".encode())
+
+
+def _load_validated_digests(validation_cache: Path, fingerprint: str) -> set[str]:
+    """Return the record digests a previous build validated, or nothing if the cache is stale or unreadable."""
     try:
-        # Use Draft7Validator with the registry so cross-schema $refs (e.g.
-        # external-references.schema.json) resolve from disk on demand.
-        Draft7Validator(_OUTPUT_SCHEMA, registry=_OUTPUT_SCHEMA_REGISTRY).validate(data)
+        cached = json.loads(validation_cache.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    if not isinstance(cached, dict) or cached.get("schema") != fingerprint:
+        return set()
+    records = cached.get("records")
+    if not isinstance(records, list):
+        return set()
+    return {record_digest for record_digest in records if isinstance(record_digest, str)}
+
+
+class _RecordValidation:
+    """
+    Output-schema validation of site data one record at a time.
+
+    Creating it validates the document with its top-level arrays emptied;
+    check() then validates each record (item of a top-level array) against
+    its array's items subschema. The output schema places no constraint on
+    the arrays themselves beyond their item type, so this gives the same
+    verdict as validating the whole document.
+    """
+
+    def __init__(self, data: dict, validation_cache: Path | None):
+        self.validation_cache = validation_cache
+        self.fingerprint = _schema_fingerprint() if validation_cache is not None else ""
+        self.validated = (
+            _load_validated_digests(validation_cache, self.fingerprint) if validation_cache is not None else set()
+        )
+        self.digests: set[str] = set()
+        _validate_output({key: [] if isinstance(value, list) else value for key, value in data.items()})
+
+    def check(self, key: str, index: int, record) -> None:
+        """Validate ``data[key][index]``, unless the validation cache lists it as valid already."""
+        if self.validation_cache is not None:
+            record_digest = _record_digest(key, record)
+            self.digests.add(record_digest)
+            if record_digest in self.validated:
+                return
+        _validate_record(key, index, record)
+
+    def finish(self) -> None:
+        """Rewrite the validation cache with the digests of every checked record."""
+        if self.validation_cache is None:
+            return
+        write_json_if_changed(self.validation_cache, {"schema": self.fingerprint, "records": sorted(self.digests)})
+
+
+def validate_site_data(data: dict, validation_cache: Path | None = None) -> None:
+    """
+    Validate site data against the output schema.
+
+    Records (items of the top-level arrays) are validated one at a time, so
+    an error names the record's position in ``data``. With
+    ``validation_cache``, records whose content digest the cache lists as
+    already valid are skipped, and on success the cache is rewritten with the
+    digests of every current record. The cache is tied to a digest of the
+    schema files, so editing a schema revalidates everything.
+
+    Args:
+        data: Site data as returned by build_site_data()
+        validation_cache: Optional JSON file recording the validated record digests
+
+    Raises:
+        jsonschema.ValidationError: If the data (or a changed record) does not conform;
+            the message names the path of the offending value in ``data``
+    """
+    validation = _RecordValidation(data, validation_cache)
+    for key, value in data.items():
+        if isinstance(value, list):
+            for index, record in enumerate(value):
+                validation.check(key, index, record)
+    validation.finish()
+
+
+def _validate_output(document: dict) -> None:
+    """Validate ``document`` against the output schema."""
+    import jsonschema
+
+    try:
+        _output_validator().validate(document)
     except jsonschema.ValidationError as exc:
         raise jsonschema.ValidationError(
             f"Persona site data failed schema validation at {list(exc.absolute_path)!r}: {exc.message}",
         ) from exc
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        # Insertion-order deterministic; do not rely on alphabetical key sort.
-        json.dump(data, handle, indent=2)
-        handle.write("\n")
+
+
+def _validate_record(key: str, index: int, record) -> None:
+    """Validate ``record``, item ``index`` of the top-level array ``key``."""
+    import jsonschema
+
+    try:
+        _record_validator(key).validate(record)
+    except jsonschema.ValidationError as exc:
+        raise jsonschema.ValidationError(
+            f"Persona site data failed schema validation at {[key, index, *exc.absolute_path]!r}: {exc.message}",
+        ) from exc
+
+
+def write_site_data(data: dict, output_path: Path, validation_cache: Path | None = None) -> None:
+    """Write site data JSON with stable formatting, validating each record against the output schema as it goes.
+
+    The file is streamed record by record through a temp file that replaces
+    ``output_path`` only once every record has passed validation, and only if
+    its content changed. ``validation_cache`` opts into validate_site_data()'s
+    changed-records fast path.
+    """
+    validation = _RecordValidation(data, validation_cache)
+    # Insertion-order deterministic; do not rely on alphabetical key sort.
+    write_json_if_changed(output_path, data, check_item=validation.check)
+    validation.finish()
+
+
+def _compact_json(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _hashed_name(stem: str, payload: bytes) -> str:
+    """Content-hashed file name: a changed payload always gets a new name, so it can be cached forever."""
+    return f"{stem}.{digest(payload)[:16]}.json"
+
+
+def _precompress(payload: bytes, suffix: str) -> bytes:
+    """Compress ``payload`` for a PRECOMPRESSED_SUFFIXES entry, reproducibly (no gzip timestamp)."""
+    if suffix == ".br":
+        return brotli.compress(payload, quality=11)
+    return gzip.compress(payload, compresslevel=9, mtime=0)
+
+
+def _search_terms(value) -> list[str]:
+    """Index terms of a title or normalized prose field, including link and reference titles."""
+    if isinstance(value, list):
+        return [term for item in value for term in _search_terms(item)]
+    if isinstance(value, dict):
+        value = value.get("title", "")
+    return [
+        term
+        for term in SEARCH_TOKEN_PATTERN.findall(value.lower())
+        if len(term) > 1 and term not in SEARCH_STOPWORDS
+    ]
+
+
+def build_search_index(data: dict) -> dict:
+    """
+    Build the inverted index behind the site's search box.
+
+    Terms are the lowercased alphanumeric words of the SEARCH_FIELD_WEIGHTS
+    fields, minus stopwords and single characters, sorted so the client can
+    find every term starting with a query word by binary search. For each
+    term and record type the index holds a flat ``[ordinal, score, ...]``
+    posting list, where the ordinal is the record's position in site data
+    (and so in ``relations``) and the score sums the field weight of every
+    occurrence.
+
+    Returns:
+        ``{"terms": [...], "risks": [...], "controls": [...]}``, with one posting
+        list per term in each record list
+    """
+    scores: dict[str, dict[str, dict[int, int]]] = {}
+    for key, weights in SEARCH_FIELD_WEIGHTS.items():
+        for ordinal, record in enumerate(data[key]):
+            for field, weight in weights.items():
+                for term in _search_terms(record.get(field, [])):
+                    term_scores = scores.setdefault(term, {}).setdefault(key, {})
+                    term_scores[ordinal] = term_scores.get(ordinal, 0) + weight
+    terms = sorted(scores)
+    index: dict = {"terms": terms}
+    for key in SEARCH_FIELD_WEIGHTS:
+        index[key] = [
+            [value for posting in sorted(scores[term].get(key, {}).items()) for value in posting] for term in terms
+        ]
+    return index
+
+
+def build_site_shards(data: dict) -> tuple[dict, dict[str, bytes]]:
+    """
+    Split site data into a bootstrap file and per-category shards of risks and controls.
+
+    The bootstrap holds everything the first screens need (personas,
+    questions, categories); each shard holds the risks or controls of one
+    category. The minified full data set is written alongside for consumers
+    that want every record at once, and the search index from
+    build_search_index() for the site's search box. File names carry a
+    digest of their content, and the manifest maps the bootstrap, the full
+    data, the search index and every shard (with the record IDs it holds) to
+    those names, so the front end fetches the manifest, then the bootstrap,
+    then only the shards its results need and, once the user searches, the
+    index.
+
+    Args:
+        data: Site data as returned by build_site_data()
+
+    Returns:
+        (manifest, files): the manifest dict, and compact JSON payloads keyed by
+        their path relative to the manifest's directory
+    """
+    files: dict[str, bytes] = {}
+
+    def add(stem: str, value) -> str:
+        payload = _compact_json(value)
+        path = f"{SHARD_DIR_NAME}/{_hashed_name(stem, payload)}"
+        files[path] = payload
+        return path
+
+    bootstrap = {key: value for key, value in data.items() if key not in SHARDED_KEYS}
+    manifest: dict = {
+        "bootstrap": add("bootstrap", bootstrap),
+        "data": add(Path(DEFAULT_OUTPUT_NAME).stem, data),
+        "search": add("search-index", build_search_index(data)),
+        "precompressed": [suffix.lstrip(".") for suffix in PRECOMPRESSED_SUFFIXES],
+        "shards": {},
+    }
+    for key in SHARDED_KEYS:
+        by_category: dict[str, list[dict]] = {}
+        for record in data[key]:
+            by_category.setdefault(record["category"], []).append(record)
+        manifest["shards"][key] = [
+            {
+                "category": category,
+                "path": add(f"{key}.{category}", records),
+                "ids": [record["id"] for record in records],
+            }
+            for category, records in by_category.items()
+        ]
+    return manifest, files
+
+
+def write_site_shards(data: dict, output_dir: Path) -> dict:
+    """
+    Write the files and manifest from build_site_shards() under ``output_dir``.
+
+    Every hashed file also gets a precompressed copy per PRECOMPRESSED_SUFFIXES
+    entry (``<name>.json.gz``, ``<name>.json.br``). A hashed name that already
+    exists holds the same bytes, so it is neither rewritten nor recompressed;
+    files no longer listed in the manifest are deleted from the shard directory.
+
+    Returns:
+        The manifest
+    """
+    manifest, files = build_site_shards(data)
+    shard_dir = output_dir / SHARD_DIR_NAME
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    expected = set()
+    for path, payload in files.items():
+        for suffix in ("", *PRECOMPRESSED_SUFFIXES):
+            target = output_dir / f"{path}{suffix}"
+            expected.add(target.name)
+            if not target.exists():
+                write_if_changed(target, _precompress(payload, suffix) if suffix else payload)
+    for stale in shard_dir.iterdir():
+        if stale.name not in expected:
+            stale.unlink()
+    write_json_if_changed(output_dir / MANIFEST_NAME, manifest)
+    return manifest
 
 
 def parse_args() -> argparse.Namespace:
@@ -509,6 +967,24 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Exact output-JSON path (overrides the --site-dir/generated/ default)",
     )
+    parser.add_argument(
+        "--record-cache",
+        type=Path,
+        default=None,
+        help=(
+            "Cache the expanded prose of each risk, control and persona in this file and, on later builds, "
+            "expand only the entities that changed (default: expand everything)"
+        ),
+    )
+    parser.add_argument(
+        "--validation-cache",
+        type=Path,
+        default=None,
+        help=(
+            "Record the content digests of validated records in this file and, on later builds, "
+            "validate only the records that changed (default: validate everything)"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -520,8 +996,10 @@ def main() -> None:
         load_yaml(args.personas_path),
         load_yaml(args.risks_path),
         load_yaml(args.controls_path),
+        record_cache=args.record_cache,
     )
-    write_site_data(site_data, output_path)
+    write_site_data(site_data, output_path, args.validation_cache)
+    write_site_shards(site_data, output_path.parent)
     print(f"Wrote {output_path}")
 
 
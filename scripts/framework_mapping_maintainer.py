@@ -30,7 +30,7 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # ---------------------------------------------------------------------------
 # sys.path bootstrap — mirror build_persona_site_data.py pattern.
@@ -43,10 +43,6 @@ if str(REPO_ROOT) not in sys.path:
 
 from io import StringIO  # noqa: E402
 
-from ruamel.yaml import YAML, CommentedMap, CommentedSeq  # noqa: E402
-from ruamel.yaml.error import CommentMark  # noqa: E402
-from ruamel.yaml.tokens import CommentToken  # noqa: E402
-
 from scripts.hooks.precommit.framework_mapping import (  # noqa: E402
     DEFAULT_FRAMEWORKS_PATH,
     DEFAULT_SCHEMA_PATH,
@@ -59,6 +55,11 @@ from scripts.hooks.precommit.framework_mapping import (  # noqa: E402
     split_pinned_value,
 )
 
+# ruamel.yaml is imported where it is used, so --help and argument errors do
+# not pay for it.
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -81,6 +82,8 @@ _CONTENT_DIR = REPO_ROOT / "risk-map" / "yaml"
 
 def _make_yaml() -> YAML:
     """Return a ruamel YAML instance configured for round-trip fidelity."""
+    from ruamel.yaml import YAML
+
     y = YAML()
     y.preserve_quotes = True
     y.indent(mapping=2, sequence=4, offset=2)
@@ -103,6 +106,8 @@ def _last_value_is_block(value: Any) -> bool:
     when the preceding item's last nested value is a block-style structure.
     This function identifies that case so we don't double-inject a blank line.
     """
+    from ruamel.yaml import CommentedMap, CommentedSeq
+
     if isinstance(value, CommentedMap) and value:
         last_nested = value[list(value.keys())[-1]]
         return _last_value_is_block(last_nested)
@@ -117,6 +122,8 @@ def _last_value_is_block(value: Any) -> bool:
 
 def _item_ends_with_block(item: Any) -> bool:
     """Return True if item's last value chain ends with a block structure."""
+    from ruamel.yaml import CommentedMap
+
     if not isinstance(item, CommentedMap) or not item:
         return False
     return _last_value_is_block(item[list(item.keys())[-1]])
@@ -146,6 +153,9 @@ def _restore_blank_lines(seq: Any, source_text: str) -> None:
         inter-item gap, matching the single-blank-line convention in
         risks.yaml / controls.yaml. A double-blank separator would collapse to one.
     """
+    from ruamel.yaml.error import CommentMark
+    from ruamel.yaml.tokens import CommentToken
+
     lines = source_text.splitlines()
     for idx in range(1, len(seq)):
         item = seq[idx]
@@ -292,6 +302,8 @@ def _cmd_add(args: argparse.Namespace) -> None:
         # Byte-level no-op: value already present, no rewrite (D4a idempotency).
         return
 
+    from ruamel.yaml import CommentedMap, CommentedSeq
+
     # Create mappings block if absent.
     if "mappings" not in entity:
         entity["mappings"] = CommentedMap()
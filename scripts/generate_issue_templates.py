@@ -18,6 +18,9 @@ Usage:
     # Validate only (no generation)
     python scripts/generate_issue_templates.py --validate
 
+    # Skip generation when nothing it reads changed since the last run
+    python scripts/generate_issue_templates.py --fingerprint-file /tmp/issue-templates.json
+
     # Verbose output
     python scripts/generate_issue_templates.py --verbose
 """
@@ -92,6 +95,9 @@ Examples:
   # Validate templates only
   python scripts/generate_issue_templates.py --validate
 
+  # Skip generation when nothing it reads changed since the last run
+  python scripts/generate_issue_templates.py --fingerprint-file /tmp/issue-templates.json
+
   # Verbose output
   python scripts/generate_issue_templates.py --verbose
         """,
@@ -110,6 +116,16 @@ Examples:
 
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
 
+    parser.add_argument(
+        "--fingerprint-file",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Record the input fingerprint and output digests of a complete run here, and skip "
+            "generating all templates (or their dry-run diffs) when both are unchanged"
+        ),
+    )
+
     args = parser.parse_args()
 
     try:
@@ -126,7 +142,7 @@ Examples:
         if args.verbose:
             print("Initializing IssueTemplateGenerator...")
 
-        generator = IssueTemplateGenerator(repo_root)
+        generator = IssueTemplateGenerator(repo_root, fingerprint_file=args.fingerprint_file)
 
         # Validate mode
         if args.validate:
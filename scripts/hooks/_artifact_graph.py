@@ -0,0 +1,353 @@
+"""Declarative dependency graph of the repository's generated artifacts.
+
+Every generated artifact (Markdown tables, Mermaid graphs, their SVGs, the
+GitHub issue templates and the persona site data) is declared once in
+ARTIFACTS, with the exact data files its generator reads and the files it
+writes. The regeneration hooks ask the graph what to rebuild instead of
+hardcoding which source file triggers which command:
+
+- an artifact is stale when one of its inputs is among the changed files;
+- an artifact whose input is another artifact's output is stale only when
+  that upstream build actually changed the output's bytes (content hashes,
+  via ArtifactWriter), as in make with content-addressed timestamps;
+- stale artifacts are built in topological order, independent artifacts of
+  the same depth in parallel, and the dependents of a failed build are
+  skipped.
+
+Only the graph hook schedules through build(), for the ``graph`` and ``svg``
+kinds, so a diagram regenerated from YAML gets its SVG in the same run. For
+the other kinds the graph is a trigger map, not a scheduler: the table,
+issue-template and persona-site hooks ask it which artifacts are stale (or
+which outputs to watch) and run their own generator for them.
+
+Inputs are repo-relative paths or ``fnmatch`` patterns (``*.schema.json``).
+Generator source code is deliberately not listed: CI regenerates every
+artifact and diffs it against the committed copy, which covers code changes.
+Each hook's ``files:`` regex in .pre-commit-config.yaml must match the
+inputs of the artifacts it rebuilds; test_artifact_graph.py enforces that.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from fnmatch import translate
+from functools import cached_property
+from pathlib import Path
+
+from scripts.hooks._artifact_writer import ArtifactWriter
+
+_YAML_DIR = "risk-map/yaml"
+_COMPONENTS = f"{_YAML_DIR}/components.yaml"
+_CONTROLS = f"{_YAML_DIR}/controls.yaml"
+_RISKS = f"{_YAML_DIR}/risks.yaml"
+_PERSONAS = f"{_YAML_DIR}/personas.yaml"
+_MERMAID_STYLES = f"{_YAML_DIR}/mermaid-styles.yaml"
+
+# Characters that make an input a glob pattern rather than a file name.
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+# Full and summary tables expand {{id}} sentinels in prose using the titles of
+# every entity in the four corpus files, so they read all of them.
+_CORPUS = (_COMPONENTS, _CONTROLS, _RISKS, _PERSONAS)
+
+# Cross-reference tables read their own file plus the file they cross-reference.
+_XREF_INPUTS = {
+    ("controls", "xref-risks"): (_CONTROLS, _RISKS),
+    ("controls", "xref-components"): (_CONTROLS, _COMPONENTS),
+    ("personas", "xref-controls"): (_PERSONAS, _CONTROLS),
+    ("personas", "xref-risks"): (_PERSONAS, _RISKS),
+}
+
+_TABLES_DIR = "risk-map/tables"
+_DIAGRAMS_DIR = "risk-map/diagrams"
+_SVG_DIR = "risk-map/svg"
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """
+    One generated artifact.
+
+    Attributes:
+        name: Unique name, "<kind>:<target>"
+        kind: Which hook builds it: table, graph, svg, issue-templates or site
+        target: Generator-specific selector (a TYPE:FORMAT table spec, a
+            validate_riskmap.py graph flag, ...)
+        inputs: Repo-relative data files or fnmatch patterns the generator reads
+        outputs: Repo-relative files (or directories) the generator writes
+    """
+
+    name: str
+    kind: str
+    target: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+
+    def reads(self, path: str | Path) -> bool:
+        """Return True if ``path`` (repo-relative or absolute) is one of this artifact's inputs."""
+        return self._reads_posix(Path(path).as_posix())
+
+    def _reads_posix(self, path: str) -> bool:
+        literals, suffixes, globs = self._input_matchers
+        return path in literals or path.endswith(suffixes) or (globs is not None and globs.match(path) is not None)
+
+    @cached_property
+    def _input_matchers(self) -> tuple[frozenset[str], tuple[str, ...], re.Pattern | None]:
+        # An input matches as the whole path or as its suffix after a "/". The
+        # graph tests every input against every output at import time, so plain
+        # file names are compared directly and only real patterns become one regex.
+        literals = [pattern for pattern in self.inputs if not _GLOB_CHARS.search(pattern)]
+        patterns = [pattern for pattern in self.inputs if _GLOB_CHARS.search(pattern)]
+        globs = "|".join(translate(form) for pattern in patterns for form in (pattern, f"*/{pattern}"))
+        return (
+            frozenset(literals),
+            tuple(f"/{literal}" for literal in literals),
+            re.compile(globs) if globs else None,
+        )
+
+
+def _table(ytype: str, table_format: str) -> Artifact:
+    inputs = _XREF_INPUTS.get((ytype, table_format), _CORPUS)
+    return Artifact(
+        name=f"table:{ytype}:{table_format}",
+        kind="table",
+        target=f"{ytype}:{table_format}",
+        inputs=inputs,
+        outputs=(f"{_TABLES_DIR}/{ytype}-{table_format}.md",),
+    )
+
+
+def _graph(stem: str, flag: str, inputs: tuple[str, ...]) -> Artifact:
+    return Artifact(
+        name=f"graph:{stem}",
+        kind="graph",
+        target=flag,
+        inputs=(*inputs, _MERMAID_STYLES),
+        outputs=(f"{_DIAGRAMS_DIR}/{stem}.md", f"{_DIAGRAMS_DIR}/{stem}.mermaid"),
+    )
+
+
+def _svg(stem: str) -> Artifact:
+    return Artifact(
+        name=f"svg:{stem}",
+        kind="svg",
+        target=stem,
+        inputs=(f"{_DIAGRAMS_DIR}/{stem}.mermaid",),
+        outputs=(f"{_SVG_DIR}/{stem}.svg",),
+    )
+
+
+# Graph category labels come from the categories of both components.yaml and
+# controls.yaml, so every graph reads both.
+_GRAPHS = (
+    _graph("risk-map-graph", "--to-graph", (_COMPONENTS, _CONTROLS)),
+    _graph("controls-graph", "--to-controls-graph", (_COMPONENTS, _CONTROLS)),
+    _graph("controls-to-risk-graph", "--to-risk-graph", (_COMPONENTS, _CONTROLS, _RISKS)),
+)
+
+ARTIFACTS: tuple[Artifact, ...] = (
+    *(
+        _table(ytype, table_format)
+        for ytype, table_formats in (
+            ("components", ("full", "summary")),
+            ("risks", ("full", "summary")),
+            ("controls", ("full", "summary", "xref-risks", "xref-components")),
+            ("personas", ("full", "summary", "xref-controls", "xref-risks")),
+        )
+        for table_format in table_formats
+    ),
+    *_GRAPHS,
+    *(_svg(Path(graph.outputs[1]).stem) for graph in _GRAPHS),
+    Artifact(
+        name="issue-templates",
+        kind="issue-templates",
+        target="all",
+        inputs=(
+            "scripts/TEMPLATES/*.yml",
+            "risk-map/schemas/*.schema.json",
+            f"{_YAML_DIR}/frameworks.yaml",
+            _COMPONENTS,
+            _PERSONAS,
+        ),
+        outputs=(".github/ISSUE_TEMPLATE",),
+    ),
+    Artifact(
+        name="site:persona-site-data",
+        kind="site",
+        target="persona-site-data",
+        inputs=(
+            *_CORPUS,
+            "risk-map/schemas/persona-site-data.schema.json",
+            "risk-map/schemas/external-references.schema.json",
+        ),
+        outputs=("site/generated/persona-site-data.json",),
+    ),
+)
+
+
+@dataclass
+class BuildResult:
+    """Outcome of ArtifactGraph.build()."""
+
+    exit_code: int
+    artifacts: ArtifactWriter
+
+
+class ArtifactGraph:
+    """
+    Topologically ordered view of a set of artifacts.
+
+    Raises:
+        ValueError: If two artifacts share a name or an output, or the
+            dependencies form a cycle
+    """
+
+    def __init__(self, artifacts: Iterable[Artifact] = ARTIFACTS):
+        artifacts = list(artifacts)
+        names = [artifact.name for artifact in artifacts]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate artifact names: {', '.join(duplicates)}")
+
+        self._producers: dict[str, Artifact] = {}
+        for artifact in artifacts:
+            for output in artifact.outputs:
+                if output in self._producers:
+                    raise ValueError(
+                        f"Output {output} is produced by both {self._producers[output].name} and {artifact.name}"
+                    )
+                self._producers[output] = artifact
+
+        self._upstream = {artifact.name: self._inputs_produced_by(artifact) for artifact in artifacts}
+        self.artifacts = self._topological_order(artifacts)
+        self._depth: dict[str, int] = {}
+        for artifact in self.artifacts:
+            self._depth[artifact.name] = 1 + max(
+                (self._depth[upstream.name] for upstream in self._upstream[artifact.name]), default=-1
+            )
+
+    def _inputs_produced_by(self, artifact: Artifact) -> list[Artifact]:
+        # Declared outputs are already repo-relative POSIX paths.
+        return [producer for output, producer in self._producers.items() if artifact._reads_posix(output)]
+
+    def _topological_order(self, artifacts: list[Artifact]) -> list[Artifact]:
+        """Order artifacts so producers precede consumers, keeping declaration order otherwise."""
+        ordered: list[Artifact] = []
+        placed: set[str] = set()
+        remaining = list(artifacts)
+        while remaining:
+            ready = [a for a in remaining if all(up.name in placed for up in self._upstream[a.name])]
+            if not ready:
+                raise ValueError(f"Dependency cycle among: {', '.join(a.name for a in remaining)}")
+            ordered.extend(ready)
+            placed.update(a.name for a in ready)
+            remaining = [a for a in remaining if a.name not in placed]
+        return ordered
+
+    def __getitem__(self, name: str) -> Artifact:
+        for artifact in self.artifacts:
+            if artifact.name == name:
+                return artifact
+        raise KeyError(name)
+
+    def of_kind(self, kind: str) -> list[Artifact]:
+        """Return every artifact of ``kind`` in topological order."""
+        return [artifact for artifact in self.artifacts if artifact.kind == kind]
+
+    def stale(self, changed: Iterable[str | Path], kinds: Iterable[str] | None = None) -> list[Artifact]:
+        """
+        Return the artifacts that may be out of date after ``changed`` files changed.
+
+        Artifacts reading a changed file are stale, and so is everything
+        downstream of them, assuming every rebuilt output changes. build()
+        refines this with content hashes.
+
+        Args:
+            changed: Changed file paths, repo-relative or absolute
+            kinds: Only return artifacts of these kinds (default: all)
+
+        Returns:
+            Stale artifacts in topological order, without duplicates
+        """
+        changed = list(changed)
+        stale: set[str] = set()
+        for artifact in self.artifacts:
+            if any(artifact.reads(path) for path in changed) or any(
+                upstream.name in stale for upstream in self._upstream[artifact.name]
+            ):
+                stale.add(artifact.name)
+        kinds = None if kinds is None else set(kinds)
+        return [a for a in self.artifacts if a.name in stale and (kinds is None or a.kind in kinds)]
+
+    def build(
+        self,
+        changed: Iterable[str | Path],
+        run: Callable[[Artifact], int],
+        kinds: Iterable[str] | None = None,
+        jobs: int | None = None,
+    ) -> BuildResult:
+        """
+        Rebuild the stale artifacts of the given kinds.
+
+        Artifacts are built depth by depth; the artifacts of one depth run
+        concurrently on a thread pool (``run`` usually starts a generator
+        subprocess). An artifact downstream of a rebuilt one is only rebuilt
+        when the upstream build changed one of its outputs. Dependents of a
+        failed build are skipped.
+
+        Args:
+            changed: Changed file paths, repo-relative or absolute
+            run: Builds one artifact and returns its exit code
+            kinds: Only build artifacts of these kinds (default: all)
+            jobs: Maximum concurrent builds (default: one per artifact of a depth)
+
+        Returns:
+            BuildResult with the first non-zero exit code (0 if all succeeded)
+            and an ArtifactWriter holding the outputs that changed
+        """
+        dirty = [Path(path).as_posix() for path in changed]
+        candidates = self.stale(dirty, kinds)
+        failed: set[str] = set()
+        artifacts = ArtifactWriter()
+        exit_code = 0
+
+        for depth in sorted({self._depth[a.name] for a in candidates}):
+            wave = [
+                a
+                for a in candidates
+                if self._depth[a.name] == depth
+                and not any(up.name in failed for up in self._upstream[a.name])
+                and any(a.reads(path) for path in dirty)
+            ]
+            if not wave:
+                continue
+
+            writers = {}
+            for artifact in wave:
+                writers[artifact.name] = ArtifactWriter()
+                writers[artifact.name].watch(artifact.outputs)
+
+            # Imported here: hooks that only call stale() should not pay for concurrent.futures.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=jobs or len(wave)) as pool:
+                returncodes = list(pool.map(run, wave))
+
+            for artifact, returncode in zip(wave, returncodes):
+                writer = writers[artifact.name]
+                if returncode == 0:
+                    dirty.extend(path.as_posix() for path in writer.collect())
+                    artifacts.merge(writer)
+                else:
+                    # Outputs of a failed build are never staged.
+                    writer.discard()
+                    failed.add(artifact.name)
+                    if exit_code == 0:
+                        exit_code = returncode
+
+        return BuildResult(exit_code, artifacts)
+
+
+ARTIFACT_GRAPH = ArtifactGraph()
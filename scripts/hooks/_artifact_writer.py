@@ -0,0 +1,307 @@
+"""Skip-unchanged, atomic writer for generated artifacts, shared by the generators
+and the Mode B pre-commit wrappers.
+
+Generated files (tables, Mermaid graphs, SVGs, issue templates, frameworks.yaml
+versionIds) are compared with what is already on disk by SHA-256 digest:
+
+- write_if_changed() only touches the file when the bytes differ, and then
+  writes through a sibling temp file and ``os.replace()`` so readers never see
+  a partial file. Unchanged artifacts cost no write and keep their mtime.
+  AtomicFileWriter and write_lines_if_changed() do the same for text produced
+  piecewise, streaming it through the temp file instead of building it in
+  memory; write_json_if_changed() streams a JSON document that way, one item
+  of its top-level arrays at a time.
+- user_cache_dir() resolves where a hook keeps caches that must stay out of
+  the repository (render caches, fingerprints).
+- ArtifactWriter collects the paths that actually changed, both for content it
+  writes itself and for files an external generator subprocess writes (via
+  watch() before the run and collect() after it), and stages them with a
+  single ``git add``. No git subprocess runs when nothing changed.
+
+"Changed" means changed relative to the working tree when the hook started.
+The pre-commit framework stashes unstaged edits before running hooks, so for
+tracked files that is also the staged content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+
+def digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the SHA-256 hex digest of a file's contents, or None if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def _install(tmp_name: str, path: Path) -> None:
+    """Move a finished temp file over ``path``, keeping its permission bits (0644 if new)."""
+    if path.exists():
+        shutil.copymode(path, tmp_name)
+    else:
+        os.chmod(tmp_name, 0o644)
+    os.replace(tmp_name, path)
+
+
+def _unlink_quietly(tmp_name: str) -> None:
+    try:
+        os.unlink(tmp_name)
+    except OSError:
+        pass
+
+
+def write_if_changed(path: Path, data: str | bytes) -> bool:
+    """
+    Atomically write ``data`` to ``path`` unless the file already holds the same bytes.
+
+    Text is encoded as UTF-8. The parent directory is created if needed. A
+    replaced file keeps its permission bits; a new file is created 0644.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if file_digest(path) == digest(data):
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        _install(tmp_name, path)
+    except BaseException:
+        _unlink_quietly(tmp_name)
+        raise
+    return True
+
+
+class AtomicFileWriter:
+    """
+    Context manager that streams text into ``path`` with write_if_changed() semantics.
+
+    Text passed to write() is UTF-8 encoded into a sibling temp file and
+    hashed on the way. On a clean exit the temp file replaces ``path`` only
+    if the digests differ (``changed`` tells which happened); otherwise, or
+    if the block raises, it is removed and ``path`` is untouched. Several
+    writers can be open at once, so one pass over a source can feed several
+    output files.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.changed = False
+
+    def __enter__(self) -> AtomicFileWriter:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._sha = hashlib.sha256()
+        return self
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._sha.update(data)
+        self._file.write(data)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._file.close()
+            if exc_type is None and file_digest(self.path) != self._sha.hexdigest():
+                _install(self._tmp_name, self.path)
+                self.changed = True
+        finally:
+            if not self.changed:
+                _unlink_quietly(self._tmp_name)
+
+
+def write_lines_if_changed(path: Path, lines: Iterable[str]) -> bool:
+    """
+    Streaming counterpart of write_if_changed() for ``"\n".join(lines)``.
+
+    Lines are written through an AtomicFileWriter as they are produced, so
+    the full text never exists in memory. If ``lines`` raises, ``path`` is
+    untouched.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    with AtomicFileWriter(path) as out:
+        separator = ""
+        for line in lines:
+            out.write(separator + line)
+            separator = "\n"
+    return out.changed
+
+
+def _indented_json(value, level: int) -> str:
+    """``json.dumps(value, indent=2)`` as it appears nested ``level`` levels deep in an indented document."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def write_json_if_changed(
+    path: Path, document: dict, check_item: Callable[[str, int, object], None] | None = None
+) -> bool:
+    """
+    Streaming counterpart of write_if_changed() for ``json.dumps(document, indent=2) + "\n"``.
+
+    The output is byte-identical to that text, but the items of each
+    top-level array are encoded and written one at a time, so at most one
+    item's text is in memory. ``check_item(key, index, item)``, if given, is
+    called before each item is written; if it raises, ``path`` is untouched.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    with AtomicFileWriter(path) as out:
+        out.write("{")
+        separator = "\n"
+        for key, value in document.items():
+            out.write(f"{separator}  {json.dumps(key)}: ")
+            separator = ",\n"
+            if not isinstance(value, list) or not value:
+                out.write(_indented_json(value, 1))
+                continue
+            item_separator = "[\n"
+            for index, item in enumerate(value):
+                if check_item is not None:
+                    check_item(key, index, item)
+                out.write(f"{item_separator}    {_indented_json(item, 2)}")
+                item_separator = ",\n"
+            out.write("\n  ]")
+        out.write("\n}\n" if document else "}\n")
+    return out.changed
+
+
+def user_cache_dir(env_var: str, name: str) -> Path:
+    """
+    Resolve a hook's cache directory outside the repository.
+
+    ``env_var`` wins when set and non-empty; otherwise the directory is
+    $XDG_CACHE_HOME (or ~/.cache) /secure-ai-tooling/``name``. Callers check
+    cached entries against the content they were built from, so a stale or
+    shared cache only costs a rebuild.
+    """
+    override = os.environ.get(env_var)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "secure-ai-tooling" / name
+
+
+def _files_under(path: Path) -> list[Path]:
+    """Return ``path`` itself for a file path, or every file below it for a directory."""
+    if path.is_dir():
+        return sorted(child for child in path.rglob("*") if child.is_file())
+    return [path]
+
+
+class ArtifactWriter:
+    """
+    Collect the generated artifacts that changed and stage them with one ``git add``.
+
+    Changed paths are kept in the order they were first detected, without
+    duplicates.
+    """
+
+    def __init__(self) -> None:
+        self.changed: list[Path] = []
+        self._watched: dict[Path, str | None] = {}
+        self._watched_dirs: list[Path] = []
+
+    def _record(self, path: Path) -> None:
+        if path not in self.changed:
+            self.changed.append(path)
+
+    def write(self, path: Path, data: str | bytes) -> bool:
+        """Write an artifact with write_if_changed(), recording it if it changed."""
+        path = Path(path)
+        written = write_if_changed(path, data)
+        if written:
+            self._record(path)
+        return written
+
+    def watch(self, paths: Iterable[Path | str]) -> None:
+        """
+        Record the current digests of files an external generator is about to write.
+
+        A directory is watched as every file below it, including files created
+        later by the generator.
+        """
+        for path in map(Path, paths):
+            if path.is_dir():
+                self._watched_dirs.append(path)
+            for file_path in _files_under(path):
+                self._watched.setdefault(file_path, file_digest(file_path))
+
+    def collect(self) -> list[Path]:
+        """
+        Record every watched file whose digest differs from when it was watched.
+
+        Created and deleted files count as changed. Returns the newly recorded paths.
+        """
+        candidates = dict.fromkeys(self._watched)
+        # Also expand watched paths that the generator created as directories.
+        for directory in [*self._watched_dirs, *(path for path in self._watched if path.is_dir())]:
+            candidates.update(dict.fromkeys(_files_under(directory)))
+
+        found = []
+        for path in candidates:
+            if file_digest(path) != self._watched.get(path):
+                found.append(path)
+                self._record(path)
+        self.discard()
+        return found
+
+    def merge(self, other: ArtifactWriter) -> None:
+        """Record the changed artifacts of another writer, e.g. one per concurrent build."""
+        for path in other.changed:
+            self._record(path)
+
+    def discard(self) -> None:
+        """Forget watched files without recording them, e.g. after their generator failed."""
+        self._watched.clear()
+        self._watched_dirs.clear()
+
+    def stage(self) -> int:
+        """
+        ``git add`` every changed artifact in a single call.
+
+        A changed path that no longer exists is staged as a deletion only if
+        git tracks it (``git ls-files``); an untracked one would make
+        ``git add`` fail with "pathspec did not match" and is left out.
+
+        Returns:
+            The git exit code, or 0 without running git when nothing is left to stage
+        """
+        paths = [path for path in self.changed if path.exists()]
+        missing = [path for path in self.changed if not path.exists()]
+        if missing:
+            listed = subprocess.run(
+                ["git", "ls-files", "-z", "--", *map(str, missing)], capture_output=True, text=True
+            )
+            if listed.returncode != 0:
+                return listed.returncode
+            tracked = {Path(name).resolve() for name in listed.stdout.split("\0") if name}
+            deleted = {path for path in missing if path.resolve() in tracked}
+            paths = [path for path in self.changed if path.exists() or path in deleted]
+        if not paths:
+            return 0
+        return subprocess.run(["git", "add", *map(str, paths)]).returncode
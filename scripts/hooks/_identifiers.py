@@ -0,0 +1,17 @@
+"""Display labels for schema identifiers, shared by yaml_to_markdown.py and
+build_persona_site_data.py.
+
+Category IDs such as ``risksRuntimeDataSecurity`` have no title in the
+corpus; both generators show them as humanized labels ("Runtime Data
+Security") so the tables and the persona site name categories the same way.
+"""
+
+import re
+
+_WORD_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def humanize_identifier(identifier: str, prefix: str = "") -> str:
+    """Convert schema-like identifiers into simple display labels."""
+    trimmed = identifier[len(prefix) :] if prefix and identifier.startswith(prefix) else identifier
+    return _WORD_BOUNDARY.sub(" ", trimmed.replace("-", " ")).strip()
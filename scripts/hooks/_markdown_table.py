@@ -0,0 +1,232 @@
+"""Dependency-free Markdown pipe-table writer used by yaml_to_markdown.py.
+
+Produces the same bytes as ``DataFrame.to_markdown(index=False)`` (i.e.
+``tabulate(..., headers="keys", tablefmt="pipe")``) for the text tables the
+generators build, without importing pandas or tabulate:
+
+- every column is left-aligned (``:---`` separators) and cells are stripped;
+- a column is at least as wide as its header plus two spaces of padding;
+- visible width uses ``wcwidth`` when it is installed, exactly as tabulate
+  does, and falls back to ``len`` otherwise;
+- if any cell contains a line break, cells are laid out line by line, so a
+  ``\\n`` still produces the extra visual rows tabulate would emit;
+- a table with headers but no rows gets a plain ``---`` separator.
+
+Tabulate's numeric-column detection (right alignment, float reformatting)
+is deliberately not reproduced: every generator emits text, and IDs or
+labels that happen to look numeric are kept verbatim.
+
+Rows are plain tuples. Column widths need every row, so layout is a separate
+pass (measure_pipe_table()) that keeps only running maxima, after which
+iter_pipe_table() formats and yields one row at a time. stream_pipe_table()
+combines the two over a single pass of a row generator, spooling the rows
+(in memory up to a bound, then on disk) between measuring and writing, so a
+table is streamed without ever holding all of its cells or lines.
+"""
+
+from __future__ import annotations
+
+import pickle
+import re
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    from wcwidth import wcswidth as _wcswidth
+except ImportError:  # pragma: no cover - depends on the environment
+    _wcswidth = None
+
+# Extra width every column gets beyond its header (tabulate.MIN_PADDING).
+MIN_PADDING = 2
+
+# Formatted rows stream_pipe_table() keeps in memory before spilling to a temp file.
+SPOOL_BYTES = 8 * 1024 * 1024
+
+_LINE_BREAK = re.compile(r"\r|\n")
+
+
+def text_width(text: str) -> int:
+    """Return the visible width of a single line of text."""
+    if _wcswidth is None:
+        return len(text)
+    return _wcswidth(text)
+
+
+def _pad(text: str, width: int) -> str:
+    """Left-align ``text`` in ``width`` visible columns."""
+    return text.ljust(width - (text_width(text) - len(text)))
+
+
+def _cell_text(value: Any) -> str:
+    """Convert a cell value to text; None renders as an empty cell."""
+    return "" if value is None else str(value)
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """
+    Column layout of a pipe table, computed by measure_pipe_table().
+
+    Attributes:
+        widths: Content width of each column (excluding the one-space margins)
+        multiline: Whether any header or cell contains a line break
+        row_count: Number of data rows measured
+    """
+
+    widths: tuple[int, ...]
+    multiline: bool
+    row_count: int
+
+
+def measure_pipe_table(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> TableLayout:
+    """
+    Compute a table's layout in one pass over ``rows`` without retaining them.
+
+    Only running maxima are kept, so ``rows`` may be a generator that formats
+    each row on the fly. Widths are tracked both for whole cells and for their
+    individual lines, because which one applies depends on whether any cell
+    turns out to contain a line break.
+
+    Args:
+        headers: Column headers
+        rows: Row tuples, one value per header; None renders as an empty cell
+
+    Returns:
+        TableLayout to pass to iter_pipe_table() together with the same rows
+    """
+    headers = [str(header) for header in headers]
+    multiline = any(_LINE_BREAK.search(text) for text in headers)
+    whole_widths = [max(map(text_width, _LINE_BREAK.split(header))) + MIN_PADDING for header in headers]
+    line_widths = list(whole_widths)
+    row_count = 0
+    for row in rows:
+        row_count += 1
+        for index, value in enumerate(row):
+            text = _cell_text(value)
+            if not multiline and _LINE_BREAK.search(text):
+                multiline = True
+            text = text.strip()
+            whole_widths[index] = max(whole_widths[index], text_width(text))
+            for line in text.splitlines():
+                line_widths[index] = max(line_widths[index], text_width(line))
+    return TableLayout(tuple(line_widths if multiline else whole_widths), multiline, row_count)
+
+
+def iter_pipe_table(
+    headers: Sequence[str], rows: Iterable[Sequence[Any]], layout: TableLayout | None = None
+) -> Iterator[str]:
+    """
+    Yield the lines of a left-aligned Markdown pipe table.
+
+    Without ``layout`` the rows are materialized once and measured. With a
+    ``layout`` from measure_pipe_table() they are consumed lazily, one row per
+    yielded line group, so a row generator can stream a table of any size;
+    ``rows`` must then produce the same rows that were measured.
+
+    Args:
+        headers: Column headers
+        rows: Row tuples, one value per header; None renders as an empty cell
+        layout: Precomputed layout of ``rows``
+
+    Yields:
+        Table lines without trailing newlines: header, separator, then data rows
+    """
+    headers = [str(header) for header in headers]
+    if layout is None:
+        rows = list(rows)
+        layout = measure_pipe_table(headers, rows)
+    if not headers and not layout.row_count:
+        return
+
+    widths = layout.widths
+
+    def cell_lines(text: str) -> list[str]:
+        return text.splitlines() if layout.multiline else [text]
+
+    def render(row: list[list[str]]) -> Iterator[str]:
+        # A multiline row whose cells are all empty has no lines, as in tabulate.
+        height = max((len(lines) for lines in row), default=0)
+        for line_no in range(height):
+            parts = (
+                _pad(lines[line_no], width) if line_no < len(lines) else " " * width
+                for lines, width in zip(row, widths)
+            )
+            yield "|" + "|".join(f" {part} " for part in parts) + "|"
+
+    yield from render([cell_lines(header) for header in headers])
+    if layout.row_count:
+        yield "|" + "|".join(":" + "-" * (width + 1) for width in widths) + "|"
+    else:
+        yield "|" + "|".join("-" * (width + 2) for width in widths) + "|"
+    for row in rows:
+        yield from render([cell_lines(_cell_text(value).strip()) for value in row])
+
+
+class RowSpool:
+    """
+    Append-only store of row tuples that can be replayed in order.
+
+    Rows are pickled into a SpooledTemporaryFile: in memory up to
+    ``spool_bytes``, then in a temporary file on disk. Replay after the last
+    append; iterating again replays from the first row.
+    """
+
+    def __init__(self, spool_bytes: int = SPOOL_BYTES):
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+        self.row_count = 0
+
+    def append(self, row: Sequence[Any]) -> None:
+        pickle.dump(tuple(row), self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.row_count += 1
+
+    def __iter__(self) -> Iterator[tuple]:
+        self._file.seek(0)
+        for _ in range(self.row_count):
+            yield pickle.load(self._file)
+        self._file.seek(0, 2)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> RowSpool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def stream_pipe_table(
+    headers: Sequence[str], rows: Iterable[Sequence[Any]], spool_bytes: int = SPOOL_BYTES
+) -> Iterator[str]:
+    """
+    Yield a pipe table from a single pass over ``rows`` in bounded memory.
+
+    Each row is measured and appended to a RowSpool as it arrives, then
+    replayed once the widths are known, so rows are formatted only once
+    (which matters when formatting expands sentinels) yet never all held in
+    memory: the spool moves to a temporary file on disk past ``spool_bytes``.
+
+    Args:
+        headers: Column headers
+        rows: Row tuples, one value per header; None renders as an empty cell
+        spool_bytes: In-memory size of the row spool before it spills to disk
+
+    Yields:
+        Table lines without trailing newlines, as iter_pipe_table()
+    """
+    with RowSpool(spool_bytes) as spool:
+
+        def spooled() -> Iterator[Sequence[Any]]:
+            for row in rows:
+                spool.append(row)
+                yield row
+
+        layout = measure_pipe_table(headers, spooled())
+        yield from iter_pipe_table(headers, spool, layout)
+
+
+def render_pipe_table(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """Render a left-aligned Markdown pipe table as a single string (no trailing newline)."""
+    return "\n".join(iter_pipe_table(headers, rows))
@@ -6,6 +6,13 @@ sentinels ({{<entity-id>}}) and external-reference sentinels
 ({{ref:<identifier>}}) into rendered output. An unresolved sentinel is a
 hard build failure — never silently passed through.
 
+Each distinct prose string is tokenized once per process: parse_prose()
+caches its segment list (text runs and sentinels) keyed by the string
+itself, and both expanders format from that cached structure. Before
+rendering, both generators run find_unresolved_sentinels() over every prose
+field they expand, so an author sees every unresolved sentinel in one
+UnresolvedSentinelsError instead of fixing them one build at a time.
+
 Wire-format note: the tokenizer at scripts/hooks/precommit/_prose_tokens.py
 accepts the bare entity-prefix camelCase form ({{riskFoo}}, {{controlFoo}},
 {{componentFoo}}, {{personaFoo}}) — NOT the {{idXxx}} meta-notation that
@@ -14,10 +21,22 @@ appears in ADR-016 D2 prose.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cache
+from typing import NamedTuple
 
 from scripts.hooks.precommit._prose_tokens import TokenKind, tokenize
 
+# Entity fields holding prose that may contain sentinels, across all four corpus files.
+PROSE_FIELDS = (
+    "description",
+    "shortDescription",
+    "longDescription",
+    "examples",
+    "responsibilities",
+    "identificationQuestions",
+)
+
 
 class UnresolvedSentinelError(ValueError):
     """Raised when a sentinel's id cannot be resolved during expansion.
@@ -45,6 +64,92 @@ class UnresolvedSentinelError(ValueError):
         super().__init__(full_message)
 
 
+class UnresolvedSentinelsError(UnresolvedSentinelError):
+    """Raised once for every unresolved sentinel found by find_unresolved_sentinels().
+
+    A subclass of UnresolvedSentinelError whose .sentinel and .field_path are
+    those of the first failure, so callers catching the single-sentinel error
+    keep working.
+
+    Attributes:
+        errors: one UnresolvedSentinelError per failing sentinel, in corpus order.
+    """
+
+    def __init__(self, errors: Iterable[UnresolvedSentinelError]) -> None:
+        self.errors = list(errors)
+        listing = "\n".join(f"  {error.field_path}: {error.sentinel}" for error in self.errors)
+        first = self.errors[0]
+        super().__init__(
+            first.sentinel,
+            first.field_path,
+            f"{len(self.errors)} unresolved sentinel(s):\n{listing}",
+        )
+
+
+class Sentinel(NamedTuple):
+    """One sentinel span in parsed prose.
+
+    Attributes:
+        span: the sentinel as written in source (e.g. "{{ref:cwe-89}}").
+        key: the entity id or, for external references, the ref id.
+        is_ref: True for {{ref:<id>}}, False for intra-document {{<entity-id>}}.
+    """
+
+    span: str
+    key: str
+    is_ref: bool
+
+
+@cache
+def parse_prose(text: str) -> tuple[str | Sentinel, ...]:
+    """Split `text` into text runs and sentinels, tokenizing each distinct string once.
+
+    Adjacent non-sentinel tokens (TEXT, BOLD, ITALIC, INVALID_*) are joined
+    into a single string by their `.value`, so concatenating the text runs
+    and sentinel spans reconstructs `text`. The result is cached for the life
+    of the process and shared by every caller; it is a tuple, so it cannot be
+    mutated.
+    """
+    segments: list[str | Sentinel] = []
+    pending_text: list[str] = []
+    for token in tokenize(text):
+        if token.kind == TokenKind.SENTINEL_INTRA:
+            sentinel = Sentinel(token.value, token.value[2:-2], False)  # strip {{ and }}
+        elif token.kind == TokenKind.SENTINEL_REF:
+            sentinel = Sentinel(token.value, token.value[6:-2], True)  # strip {{ref: and }}
+        else:
+            pending_text.append(token.value)
+            continue
+        if pending_text:
+            segments.append("".join(pending_text))
+            pending_text.clear()
+        segments.append(sentinel)
+    if pending_text:
+        segments.append("".join(pending_text))
+    return tuple(segments)
+
+
+def _resolve(
+    sentinel: Sentinel, intra_lookup: Mapping[str, str], ref_lookup: Mapping[str, dict], field_path: str
+) -> str | dict:
+    """Return the entity title (intra) or the {"title", "url"} entry (ref) for one sentinel."""
+    if sentinel.is_ref:
+        if sentinel.key not in ref_lookup:
+            raise UnresolvedSentinelError(
+                sentinel=sentinel.span,
+                field_path=field_path,
+                message=f"Ref sentinel {sentinel.span!r} not in ref_lookup at {field_path!r}",
+            )
+        return ref_lookup[sentinel.key]
+    if sentinel.key not in intra_lookup:
+        raise UnresolvedSentinelError(
+            sentinel=sentinel.span,
+            field_path=field_path,
+            message=f"Intra sentinel {sentinel.span!r} not in intra_lookup at {field_path!r}",
+        )
+    return intra_lookup[sentinel.key]
+
+
 def expand_sentinels_to_text(
     text: str,
     *,
@@ -77,36 +182,16 @@ def expand_sentinels_to_text(
         UnresolvedSentinelError: any sentinel whose id is not in the
             corresponding lookup. Surfaces the sentinel span and field_path.
     """
-    tokens = tokenize(text)
     parts: list[str] = []
 
-    for token in tokens:
-        if token.kind == TokenKind.SENTINEL_INTRA:
-            entity_id = token.value[2:-2]  # strip {{ and }}
-            if entity_id not in intra_lookup:
-                raise UnresolvedSentinelError(
-                    sentinel=token.value,
-                    field_path=field_path,
-                    message=f"Intra sentinel {token.value!r} not in intra_lookup at {field_path!r}",
-                )
-            parts.append(intra_lookup[entity_id])
-
-        elif token.kind == TokenKind.SENTINEL_REF:
-            # Strip {{ and }} to get "ref:<id>", then strip the "ref:" prefix.
-            inner = token.value[2:-2]
-            ref_id = inner[4:]  # strip "ref:"
-            if ref_id not in ref_lookup:
-                raise UnresolvedSentinelError(
-                    sentinel=token.value,
-                    field_path=field_path,
-                    message=f"Ref sentinel {token.value!r} not in ref_lookup at {field_path!r}",
-                )
-            entry = ref_lookup[ref_id]
+    for segment in parse_prose(text):
+        if isinstance(segment, str):
+            parts.append(segment)
+        elif segment.is_ref:
+            entry = _resolve(segment, intra_lookup, ref_lookup, field_path)
             parts.append(link_format(entry["title"], entry["url"]))
-
         else:
-            # TEXT, BOLD, ITALIC, and all INVALID_* tokens pass through verbatim.
-            parts.append(token.value)
+            parts.append(_resolve(segment, intra_lookup, ref_lookup, field_path))
 
     return "".join(parts)
 
@@ -148,48 +233,116 @@ def expand_sentinels_to_items(
         UnresolvedSentinelError: any sentinel whose id is not in the
             corresponding lookup.
     """
-    tokens = tokenize(text)
     items: list = []
-    # Buffer for accumulating adjacent non-sentinel token values.
-    pending_text: list[str] = []
 
-    def flush_pending() -> None:
-        """Emit the accumulated text buffer as a string item if non-whitespace."""
-        if pending_text:
-            segment = "".join(pending_text)
+    for segment in parse_prose(text):
+        if isinstance(segment, str):
             # Drop whitespace-only segments (NIT-08 parity).
             if segment.strip():
                 items.append(segment)
-            pending_text.clear()
-
-    for token in tokens:
-        if token.kind == TokenKind.SENTINEL_INTRA:
-            flush_pending()
-            entity_id = token.value[2:-2]
-            if entity_id not in intra_lookup:
-                raise UnresolvedSentinelError(
-                    sentinel=token.value,
-                    field_path=field_path,
-                    message=f"Intra sentinel {token.value!r} not in intra_lookup at {field_path!r}",
-                )
-            items.append({"type": "ref", "id": entity_id, "title": intra_lookup[entity_id]})
-
-        elif token.kind == TokenKind.SENTINEL_REF:
-            flush_pending()
-            inner = token.value[2:-2]
-            ref_id = inner[4:]  # strip "ref:"
-            if ref_id not in ref_lookup:
-                raise UnresolvedSentinelError(
-                    sentinel=token.value,
-                    field_path=field_path,
-                    message=f"Ref sentinel {token.value!r} not in ref_lookup at {field_path!r}",
-                )
-            entry = ref_lookup[ref_id]
+        elif segment.is_ref:
+            entry = _resolve(segment, intra_lookup, ref_lookup, field_path)
             items.append({"type": "link", "title": entry["title"], "url": entry["url"]})
-
         else:
-            # Accumulate TEXT, BOLD, ITALIC, and INVALID_* tokens into the text buffer.
-            pending_text.append(token.value)
+            title = _resolve(segment, intra_lookup, ref_lookup, field_path)
+            items.append({"type": "ref", "id": segment.key, "title": title})
 
-    flush_pending()
     return items
+
+
+def build_intra_lookup(entities_by_type: Mapping[str, Iterable[dict] | None]) -> dict[str, str]:
+    """Build the corpus-wide entity-id -> title map for intra-document sentinels.
+
+    Args:
+        entities_by_type: entity lists keyed by corpus type ("risks",
+            "controls", ...), in lookup order; None counts as empty.
+
+    Returns:
+        Dict mapping the id of every entity that has both an id and a title
+        to that title.
+    """
+    lookup: dict[str, str] = {}
+    for entities in entities_by_type.values():
+        for entity in entities or []:
+            if isinstance(entity, dict) and "id" in entity and "title" in entity:
+                lookup[entity["id"]] = entity["title"]
+    return lookup
+
+
+def build_ref_lookup(entry: dict) -> dict[str, dict]:
+    """Build a ref-id -> {"title", "url"} map from a single entity's externalReferences.
+
+    Per ADR-016 D6 rule 3, ref-id resolution scope is per-entry: a ref id
+    declared on one entry must not resolve from a sibling entry's
+    externalReferences.
+    """
+    return {ref["id"]: {"title": ref["title"], "url": ref["url"]} for ref in entry.get("externalReferences", [])}
+
+
+def iter_prose_strings(ytype: str, entries: Iterable[dict]) -> Iterator[tuple[str, str, dict]]:
+    """Yield (field_path, text, entry) for every prose string in `entries`.
+
+    Field paths use the entry's position in `entries` and the item indices
+    within list-valued fields: "risks[3].longDescription[0]",
+    "risks[3].longDescription[1][2]" for nested groups, or
+    "controls[0].description" for a scalar string. Non-string leaves are
+    skipped; the renderers reject them with their own errors.
+    """
+    for idx, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            continue
+        for field in PROSE_FIELDS:
+            value = entry.get(field)
+            field_path = f"{ytype}[{idx}].{field}"
+            if isinstance(value, str):
+                yield field_path, value, entry
+            elif isinstance(value, list):
+                for item_idx, item in enumerate(value):
+                    if isinstance(item, str):
+                        yield f"{field_path}[{item_idx}]", item, entry
+                    elif isinstance(item, list):
+                        for inner_idx, inner in enumerate(item):
+                            if isinstance(inner, str):
+                                yield f"{field_path}[{item_idx}][{inner_idx}]", inner, entry
+
+
+def find_unresolved_sentinels(
+    entities_by_type: Mapping[str, Iterable[dict] | None], intra_lookup: Mapping[str, str]
+) -> list[UnresolvedSentinelError]:
+    """Resolve every sentinel in the given entities' prose and collect the failures.
+
+    One pass over every prose field (PROSE_FIELDS), with per-entry external
+    reference lookups. Parsing goes through parse_prose(), so the renders
+    that follow format from already-tokenized prose.
+
+    Args:
+        entities_by_type: entity lists keyed by corpus type; None counts as empty.
+        intra_lookup: maps entity-id -> title (see build_intra_lookup()).
+
+    Returns:
+        One UnresolvedSentinelError per unresolved sentinel, in corpus order;
+        empty when everything resolves.
+    """
+    errors: list[UnresolvedSentinelError] = []
+    for ytype, entities in entities_by_type.items():
+        ref_lookups: dict[int, dict[str, dict]] = {}
+        for field_path, text, entry in iter_prose_strings(ytype, entities or []):
+            ref_lookup = ref_lookups.get(id(entry))
+            if ref_lookup is None:
+                ref_lookup = ref_lookups[id(entry)] = build_ref_lookup(entry)
+            for segment in parse_prose(text):
+                if isinstance(segment, Sentinel):
+                    try:
+                        _resolve(segment, intra_lookup, ref_lookup, field_path)
+                    except UnresolvedSentinelError as error:
+                        errors.append(error)
+    return errors
+
+
+def check_sentinels(
+    entities_by_type: Mapping[str, Iterable[dict] | None], intra_lookup: Mapping[str, str]
+) -> None:
+    """Raise UnresolvedSentinelsError listing every unresolved sentinel, if there are any."""
+    errors = find_unresolved_sentinels(entities_by_type, intra_lookup)
+    if errors:
+        raise UnresolvedSentinelsError(errors)
@@ -0,0 +1,183 @@
+"""Intermediate representation of generated tables and the emitters that write it.
+
+The table generators in yaml_to_markdown.py describe each table once, as a
+Table: column names, a lazy iterable of row tuples and any trailing
+Markdown sections. Emitters turn a Table into a file format:
+
+- ``md``: the Markdown pipe table followed by the trailing sections (the
+  committed output, byte for byte);
+- ``csv``: CSV with a header row;
+- ``jsonl``: JSON Lines, one object per row keyed by column name.
+
+emit_table() feeds every requested emitter from a single pass over the
+rows, each writing through its own AtomicFileWriter, so extra formats cost
+no extra rendering and unchanged files are not rewritten. Trailing sections
+are Markdown prose ("## References for {id}") and only the Markdown emitter
+writes them. Cells are the text the generator produced for Markdown, so
+prose columns keep their ``<br>`` breaks and links; the flat cross-reference
+tables hold bare IDs and titles, one mapping per row.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+
+from scripts.hooks._artifact_writer import AtomicFileWriter
+from scripts.hooks._markdown_table import RowSpool, iter_pipe_table, measure_pipe_table, stream_pipe_table
+
+Cell = str | int | None
+
+
+@dataclass(frozen=True)
+class Table:
+    """
+    One generated table.
+
+    Attributes:
+        columns: Column names, in order
+        rows: Row tuples, one cell per column; may be a generator, consumed once
+        sections: Markdown written after the table by the Markdown emitter;
+            may be a generator, consumed once
+    """
+
+    columns: tuple[str, ...]
+    rows: Iterable[tuple[Cell, ...]]
+    sections: Iterable[str] = ()
+
+
+def markdown_lines(table: Table) -> Iterator[str]:
+    """Yield the Markdown document for ``table`` line by line (joined with newlines by callers)."""
+    yield from stream_pipe_table(table.columns, table.rows)
+    yield from table.sections
+
+
+class TableEmitter(ABC):
+    """
+    Writes one file format from rows pushed to it one at a time.
+
+    Attributes:
+        suffix: File suffix of the format, including the dot
+    """
+
+    suffix: str = ""
+
+    def __init__(self, out: AtomicFileWriter, columns: Sequence[str]):
+        self.out = out
+        self.columns = tuple(columns)
+
+    @abstractmethod
+    def row(self, row: tuple[Cell, ...]) -> None:
+        """Emit one row."""
+
+    def finish(self, sections: Iterable[str]) -> None:
+        """Complete the file after the last row; ``sections`` is ignored by non-Markdown formats."""
+
+    def close(self) -> None:
+        """Release temporary resources, whether or not finish() ran."""
+
+
+class MarkdownEmitter(TableEmitter):
+    """Pipe table plus trailing sections; rows are spooled until the column widths are known."""
+
+    suffix = ".md"
+
+    def __init__(self, out: AtomicFileWriter, columns: Sequence[str]):
+        super().__init__(out, columns)
+        self._spool = RowSpool()
+
+    def row(self, row: tuple[Cell, ...]) -> None:
+        self._spool.append(row)
+
+    def finish(self, sections: Iterable[str]) -> None:
+        layout = measure_pipe_table(self.columns, self._spool)
+        separator = ""
+        for line in chain(iter_pipe_table(self.columns, self._spool, layout), sections):
+            self.out.write(separator + line)
+            separator = "\n"
+
+    def close(self) -> None:
+        self._spool.close()
+
+
+class CsvEmitter(TableEmitter):
+    """CSV with a header row; None is an empty field."""
+
+    suffix = ".csv"
+
+    def __init__(self, out: AtomicFileWriter, columns: Sequence[str]):
+        super().__init__(out, columns)
+        self._writer = csv.writer(out, lineterminator="\n")
+        self._writer.writerow(self.columns)
+
+    def row(self, row: tuple[Cell, ...]) -> None:
+        self._writer.writerow(row)
+
+
+class JsonLinesEmitter(TableEmitter):
+    """One JSON object per row, keyed by column name; None is null."""
+
+    suffix = ".jsonl"
+
+    def row(self, row: tuple[Cell, ...]) -> None:
+        self.out.write(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False) + "\n")
+
+
+# Emitter registry, keyed by the names accepted by yaml_to_markdown.py --emit
+EMITTERS: dict[str, type[TableEmitter]] = {
+    "md": MarkdownEmitter,
+    "csv": CsvEmitter,
+    "jsonl": JsonLinesEmitter,
+}
+
+
+def emitter_paths(markdown_path: Path, formats: Iterable[str]) -> dict[str, Path]:
+    """
+    Map each format to its output path.
+
+    Markdown is written to ``markdown_path`` itself; every other format
+    replaces its suffix (``risks-full.md`` -> ``risks-full.csv``).
+    """
+    markdown_path = Path(markdown_path)
+    return {
+        fmt: markdown_path if fmt == "md" else markdown_path.with_suffix(EMITTERS[fmt].suffix) for fmt in formats
+    }
+
+
+def emit_table(table: Table, outputs: Mapping[str, Path]) -> list[Path]:
+    """
+    Write ``table`` in several formats from one pass over its rows.
+
+    Args:
+        table: The table to write
+        outputs: Format name (a key of EMITTERS) -> output path
+
+    Returns:
+        The output paths whose content changed, in ``outputs`` order
+
+    Raises:
+        Whatever producing the rows raises; no output file is touched then
+    """
+    writers: list[AtomicFileWriter] = []
+    with ExitStack() as stack:
+        emitters = []
+        for fmt, path in outputs.items():
+            writer = stack.enter_context(AtomicFileWriter(path))
+            emitter = EMITTERS[fmt](writer, table.columns)
+            stack.callback(emitter.close)
+            writers.append(writer)
+            emitters.append(emitter)
+
+        for row in table.rows:
+            for emitter in emitters:
+                emitter.row(row)
+        for emitter in emitters:
+            emitter.finish(table.sections)
+
+    return [writer.path for writer in writers if writer.changed]
@@ -7,13 +7,15 @@ from template sources with dynamic placeholder expansion.
 """
 
 import difflib
+import hashlib
+import json
 import subprocess
 import tempfile
 from pathlib import Path
 
 import yaml
 
-from issue_template_generator.schema_parser import SchemaParser
+from issue_template_generator.schema_parser import YAML_LOADER, SchemaParser
 from issue_template_generator.template_renderer import TemplateRenderer
 
 
@@ -36,14 +38,18 @@ class IssueTemplateGenerator:
         frameworks_data: Loaded frameworks data from YAML
         schema_parser: SchemaParser instance for schema access
         template_renderer: TemplateRenderer instance for rendering
+        fingerprint_file: Optional JSON file recording the inputs and outputs
+            of the last complete run (see generate_all_templates())
     """
 
-    def __init__(self, repo_root: Path) -> None:
+    def __init__(self, repo_root: Path, fingerprint_file: Path | None = None) -> None:
         """
         Initialize IssueTemplateGenerator.
 
         Args:
             repo_root: Path to repository root directory
+            fingerprint_file: Optional JSON file used by generate_all_templates()
+                to skip runs whose inputs and outputs are unchanged
 
         Raises:
             TypeError: If repo_root is None
@@ -59,6 +65,7 @@ class IssueTemplateGenerator:
             raise FileNotFoundError(f"Repository root '{repo_root}' does not exist")
 
         self.repo_root = repo_root
+        self.fingerprint_file = fingerprint_file
 
         # Define paths
         self.schemas_dir = repo_root / "risk-map" / "schemas"
@@ -158,13 +165,20 @@ class IssueTemplateGenerator:
 
         return entity_mappings[template_name]
 
-    def generate_template(self, template_name: str, dry_run: bool = False) -> Path | str:
+    def generate_template(
+        self,
+        template_name: str,
+        dry_run: bool = False,
+        expansions: dict[tuple[str, str], list[str] | None] | None = None,
+    ) -> Path | str:
         """
         Generate a single template.
 
         Args:
             template_name: Name of template to generate (without .template.yml)
             dry_run: If True, return diff instead of writing file
+            expansions: Optional placeholder expansion table shared with the
+                other templates of a run (see TemplateRenderer.expand_placeholders())
 
         Returns:
             If dry_run=False: Path to generated output file
@@ -195,14 +209,14 @@ class IssueTemplateGenerator:
 
         # Render template if entity_type is not None
         if entity_type is not None:
-            rendered_content = self.template_renderer.render_template(template_content, entity_type)
+            rendered_content = self.template_renderer.render_template(template_content, entity_type, expansions)
         else:
             # Infrastructure template - use as-is
             rendered_content = template_content
 
         # Validate rendered content is valid YAML (catches corrupted templates)
         try:
-            yaml.safe_load(rendered_content)
+            yaml.load(rendered_content, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Rendered template is not valid YAML: {e}") from e
 
@@ -224,6 +238,62 @@ class IssueTemplateGenerator:
         output_path.write_text(rendered_content, encoding="utf-8")
         return output_path
 
+    def input_fingerprint(self) -> str:
+        """
+        Digest everything template generation reads.
+
+        Covers the template sources, frameworks.yaml, the schema and YAML
+        files the renderer reads (see TemplateRenderer.input_paths(); the
+        personas YAML carries the deprecated IDs), and the code of this
+        package, so a generator change also counts as an input change.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        package_dir = Path(__file__).resolve().parent
+        sources = [
+            *sorted(self.templates_dir.glob("*.template.yml")),
+            self.frameworks_yaml,
+            *self.template_renderer.input_paths(),
+            *sorted(package_dir.glob("*.py")),
+        ]
+
+        sha = hashlib.sha256()
+        for path in sources:
+            sha.update(f"{path.parent.name}/{path.name}\0".encode())
+            sha.update(path.read_bytes() if path.is_file() else b"\0missing")
+            sha.update(b"\0")
+        return sha.hexdigest()
+
+    def _output_digests(self, template_names: list[str]) -> dict[str, str | None]:
+        """Map each template name to the SHA-256 of its output file, or None if it does not exist."""
+        digests: dict[str, str | None] = {}
+        for template_name in template_names:
+            try:
+                with open(self.output_dir / f"{template_name}.yml", "rb") as f:
+                    digests[template_name] = hashlib.file_digest(f, "sha256").hexdigest()
+            except FileNotFoundError:
+                digests[template_name] = None
+        return digests
+
+    def _is_up_to_date(self, inputs: str, template_names: list[str]) -> bool:
+        """Return True if fingerprint_file records ``inputs`` and the outputs are as that run left them."""
+        try:
+            recorded = json.loads(self.fingerprint_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(recorded, dict) or recorded.get("inputs") != inputs:
+            return False
+
+        return recorded.get("outputs") == self._output_digests(template_names)
+
+    def _record_fingerprint(self, inputs: str, template_names: list[str]) -> None:
+        """Record ``inputs`` and the current output digests in fingerprint_file."""
+        state = {"inputs": inputs, "outputs": self._output_digests(template_names)}
+        self.fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+        self.fingerprint_file.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+
     def _generate_diff(self, old_content: str, new_content: str, filepath: Path) -> str:
         """
         Generate unified diff between old and new content.
@@ -255,6 +325,17 @@ class IssueTemplateGenerator:
         """
         Generate all available templates.
 
+        All templates are rendered from one placeholder expansion table, so
+        each placeholder's schema lookup, deprecated-ID filtering and
+        formatting happens once per run rather than once per template.
+
+        With fingerprint_file set, a run that generates every template without
+        error (or, with dry_run, finds no differences) records the
+        input_fingerprint() and the digests of the output files. A later run
+        whose inputs still have that fingerprint, and whose outputs are
+        unchanged, returns without rendering anything: the output paths, or
+        an empty diff for every template with dry_run.
+
         Args:
             dry_run: If True, return diffs instead of writing files
 
@@ -266,15 +347,31 @@ class IssueTemplateGenerator:
         """
         templates = self.get_available_templates()
         results: dict[str, str | Path] = {}
+        expansions: dict[tuple[str, str], list[str] | None] = {}
+
+        inputs = self.input_fingerprint() if self.fingerprint_file is not None else None
+        if inputs is not None and self._is_up_to_date(inputs, templates):
+            # Nothing generation reads changed since the recorded run, and its output is untouched
+            for template_name in templates:
+                results[template_name] = "" if dry_run else self.output_dir / f"{template_name}.yml"
+            return results
 
         for template_name in templates:
             try:
-                result = self.generate_template(template_name, dry_run=dry_run)
+                result = self.generate_template(template_name, dry_run=dry_run, expansions=expansions)
                 results[template_name] = result
             except Exception as e:
                 # Store error message but continue processing other templates
                 results[template_name] = f"Error: {str(e)}"
 
+        if inputs is not None:
+            if dry_run:
+                complete = all(result == "" for result in results.values())
+            else:
+                complete = all(isinstance(result, Path) for result in results.values())
+            if complete:
+                self._record_fingerprint(inputs, templates)
+
         return results
 
     def validate_generated_template(self, template_content: str) -> bool:
@@ -11,6 +11,11 @@ from typing import Any
 
 import yaml
 
+# The libyaml-backed loader parses framework YAML and rendered templates several
+# times faster than the pure-Python one, which remains the fallback when PyYAML
+# was built without libyaml.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SchemaParser:
     """
@@ -20,6 +25,11 @@ class SchemaParser:
     enum values, required fields, and other metadata needed for generating
     GitHub issue templates.
 
+    Loaded schemas and their extract_all_enums() results are cached per
+    schema name together with the file bytes they came from; a later call
+    re-reads the file and re-parses it only if those bytes changed. Callers
+    share the cached dictionaries and must not modify them.
+
     Attributes:
         schema_dir: Path to directory containing JSON schema files
         yaml_data_dir: Optional path to directory containing YAML data files
@@ -47,11 +57,16 @@ class SchemaParser:
         self.schema_dir = schema_dir
         self.yaml_data_dir = yaml_data_dir
         self._deprecated_ids_cache: dict[tuple[str, str], set[str]] = {}
+        self._schema_cache: dict[str, tuple[bytes, dict[str, Any]]] = {}
+        self._enums_cache: dict[str, tuple[dict[str, Any], dict[str, list[str]]]] = {}
 
     def load_schema(self, schema_name: str) -> dict[str, Any]:
         """
         Load a JSON schema file.
 
+        The parsed schema is cached; it is parsed again only when the file's
+        content differs from the content it was parsed from.
+
         Args:
             schema_name: Name of schema file (e.g., "controls.schema.json")
 
@@ -67,8 +82,14 @@ class SchemaParser:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file '{schema_name}' not found in {self.schema_dir}")
 
-        with open(schema_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        raw = schema_path.read_bytes()
+        cached = self._schema_cache.get(schema_name)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+
+        schema_data = json.loads(raw.decode("utf-8"))
+        self._schema_cache[schema_name] = (raw, schema_data)
+        return schema_data
 
     def load_deprecated_ids(self, yaml_filename: str, list_key: str) -> set[str]:
         """
@@ -99,7 +120,7 @@ class SchemaParser:
         yaml_path = self.yaml_data_dir / yaml_filename
         # Let FileNotFoundError propagate naturally if the file is missing
         with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
 
         deprecated: set[str] = set()
         for entry in data.get(list_key, []):
@@ -184,7 +205,8 @@ class SchemaParser:
         Extract all enum fields from a schema.
 
         Recursively searches the schema and returns a mapping of field paths
-        to their enum values.
+        to their enum values. The result is cached until load_schema() parses
+        a changed file.
 
         Args:
             schema_name: Name of schema file to process
@@ -198,7 +220,13 @@ class SchemaParser:
             JSONDecodeError: If schema file contains invalid JSON
         """
         schema_data = self.load_schema(schema_name)
-        return self._find_all_enums(schema_data, "")
+        cached = self._enums_cache.get(schema_name)
+        if cached is not None and cached[0] is schema_data:
+            return cached[1]
+
+        enums = self._find_all_enums(schema_data, "")
+        self._enums_cache[schema_name] = (schema_data, enums)
+        return enums
 
     def _find_all_enums(self, obj: Any, path_prefix: str) -> dict[str, list[str]]:
         """
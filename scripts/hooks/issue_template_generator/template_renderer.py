@@ -6,11 +6,12 @@ templates by expanding placeholders and filtering frameworks based on applicabil
 """
 
 import re
+from pathlib import Path
 from typing import Any
 
 import yaml
 
-from .schema_parser import SchemaParser
+from .schema_parser import YAML_LOADER, SchemaParser
 
 
 class TemplateRenderer:
@@ -141,7 +142,12 @@ class TemplateRenderer:
         self.schema_parser = schema_parser
         self.frameworks_data = frameworks_data
 
-    def expand_placeholders(self, template_content: str, entity_type: str) -> str:
+    def expand_placeholders(
+        self,
+        template_content: str,
+        entity_type: str,
+        expansions: dict[tuple[str, str], list[str] | None] | None = None,
+    ) -> str:
         """
         Expand all placeholders in template with enum values.
 
@@ -152,9 +158,16 @@ class TemplateRenderer:
         - checkbox: Label-only objects (e.g., "- label: personaModelCreator")
         - None: Fallback format with label and value
 
+        Each placeholder is expanded once per call (see expand_placeholder());
+        only the indentation of each occurrence is applied per occurrence.
+
         Args:
             template_content: Raw template content with placeholders
             entity_type: Type of entity (controls, risks, components, personas)
+            expansions: Optional table of expand_placeholder() results keyed by
+                expansion_key(). Missing entries are added, so passing the same
+                table when rendering several templates expands each placeholder
+                once for all of them.
 
         Returns:
             Template content with placeholders replaced
@@ -169,164 +182,188 @@ class TemplateRenderer:
         if not template_content:
             return template_content
 
+        if expansions is None:
+            expansions = {}
+
         # Find all placeholders using regex (case-insensitive)
         pattern = r"\{\{([A-Z_]+)\}\}"
 
         def replace_placeholder(match: re.Match) -> str:
             placeholder_name = match.group(1).upper()  # Normalize to uppercase
-            full_match = match.group(0)
 
             # Get the line containing the placeholder to determine indentation
             match_start = match.start()
             line_start = template_content.rfind("\n", 0, match_start) + 1
-            line = template_content[line_start:match_start]
-            indentation = line  # Use the existing indentation before the placeholder
-
-            # Handle framework-related placeholders specially
-            if placeholder_name == "FRAMEWORK_MAPPINGS":
-                # Generate framework mapping sections as YAML
-                sections = self.expand_framework_mappings(entity_type)
-                if not sections:
-                    return ""
-
-                # Convert sections to YAML format
-                yaml_lines = []
-                for i, section in enumerate(sections):
-                    # Serialize section to YAML
-                    section_yaml = yaml.dump(section, default_flow_style=False, sort_keys=False)
-                    # Split into lines and add indentation
-                    section_lines = section_yaml.strip().split("\n")
-
-                    if i == 0:
-                        # First section - no leading indentation (replaces placeholder inline)
-                        yaml_lines.append(f"- {section_lines[0]}")
-                        yaml_lines.extend(f"{indentation}  {line}" for line in section_lines[1:])
-                    else:
-                        # Subsequent sections - add indentation
-                        yaml_lines.append(f"\n{indentation}- {section_lines[0]}")
-                        yaml_lines.extend(f"{indentation}  {line}" for line in section_lines[1:])
-
-                return "\n".join(yaml_lines)
-
-            elif placeholder_name == "CONTROL_FRAMEWORKS_LIST":
-                # Return comma-separated list of frameworks for controls
-                return self.get_frameworks_list("controls")
-
-            elif placeholder_name == "RISK_FRAMEWORKS_LIST":
-                # Return comma-separated list of frameworks for risks
-                return self.get_frameworks_list("risks")
-
-            elif placeholder_name == "COMPONENT_CATEGORY_SUBCATEGORY":
-                # Join-resolver (ADR-026 D8): derives valid (category, subcategory)
-                # pairs from the categories[].subcategory[] nesting in components.yaml.
-                # Reads the YAML taxonomy via schema_parser.yaml_data_dir so that
-                # test fixtures using a temp yaml_data_dir are honoured correctly.
-                # This must NOT use the flat schema enum (which has no pairing info)
-                # and must NOT count component instances (zero-instance subcategories
-                # must still appear per D9).
-                tuples = self._resolve_category_subcategory_tuples()
-                if not tuples:
-                    return ""
-                yaml_lines = []
-                for i, option in enumerate(tuples):
-                    # Double-quote each option: "category: subcategory" contains a
-                    # colon, which YAML parses as a mapping key without quoting.
-                    # GitHub issue-form dropdown options must be plain strings.
-                    if i == 0:
-                        yaml_lines.append(f'- "{option}"')
-                    else:
-                        yaml_lines.append(f'{indentation}- "{option}"')
-                return "\n".join(yaml_lines)
-
-            # Check if we have a mapping for this placeholder
-            if placeholder_name not in self.PLACEHOLDER_MAPPINGS:
-                # Unknown placeholder - leave as-is
-                return full_match
-
-            # Get mapping configuration
-            mapping = self.PLACEHOLDER_MAPPINGS[placeholder_name]
-            schema_paths = mapping["schema_paths"]
-            field_type = mapping.get("field_type")
-
-            # Try each path mapping until one works
-            enum_values = None
-            for schema_file, field_path in schema_paths:
-                try:
-                    # Load schema and extract enum values (let FileNotFoundError propagate)
-                    schema_data = self.schema_parser.load_schema(schema_file)
-                    enum_values = self.schema_parser.extract_enum_values(schema_data, field_path)
-                    break  # Success - stop trying other paths
-                except KeyError:
-                    # This path doesn't exist, try next one
-                    continue
-
-            if enum_values is None:
-                # None of the paths worked - leave placeholder as-is
-                return full_match
-
-            if not enum_values:
-                # Empty enum - return empty string
-                return ""
-
-            # Remove deprecated entries when the mapping declares a yaml_source
-            # and the schema_parser has a yaml_data_dir configured
-            yaml_source = mapping.get("yaml_source")
-            if yaml_source is not None and self.schema_parser.yaml_data_dir is not None:
-                deprecated_ids = self.schema_parser.load_deprecated_ids(*yaml_source)
-                enum_values = [v for v in enum_values if v not in deprecated_ids]
-
-            # Remove explicitly excluded IDs (per-mapping context exclusion).
-            # Applies after deprecated-filter; compose order:
-            #   enum_ids - deprecated_ids - exclude_ids
-            exclude_ids = mapping.get("exclude_ids", ())
-            if exclude_ids:
-                enum_values = [v for v in enum_values if v not in exclude_ids]
-
-            if not enum_values:
-                # All values were filtered out - return empty string
-                return ""
-
-            # Format based on field type
-            yaml_lines = []
+            indentation = template_content[line_start:match_start]  # Existing indentation before the placeholder
+
+            key = self.expansion_key(placeholder_name, entity_type)
+            if key not in expansions:
+                expansions[key] = self.expand_placeholder(placeholder_name, entity_type)
+            lines = expansions[key]
 
-            if field_type == "dropdown":
-                # Plain strings for dropdown fields (no label/value, no quotes)
-                for i, value in enumerate(enum_values):
-                    if i == 0:
-                        # First item - no leading indentation (replaces placeholder inline)
-                        yaml_lines.append(f"- {value}")
-                    else:
-                        # Subsequent items - add indentation to align
-                        yaml_lines.append(f"{indentation}- {value}")
-
-            elif field_type == "checkbox":
-                # Label-only objects for checkbox fields (no value field, no quotes)
-                for i, value in enumerate(enum_values):
-                    if i == 0:
-                        # First item - no leading indentation (replaces placeholder inline)
-                        yaml_lines.append(f"- label: {value}")
-                    else:
-                        # Subsequent items - add indentation to align
-                        yaml_lines.append(f"{indentation}- label: {value}")
-
-            else:
-                # Fallback for field_type=None (not used in dropdowns/checkboxes)
-                # Maintains backward compatibility for textarea content where both
-                # human-readable label and machine-readable value may be useful
-                for i, value in enumerate(enum_values):
-                    if i == 0:
-                        # First item - no leading indentation (replaces placeholder inline)
-                        yaml_lines.append(f'- label: "{value}"\n{indentation}  value: {value}')
-                    else:
-                        # Subsequent items - add indentation to align
-                        yaml_lines.append(f'{indentation}- label: "{value}"\n{indentation}  value: {value}')
-
-            return "\n".join(yaml_lines)
+            if lines is None:
+                # Unknown or unresolvable placeholder - leave as-is
+                return match.group(0)
+
+            # The first line replaces the placeholder inline; later lines are
+            # indented to align with it (blank lines stay empty).
+            return "\n".join(lines[:1] + [f"{indentation}{line}" if line else "" for line in lines[1:]])
 
         # Replace all placeholders
         result = re.sub(pattern, replace_placeholder, template_content, flags=re.IGNORECASE)
         return result
 
+    @staticmethod
+    def expansion_key(placeholder_name: str, entity_type: str) -> tuple[str, str]:
+        """
+        Key of a placeholder's expansion in an expand_placeholders() table.
+
+        {{FRAMEWORK_MAPPINGS}} depends on the entity type of the template; every
+        other placeholder expands the same way in every template.
+        """
+        return (placeholder_name, entity_type if placeholder_name == "FRAMEWORK_MAPPINGS" else "")
+
+    def expand_placeholder(self, placeholder_name: str, entity_type: str) -> list[str] | None:
+        """
+        Expand one placeholder into the lines that replace it, before indentation.
+
+        Args:
+            placeholder_name: Uppercase placeholder name (e.g., "CONTROL_CATEGORIES")
+            entity_type: Type of entity the template describes
+
+        Returns:
+            Lines of the expansion, without the indentation of the placeholder
+            (an empty list expands to nothing), or None if the placeholder is
+            unknown or none of its schema paths resolve
+
+        Raises:
+            FileNotFoundError: If required schema file is missing
+        """
+        # Handle framework-related placeholders specially
+        if placeholder_name == "FRAMEWORK_MAPPINGS":
+            # Generate framework mapping sections as YAML
+            yaml_lines = []
+            for i, section in enumerate(self.expand_framework_mappings(entity_type)):
+                # Serialize section to YAML
+                section_yaml = yaml.dump(section, default_flow_style=False, sort_keys=False)
+                # Split into lines and indent all but the first under the list item
+                section_lines = section_yaml.strip().split("\n")
+
+                if i > 0:
+                    # Separate subsequent sections with a blank line
+                    yaml_lines.append("")
+                yaml_lines.append(f"- {section_lines[0]}")
+                yaml_lines.extend(f"  {line}" for line in section_lines[1:])
+
+            return yaml_lines
+
+        elif placeholder_name == "CONTROL_FRAMEWORKS_LIST":
+            # Return comma-separated list of frameworks for controls
+            return [self.get_frameworks_list("controls")]
+
+        elif placeholder_name == "RISK_FRAMEWORKS_LIST":
+            # Return comma-separated list of frameworks for risks
+            return [self.get_frameworks_list("risks")]
+
+        elif placeholder_name == "COMPONENT_CATEGORY_SUBCATEGORY":
+            # Join-resolver (ADR-026 D8): derives valid (category, subcategory)
+            # pairs from the categories[].subcategory[] nesting in components.yaml.
+            # Reads the YAML taxonomy via schema_parser.yaml_data_dir so that
+            # test fixtures using a temp yaml_data_dir are honoured correctly.
+            # This must NOT use the flat schema enum (which has no pairing info)
+            # and must NOT count component instances (zero-instance subcategories
+            # must still appear per D9).
+            #
+            # Double-quote each option: "category: subcategory" contains a
+            # colon, which YAML parses as a mapping key without quoting.
+            # GitHub issue-form dropdown options must be plain strings.
+            return [f'- "{option}"' for option in self._resolve_category_subcategory_tuples()]
+
+        # Check if we have a mapping for this placeholder
+        if placeholder_name not in self.PLACEHOLDER_MAPPINGS:
+            # Unknown placeholder - leave as-is
+            return None
+
+        # Get mapping configuration
+        mapping = self.PLACEHOLDER_MAPPINGS[placeholder_name]
+        schema_paths = mapping["schema_paths"]
+        field_type = mapping.get("field_type")
+
+        # Try each path mapping until one works
+        enum_values = None
+        for schema_file, field_path in schema_paths:
+            try:
+                # Load schema and extract enum values (let FileNotFoundError propagate)
+                schema_data = self.schema_parser.load_schema(schema_file)
+                enum_values = self.schema_parser.extract_enum_values(schema_data, field_path)
+                break  # Success - stop trying other paths
+            except KeyError:
+                # This path doesn't exist, try next one
+                continue
+
+        if enum_values is None:
+            # None of the paths worked - leave placeholder as-is
+            return None
+
+        # Remove deprecated entries when the mapping declares a yaml_source
+        # and the schema_parser has a yaml_data_dir configured
+        yaml_source = mapping.get("yaml_source")
+        if enum_values and yaml_source is not None and self.schema_parser.yaml_data_dir is not None:
+            deprecated_ids = self.schema_parser.load_deprecated_ids(*yaml_source)
+            enum_values = [v for v in enum_values if v not in deprecated_ids]
+
+        # Remove explicitly excluded IDs (per-mapping context exclusion).
+        # Applies after deprecated-filter; compose order:
+        #   enum_ids - deprecated_ids - exclude_ids
+        exclude_ids = mapping.get("exclude_ids", ())
+        if exclude_ids:
+            enum_values = [v for v in enum_values if v not in exclude_ids]
+
+        # Format based on field type; an empty (or fully filtered) enum expands to nothing
+        if field_type == "dropdown":
+            # Plain strings for dropdown fields (no label/value, no quotes)
+            return [f"- {value}" for value in enum_values]
+
+        elif field_type == "checkbox":
+            # Label-only objects for checkbox fields (no value field, no quotes)
+            return [f"- label: {value}" for value in enum_values]
+
+        # Fallback for field_type=None (not used in dropdowns/checkboxes)
+        # Maintains backward compatibility for textarea content where both
+        # human-readable label and machine-readable value may be useful
+        return [line for value in enum_values for line in (f'- label: "{value}"', f"  value: {value}")]
+
+    def input_paths(self) -> list[Path]:
+        """
+        Files that placeholder expansion reads, besides the frameworks data.
+
+        These are the schema files named in PLACEHOLDER_MAPPINGS. With a
+        yaml_data_dir, they also include the YAML files of the yaml_source
+        entries and components.yaml, which the category/subcategory
+        join-resolver reads.
+
+        Returns:
+            Paths in a stable order; files that do not exist are included
+        """
+        schema_files = {
+            schema_file
+            for mapping in self.PLACEHOLDER_MAPPINGS.values()
+            for schema_file, _ in mapping.get("schema_paths", ())
+        }
+        paths = [self.schema_parser.schema_dir / name for name in sorted(schema_files)]
+
+        yaml_data_dir = self.schema_parser.yaml_data_dir
+        if yaml_data_dir is not None:
+            yaml_files = {
+                mapping["yaml_source"][0]
+                for mapping in self.PLACEHOLDER_MAPPINGS.values()
+                if "yaml_source" in mapping
+            }
+            yaml_files.add("components.yaml")
+            paths.extend(yaml_data_dir / name for name in sorted(yaml_files))
+
+        return paths
+
     def filter_frameworks_by_applicability(self, entity_type: str) -> list[str]:
         """
         Filter frameworks applicable to entity_type.
@@ -462,7 +499,7 @@ class TemplateRenderer:
             return []
 
         with open(components_path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=YAML_LOADER)
 
         tuples: list[str] = []
         for category in data.get("categories", []):
@@ -473,7 +510,12 @@ class TemplateRenderer:
                     tuples.append(f"{cat_id}: {sub_id}")
         return tuples
 
-    def render_template(self, template_content: str, entity_type: str) -> str:
+    def render_template(
+        self,
+        template_content: str,
+        entity_type: str,
+        expansions: dict[tuple[str, str], list[str] | None] | None = None,
+    ) -> str:
         """
         Main template rendering method.
 
@@ -483,6 +525,8 @@ class TemplateRenderer:
         Args:
             template_content: Raw template content
             entity_type: Type of entity (controls, risks, components, personas)
+            expansions: Optional placeholder expansion table shared across
+                templates (see expand_placeholders())
 
         Returns:
             Fully rendered template content
@@ -496,6 +540,6 @@ class TemplateRenderer:
             raise ValueError(f"Invalid entity type: {entity_type}. Must be one of {self.VALID_ENTITY_TYPES}")
 
         # Expand placeholders
-        result = self.expand_placeholders(template_content, entity_type)
+        result = self.expand_placeholders(template_content, entity_type, expansions)
 
         return result
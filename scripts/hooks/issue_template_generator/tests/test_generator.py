@@ -10,6 +10,7 @@ Test Coverage:
 - Template discovery and entity type mapping
 - Single template generation
 - Batch template generation (all templates)
+- Fingerprint skip of unchanged batch runs
 - Template validation (YAML + GitHub schema)
 - Dry-run mode with diff comparison
 - CLI argument parsing and execution
@@ -769,6 +770,24 @@ class TestBatchGeneration:
         # Failed template might be in result with error message or excluded
         assert len(result) >= 8
 
+    def test_generate_all_templates_expands_each_placeholder_once(self, mock_repo_root: Path) -> None:
+        """
+        Test that generate_all_templates() renders every template from one expansion table.
+
+        Given: Templates that share placeholders
+        When: generate_all_templates() is called
+        Then: Each placeholder (per entity type for {{FRAMEWORK_MAPPINGS}}) is expanded once
+        """
+        generator = IssueTemplateGenerator(mock_repo_root)
+        renderer = generator.template_renderer
+
+        with patch.object(renderer, "expand_placeholder", wraps=renderer.expand_placeholder) as expand:
+            generator.generate_all_templates()
+
+        keys = [renderer.expansion_key(*call.args) for call in expand.call_args_list]
+        assert keys
+        assert len(keys) == len(set(keys))
+
     def test_generate_all_templates_reports_progress(self, mock_repo_root: Path, capsys) -> None:
         """
         Test that generate_all_templates() reports progress (optional).
@@ -784,6 +803,94 @@ class TestBatchGeneration:
         assert len(result) == 9
 
 
+class TestFingerprintSkip:
+    """Test generate_all_templates() with a fingerprint file."""
+
+    def test_unchanged_run_skips_rendering(self, mock_repo_root: Path, tmp_path: Path) -> None:
+        """
+        Test that a run with unchanged inputs and outputs renders nothing.
+
+        Given: A complete run recorded in a fingerprint file
+        When: generate_all_templates() runs again with a new generator
+        Then: No template is rendered and every result is the existing output path
+        """
+        fingerprint_file = tmp_path / "cache" / "fingerprint.json"
+        first = IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file).generate_all_templates()
+
+        generator = IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file)
+        with patch.object(generator.template_renderer, "render_template") as render:
+            result = generator.generate_all_templates()
+
+        render.assert_not_called()
+        assert result == first
+
+    def test_dry_run_reuses_fingerprint(self, mock_repo_root: Path, tmp_path: Path) -> None:
+        """
+        Test that dry-run skips diffing when the recorded run is still current.
+
+        Given: A complete run recorded in a fingerprint file
+        When: generate_all_templates(dry_run=True) is called
+        Then: No template is rendered and every diff is empty
+        """
+        fingerprint_file = tmp_path / "fingerprint.json"
+        IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file).generate_all_templates()
+
+        generator = IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file)
+        with patch.object(generator.template_renderer, "render_template") as render:
+            result = generator.generate_all_templates(dry_run=True)
+
+        render.assert_not_called()
+        assert set(result.values()) == {""}
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            "scripts/TEMPLATES/new_control.template.yml",
+            "risk-map/yaml/frameworks.yaml",
+            "risk-map/schemas/personas.schema.json",
+            ".github/ISSUE_TEMPLATE/update_risk.yml",
+        ],
+    )
+    def test_changed_input_or_output_regenerates(self, mock_repo_root: Path, tmp_path: Path, edit: str) -> None:
+        """
+        Test that a changed input, or a hand-edited output, is not skipped.
+
+        Given: A complete run recorded in a fingerprint file
+        When: A template source, frameworks.yaml, a referenced schema or an output file changes
+        Then: The next run renders the templates again and restores the outputs
+        """
+        fingerprint_file = tmp_path / "fingerprint.json"
+        IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file).generate_all_templates()
+        expected = (mock_repo_root / ".github" / "ISSUE_TEMPLATE" / "update_risk.yml").read_text()
+        edited = mock_repo_root / edit
+        edited.write_text(edited.read_text() + "\n")
+
+        generator = IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file)
+        with patch.object(
+            generator.template_renderer, "render_template", wraps=generator.template_renderer.render_template
+        ) as render:
+            generator.generate_all_templates()
+
+        assert render.called
+        assert (mock_repo_root / ".github" / "ISSUE_TEMPLATE" / "update_risk.yml").read_text() == expected
+
+    def test_failed_run_is_not_recorded(self, mock_repo_root: Path, tmp_path: Path) -> None:
+        """
+        Test that a run with a failing template records no fingerprint.
+
+        Given: A template whose name has no entity mapping
+        When: generate_all_templates() is called with a fingerprint file
+        Then: The failure is reported and no fingerprint file is written
+        """
+        (mock_repo_root / "scripts" / "TEMPLATES" / "unknown.template.yml").write_text("name: Unknown\n")
+        fingerprint_file = tmp_path / "fingerprint.json"
+
+        result = IssueTemplateGenerator(mock_repo_root, fingerprint_file=fingerprint_file).generate_all_templates()
+
+        assert str(result["unknown"]).startswith("Error:")
+        assert not fingerprint_file.exists()
+
+
 class TestTemplateValidation:
     """Test validate_generated_template() method."""
 
@@ -174,6 +174,28 @@ class TestLoadSchema:
         assert result == schema_data
         assert isinstance(result, dict)
 
+    def test_load_schema_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        """
+        Test that a loaded schema is cached until its file content changes.
+
+        Given: A schema file loaded once
+        When: load_schema() is called again, then again after the file is rewritten
+        Then: The second call returns the cached object; the third returns the new content
+        """
+        schema_dir = tmp_path / "schemas"
+        schema_dir.mkdir()
+        schema_file = schema_dir / "test.schema.json"
+        schema_file.write_text(json.dumps({"enum": ["a"]}))
+
+        parser = SchemaParser(schema_dir)
+        first = parser.load_schema("test.schema.json")
+
+        assert parser.load_schema("test.schema.json") is first
+
+        schema_file.write_text(json.dumps({"enum": ["b"]}))
+
+        assert parser.load_schema("test.schema.json") == {"enum": ["b"]}
+
     def test_load_schema_with_nested_definitions(self, tmp_path: Path) -> None:
         """
         Test loading schema with nested definitions.
@@ -1078,6 +1100,33 @@ class TestExtractAllEnums:
         assert "properties.status" in result
         assert result["properties.status"] == ["active", "inactive"]
 
+    def test_extract_all_enums_cached_until_schema_changes(self, tmp_path: Path) -> None:
+        """
+        Test that extract_all_enums() results are cached per schema content.
+
+        Given: Enums extracted once from a schema file
+        When: extract_all_enums() is called again, then again after the file gains an enum
+        Then: The second call returns the cached result; the third includes the new enum
+        """
+        schema_dir = tmp_path / "schemas"
+        schema_dir.mkdir()
+        schema_file = schema_dir / "single.schema.json"
+        schema_file.write_text(json.dumps({"properties": {"status": {"enum": ["active"]}}}))
+
+        parser = SchemaParser(schema_dir)
+        first = parser.extract_all_enums("single.schema.json")
+
+        assert parser.extract_all_enums("single.schema.json") is first
+
+        schema_file.write_text(
+            json.dumps({"properties": {"status": {"enum": ["active"]}, "kind": {"enum": ["new"]}}})
+        )
+
+        assert parser.extract_all_enums("single.schema.json") == {
+            "properties.status": ["active"],
+            "properties.kind": ["new"],
+        }
+
 
 class TestSchemaParserIntegration:
     """Test SchemaParser with real production schemas."""
@@ -1704,6 +1704,56 @@ class TestFrameworkMappingsEdgeCases:
             renderer.expand_framework_mappings(None)
 
 
+class TestSharedExpansionTable:
+    """Test expand_placeholders() with an expansion table shared across templates."""
+
+    def test_shared_table_expands_each_placeholder_once(
+        self, sample_schema_parser: SchemaParser, sample_frameworks_data: dict[str, Any], monkeypatch
+    ) -> None:
+        """
+        Test that templates rendered with one table reuse each placeholder's expansion.
+
+        Given: Two templates using {{PERSONAS}} at different indentations
+        When: Both are expanded with the same expansions table
+        Then: The placeholder is expanded once, and each occurrence is indented to its own position
+        """
+        renderer = TemplateRenderer(sample_schema_parser, sample_frameworks_data)
+        calls = []
+        real_expand = renderer.expand_placeholder
+
+        def spy(placeholder_name: str, entity_type: str):
+            calls.append(placeholder_name)
+            return real_expand(placeholder_name, entity_type)
+
+        monkeypatch.setattr(renderer, "expand_placeholder", spy)
+        expansions: dict = {}
+
+        controls = renderer.expand_placeholders("options:\n  {{PERSONAS}}", "controls", expansions)
+        risks = renderer.expand_placeholders("options:\n      {{PERSONAS}}", "risks", expansions)
+
+        assert calls == ["PERSONAS"]
+        assert controls == "options:\n  - label: personaModelCreator\n  - label: personaModelConsumer"
+        assert risks == "options:\n      - label: personaModelCreator\n      - label: personaModelConsumer"
+
+    def test_shared_table_keeps_framework_mappings_per_entity_type(
+        self, sample_schema_parser: SchemaParser, sample_frameworks_data: dict[str, Any]
+    ) -> None:
+        """
+        Test that {{FRAMEWORK_MAPPINGS}} is not shared between entity types.
+
+        Given: One expansions table
+        When: {{FRAMEWORK_MAPPINGS}} is expanded for controls and then for risks
+        Then: Each result matches expanding that entity type without a table
+        """
+        renderer = TemplateRenderer(sample_schema_parser, sample_frameworks_data)
+        template = "body:\n  {{FRAMEWORK_MAPPINGS}}\n"
+        expansions: dict = {}
+
+        for entity_type in ("controls", "risks"):
+            shared = renderer.expand_placeholders(template, entity_type, expansions)
+            assert shared == renderer.expand_placeholders(template, entity_type)
+
+
 class TestRenderTemplate:
     """Test render_template() main method."""
 
@@ -31,9 +31,7 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import jsonschema
 import yaml
-from jsonschema import ValidationError as JSONSchemaValidationError
 
 # ---------------------------------------------------------------------------
 # Repo-relative default paths (resolved from this file's location)
@@ -277,16 +275,13 @@ def compose_pinned_value(
             candidate = f"{ref}@{version}"
 
     # Step 5: final schema validation.
-    if sub_schema is not None:
-        try:
-            jsonschema.validate(instance=candidate, schema=sub_schema)
-        except JSONSchemaValidationError:
-            raise InvalidRefError(
-                f"Framework {framework_id!r}: ref {ref!r} (version {version!r}) "
-                f"produced candidate {candidate!r} which does not validate against "
-                "the pinned subschema. Check that the ref is in the correct form "
-                "and the version is recognized."
-            )
+    if sub_schema is not None and not _validates(candidate, sub_schema):
+        raise InvalidRefError(
+            f"Framework {framework_id!r}: ref {ref!r} (version {version!r}) "
+            f"produced candidate {candidate!r} which does not validate against "
+            "the pinned subschema. Check that the ref is in the correct form "
+            "and the version is recognized."
+        )
 
     return candidate
 
@@ -306,14 +301,28 @@ def _try_delimiters(ref: str, version: str, sub_schema: dict[str, Any] | None) -
         return None
     for delim in ("@", ":"):
         candidate = f"{ref}{delim}{version}"
-        try:
-            jsonschema.validate(instance=candidate, schema=sub_schema)
+        if _validates(candidate, sub_schema):
             return candidate
-        except JSONSchemaValidationError:
-            continue
     return None
 
 
+def _validates(instance: Any, sub_schema: dict[str, Any]) -> bool:
+    """
+    Return True if `instance` validates against `sub_schema`.
+
+    jsonschema is imported on first use rather than at module import: it
+    dominates this module's import time, and the hooks that import this
+    module exit early on most commits without validating anything.
+    """
+    import jsonschema
+
+    try:
+        jsonschema.validate(instance=instance, schema=sub_schema)
+    except jsonschema.ValidationError:
+        return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # split_pinned_value
 # ---------------------------------------------------------------------------
@@ -372,11 +381,8 @@ def split_pinned_value(
         if ver_token not in recognized:
             continue
         # Belt-and-suspenders: validate the recomposition against the schema.
-        if sub_schema is not None:
-            try:
-                jsonschema.validate(instance=value, schema=sub_schema)
-            except JSONSchemaValidationError:
-                continue
+        if sub_schema is not None and not _validates(value, sub_schema):
+            continue
         return (base_ref, ver_token)
 
     raise InvalidRefError(
@@ -493,13 +499,10 @@ def migrate_legacy_value(
     # return unchanged. A missing/None subschema means no pinned validation exists
     # for this framework, so we treat it as "not yet pinned" and proceed.
     sub_schema = pinned_patterns.get(framework_id)
-    if sub_schema is not None:
-        try:
-            jsonschema.validate(instance=value, schema=sub_schema)
-            # Value already validates against the pinned subschema — idempotent.
-            return (value, False)
-        except JSONSchemaValidationError:
-            pass  # Not yet pinned; fall through to respell logic.
+    if sub_schema is not None and _validates(value, sub_schema):
+        # Value already validates against the pinned subschema — idempotent.
+        return (value, False)
+    # Otherwise not yet pinned; fall through to respell logic.
 
     # Respell the base_ref per framework.
     if framework_id == "nist-ai-rmf":
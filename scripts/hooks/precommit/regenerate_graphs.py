@@ -3,39 +3,51 @@
 Pre-commit framework hook that regenerates Mermaid graph files when source YAML files change.
 
 Invoked by the pre-commit framework with staged filenames as positional argv (pass_filenames:
-true). Regenerates the appropriate graphs via validate_riskmap.py and git-adds them so they
-land in the same commit as the source change (Mode B auto-stage).
+true). The graphs to rebuild, and the files each one reads, come from the artifact graph in
+scripts/hooks/_artifact_graph.py, which also schedules the build. Stale graphs are regenerated
+concurrently via validate_riskmap.py; a graph whose .mermaid output changed then gets its SVG
+re-rendered with regenerate_svgs.render(). The outputs whose content changed, diagrams and SVGs
+alike, are git-added in one call, so they land in the same commit as the source change (Mode B
+auto-stage).
 """
 
 import subprocess
 import sys
+from pathlib import Path
 
-# Source YAML triggers (repo-relative, as pre-commit framework passes them)
-_COMPONENTS = "risk-map/yaml/components.yaml"
-_CONTROLS = "risk-map/yaml/controls.yaml"
-_RISKS = "risk-map/yaml/risks.yaml"
+# Make the repo root importable so `scripts.hooks.*` resolves when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
 
-# Output file paths (repo-relative)
-_RISK_MAP_MD = "risk-map/diagrams/risk-map-graph.md"
-_RISK_MAP_MERMAID = "risk-map/diagrams/risk-map-graph.mermaid"
+from scripts.hooks._artifact_graph import ARTIFACT_GRAPH, Artifact  # noqa: E402
+from scripts.hooks.precommit import regenerate_svgs  # noqa: E402
 
-_CONTROLS_MD = "risk-map/diagrams/controls-graph.md"
-_CONTROLS_MERMAID = "risk-map/diagrams/controls-graph.mermaid"
+_VALIDATOR = "scripts/hooks/validate_riskmap.py"
 
-_RISK_GRAPH_MD = "risk-map/diagrams/controls-to-risk-graph.md"
-_RISK_GRAPH_MERMAID = "risk-map/diagrams/controls-to-risk-graph.mermaid"
 
-_VALIDATOR = "scripts/hooks/validate_riskmap.py"
+def _generate(graph: Artifact) -> int:
+    """Regenerate one graph's .md and .mermaid outputs and return the validator's exit code."""
+    markdown_file = graph.outputs[0]
+    return subprocess.run(["python3", _VALIDATOR, graph.target, markdown_file, "-m", "--quiet"]).returncode
+
+
+def _render_svg(svg: Artifact) -> int:
+    """Render one SVG from its graph's .mermaid output and return the renderer's exit code."""
+    exit_code, _ = regenerate_svgs.render(list(svg.inputs))
+    return exit_code
 
 
-def _matches(argv: list[str], target: str) -> bool:
-    """Return True if any path in argv ends with the repo-relative target path."""
-    return any(p.endswith(target) for p in argv)
+def _build(artifact: Artifact) -> int:
+    """Build one graph or SVG artifact; ArtifactGraph.build() collects what changed."""
+    if artifact.kind == "svg":
+        return _render_svg(artifact)
+    return _generate(artifact)
 
 
 def main(argv: list[str]) -> int:
     """
-    Regenerate Mermaid graphs for any staged YAML source files and git-add the outputs.
+    Regenerate Mermaid graphs and their SVGs for any staged YAML source files and git-add the outputs.
 
     Args:
         argv: List of staged file paths passed by the pre-commit framework.
@@ -43,54 +55,12 @@ def main(argv: list[str]) -> int:
     Returns:
         0 if all attempted generations and git-adds succeeded, non-zero otherwise.
     """
-    has_components = _matches(argv, _COMPONENTS)
-    has_controls = _matches(argv, _CONTROLS)
-    has_risks = _matches(argv, _RISKS)
-
-    # Determine which graphs need to be generated based on trigger logic
-    gen_risk_map = has_components
-    gen_controls = has_components or has_controls
-    gen_risk_graph = has_components or has_controls or has_risks
-
-    if not (gen_risk_map or gen_controls or gen_risk_graph):
-        return 0
-
-    exit_code = 0
-
-    # Generation 1: risk-map-graph (triggered by components.yaml)
-    if gen_risk_map:
-        cmd = ["python3", _VALIDATOR, "--to-graph", _RISK_MAP_MD, "-m", "--quiet"]
-        result = subprocess.run(cmd)
-        if result.returncode == 0:
-            git_result = subprocess.run(["git", "add", _RISK_MAP_MD, _RISK_MAP_MERMAID])
-            if git_result.returncode != 0 and exit_code == 0:
-                exit_code = git_result.returncode
-        elif exit_code == 0:
-            exit_code = result.returncode
-
-    # Generation 2: controls-graph (triggered by components.yaml OR controls.yaml)
-    if gen_controls:
-        cmd = ["python3", _VALIDATOR, "--to-controls-graph", _CONTROLS_MD, "-m", "--quiet"]
-        result = subprocess.run(cmd)
-        if result.returncode == 0:
-            git_result = subprocess.run(["git", "add", _CONTROLS_MD, _CONTROLS_MERMAID])
-            if git_result.returncode != 0 and exit_code == 0:
-                exit_code = git_result.returncode
-        elif exit_code == 0:
-            exit_code = result.returncode
-
-    # Generation 3: controls-to-risk-graph (triggered by any of the three source files)
-    if gen_risk_graph:
-        cmd = ["python3", _VALIDATOR, "--to-risk-graph", _RISK_GRAPH_MD, "-m", "--quiet"]
-        result = subprocess.run(cmd)
-        if result.returncode == 0:
-            git_result = subprocess.run(["git", "add", _RISK_GRAPH_MD, _RISK_GRAPH_MERMAID])
-            if git_result.returncode != 0 and exit_code == 0:
-                exit_code = git_result.returncode
-        elif exit_code == 0:
-            exit_code = result.returncode
+    result = ARTIFACT_GRAPH.build(dict.fromkeys(argv), _build, kinds={"graph", "svg"})
 
-    return exit_code
+    git_returncode = result.artifacts.stage()
+    if git_returncode != 0 and result.exit_code == 0:
+        return git_returncode
+    return result.exit_code
 
 
 if __name__ == "__main__":
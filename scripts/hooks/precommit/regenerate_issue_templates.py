@@ -3,22 +3,41 @@
 Pre-commit framework hook that regenerates GitHub Issue Templates.
 
 Invoked by the pre-commit framework without filenames (pass_filenames: false
-in .pre-commit-config.yaml). The framework's `files:` regex decides when to
-call this wrapper; when called, the wrapper unconditionally regenerates the
-templates and git-adds the output directory (Mode B auto-stage). argv is
-ignored, making the wrapper safe to invoke directly from the CLI.
+in .pre-commit-config.yaml). The framework's `files:` regex, which covers the
+inputs declared for the issue templates in scripts/hooks/_artifact_graph.py,
+decides when to call this wrapper; when called, the wrapper unconditionally
+regenerates the templates and git-adds the template files whose content
+changed, in one call (Mode B auto-stage). argv is ignored, making the wrapper
+safe to invoke directly from the CLI.
+
+The generator keeps a fingerprint of its inputs and outputs in the cache
+directory and returns without rendering when neither changed since its last
+complete run, which is the common case for commits that touch a trigger file
+without affecting any template.
+
+Environment:
+    ISSUE_TEMPLATE_CACHE_DIR: Cache directory (default: $XDG_CACHE_HOME or ~/.cache, then
+        secure-ai-tooling/issue-templates).
 """
 
 import subprocess
 import sys
+from pathlib import Path
+
+# Make the repo root importable so `scripts.hooks.*` resolves when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.hooks._artifact_graph import ARTIFACT_GRAPH  # noqa: E402
+from scripts.hooks._artifact_writer import ArtifactWriter, user_cache_dir  # noqa: E402
 
 _CMD_GENERATE = ["python3", "scripts/generate_issue_templates.py"]
-_GIT_ADD_TEMPLATES = ["git", "add", ".github/ISSUE_TEMPLATE"]
 
 
 def main(argv: list[str]) -> int:
     """
-    Regenerate issue templates and git-add the output directory.
+    Regenerate issue templates and git-add the templates that changed.
 
     Args:
         argv: Ignored. The pre-commit framework is the scheduler; reaching
@@ -26,19 +45,20 @@ def main(argv: list[str]) -> int:
 
     Returns:
         0 if both generation and git-add succeeded, the first non-zero
-        returncode otherwise.
+        returncode otherwise. git is not run when no template changed.
     """
     del argv  # scheduler is the framework; argv adds no information
 
-    result = subprocess.run(_CMD_GENERATE)
+    artifacts = ArtifactWriter()
+    artifacts.watch(ARTIFACT_GRAPH["issue-templates"].outputs)
+
+    fingerprint = user_cache_dir("ISSUE_TEMPLATE_CACHE_DIR", "issue-templates") / "fingerprint.json"
+    result = subprocess.run([*_CMD_GENERATE, "--fingerprint-file", str(fingerprint)])
     if result.returncode != 0:
         return result.returncode
 
-    git_result = subprocess.run(_GIT_ADD_TEMPLATES)
-    if git_result.returncode != 0:
-        return git_result.returncode
-
-    return 0
+    artifacts.collect()
+    return artifacts.stage()
 
 
 if __name__ == "__main__":
@@ -6,16 +6,46 @@ Invoked by the pre-commit framework with staged filenames as positional argv (pa
 true). Converts .mmd/.mermaid files under risk-map/diagrams/ to SVGs under risk-map/svg/ via
 the Mermaid CLI (mmdc) and git-adds them so they land in the same commit as the source change
 (Mode B auto-stage).
+
+Rendering is batched and cached:
+
+- Every diagram is keyed by a SHA-256 over its Mermaid source, the mmdc render flags, the
+  puppeteer config and the renderer identity: the renderer command plus the mermaid-cli and
+  mermaid versions installed under node_modules (or, without them, the renderer's
+  ``--version`` output), read once per run. Upgrading mermaid-cli therefore re-renders every
+  diagram instead of restoring SVGs from the old version. A key already in the SVG cache is
+  copied into place without invoking mmdc.
+- All cache misses are rendered in a single mmdc/Chromium session by wrapping them as fenced
+  blocks in one markdown input (mmdc writes ``<out>-1.svg``, ``<out>-2.svg``, ...). If the batch
+  fails, the misses are retried one file at a time so a single broken diagram does not block the
+  rest and its error is attributable.
+- Outputs are written only when their bytes change, and every changed SVG is staged with a
+  single ``git add`` (no git call when nothing changed).
+
+Environment:
+    CHROMIUM_PATH: Explicit Chromium binary for puppeteer.
+    MERMAID_RENDERER: Renderer command replacing ``npx mmdc`` (e.g. a stub executable in tests).
+    SVG_RENDER_CACHE_DIR: SVG cache directory (default: $XDG_CACHE_HOME or ~/.cache, then
+        secure-ai-tooling/mermaid-svg).
 """
 
+import hashlib
 import json
 import os
 import platform
+import shlex
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
+# Make the repo root importable so `scripts.hooks.*` resolves when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.hooks._artifact_writer import ArtifactWriter, user_cache_dir, write_if_changed  # noqa: E402
+
 _DIAGRAMS_DIR = "risk-map/diagrams"
 _SVG_DIR = "risk-map/svg"
 
@@ -23,6 +53,16 @@ _PUPPETEER_ARGS = ["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-sh
 
 _MERMAID_EXTENSIONS = (".mmd", ".mermaid")
 
+_DEFAULT_RENDERER = ["npx", "mmdc"]
+_RENDER_FLAGS = ["-t", "neutral", "-b", "transparent"]
+
+# Bump when the cache key inputs or the batch protocol change.
+_CACHE_VERSION = "2"
+
+# Packages whose installed versions identify the default renderer, for the cache key.
+_NODE_MODULES = _REPO_ROOT / "node_modules"
+_RENDERER_PACKAGES = ("@mermaid-js/mermaid-cli", "mermaid")
+
 
 def _build_puppeteer_config(chromium_path: str | None) -> dict:
     """
@@ -117,66 +157,236 @@ def _discover_chromium() -> str | None:
     return None
 
 
-def main(argv: list[str]) -> int:
+def _renderer_command() -> list[str]:
     """
-    Convert staged Mermaid files to SVG and git-add the outputs.
+    Return the renderer command prefix.
+
+    MERMAID_RENDERER (if set and non-empty) is split with shell rules and replaces the default
+    ``npx mmdc``; any replacement must accept the same flags as mmdc.
+    """
+    override = os.environ.get("MERMAID_RENDERER")
+    if override:
+        return shlex.split(override)
+    return list(_DEFAULT_RENDERER)
+
+
+def _renderer_identity(command: list[str]) -> str:
+    """
+    Identify the renderer that produces the SVGs, for the cache key.
+
+    The identity is ``command`` plus the versions of the mermaid-cli and mermaid packages
+    installed under node_modules. When mermaid-cli is not installed there (npx then fetches
+    it), the renderer's own ``--version`` output is used instead; a renderer that cannot
+    report one leaves only the command.
+    """
+    versions = []
+    for package in _RENDERER_PACKAGES:
+        try:
+            manifest = json.loads((_NODE_MODULES / package / "package.json").read_text(encoding="utf-8"))
+            versions.append(f"{package}@{manifest['version']}")
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    if not versions:
+        try:
+            result = subprocess.run([*command, "--version"], capture_output=True, text=True)
+        except OSError:
+            result = None
+        if result is not None and result.returncode == 0:
+            versions.append(result.stdout.strip())
+    return "\0".join([shlex.join(command), *versions])
 
-    One puppeteer config temp file is created per invocation and shared across all
-    input files. The temp file is cleaned up in a finally block regardless of outcome.
+
+def _cache_key(source: bytes, config: dict, renderer: str) -> str:
+    """
+    Compute the content-hash cache key for one diagram.
 
     Args:
-        argv: List of staged file paths passed by the pre-commit framework.
+        source: Raw Mermaid source bytes.
+        config: Puppeteer config dict passed to mmdc.
+        renderer: Renderer identity from _renderer_identity().
 
     Returns:
-        0 if all conversions and git-adds succeeded, non-zero otherwise.
+        Hex SHA-256 over the cache version, renderer, render flags, config and source.
     """
-    mermaid_files = [p for p in argv if _is_mermaid_file(p)]
+    digest = hashlib.sha256()
+    digest.update(f"v{_CACHE_VERSION}\0".encode())
+    digest.update(renderer.encode())
+    digest.update(b"\0")
+    digest.update("\0".join(_RENDER_FLAGS).encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    digest.update(b"\0")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def _store_in_cache(output_file: str, key: str) -> None:
+    """Copy a freshly rendered SVG into the cache; cache failures never fail the hook."""
+    try:
+        cached = user_cache_dir("SVG_RENDER_CACHE_DIR", "mermaid-svg") / f"{key}.svg"
+        write_if_changed(cached, Path(output_file).read_bytes())
+    except OSError:
+        pass
 
-    if not mermaid_files:
-        return 0
 
+def _render_one(input_file: str, output_file: str, config_path: str) -> int:
+    """Render a single Mermaid file with its own mmdc invocation. Returns the renderer exit code."""
+    mmdc_cmd = _renderer_command() + ["-i", input_file, "-o", output_file] + _RENDER_FLAGS + ["-p", config_path]
+    return subprocess.run(mmdc_cmd).returncode
+
+
+def _render_batch(jobs: list[tuple[str, str, bytes]], config_path: str, artifacts: ArtifactWriter) -> bool:
+    """
+    Render several diagrams in one mmdc session.
+
+    The sources are wrapped as fenced ``mermaid`` blocks in a temporary markdown file; mmdc
+    renders each block to ``<out>-<n>.svg`` (1-based, in block order) with one browser launch.
+
+    Args:
+        jobs: (input_file, output_file, source) triples, in render order.
+        config_path: Puppeteer config file path.
+        artifacts: Writer that places each SVG (skipping unchanged ones) and records changes.
+
+    Returns:
+        True when the renderer succeeded and produced every expected SVG (which are then moved
+        into place), False otherwise (nothing is moved).
+    """
+    with tempfile.TemporaryDirectory(prefix="regenerate-svgs-") as batch_dir:
+        batch_input = Path(batch_dir) / "batch.md"
+        batch_output = Path(batch_dir) / "batch.svg"
+
+        blocks = []
+        for _, _, source in jobs:
+            text = source.decode("utf-8").rstrip("\n")
+            blocks.append(f"```mermaid\n{text}\n```\n")
+        batch_input.write_text("\n".join(blocks), encoding="utf-8")
+
+        mmdc_cmd = (
+            _renderer_command()
+            + ["-i", str(batch_input), "-o", str(batch_output)]
+            + _RENDER_FLAGS
+            + ["-p", config_path]
+        )
+        if subprocess.run(mmdc_cmd).returncode != 0:
+            return False
+
+        rendered = [Path(batch_dir) / f"batch-{n}.svg" for n in range(1, len(jobs) + 1)]
+        if not all(path.exists() for path in rendered):
+            return False
+
+        for path, (_, output_file, _) in zip(rendered, jobs):
+            artifacts.write(Path(output_file), path.read_bytes())
+        return True
+
+
+def render(mermaid_files: list[str]) -> tuple[int, ArtifactWriter]:
+    """
+    Convert Mermaid files to SVG without staging them.
+
+    Diagrams whose content-hash key is cached are restored without rendering. Remaining
+    diagrams are rendered in one batched mmdc call (or one direct call when only a single
+    diagram needs rendering), falling back to per-file rendering if the batch fails. One
+    puppeteer config temp file is shared across all renderer calls and cleaned up in a
+    finally block regardless of outcome.
+
+    Args:
+        mermaid_files: Mermaid sources under risk-map/diagrams/.
+
+    Returns:
+        The first non-zero renderer exit code (0 if every diagram rendered) and the
+        ArtifactWriter holding the SVGs that changed.
+    """
     chromium_path = _discover_chromium()
     config = _build_puppeteer_config(chromium_path)
+    cache_dir = user_cache_dir("SVG_RENDER_CACHE_DIR", "mermaid-svg")
+    renderer = _renderer_identity(_renderer_command())
 
-    # One shared temp config for the entire invocation (mirrors bash behaviour)
-    tmp = tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".json")
-    config_path = tmp.name
-    try:
-        json.dump(config, tmp)
-        tmp.close()
-
-        exit_code = 0
-
-        for input_file in mermaid_files:
-            output_file = _output_path(input_file)
-
-            mmdc_cmd = [
-                "npx",
-                "mmdc",
-                "-i",
-                input_file,
-                "-o",
-                output_file,
-                "-t",
-                "neutral",
-                "-b",
-                "transparent",
-                "-p",
-                config_path,
-            ]
-
-            result = subprocess.run(mmdc_cmd)
-            if result.returncode == 0:
-                git_result = subprocess.run(["git", "add", output_file])
-                if git_result.returncode != 0 and exit_code == 0:
-                    exit_code = git_result.returncode
-            elif exit_code == 0:
-                exit_code = result.returncode
-    finally:
+    exit_code = 0
+    artifacts = ArtifactWriter()
+    # (input_file, output_file, source or None if unreadable, cache key or None)
+    misses: list[tuple[str, str, bytes | None, str | None]] = []
+
+    for input_file in mermaid_files:
+        output_file = _output_path(input_file)
         try:
-            os.unlink(config_path)
+            source = Path(input_file).read_bytes()
         except OSError:
-            pass
+            # Let the renderer report the problem in its own words.
+            misses.append((input_file, output_file, None, None))
+            continue
+
+        key = _cache_key(source, config, renderer)
+        cached = cache_dir / f"{key}.svg"
+        if cached.is_file():
+            try:
+                artifacts.write(Path(output_file), cached.read_bytes())
+                continue
+            except OSError:
+                pass
+        misses.append((input_file, output_file, source, key))
+
+    if misses:
+        # One shared temp config for the entire invocation (mirrors bash behaviour)
+        tmp = tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".json")
+        config_path = tmp.name
+        try:
+            json.dump(config, tmp)
+            tmp.close()
+
+            rendered: list[tuple[str, str | None]] = []
+            batchable = [(i, o, s) for i, o, s, _ in misses if s is not None]
+
+            if (
+                len(misses) > 1
+                and len(batchable) == len(misses)
+                and _render_batch(batchable, config_path, artifacts)
+            ):
+                rendered = [(o, k) for _, o, _, k in misses]
+            else:
+                for input_file, output_file, _, key in misses:
+                    # mmdc writes the output itself; compare digests around the call.
+                    artifacts.watch([output_file])
+                    returncode = _render_one(input_file, output_file, config_path)
+                    if returncode == 0:
+                        artifacts.collect()
+                        rendered.append((output_file, key))
+                    else:
+                        artifacts.discard()
+                        if exit_code == 0:
+                            exit_code = returncode
+
+            for output_file, key in rendered:
+                if key is not None and Path(output_file).is_file():
+                    _store_in_cache(output_file, key)
+        finally:
+            try:
+                os.unlink(config_path)
+            except OSError:
+                pass
+
+    return exit_code, artifacts
+
+
+def main(argv: list[str]) -> int:
+    """
+    Convert staged Mermaid files to SVG with render() and git-add the outputs that changed.
+
+    Args:
+        argv: List of staged file paths passed by the pre-commit framework.
+
+    Returns:
+        0 if all conversions and the git-add succeeded, non-zero otherwise.
+    """
+    mermaid_files = [p for p in argv if _is_mermaid_file(p)]
+
+    if not mermaid_files:
+        return 0
+
+    exit_code, artifacts = render(mermaid_files)
+
+    git_returncode = artifacts.stage()
+    if git_returncode != 0 and exit_code == 0:
+        exit_code = git_returncode
 
     return exit_code
 
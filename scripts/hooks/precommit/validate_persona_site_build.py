@@ -3,19 +3,28 @@
 Pre-commit hook: validate the persona-site builder succeeds on current YAML.
 
 Invoked when a change to the persona-site input YAML, the builder, or either
-of its schemas is staged. Re-runs the full build pipeline against a temp
-directory so nothing leaks into the repo working tree, and fails the commit
-with a clear stderr message if the build raises.
+of its schemas is staged. Runs the build pipeline in memory (site data,
+output-schema validation, then the shards and search index the site loads),
+writing nothing into the repo working tree, and fails the commit with a clear
+stderr message if any step raises.
+
+The build keeps a record cache and a validation cache outside the repository,
+so a commit that edits one risk re-expands and re-validates only what that
+edit changed (see build_site_data() and validate_site_data()).
+
+Environment:
+    PERSONA_SITE_CACHE_DIR: Cache directory (default: $XDG_CACHE_HOME or ~/.cache, then
+        secure-ai-tooling/persona-site).
 """
 
 import sys
-import tempfile
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(REPO_ROOT))
 
 import scripts.build_persona_site_data as builder  # noqa: E402
+from scripts.hooks._artifact_writer import user_cache_dir  # noqa: E402
 
 
 def main(argv: list[str]) -> int:
@@ -30,16 +39,16 @@ def main(argv: list[str]) -> int:
         0 on success, 1 on any build failure.
     """
     del argv  # intentionally ignored; framework uses pass_filenames: false
+    cache_dir = user_cache_dir("PERSONA_SITE_CACHE_DIR", "persona-site")
     try:
-        with tempfile.TemporaryDirectory() as tmp:
-            site_dir = Path(tmp) / "site"
-            output_path = builder.resolve_output_path(site_dir, None)
-            site_data = builder.build_site_data(
-                builder.load_yaml(builder.DEFAULT_PERSONAS_PATH),
-                builder.load_yaml(builder.DEFAULT_RISKS_PATH),
-                builder.load_yaml(builder.DEFAULT_CONTROLS_PATH),
-            )
-            builder.write_site_data(site_data, output_path)
+        site_data = builder.build_site_data(
+            builder.load_yaml(builder.DEFAULT_PERSONAS_PATH),
+            builder.load_yaml(builder.DEFAULT_RISKS_PATH),
+            builder.load_yaml(builder.DEFAULT_CONTROLS_PATH),
+            record_cache=cache_dir / "records.json",
+        )
+        builder.validate_site_data(site_data, cache_dir / "validated-records.json")
+        builder.build_site_shards(site_data)
     except Exception as exc:
         print(f"Persona-site builder failed: {type(exc).__name__}: {exc}", file=sys.stderr)
         return 1
@@ -45,6 +45,13 @@ from typing import Any
 
 import yaml
 
+# Make the repo root importable so `scripts.hooks.*` resolves when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.hooks._artifact_writer import ArtifactWriter  # noqa: E402
+
 # Repo-relative default; the same path the pre-commit framework hook triggers on.
 _DEFAULT_PATH = Path("risk-map") / "yaml" / "frameworks.yaml"
 
@@ -258,16 +265,16 @@ def _update_text_in_place(text: str, derived_by_id: dict[str, str]) -> str:
     return "".join(out)
 
 
-def _stage_in_git(path: Path) -> int:
+def _stage_in_git(artifacts: ArtifactWriter) -> int:
     """
-    `git add` the (possibly mutated) frameworks.yaml so the regenerated content
-    lands in the same commit as the source change (Mode B auto-stage, the
-    same posture as the table/diagram generators).
+    `git add` the mutated frameworks.yaml so the regenerated content lands in
+    the same commit as the source change (Mode B auto-stage, through the same
+    shared artifact writer as the table/diagram generators).
 
-    Returns the git returncode; non-zero is propagated as the script exit
-    code by the caller.
+    Returns the git returncode (0 without running git when nothing changed);
+    non-zero is propagated as the script exit code by the caller.
     """
-    return subprocess.run(["git", "add", str(path)]).returncode
+    return artifacts.stage()
 
 
 def main(argv: list[str]) -> int:
@@ -327,8 +334,8 @@ def main(argv: list[str]) -> int:
     # Surgical text update: insert or replace the versionId line per entry.
     updated = _update_text_in_place(original, derived_by_id)
 
-    if updated != original:
-        target.write_text(updated, encoding="utf-8")
+    artifacts = ArtifactWriter()
+    if updated != original and artifacts.write(target, updated):
         # Auto-stage so the regenerated value lands in the same commit. Skip
         # the stage step if the file is not inside a git repo (test fixtures
         # under tmp_path) — `git add <path-outside-repo>` would non-zero exit
@@ -341,7 +348,7 @@ def main(argv: list[str]) -> int:
                 text=True,
             )
             if probe.returncode == 0:
-                stage_rc = _stage_in_git(target)
+                stage_rc = _stage_in_git(artifacts)
                 if stage_rc != 0:
                     return stage_rc
         except FileNotFoundError:
@@ -14,6 +14,7 @@ Modules:
     models: Data models for ComponentNode and ControlNode objects
     utils: Utility functions for file parsing and git integration
     validator: Core validation logic for component edge consistency
+    reference_graph: Shared cross-reference multigraph for referential checks
     graphing: Graph generation classes for Mermaid visualization
 
 Usage:
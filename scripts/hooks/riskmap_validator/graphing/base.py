@@ -23,11 +23,13 @@ Dependencies:
 
 from os.path import commonprefix
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from riskmap_validator.models import ComponentNode, ControlNode, RiskNode
 
+from .graph_export import build_node_link, node_link_to_dot, node_link_to_json, write_node_link
 from .graph_utils import MermaidConfigLoader, UnionFind, _get_schema_categories
 
 
@@ -43,8 +45,11 @@ class BaseGraph:
     - Category display name generation with YAML config loading
     - Shared configuration patterns
     - Consistent category handling across graph types
+    - Structured node-link (JSON) and Graphviz DOT export of the built graph
     """
 
+    graph_type: str = "base"
+
     def __init__(
         self,
         components: dict[str, ComponentNode],
@@ -76,6 +81,8 @@ class BaseGraph:
 
         self.components_by_control: dict[str, list[str]] = dict()
         self.graph: str = ""
+        # (edge_index, source, target, kind) for every edge emitted by the Mermaid builder
+        self._edge_records: list[tuple[int, str, str, str]] = []
 
         if not isinstance(components, dict) or not all(
             isinstance(node, ComponentNode) for node in components.values()
@@ -96,6 +103,70 @@ class BaseGraph:
 
         return lines + "\n"
 
+    def to_node_link(self) -> dict[str, Any]:
+        """
+        Export the built graph as a node-link dictionary.
+
+        Reuses the groupings, subgroupings and edge styles computed while
+        building the Mermaid graph, so the structured export and the
+        diagram always describe the same relationships.
+
+        Returns:
+            dict: Node-link document (see graph_export for the shape)
+        """
+        return build_node_link(self.graph_type, self._export_groups(), self._export_nodes(), self._export_links())
+
+    def to_json(self) -> str:
+        """Export the built graph as a compact JSON node-link string."""
+        return node_link_to_json(self.to_node_link())
+
+    def write_json(self, path: Path, compress: bool | None = None) -> Path:
+        """
+        Write the compact JSON node-link export to a file.
+
+        Args:
+            path: Output path
+            compress: Gzip the output. None infers from a ``.gz`` suffix.
+
+        Returns:
+            Path: The path that was written
+        """
+        return write_node_link(self.to_node_link(), path, compress=compress)
+
+    def to_dot(self) -> str:
+        """Export the built graph as Graphviz DOT source."""
+        return node_link_to_dot(self.to_node_link())
+
+    def _export_groups(self) -> list[dict[str, Any]]:
+        """Group (subgraph) records for the structured export. Overridden by subclasses."""
+        return []
+
+    def _export_nodes(self) -> list[dict[str, Any]]:
+        """Node records for the structured export. Overridden by subclasses."""
+        return []
+
+    def _export_edge_styles(self) -> dict[int, str]:
+        """Map Mermaid edge indices to their linkStyle strings. Overridden by subclasses."""
+        return {}
+
+    def _export_links(self) -> list[dict[str, Any]]:
+        """Edge records for the structured export, styled from the Mermaid linkStyle indices."""
+        styles = self._export_edge_styles()
+        links: list[dict[str, Any]] = []
+        for edge_index, source, target, kind in self._edge_records:
+            link: dict[str, Any] = {"source": source, "target": target, "kind": kind}
+            if edge_index in styles:
+                link["style"] = styles[edge_index]
+            links.append(link)
+        return links
+
+    @staticmethod
+    def _group_record(
+        group_id: str, title: str, kind: str, parent: str | None = None, style: str | None = None
+    ) -> dict[str, Any]:
+        """Build a single group record for the structured export."""
+        return {"id": group_id, "title": title, "kind": kind, "parent": parent, "style": style}
+
     def _component_to_control_mapping(self):
         self._nodetype_a_to_b_mapping("component-by-control")
 
@@ -6,6 +6,8 @@ organization and topological ranking. Uses configuration-driven styling
 for visual consistency across the CoSAI Risk Map framework.
 """
 
+from typing import Any
+
 from ..models import ComponentNode
 from .base import BaseGraph
 from .graph_utils import MermaidConfigLoader
@@ -25,6 +27,8 @@ class ComponentGraph(BaseGraph):
         graph (str): Generated Mermaid graph content
     """
 
+    graph_type = "component"
+
     def __init__(
         self,
         forward_map: dict[str, list[str]],
@@ -75,8 +79,10 @@ class ComponentGraph(BaseGraph):
 
         # Add dependency edges outside subgraphs for cleaner layout
         graph_content.append("")
+        self._edge_records = []
         for src, targets in self.forward_map.items():
             for tgt in targets:
+                self._edge_records.append((len(self._edge_records), src, tgt, "dependency"))
                 graph_content.append(f"    {src} --> {tgt}")
 
         # Apply category styling
@@ -119,3 +125,41 @@ class ComponentGraph(BaseGraph):
             )
 
         return subgraph_lines or []
+
+    def _export_groups(self) -> list[dict[str, Any]]:
+        """Category and subcategory groups, styled like the Mermaid category subgraphs."""
+        component_categories = self.config_loader.get_component_category_styles()
+        groups = []
+        for category in self.component_by_category:
+            category_config = component_categories.get(category)
+            style = (
+                self._get_node_style("componentCategory", category_config=category_config)
+                if category_config
+                else None
+            )
+            groups.append(
+                self._group_record(category, self._get_category_display_name(category), "category", style=style)
+            )
+            for subcategory in self.component_by_subcategory.get(category, {}):
+                groups.append(
+                    self._group_record(
+                        subcategory, self._get_category_display_name(subcategory), "subcategory", parent=category
+                    )
+                )
+        return groups
+
+    def _export_nodes(self) -> list[dict[str, Any]]:
+        """Component nodes placed in their innermost (sub)category group."""
+        nodes = []
+        for category, component_ids in self.component_by_category.items():
+            for component_id in sorted(component_ids):
+                component = self.components[component_id]
+                nodes.append(
+                    {
+                        "id": component_id,
+                        "title": component.title,
+                        "kind": "component",
+                        "group": component.subcategory or category,
+                    }
+                )
+        return nodes
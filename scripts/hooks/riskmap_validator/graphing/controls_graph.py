@@ -32,6 +32,8 @@ class ControlGraph(BaseGraph):
         control_to_component_map: Optimized control mappings
     """
 
+    graph_type = "control"
+
     def __init__(
         self,
         controls: dict[str, ControlNode],
@@ -288,10 +290,12 @@ class ControlGraph(BaseGraph):
 
     def _get_all_edge(self, control_id: str, component_id: str, edge_index: int) -> str:
         self._universal_control_edge_indices.append(edge_index)
+        self._edge_records.append((edge_index, control_id, component_id, "all"))
         return f"    {control_id} -.-> {component_id}"
 
     def _get_edge_subgraph(self, control_id: str, component_id: str, edge_index: int) -> str:
         self._category_edge_indices.append(edge_index)
+        self._edge_records.append((edge_index, control_id, component_id, "category"))
         return self._get_edge(control_id, component_id)
 
     def _get_edge(self, control_id: str, component_id: str) -> str:
@@ -339,6 +343,7 @@ class ControlGraph(BaseGraph):
 
         # Track edge indices for styling
         edge_index: int = 0
+        self._edge_records = []
         control_edge_counts = {}  # Track edge count per control
 
         # Count edges per control to identify multi-edge controls (3+ edges)
@@ -378,6 +383,7 @@ class ControlGraph(BaseGraph):
                     if self.debug:
                         lines.append(f"    %% DEBUG: {control_id} → {component_id} (individual)")
                     lines.append(self._get_edge(control_id=control_id, component_id=component_id))
+                    self._edge_records.append((edge_index, control_id, component_id, "component"))
 
                     # Apply cycling colors for multi-edge controls
                     if is_multi_edge_control:
@@ -449,3 +455,113 @@ class ControlGraph(BaseGraph):
         lines.extend([])
 
         return "\n".join(lines)
+
+    def _export_edge_styles(self) -> dict[int, str]:
+        """Resolve the universal, category and multi-edge linkStyle groups to per-edge styles."""
+        styles: dict[int, str] = {}
+
+        if self._universal_control_edge_indices:
+            style_str = self._get_edge_style("allControlEdges")
+            styles.update(dict.fromkeys(self._universal_control_edge_indices, style_str))
+
+        if self._category_edge_indices:
+            style_str = self._get_edge_style("subgraphEdges")
+            styles.update(dict.fromkeys(self._category_edge_indices, style_str))
+
+        multi_styles = self.config_loader.get_control_edge_styles().get("multiEdgeStyles", [])
+        for i, style_group in enumerate(self._multi_edge_styler.edges):
+            if style_group and i < len(multi_styles):
+                styles.update(dict.fromkeys(style_group, self._get_edge_style(multi_styles[i])))
+
+        return styles
+
+    def _export_groups(self) -> list[dict[str, Any]]:
+        """Controls/components containers, their categories and the discovered component subgroups."""
+        components_container_style = self.config_loader.get_components_container_style(self.graph_type)
+        controls_container_style = self.config_loader.get_controls_container_style(self.graph_type)
+        component_categories = self.config_loader.get_component_category_styles()
+
+        groups = [
+            self._group_record(
+                "controls",
+                "controls",
+                "container",
+                style=self._style_node_from_dict(controls_container_style) if controls_container_style else None,
+            )
+        ]
+        for category, control_ids in self.control_by_category.items():
+            if control_ids:
+                groups.append(
+                    self._group_record(
+                        category, self._get_category_display_name(category), "category", parent="controls"
+                    )
+                )
+
+        groups.append(
+            self._group_record(
+                "components",
+                "components",
+                "container",
+                style=(
+                    self._style_node_from_dict(components_container_style) if components_container_style else None
+                ),
+            )
+        )
+
+        subgroup_parents = {
+            subgroup_name: parent_category
+            for parent_category, subgroups in self.subgroupings.items()
+            for subgroup_name in subgroups
+        }
+        for category in self.component_by_category:
+            if category in subgroup_parents:
+                continue
+            category_config = component_categories.get(category)
+            style = (
+                self._get_node_style("componentCategory", category_config=category_config)
+                if category_config
+                else None
+            )
+            groups.append(
+                self._group_record(
+                    category, self._get_category_display_name(category), "category", "components", style
+                )
+            )
+            for subgroup_name in self.subgroupings.get(category, {}):
+                groups.append(
+                    self._group_record(
+                        subgroup_name,
+                        self._get_category_display_name(subgroup_name),
+                        "subgroup",
+                        parent=category,
+                        style=self._get_node_style("dynamicSubgroup", parent_category=category),
+                    )
+                )
+
+        return groups
+
+    def _export_nodes(self) -> list[dict[str, Any]]:
+        """Control nodes by category, then component nodes in their category or subgroup."""
+        nodes = []
+        for category, control_ids in self.control_by_category.items():
+            for control_id in sorted(control_ids):
+                nodes.append(
+                    {
+                        "id": control_id,
+                        "title": self.controls[control_id].title,
+                        "kind": "control",
+                        "group": category,
+                    }
+                )
+
+        for category, component_ids in self.component_by_category.items():
+            for component_id in sorted(component_ids):
+                nodes.append(
+                    {
+                        "id": component_id,
+                        "title": self.components[component_id].title,
+                        "kind": "component",
+                        "group": category,
+                    }
+                )
+        return nodes
@@ -0,0 +1,224 @@
+"""
+Structured (non-Mermaid) serialisers for CoSAI Risk Map graphs.
+
+Every graph class records the groups, nodes and styled edges it already
+computed while building its Mermaid output. This module turns that
+node-link dictionary into formats that downstream tooling can load
+directly instead of regex-parsing ``.mermaid`` files:
+
+- Compact JSON node-link documents (optionally gzip-compressed)
+- Graphviz DOT, with groups rendered as nested ``cluster_*`` subgraphs
+
+Node-link document shape::
+
+    {
+      "directed": true,
+      "multigraph": false,
+      "graph": {"type": "control"},
+      "groups": [{"id", "title", "kind", "parent", "style"}, ...],
+      "nodes":  [{"id", "title", "kind", "group"}, ...],
+      "links":  [{"source", "target", "kind", "style"?}, ...]
+    }
+
+Link targets may name a group ID (category, subgroup or container) when the
+Mermaid graph points an edge at a subgraph rather than a single node.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+NODE_LINK_FORMAT_VERSION = "1.0"
+
+
+def build_node_link(
+    graph_type: str, groups: list[dict[str, Any]], nodes: list[dict[str, Any]], links: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Assemble a node-link document from already-collected graph parts.
+
+    Args:
+        graph_type: Graph identifier ("component", "control" or "risk")
+        groups: Group (subgraph) records, parents before children
+        nodes: Node records, each naming its innermost group
+        links: Edge records in Mermaid edge-index order
+
+    Returns:
+        Node-link dictionary ready for JSON or DOT serialisation
+    """
+    return {
+        "directed": True,
+        "multigraph": False,
+        "graph": {"type": graph_type, "version": NODE_LINK_FORMAT_VERSION},
+        "groups": groups,
+        "nodes": nodes,
+        "links": links,
+    }
+
+
+def node_link_to_json(data: dict[str, Any]) -> str:
+    """Serialise a node-link document as compact, key-order-stable JSON."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_node_link(data: dict[str, Any], path: Path, compress: bool | None = None) -> Path:
+    """
+    Write a node-link document to disk.
+
+    Args:
+        data: Node-link dictionary from build_node_link()
+        path: Output file path
+        compress: Gzip the output. None infers from a ``.gz`` suffix.
+
+    Returns:
+        The path that was written
+    """
+    path = Path(path)
+    if compress is None:
+        compress = path.suffix == ".gz"
+
+    payload = node_link_to_json(data).encode("utf-8")
+    if compress:
+        # mtime=0 keeps the archive byte-stable across regenerations.
+        with open(path, "wb") as raw, gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as fh:
+            fh.write(payload)
+    else:
+        path.write_bytes(payload)
+    return path
+
+
+def read_node_link(path: Path) -> dict[str, Any]:
+    """Load a node-link document written by write_node_link(), gzip or plain."""
+    path = Path(path)
+    raw = path.read_bytes()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def parse_mermaid_style(style: str | None) -> dict[str, str]:
+    """
+    Split a Mermaid style string into a property dictionary.
+
+    Example:
+        >>> parse_mermaid_style("stroke:#4285f4,stroke-width:3px,stroke-dasharray: 8 4")
+        {'stroke': '#4285f4', 'stroke-width': '3px', 'stroke-dasharray': '8 4'}
+    """
+    properties: dict[str, str] = {}
+    if not style:
+        return properties
+    for part in style.split(","):
+        key, sep, value = part.partition(":")
+        if sep:
+            properties[key.strip()] = value.strip()
+    return properties
+
+
+def _dot_id(value: str) -> str:
+    """Quote an identifier or label for DOT output."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _dot_style_attrs(style: str | None, is_group: bool = False) -> list[str]:
+    """Translate a Mermaid style string into DOT attribute assignments."""
+    properties = parse_mermaid_style(style)
+    attrs: list[str] = []
+    styles: list[str] = []
+
+    if "stroke" in properties:
+        attrs.append(f"color={_dot_id(properties['stroke'])}")
+    if "stroke-width" in properties:
+        width = properties["stroke-width"].removesuffix("px")
+        attrs.append(f"penwidth={_dot_id(width)}")
+    if properties.get("stroke-dasharray"):
+        styles.append("dashed")
+    if is_group and "fill" in properties:
+        attrs.append(f"fillcolor={_dot_id(properties['fill'])}")
+        styles.append("filled")
+    if styles:
+        attrs.append(f"style={_dot_id(','.join(styles))}")
+
+    return attrs
+
+
+def node_link_to_dot(data: dict[str, Any]) -> str:
+    """
+    Render a node-link document as a Graphviz DOT digraph.
+
+    Groups become nested ``cluster_<id>`` subgraphs. Edges that target a
+    group are drawn to the group's first node with ``lhead`` set, which is
+    the Graphviz idiom for pointing an edge at a cluster (``compound=true``).
+
+    Args:
+        data: Node-link dictionary from build_node_link()
+
+    Returns:
+        DOT source as a string
+    """
+    groups = data.get("groups", [])
+    nodes = data.get("nodes", [])
+    graph_type = data.get("graph", {}).get("type", "graph")
+
+    children: dict[str | None, list[dict[str, Any]]] = {}
+    for group in groups:
+        children.setdefault(group.get("parent"), []).append(group)
+
+    nodes_by_group: dict[str | None, list[dict[str, Any]]] = {}
+    for node in nodes:
+        nodes_by_group.setdefault(node.get("group"), []).append(node)
+
+    # First concrete node reachable inside each group, used as an lhead anchor.
+    anchors: dict[str, str] = {}
+
+    def find_anchor(group_id: str) -> str | None:
+        if group_id in anchors:
+            return anchors[group_id]
+        for node in nodes_by_group.get(group_id, []):
+            anchors[group_id] = node["id"]
+            return node["id"]
+        for child in children.get(group_id, []):
+            if anchor := find_anchor(child["id"]):
+                anchors[group_id] = anchor
+                return anchor
+        return None
+
+    lines = [f"digraph {_dot_id(graph_type)} {{", "    compound=true;", "    node [shape=box];"]
+
+    def emit_group(group: dict[str, Any], indent: str) -> None:
+        lines.append(f"{indent}subgraph {_dot_id('cluster_' + group['id'])} {{")
+        lines.append(f"{indent}    label={_dot_id(group.get('title') or group['id'])};")
+        for attr in _dot_style_attrs(group.get("style"), is_group=True):
+            lines.append(f"{indent}    {attr};")
+        for node in nodes_by_group.get(group["id"], []):
+            lines.append(f"{indent}    {_dot_id(node['id'])} [label={_dot_id(node['title'])}];")
+        for child in children.get(group["id"], []):
+            emit_group(child, indent + "    ")
+        lines.append(f"{indent}}}")
+
+    for group in children.get(None, []):
+        emit_group(group, "    ")
+
+    group_ids = {group["id"] for group in groups}
+    for node in nodes_by_group.get(None, []):
+        lines.append(f"    {_dot_id(node['id'])} [label={_dot_id(node['title'])}];")
+    for node in nodes:
+        group_id = node.get("group")
+        if group_id is not None and group_id not in group_ids:
+            lines.append(f"    {_dot_id(node['id'])} [label={_dot_id(node['title'])}];")
+
+    for link in data.get("links", []):
+        source, target = link["source"], link["target"]
+        attrs = _dot_style_attrs(link.get("style"))
+        if target in group_ids:
+            anchor = find_anchor(target)
+            if anchor is None:
+                continue
+            attrs.append(f"lhead={_dot_id('cluster_' + target)}")
+            target = anchor
+        attr_str = f" [{', '.join(attrs)}]" if attrs else ""
+        lines.append(f"    {_dot_id(source)} -> {_dot_id(target)}{attr_str};")
+
+    lines.append("}")
+    return "\n".join(lines) + "\n"
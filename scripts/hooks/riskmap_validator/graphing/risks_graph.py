@@ -5,6 +5,8 @@ Generates three-layer Mermaid graphs (Risks → Controls → Components).
 Reuses ControlGraph functionality through composition to avoid code duplication.
 """
 
+from typing import Any
+
 from ..models import ComponentNode, ControlNode, RiskNode
 from .base import BaseGraph, MermaidConfigLoader
 from .controls_graph import ControlGraph
@@ -24,6 +26,8 @@ class RiskGraph(BaseGraph):
         risks_by_category: Risks grouped by category
     """
 
+    graph_type = "risk"
+
     def __init__(
         self,
         risks: dict[str, RiskNode],
@@ -49,6 +53,7 @@ class RiskGraph(BaseGraph):
         self.control_graph = ControlGraph(controls, components, debug=debug, config_loader=self.config_loader)
 
         # Build risk mappings
+        self._risk_edge_styles: dict[int, str] = {}
         self.risk_to_control_map = self._build_risk_control_mapping()
         self.graph = self.build_risk_control_component_graph()
 
@@ -178,6 +183,8 @@ class RiskGraph(BaseGraph):
         lines.append("    %% Risk to Control relationships")
         risk_control_edge_indices = []
         edge_index = 0
+        self._edge_records = []
+        self._risk_edge_styles = {}
 
         for risk_id, control_ids in self.risk_to_control_map.items():
             if not control_ids:  # Skip risks with no mitigating controls
@@ -189,6 +196,7 @@ class RiskGraph(BaseGraph):
                 if self.debug:
                     lines.append(f"    %% DEBUG: {risk_id} → {control_id}")
                 lines.append(f"    {risk_id} --> {control_id}")
+                self._edge_records.append((edge_index, risk_id, control_id, "mitigation"))
                 risk_control_edge_indices.append(edge_index)
                 edge_index += 1
 
@@ -234,6 +242,7 @@ class RiskGraph(BaseGraph):
                 if style_str not in style_groups:
                     style_groups[style_str] = []
                 style_groups[style_str].append(edge_idx)
+                self._risk_edge_styles[edge_idx] = style_str
 
             # Apply styles to grouped edges
             for style_str, edge_indices in style_groups.items():
@@ -294,3 +303,59 @@ class RiskGraph(BaseGraph):
                 lines.append(f"    style {category_key} {style_str}")
 
         return "\n".join(lines)
+
+    def _export_edge_styles(self) -> dict[int, str]:
+        """Cycling risk→control styles resolved while building the Mermaid graph."""
+        return self._risk_edge_styles
+
+    def _export_links(self) -> list[dict[str, Any]]:
+        """Risk→control edges followed by the composed ControlGraph's styled control→component edges."""
+        return super()._export_links() + self.control_graph._export_links()
+
+    def _export_groups(self) -> list[dict[str, Any]]:
+        """Risks container and categories, then the ControlGraph groups with risk-graph container styles."""
+        risks_container_style = self.config_loader.get_risks_container_style()
+        risk_categories = self.config_loader.get_risk_category_styles()
+
+        groups = [
+            self._group_record(
+                "risks",
+                "risks",
+                "container",
+                style=self._style_node_from_dict(risks_container_style) if risks_container_style else None,
+            )
+        ]
+        for category, risk_ids in self.risks_by_category.items():
+            if not risk_ids:
+                continue
+            category_config = risk_categories.get(category, risk_categories.get("risks", {}))
+            groups.append(
+                self._group_record(
+                    category,
+                    self._get_category_display_name(category),
+                    "category",
+                    parent="risks",
+                    style=self._get_node_style("riskCategory", category_config=category_config),
+                )
+            )
+
+        container_styles = {
+            "controls": self.config_loader.get_controls_container_style(),
+            "components": self.config_loader.get_components_container_style(),
+        }
+        for group in self.control_graph._export_groups():
+            if group["kind"] == "container":
+                container_style = container_styles.get(group["id"])
+                group["style"] = self._style_node_from_dict(container_style) if container_style else None
+            groups.append(group)
+
+        return groups
+
+    def _export_nodes(self) -> list[dict[str, Any]]:
+        """Risk nodes by category, then the ControlGraph's control and component nodes."""
+        nodes = []
+        for category, risk_ids in self.risks_by_category.items():
+            for risk_id in sorted(risk_ids):
+                risk = self.risks[risk_id]
+                nodes.append({"id": risk_id, "title": risk.title, "kind": "risk", "group": category})
+        return nodes + self.control_graph._export_nodes()
@@ -1,10 +1,54 @@
 """
 Data models for risk map validation system.
 
-Contains ComponentNode and ControlNode classes that represent the core
+Contains ComponentNode, ControlNode and RiskNode classes that represent the core
 entities in the CoSAI Risk Map framework with validation and comparison logic.
+
+The node classes are slotted (no per-instance ``__dict__``), intern every ID
+string (categories and edge/relationship targets) and store relationship lists
+as immutable IdTuple values. Each class also offers a ``from_trusted``
+constructor that skips per-element validation for data that has already been
+shape-checked (schema-validated or coerced by the parsers in ``utils``).
 """
 
+import sys
+from collections.abc import Iterable
+
+
+class IdTuple(tuple):
+    """
+    Immutable, tuple-backed sequence of interned IDs.
+
+    Compares equal to a list with the same items and reprs like one, so callers
+    that compare against list literals (``control.components == ["all"]``) and
+    existing string formatting keep working.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, list):
+            return tuple.__eq__(self, tuple(other))
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _intern_ids(ids: Iterable[str]) -> IdTuple:
+    """Intern each ID and pack them into an IdTuple."""
+    return IdTuple(map(sys.intern, ids))
+
+
+def _is_str_sequence(value) -> bool:
+    """True for a list or tuple whose items are all strings."""
+    return isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value)
+
 
 class ComponentNode:
     """
@@ -12,6 +56,8 @@ class ComponentNode:
     Includes validation for data integrity.
     """
 
+    __slots__ = ("title", "category", "subcategory", "to_edges", "from_edges")
+
     def __init__(
         self, title: str, category: str, to_edges: list[str], from_edges: list[str], subcategory: str | None = None
     ) -> None:
@@ -33,22 +79,46 @@ class ComponentNode:
         # Validate and set the category
         if not isinstance(category, str) or not category.strip():
             raise TypeError("The 'category' must be a string consisting of at least one printing character.")
-        self.category: str = category
+        self.category: str = sys.intern(category)
 
         # Validate and set the subcategory if it exists
         self.subcategory: str | None = None
         if isinstance(subcategory, str):
-            self.subcategory = subcategory
+            self.subcategory = sys.intern(subcategory)
 
         # Validate and set 'to_edges'
-        if not isinstance(to_edges, list) or not all(isinstance(edge, str) for edge in to_edges):
+        if not _is_str_sequence(to_edges):
             raise TypeError("The 'to_edges' must be a list of strings.")
-        self.to_edges: list[str] = to_edges
+        self.to_edges: IdTuple = _intern_ids(to_edges)
 
         # Validate and set 'from_edges'
-        if not isinstance(from_edges, list) or not all(isinstance(edge, str) for edge in from_edges):
+        if not _is_str_sequence(from_edges):
             raise TypeError("The 'from_edges' must be a list of strings.")
-        self.from_edges: list[str] = from_edges
+        self.from_edges: IdTuple = _intern_ids(from_edges)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        title: str,
+        category: str,
+        to_edges: Iterable[str],
+        from_edges: Iterable[str],
+        subcategory: str | None = None,
+    ) -> "ComponentNode":
+        """
+        Build a component without per-field validation.
+
+        Only for data whose shape is already guaranteed (schema-validated
+        corpus, or values coerced by parse_components_yaml). IDs are still
+        interned and edges packed into IdTuples.
+        """
+        node = cls.__new__(cls)
+        node.title = title
+        node.category = sys.intern(category)
+        node.subcategory = sys.intern(subcategory) if isinstance(subcategory, str) else None
+        node.to_edges = _intern_ids(to_edges)
+        node.from_edges = _intern_ids(from_edges)
+        return node
 
     def __repr__(self) -> str:
         """
@@ -96,6 +166,8 @@ class ControlNode:
     Special component values: "all" (applies to all components), "none" (no components)
     """
 
+    __slots__ = ("title", "category", "components", "risks", "personas")
+
     def __init__(
         self,
         title: str,
@@ -120,19 +192,42 @@ class ControlNode:
 
         if not isinstance(category, str) or not category.strip():
             raise TypeError("Control 'category' must be a non-empty string.")
-        self.category: str = category
+        self.category: str = sys.intern(category)
 
-        if not isinstance(components, list) or not all(isinstance(c, str) for c in components):
+        if not _is_str_sequence(components):
             raise TypeError("Control 'components' must be a list of strings.")
-        self.components: list[str] = components
+        self.components: IdTuple = _intern_ids(components)
 
-        if not isinstance(risks, list) or not all(isinstance(r, str) for r in risks):
+        if not _is_str_sequence(risks):
             raise TypeError("Control 'risks' must be a list of strings.")
-        self.risks: list[str] = risks
+        self.risks: IdTuple = _intern_ids(risks)
 
-        if not isinstance(personas, list) or not all(isinstance(p, str) for p in personas):
+        if not _is_str_sequence(personas):
             raise TypeError("Control 'personas' must be a list of strings.")
-        self.personas: list[str] = personas
+        self.personas: IdTuple = _intern_ids(personas)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        title: str,
+        category: str,
+        components: Iterable[str],
+        risks: Iterable[str],
+        personas: Iterable[str],
+    ) -> "ControlNode":
+        """
+        Build a control without per-field validation.
+
+        Only for data whose shape is already guaranteed (schema-validated
+        corpus). IDs are still interned and relationships packed into IdTuples.
+        """
+        node = cls.__new__(cls)
+        node.title = title
+        node.category = sys.intern(category)
+        node.components = _intern_ids(components)
+        node.risks = _intern_ids(risks)
+        node.personas = _intern_ids(personas)
+        return node
 
     def __repr__(self) -> str:
         return (
@@ -172,6 +267,8 @@ class RiskNode:
     Represents a risk with title and category for graph generation.
     """
 
+    __slots__ = ("title", "category")
+
     def __init__(self, title: str, category: str = "") -> None:
         """
         Initialize risk with validation.
@@ -186,7 +283,15 @@ class RiskNode:
 
         if not isinstance(category, str):
             raise TypeError("Risk 'category' must be a string.")
-        self.category: str = category
+        self.category: str = sys.intern(category)
+
+    @classmethod
+    def from_trusted(cls, title: str, category: str = "") -> "RiskNode":
+        """Build a risk without validation, for data whose shape is already guaranteed."""
+        node = cls.__new__(cls)
+        node.title = title
+        node.category = sys.intern(category)
+        return node
 
     def __repr__(self) -> str:
         return f"RiskNode(title='{self.title}', category='{self.category}')"
@@ -0,0 +1,287 @@
+"""
+Typed cross-reference multigraph shared by the referential validators.
+
+Every relation in the risk map corpus is loaded once into a ReferenceGraph:
+component↔component edges, control→component, control↔risk,
+control/risk→persona, entity→framework mappings, framework applicability and
+component category placement. Referential checks are then set operations over
+those relations instead of per-validator dict building and nested loops, so a
+single build serves every check and each check is O(V + E).
+
+Relations are directed and stored as ordered adjacency (source → targets, both
+in YAML order), so diagnostics keep the deterministic order of the source
+files. A source may be registered with no targets, which keeps "declared but
+empty" distinct from "not declared" (e.g. a framework whose applicableTo is
+``[]`` versus one that omits the field).
+
+Dependencies:
+    - .models: ComponentNode and ControlNode data models
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from .models import ComponentNode, ControlNode
+
+# Node kinds
+COMPONENT = "component"
+CONTROL = "control"
+RISK = "risk"
+PERSONA = "persona"
+FRAMEWORK = "framework"
+CATEGORY = "category"
+
+# Relations. component.from stores the edge x → y declared by y's ``edges.from``
+# list in edge direction, so it is directly comparable with component.to.
+COMPONENT_TO = "component.to"
+COMPONENT_FROM = "component.from"
+CATEGORY_SUBCATEGORY = "category.subcategory"
+CONTROL_COMPONENT = "control.component"
+CONTROL_RISK = "control.risk"
+CONTROL_PERSONA = "control.persona"
+RISK_CONTROL = "risk.control"
+RISK_PERSONA = "risk.persona"
+RISK_FRAMEWORK = "risk.framework"
+CONTROL_FRAMEWORK = "control.framework"
+PERSONA_FRAMEWORK = "persona.framework"
+FRAMEWORK_APPLICABLE_TO = "framework.applicableTo"
+
+Pair = tuple[str, str]
+
+
+class ReferenceGraph:
+    """
+    Directed multigraph of typed nodes and named relations.
+
+    Nodes are grouped by kind and may carry attributes. Each relation is an
+    independent edge set, so the same pair of IDs can be linked by several
+    relations (e.g. control.risk and the reverse-declared risk.control).
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, dict[str, dict[str, Any]]] = {}
+        self._relations: dict[str, dict[str, dict[str, None]]] = {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_node(self, kind: str, node_id: str, **attrs: Any) -> None:
+        """Register a node of the given kind, merging any attributes."""
+        self._nodes.setdefault(kind, {}).setdefault(node_id, {}).update(attrs)
+
+    def add_nodes(self, kind: str, node_ids: Iterable[str]) -> None:
+        """Register several attribute-less nodes of one kind."""
+        nodes = self._nodes.setdefault(kind, {})
+        for node_id in node_ids:
+            nodes.setdefault(node_id, {})
+
+    def add_edges(self, relation: str, source: str, targets: Iterable[str] = ()) -> None:
+        """Register ``source`` in ``relation`` and add an edge to each target."""
+        adjacency = self._relations.setdefault(relation, {}).setdefault(source, {})
+        for target in targets:
+            adjacency[target] = None
+
+    def add_adjacency(self, relation: str, adjacency: Mapping[str, Iterable[str]]) -> None:
+        """Bulk-load a relation from a ``source -> targets`` mapping."""
+        for source, targets in adjacency.items():
+            self.add_edges(relation, source, targets)
+
+    def add_components(self, components: Mapping[str, ComponentNode]) -> None:
+        """Load component nodes (with category placement) and both edge directions."""
+        for component_id, node in components.items():
+            self.add_node(COMPONENT, component_id, category=node.category, subcategory=node.subcategory)
+            if node.to_edges:
+                self.add_edges(COMPONENT_TO, component_id, node.to_edges)
+            for source in node.from_edges:
+                self.add_edges(COMPONENT_FROM, source, (component_id,))
+
+    def add_category_nesting(self, category_to_subcategories: Mapping[str, Iterable[str]]) -> None:
+        """Load the declared category → subcategory nesting."""
+        self.add_nodes(CATEGORY, category_to_subcategories)
+        self.add_adjacency(CATEGORY_SUBCATEGORY, category_to_subcategories)
+
+    def add_controls(self, controls: Mapping[str, ControlNode]) -> None:
+        """Load control nodes and their component, risk and persona references."""
+        for control_id, node in controls.items():
+            self.add_node(CONTROL, control_id)
+            self.add_edges(CONTROL_COMPONENT, control_id, node.components)
+            self.add_edges(CONTROL_RISK, control_id, node.risks)
+            self.add_edges(CONTROL_PERSONA, control_id, node.personas)
+
+    def add_frameworks(self, frameworks_data: Mapping[str, Any] | None) -> None:
+        """
+        Load framework nodes and applicability from parsed frameworks.yaml.
+
+        Frameworks without an ``applicableTo`` field are nodes but not sources
+        of framework.applicableTo; a scalar applicableTo is treated as a
+        single-item list.
+        """
+        if not frameworks_data or "frameworks" not in frameworks_data:
+            return
+        for framework in frameworks_data["frameworks"]:
+            framework_id = framework.get("id")
+            if not framework_id:
+                continue
+            self.add_framework(framework_id, framework.get("applicableTo"))
+
+    def add_framework(self, framework_id: str, applicable_to: Any = None) -> None:
+        """Register one framework node, keeping the raw applicableTo value as an attribute."""
+        self.add_node(FRAMEWORK, framework_id, applicableTo=applicable_to)
+        if applicable_to is None:
+            return
+        if isinstance(applicable_to, str):
+            applicable_to = [applicable_to]
+        self.add_edges(FRAMEWORK_APPLICABLE_TO, framework_id, applicable_to)
+
+    def add_entities(self, kind: str, entries: Iterable[Mapping[str, Any]] | None) -> None:
+        """
+        Load risks, controls or personas from a parsed YAML entity list.
+
+        Registers each entity with an ``id`` as a node, its non-empty
+        ``mappings`` keys in ``<kind>.framework``, and (for controls and risks)
+        its cross-references. Persona nodes record the ``deprecated`` flag.
+        """
+        for entry in entries or []:
+            entity_id = entry.get("id")
+            if not entity_id:
+                continue
+
+            if kind == PERSONA:
+                self.add_node(PERSONA, entity_id, deprecated=bool(entry.get("deprecated", False)))
+            else:
+                self.add_node(kind, entity_id)
+
+            mappings = entry.get("mappings", {})
+            if mappings and isinstance(mappings, dict):
+                self.add_edges(f"{kind}.framework", entity_id, mappings.keys())
+
+            if kind == CONTROL:
+                self.add_edges(CONTROL_RISK, entity_id, _as_id_list(entry.get("risks", [])))
+                self.add_edges(CONTROL_COMPONENT, entity_id, _as_id_list(entry.get("components", [])))
+                self.add_edges(CONTROL_PERSONA, entity_id, _as_id_list(entry.get("personas", [])))
+            elif kind == RISK:
+                self.add_edges(RISK_CONTROL, entity_id, _as_id_list(entry.get("controls", [])))
+                self.add_edges(RISK_PERSONA, entity_id, _as_id_list(entry.get("personas", [])))
+
+    @classmethod
+    def from_corpus(
+        cls,
+        *,
+        frameworks: Mapping[str, Any] | None = None,
+        risks: Mapping[str, Any] | None = None,
+        controls: Mapping[str, Any] | None = None,
+        personas: Mapping[str, Any] | None = None,
+    ) -> "ReferenceGraph":
+        """Build a graph from parsed frameworks/risks/controls/personas YAML documents."""
+        graph = cls()
+        graph.add_frameworks(frameworks)
+        for kind, document, key in (
+            (RISK, risks, "risks"),
+            (CONTROL, controls, "controls"),
+            (PERSONA, personas, "personas"),
+        ):
+            if document and key in document:
+                graph.add_entities(kind, document[key])
+        return graph
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def nodes(self, kind: str) -> dict[str, dict[str, Any]]:
+        """Return ``node_id -> attributes`` for a kind, in insertion order."""
+        return self._nodes.get(kind, {})
+
+    def adjacency(self, relation: str) -> dict[str, dict[str, None]]:
+        """Return the ordered ``source -> {target: None}`` adjacency of a relation."""
+        return self._relations.get(relation, {})
+
+    def pairs(self, relation: str) -> dict[Pair, None]:
+        """Return the relation's edges as an ordered set of ``(source, target)`` pairs."""
+        return {
+            (source, target): None for source, targets in self.adjacency(relation).items() for target in targets
+        }
+
+    def targets(self, relation: str) -> set[str]:
+        """Return every ID that appears as a target of a relation."""
+        return {target for targets in self.adjacency(relation).values() for target in targets}
+
+    def dangling(self, relation: str, kind: str, ignore: Iterable[str] = ()) -> list[Pair]:
+        """
+        Return edges whose target is not a node of ``kind``.
+
+        Args:
+            relation: Relation to check
+            kind: Node kind the targets must belong to
+            ignore: Target literals that are never reported (e.g. "all", "none")
+        """
+        unknown = self.targets(relation) - self.nodes(kind).keys() - set(ignore)
+        if not unknown:
+            return []
+        return [pair for pair in self.pairs(relation) if pair[1] in unknown]
+
+    def inapplicable(self, relation: str, entity_type: str, require_declared: bool = False) -> list[Pair]:
+        """
+        Return entity→framework edges to frameworks not applicable to ``entity_type``.
+
+        Args:
+            relation: Entity→framework relation to check
+            entity_type: applicableTo value the framework must list
+            require_declared: When False, frameworks that omit applicableTo are
+                skipped; when True they count as applicable to nothing. Unknown
+                frameworks are never reported here (see dangling()).
+        """
+        applicability = self.adjacency(FRAMEWORK_APPLICABLE_TO)
+        candidates = self.nodes(FRAMEWORK).keys() if require_declared else applicability.keys()
+        not_applicable = {
+            framework_id for framework_id in candidates if entity_type not in applicability.get(framework_id, ())
+        }
+        if not not_applicable:
+            return []
+        return [pair for pair in self.pairs(relation) if pair[1] in not_applicable]
+
+    def references_to(self, relation: str, target_ids: Iterable[str]) -> list[Pair]:
+        """Return edges of a relation that land on any of ``target_ids``."""
+        wanted = set(target_ids) & self.targets(relation)
+        if not wanted:
+            return []
+        return [pair for pair in self.pairs(relation) if pair[1] in wanted]
+
+    def relation_mismatches(self, relation_a: str, relation_b: str) -> tuple[dict[Pair, None], dict[Pair, None]]:
+        """
+        Compare two relations that should hold the same edges.
+
+        Returns:
+            Tuple of (only_in_a, only_in_b) as ordered pair sets, together the
+            symmetric difference of the two edge sets
+        """
+        pairs_a = self.pairs(relation_a)
+        pairs_b = self.pairs(relation_b)
+        only_in_a = {pair: None for pair in pairs_a if pair not in pairs_b}
+        only_in_b = {pair: None for pair in pairs_b if pair not in pairs_a}
+        return only_in_a, only_in_b
+
+    def misplaced_components(self) -> list[tuple[str, str, str | None]]:
+        """
+        Return components whose (category, subcategory) pair is not declared.
+
+        A missing subcategory is reported with ``None``; an unknown category has
+        no declared subcategories, so any subcategory under it is reported.
+        """
+        declared = self.pairs(CATEGORY_SUBCATEGORY)
+        misplaced = []
+        for component_id, attrs in self.nodes(COMPONENT).items():
+            category, subcategory = attrs.get("category"), attrs.get("subcategory")
+            if subcategory is None or (category, subcategory) not in declared:
+                misplaced.append((component_id, category, subcategory))
+        return misplaced
+
+
+def _as_id_list(value: Any) -> list[str]:
+    """Normalise a YAML reference field: keyword strings become one-item lists, non-lists empty."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, str)]
+    return []
@@ -51,7 +51,7 @@ def parse_components_yaml(file_path: Path = None) -> dict[str, ComponentNode]:
             if not category:
                 continue
 
-            if not isinstance(category, str):
+            if not isinstance(category, str) or not category.strip():
                 continue
 
             subcategory: str | None = component.get("subcategory")
@@ -71,8 +71,8 @@ def parse_components_yaml(file_path: Path = None) -> dict[str, ComponentNode]:
             if not isinstance(from_edges, list):
                 from_edges = []
 
-            # Create ComponentNode with validation
-            components[component_id] = ComponentNode(
+            # Every field is already type-checked or coerced above, so skip re-validation
+            components[component_id] = ComponentNode.from_trusted(
                 title=component_title,
                 category=category,
                 subcategory=subcategory,
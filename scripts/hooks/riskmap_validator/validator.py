@@ -11,9 +11,15 @@ that validates control→component references against the component ID set
 component's (category, subcategory) pair against the categories block
 declaration (ADR-018 D6).
 
+The referential checks are expressed as set operations over a shared
+ReferenceGraph. Each check_* function accepts plain dicts and builds a graph
+for one-off use; the *_warnings/*_errors variants take a prebuilt graph so a
+caller can run every check off a single build.
+
 Dependencies:
     - PyYAML: For YAML file parsing
     - .models: ComponentNode and ControlNode data models
+    - .reference_graph: Shared cross-reference multigraph
 """
 
 from dataclasses import dataclass, field
@@ -21,6 +27,13 @@ from pathlib import Path
 from typing import Any
 
 from .models import ComponentNode, ControlNode
+from .reference_graph import (
+    COMPONENT,
+    COMPONENT_FROM,
+    COMPONENT_TO,
+    CONTROL_COMPONENT,
+    ReferenceGraph,
+)
 from .utils import parse_components_yaml
 
 
@@ -49,6 +62,7 @@ class ComponentEdgeValidator:
         self.verbose = verbose
         self.components: dict[str, ComponentNode] = {}
         self.forward_map: dict[str, list[str]] = {}
+        self.graph: ReferenceGraph | None = None
 
     def log(self, message: str, level: str = "info") -> None:
         """Log messages if verbose enabled."""
@@ -74,7 +88,7 @@ class ComponentEdgeValidator:
         for component_id, node in components.items():
             # Forward edges: this component → other components
             if node.to_edges:
-                forward_map[component_id] = node.to_edges[:]  # Create copy
+                forward_map[component_id] = list(node.to_edges)  # Mutable copy
 
             # Build reverse mapping from from_edges
             for from_node in node.from_edges:
@@ -86,6 +100,14 @@ class ComponentEdgeValidator:
 
         return forward_map, reverse_map
 
+    def _graph_for(self, components: dict[str, ComponentNode]) -> ReferenceGraph:
+        """Reuse the graph built by validate_file() for self.components, else build one."""
+        if self.graph is not None and components is self.components:
+            return self.graph
+        graph = ReferenceGraph()
+        graph.add_components(components)
+        return graph
+
     def find_isolated_components(self, components: dict[str, ComponentNode]) -> set[str]:
         """
         Find components with no edges.
@@ -93,13 +115,10 @@ class ComponentEdgeValidator:
         Returns:
             Set of isolated component IDs
         """
-        isolated = set()
-
-        for component_id, node in components.items():
-            if not node.to_edges and not node.from_edges:
-                isolated.add(component_id)
+        graph = self._graph_for(components)
 
-        return isolated
+        # Neither a to-edge source nor the declaring end of a from-edge
+        return set(graph.nodes(COMPONENT)) - graph.adjacency(COMPONENT_TO).keys() - graph.targets(COMPONENT_FROM)
 
     def find_missing_components(self, components: dict[str, ComponentNode]) -> set[str]:
         """
@@ -108,15 +127,10 @@ class ComponentEdgeValidator:
         Returns:
             Set of missing component IDs
         """
-        existing_components = set(components.keys())
-        referenced_components = set()
-
-        # Collect all referenced components
-        for node in components.values():
-            referenced_components.update(node.to_edges)
-            referenced_components.update(node.from_edges)
+        graph = self._graph_for(components)
+        referenced_components = graph.targets(COMPONENT_TO) | graph.adjacency(COMPONENT_FROM).keys()
 
-        return referenced_components - existing_components
+        return referenced_components - graph.nodes(COMPONENT).keys()
 
     def validate_edge_consistency(
         self, forward_map: dict[str, list[str]], reverse_map: dict[str, list[str]]
@@ -131,34 +145,11 @@ class ComponentEdgeValidator:
         Returns:
             List of error messages
         """
-        errors = []
-
-        # Check forward → reverse consistency
-        for component, targets in forward_map.items():
-            if component not in reverse_map:
-                errors.append(f"Component '{component}' has outgoing edges but no corresponding incoming edges")
-            else:
-                expected_incoming = set(targets)
-                actual_incoming = set(reverse_map[component])
-
-                missing = expected_incoming - actual_incoming
-                extra = actual_incoming - expected_incoming
-
-                if missing:
-                    errors.append(
-                        f"Component '{component}' → missing incoming edges from: {', '.join(sorted(missing))}"
-                    )
-                if extra:
-                    errors.append(
-                        f"Component '{component}' → unexpected incoming edges from: {', '.join(sorted(extra))}"
-                    )
-
-        # Check reverse → forward consistency
-        for component in reverse_map.keys():
-            if component not in forward_map:
-                errors.append(f"Component '{component}' has incoming edges but no corresponding outgoing edges")
-
-        return errors
+        graph = ReferenceGraph()
+        graph.add_adjacency(COMPONENT_TO, forward_map)
+        graph.add_adjacency(COMPONENT_FROM, reverse_map)
+
+        return edge_consistency_errors(graph)
 
     def validate_file(self, file_path: Path) -> bool:
         """
@@ -174,11 +165,16 @@ class ComponentEdgeValidator:
 
         try:
             self.components = parse_components_yaml(file_path)
+            self.graph = None
 
             if not self.components:
                 self.log("No components found - skipping validation", "info")
                 return True
 
+            # One graph build serves every check below (and callers via self.graph)
+            self.graph = ReferenceGraph()
+            self.graph.add_components(self.components)
+
             # Run validation checks
             success = True
 
@@ -207,8 +203,10 @@ class ComponentEdgeValidator:
                 )
 
             # Check edge consistency
-            forward_map, reverse_map = self.build_edge_maps(self.components)
-            consistency_errors = self.validate_edge_consistency(forward_map, reverse_map)
+            self.forward_map = {
+                component_id: list(targets) for component_id, targets in self.graph.adjacency(COMPONENT_TO).items()
+            }
+            consistency_errors = edge_consistency_errors(self.graph)
 
             if consistency_errors:
                 self.log(f"Found {len(consistency_errors)} edge consistency errors:", "error")
@@ -226,6 +224,54 @@ class ComponentEdgeValidator:
             return False
 
 
+def edge_consistency_errors(graph: ReferenceGraph) -> list[str]:
+    """
+    Compare declared to-edges with declared from-edges in a reference graph.
+
+    The mismatching edges are the symmetric difference of the component.to and
+    component.from relations; they are grouped per source component into the
+    same messages ComponentEdgeValidator has always reported.
+
+    Args:
+        graph: Graph holding the component.to and component.from relations
+
+    Returns:
+        List of error messages
+    """
+    forward = graph.adjacency(COMPONENT_TO)
+    reverse = graph.adjacency(COMPONENT_FROM)
+    only_forward, only_reverse = graph.relation_mismatches(COMPONENT_TO, COMPONENT_FROM)
+
+    missing_by_component: dict[str, list[str]] = {}
+    for component, target in only_forward:
+        missing_by_component.setdefault(component, []).append(target)
+    extra_by_component: dict[str, list[str]] = {}
+    for component, target in only_reverse:
+        extra_by_component.setdefault(component, []).append(target)
+
+    errors = []
+
+    # Check forward → reverse consistency
+    for component in forward:
+        if component not in reverse:
+            errors.append(f"Component '{component}' has outgoing edges but no corresponding incoming edges")
+            continue
+
+        missing = missing_by_component.get(component)
+        extra = extra_by_component.get(component)
+        if missing:
+            errors.append(f"Component '{component}' → missing incoming edges from: {', '.join(sorted(missing))}")
+        if extra:
+            errors.append(f"Component '{component}' → unexpected incoming edges from: {', '.join(sorted(extra))}")
+
+    # Check reverse → forward consistency
+    for component in reverse:
+        if component not in forward:
+            errors.append(f"Component '{component}' has incoming edges but no corresponding outgoing edges")
+
+    return errors
+
+
 # ---------------------------------------------------------------------------
 # Lifecycle stage order uniqueness check (ADR-022 D4)
 # ---------------------------------------------------------------------------
@@ -317,20 +363,32 @@ def check_controls_components_mirror(
         List of human-readable warning strings, one per (control_id,
         missing_component_id) pair.  Empty list when all references resolve.
     """
-    warnings: list[str] = []
+    graph = ReferenceGraph()
+    graph.add_nodes(COMPONENT, component_ids)
+    graph.add_controls(controls)
 
-    for control_id, node in controls.items():
-        for component_ref in node.components:
-            # Skip documented escape hatches — they are not real component IDs.
-            if component_ref in _COMPONENT_ESCAPE_HATCHES:
-                continue
-            if component_ref not in component_ids:
-                warnings.append(
-                    f"Control '{control_id}' references component '{component_ref}' "
-                    f"which does not exist in components.yaml"
-                )
+    return controls_components_mirror_warnings(graph)
 
-    return warnings
+
+def controls_components_mirror_warnings(graph: ReferenceGraph) -> list[str]:
+    """
+    Run the controls↔components mirror check over a prebuilt reference graph.
+
+    The unresolved references are the control.component edges whose target is
+    not a component node, minus the "all"/"none" escape hatches.
+
+    Args:
+        graph: Graph holding component nodes and the control.component relation
+
+    Returns:
+        Same warnings as check_controls_components_mirror()
+    """
+    return [
+        f"Control '{control_id}' references component '{component_ref}' which does not exist in components.yaml"
+        for control_id, component_ref in graph.dangling(
+            CONTROL_COMPONENT, COMPONENT, ignore=_COMPONENT_ESCAPE_HATCHES
+        )
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -369,20 +427,38 @@ def check_category_subcategory_nesting(
     Returns:
         List of human-readable warning strings; empty when all pairs are valid.
     """
+    graph = ReferenceGraph()
+    graph.add_components(components)
+    graph.add_category_nesting(category_to_subcategories)
+
+    return category_subcategory_nesting_warnings(graph)
+
+
+def category_subcategory_nesting_warnings(graph: ReferenceGraph) -> list[str]:
+    """
+    Run the category/subcategory nesting check over a prebuilt reference graph.
+
+    Each component's (category, subcategory) placement is tested for membership
+    in the declared category.subcategory pair set.
+
+    Args:
+        graph: Graph holding component nodes and the category.subcategory relation
+
+    Returns:
+        Same warnings as check_category_subcategory_nesting()
+    """
     warnings: list[str] = []
 
-    for component_id, node in components.items():
-        if node.subcategory is None:
+    for component_id, category, subcategory in graph.misplaced_components():
+        if subcategory is None:
             # Class 2: subcategory absent — surface for content debt tracking.
-            warnings.append(f"Component '{component_id}' (category '{node.category}') is missing a subcategory")
+            warnings.append(f"Component '{component_id}' (category '{category}') is missing a subcategory")
         else:
-            # Class 1: subcategory present — check it is nested under the claimed category.
+            # Class 1: subcategory present but not nested under the claimed category.
             # An unknown category is treated as having no valid subcategories.
-            valid_subcategories = category_to_subcategories.get(node.category, set())
-            if node.subcategory not in valid_subcategories:
-                warnings.append(
-                    f"Component '{component_id}' claims category '{node.category}' "
-                    f"but subcategory '{node.subcategory}' is not nested under that category"
-                )
+            warnings.append(
+                f"Component '{component_id}' claims category '{category}' "
+                f"but subcategory '{subcategory}' is not nested under that category"
+            )
 
     return warnings
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Stub Mermaid renderer used by test_regenerate_svgs.py in place of ``npx mmdc``.
+
+Accepts the mmdc flags the hook passes (-i, -o, -t, -b, -p). For a single diagram input it
+writes a deterministic SVG to -o; for a markdown input it writes ``<out>-<n>.svg`` per fenced
+``mermaid`` block, mirroring mmdc's markdown mode. Each invocation is appended as one JSON line
+to $STUB_MMDC_LOG. Any diagram containing the text ``FAIL`` makes the whole invocation exit 1.
+``--version`` prints $STUB_MMDC_VERSION (default 0.0.0) and is not logged.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+
+def _svg(source: str) -> str:
+    # Trailing whitespace does not change a Mermaid render.
+    digest = hashlib.sha256(source.rstrip().encode("utf-8")).hexdigest()[:16]
+    return f'<svg xmlns="http://www.w3.org/2000/svg"><!-- {digest} --></svg>\n'
+
+
+def main(argv: list[str]) -> int:
+    if argv == ["--version"]:
+        print(os.environ.get("STUB_MMDC_VERSION", "0.0.0"))
+        return 0
+
+    args = dict(zip(argv[::2], argv[1::2]))
+    input_path, output_path = Path(args["-i"]), Path(args["-o"])
+
+    log_path = os.environ.get("STUB_MMDC_LOG")
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(argv) + "\n")
+
+    text = input_path.read_text(encoding="utf-8")
+    if input_path.suffix == ".md":
+        sources = re.findall(r"```mermaid\n(.*?)\n```", text, flags=re.DOTALL)
+    else:
+        sources = [text]
+
+    if any("FAIL" in source for source in sources):
+        print("stub mmdc: parse error", file=sys.stderr)
+        return 1
+
+    if input_path.suffix == ".md":
+        for n, source in enumerate(sources, start=1):
+            output_path.with_name(f"{output_path.stem}-{n}{output_path.suffix}").write_text(
+                _svg(source), encoding="utf-8"
+            )
+    else:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(_svg(sources[0]), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
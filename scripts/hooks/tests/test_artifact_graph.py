@@ -0,0 +1,297 @@
+"""
+Tests for scripts/hooks/_artifact_graph.py
+
+Test Coverage:
+==============
+1. Declarations: exact inputs of tables, graphs, SVGs, issue templates and site data;
+   every committed generated file has exactly one producer
+2. Graph structure: topological order, duplicate and cycle detection
+3. Staleness: direct inputs, transitive dependents, kind filtering, path forms
+4. Build scheduling: content-hash propagation, failure isolation, parallel waves
+5. Hook triggers: each regeneration hook's files: regex matches every declared input
+"""
+
+import re
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.hooks._artifact_graph import ARTIFACT_GRAPH, Artifact, ArtifactGraph  # noqa: E402
+
+COMPONENTS_YAML = "risk-map/yaml/components.yaml"
+CONTROLS_YAML = "risk-map/yaml/controls.yaml"
+RISKS_YAML = "risk-map/yaml/risks.yaml"
+PERSONAS_YAML = "risk-map/yaml/personas.yaml"
+
+# Hook that rebuilds (or, for site data, validates) each artifact kind.
+HOOK_FOR_KIND = {
+    "table": "regenerate-tables",
+    "graph": "regenerate-graphs",
+    "svg": "regenerate-svgs",
+    "issue-templates": "regenerate-issue-templates",
+    "site": "validate-persona-site-build",
+}
+
+
+def _artifact(name: str, inputs: tuple[str, ...], outputs: tuple[str, ...]) -> Artifact:
+    return Artifact(name=name, kind="test", target=name, inputs=inputs, outputs=outputs)
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    """A three-step chain src.txt -> a.txt -> b.txt -> c.txt built in a temp working tree."""
+    monkeypatch.chdir(tmp_path)
+    return ArtifactGraph(
+        [
+            _artifact("c", ("b.txt",), ("c.txt",)),
+            _artifact("b", ("a.txt",), ("b.txt",)),
+            _artifact("a", ("src.txt",), ("a.txt",)),
+        ]
+    )
+
+
+def _copy_upper(mapping: dict[str, str], log: list[str] | None = None):
+    """Return a run() callback that writes each output as the upper-cased first input."""
+
+    def run(artifact: Artifact) -> int:
+        if log is not None:
+            log.append(artifact.name)
+        source = Path(artifact.inputs[0])
+        Path(artifact.outputs[0]).write_text(mapping.get(artifact.name, source.read_text().upper()))
+        return 0
+
+    return run
+
+
+class TestDeclarations:
+    """The declared graph matches what the generators read and write."""
+
+    def test_prose_tables_read_the_whole_corpus(self):
+        """
+        Given: The components full table, whose prose expands sentinels from any corpus file
+        When: Its inputs are inspected
+        Then: All four corpus files are inputs
+        """
+        table = ARTIFACT_GRAPH["table:components:full"]
+
+        assert set(table.inputs) == {COMPONENTS_YAML, CONTROLS_YAML, RISKS_YAML, PERSONAS_YAML}
+
+    def test_xref_tables_read_only_both_sides(self):
+        """
+        Given: The personas xref-risks table
+        When: Its inputs are inspected
+        Then: Only personas.yaml and risks.yaml are inputs
+        """
+        assert set(ARTIFACT_GRAPH["table:personas:xref-risks"].inputs) == {PERSONAS_YAML, RISKS_YAML}
+
+    def test_every_graph_reads_category_titles_and_styles(self):
+        """
+        Given: The three Mermaid graphs
+        When: Their inputs are inspected
+        Then: Each reads components.yaml, controls.yaml and mermaid-styles.yaml
+        """
+        for graph in ARTIFACT_GRAPH.of_kind("graph"):
+            assert {COMPONENTS_YAML, CONTROLS_YAML, "risk-map/yaml/mermaid-styles.yaml"} <= set(graph.inputs)
+
+    def test_svgs_depend_on_graph_outputs(self):
+        """
+        Given: The controls-graph SVG
+        When: Staleness is computed for controls.yaml
+        Then: The SVG is stale after the graph that produces its .mermaid source
+        """
+        stale = [artifact.name for artifact in ARTIFACT_GRAPH.stale([CONTROLS_YAML])]
+
+        assert stale.index("graph:controls-graph") < stale.index("svg:controls-graph")
+
+    @pytest.mark.live_corpus
+    def test_every_committed_generated_file_has_a_producer(self):
+        """
+        Given: The committed tables, graph diagrams and graph SVGs
+        When: Compared with the declared outputs
+        Then: Each committed file is produced by a declared artifact
+        """
+        outputs = {output for artifact in ARTIFACT_GRAPH.artifacts for output in artifact.outputs}
+        committed = [
+            *(REPO_ROOT / "risk-map" / "tables").glob("*.md"),
+            *(REPO_ROOT / "risk-map" / "diagrams").glob("*-graph.*"),
+        ]
+
+        for path in committed:
+            assert path.relative_to(REPO_ROOT).as_posix() in outputs
+
+
+class TestGraphStructure:
+    """Ordering and validation of the graph itself."""
+
+    def test_producers_precede_consumers(self, chain):
+        """
+        Given: A chain declared in reverse order
+        When: The graph is built
+        Then: Artifacts are ordered a, b, c
+        """
+        assert [artifact.name for artifact in chain.artifacts] == ["a", "b", "c"]
+
+    def test_cycle_is_rejected(self):
+        """
+        Given: Two artifacts that read each other's outputs
+        When: The graph is built
+        Then: ValueError names the cycle
+        """
+        with pytest.raises(ValueError, match="Dependency cycle"):
+            ArtifactGraph([_artifact("x", ("y.txt",), ("x.txt",)), _artifact("y", ("x.txt",), ("y.txt",))])
+
+    def test_shared_output_is_rejected(self):
+        """
+        Given: Two artifacts writing the same file
+        When: The graph is built
+        Then: ValueError names both producers
+        """
+        with pytest.raises(ValueError, match="produced by both x and y"):
+            ArtifactGraph([_artifact("x", ("a",), ("out",)), _artifact("y", ("b",), ("out",))])
+
+
+class TestStaleness:
+    """Which artifacts a set of changed files makes stale."""
+
+    def test_changed_input_makes_dependents_stale(self, chain):
+        """
+        Given: The chain
+        When: a.txt (an intermediate output) changes
+        Then: b and c are stale, a is not
+        """
+        assert [artifact.name for artifact in chain.stale(["a.txt"])] == ["b", "c"]
+
+    def test_kind_filter(self):
+        """
+        Given: risks.yaml changed
+        When: Only graphs are requested
+        Then: Only the controls-to-risk graph is stale
+        """
+        assert [artifact.name for artifact in ARTIFACT_GRAPH.stale([RISKS_YAML], kinds={"graph"})] == [
+            "graph:controls-to-risk-graph"
+        ]
+
+    def test_absolute_and_suffix_paths(self):
+        """
+        Given: An absolute path to personas.yaml and a file that merely ends in "personas.yaml"
+        When: Staleness is computed
+        Then: The absolute path matches; the look-alike does not
+        """
+        assert ARTIFACT_GRAPH.stale(["/work/repo/risk-map/yaml/personas.yaml"], kinds={"table"})
+        assert ARTIFACT_GRAPH.stale(["risk-map/yaml/old-personas.yaml"]) == []
+
+    def test_glob_inputs(self):
+        """
+        Given: A changed schema file
+        When: Staleness is computed
+        Then: The issue templates (which read every schema) are stale
+        """
+        stale = ARTIFACT_GRAPH.stale(["risk-map/schemas/risks.schema.json"])
+
+        assert "issue-templates" in [artifact.name for artifact in stale]
+
+
+class TestBuild:
+    """make-like rebuilds driven by content hashes."""
+
+    def test_chain_is_rebuilt_in_order(self, chain):
+        """
+        Given: src.txt changed and no outputs exist
+        When: build() runs
+        Then: a, b and c are built in order and all three outputs are recorded as changed
+        """
+        Path("src.txt").write_text("x")
+        log: list[str] = []
+
+        result = chain.build(["src.txt"], _copy_upper({}, log))
+
+        assert result.exit_code == 0
+        assert log == ["a", "b", "c"]
+        assert result.artifacts.changed == [Path("a.txt"), Path("b.txt"), Path("c.txt")]
+
+    def test_unchanged_output_stops_propagation(self, chain):
+        """
+        Given: src.txt changed but rebuilding a produces the bytes already on disk
+        When: build() runs
+        Then: Only a is built; b and c are not rebuilt and nothing is recorded
+        """
+        Path("src.txt").write_text("x")
+        Path("a.txt").write_text("X")
+        log: list[str] = []
+
+        result = chain.build(["src.txt"], _copy_upper({}, log))
+
+        assert log == ["a"]
+        assert result.artifacts.changed == []
+
+    def test_failed_build_skips_dependents(self, chain):
+        """
+        Given: src.txt changed and building a fails
+        When: build() runs
+        Then: b and c are skipped, nothing is recorded, a's exit code is returned
+        """
+        Path("src.txt").write_text("x")
+        log: list[str] = []
+
+        def run(artifact):
+            log.append(artifact.name)
+            Path(artifact.outputs[0]).write_text("partial")
+            return 3
+
+        result = chain.build(["src.txt"], run)
+
+        assert result.exit_code == 3
+        assert log == ["a"]
+        assert result.artifacts.changed == []
+
+    def test_independent_artifacts_run_concurrently(self, tmp_path, monkeypatch):
+        """
+        Given: Three artifacts reading the same changed file
+        When: build() runs
+        Then: All three are in flight at the same time
+        """
+        monkeypatch.chdir(tmp_path)
+        graph = ArtifactGraph([_artifact(name, ("src.txt",), (f"{name}.txt",)) for name in "xyz"])
+        barrier = threading.Barrier(3, timeout=5)
+
+        def run(artifact):
+            barrier.wait()
+            Path(artifact.outputs[0]).write_text(artifact.name)
+            return 0
+
+        result = graph.build(["src.txt"], run)
+
+        assert result.exit_code == 0
+        assert result.artifacts.changed == [Path("x.txt"), Path("y.txt"), Path("z.txt")]
+
+
+class TestHookTriggers:
+    """.pre-commit-config.yaml triggers each hook on every declared input."""
+
+    @staticmethod
+    def _hook_files(hook_id: str) -> str:
+        config = yaml.safe_load((REPO_ROOT / ".pre-commit-config.yaml").read_text(encoding="utf-8"))
+        for repo in config["repos"]:
+            for hook in repo.get("hooks", []):
+                if hook.get("id") == hook_id:
+                    return hook["files"]
+        raise AssertionError(f"hook {hook_id} not declared")
+
+    @pytest.mark.parametrize("artifact", ARTIFACT_GRAPH.artifacts, ids=lambda artifact: artifact.name)
+    def test_hook_regex_matches_every_input(self, artifact):
+        """
+        Given: A declared artifact
+        When: Each of its inputs is matched against its hook's files: regex
+        Then: Every input triggers the hook
+        """
+        files_regex = self._hook_files(HOOK_FOR_KIND[artifact.kind])
+
+        for pattern in artifact.inputs:
+            example = pattern.replace("*", "example")
+            assert re.search(files_regex, example), f"{HOOK_FOR_KIND[artifact.kind]} does not trigger on {pattern}"
@@ -0,0 +1,428 @@
+"""
+Tests for scripts/hooks/_artifact_writer.py
+
+Test Coverage:
+==============
+1. write_if_changed(): digest comparison, atomic replace, mode handling, failure cleanup
+2. write_lines_if_changed(): streamed writes with the same guarantees
+3. write_json_if_changed(): indented JSON streamed item by item, byte-identical to json.dumps()
+4. AtomicFileWriter: several files written side by side, each replaced only if changed
+5. user_cache_dir(): env override, $XDG_CACHE_HOME, ~/.cache fallback
+6. ArtifactWriter: change collection for own writes and watched external outputs
+7. Staging: one git add for all changed paths, none when nothing changed;
+   deleted outputs are staged only when git tracks them
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.hooks._artifact_writer import (  # noqa: E402
+    ArtifactWriter,
+    AtomicFileWriter,
+    file_digest,
+    user_cache_dir,
+    write_if_changed,
+    write_json_if_changed,
+    write_lines_if_changed,
+)
+
+
+class TestWriteIfChanged:
+    """Digest-compared atomic writes."""
+
+    def test_new_file_is_written_world_readable(self, tmp_path):
+        """
+        Given: A path in a directory that does not exist yet
+        When: write_if_changed() is called
+        Then: The directory and file are created with mode 0644 and True is returned
+        """
+        target = tmp_path / "out" / "table.md"
+
+        assert write_if_changed(target, "text") is True
+        assert target.read_text() == "text"
+        assert target.stat().st_mode & 0o777 == 0o644
+
+    def test_identical_content_is_not_rewritten(self, tmp_path):
+        """
+        Given: A file that already holds the rendered bytes
+        When: write_if_changed() is called with the same text
+        Then: False is returned and the mtime is untouched
+        """
+        target = tmp_path / "table.md"
+        target.write_text("same")
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+
+        assert write_if_changed(target, "same") is False
+        assert target.stat().st_mtime_ns == 1_000_000_000
+
+    def test_replace_keeps_mode_and_leaves_no_temp_file(self, tmp_path):
+        """
+        Given: An existing file with mode 0640
+        When: Different content is written
+        Then: The new bytes are in place, the mode is kept and no temp file remains
+        """
+        target = tmp_path / "table.md"
+        target.write_text("old")
+        target.chmod(0o640)
+
+        assert write_if_changed(target, b"new") is True
+        assert target.read_bytes() == b"new"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_rename_keeps_original(self, tmp_path):
+        """
+        Given: An existing file
+        When: The rename step fails
+        Then: The original survives, the temp file is removed and the error propagates
+        """
+        target = tmp_path / "table.md"
+        target.write_text("old")
+
+        with patch("scripts.hooks._artifact_writer.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_if_changed(target, "new")
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_file_digest_of_missing_file_is_none(self, tmp_path):
+        """
+        Given: A path that does not exist
+        When: file_digest() is called
+        Then: None is returned
+        """
+        assert file_digest(tmp_path / "missing") is None
+
+
+class TestWriteLinesIfChanged:
+    """Streamed, digest-compared atomic writes."""
+
+    def test_lines_are_joined_with_newlines(self, tmp_path):
+        """
+        Given: A generator of lines
+        When: write_lines_if_changed() is called
+        Then: The file holds the lines joined by newlines, with no trailing newline added
+        """
+        target = tmp_path / "out" / "table.md"
+
+        assert write_lines_if_changed(target, (line for line in ["a", "b", "\nc\n"])) is True
+        assert target.read_text() == "a\nb\n\nc\n"
+        assert target.stat().st_mode & 0o777 == 0o644
+
+    def test_identical_content_is_not_rewritten(self, tmp_path):
+        """
+        Given: A file that already holds the joined lines
+        When: write_lines_if_changed() streams the same lines
+        Then: False is returned, the mtime is untouched and the temp file is removed
+        """
+        target = tmp_path / "table.md"
+        target.write_text("a\nb")
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+
+        assert write_lines_if_changed(target, iter(["a", "b"])) is False
+        assert target.stat().st_mtime_ns == 1_000_000_000
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failing_source_keeps_original(self, tmp_path):
+        """
+        Given: An existing file and a line source that raises part-way through
+        When: write_lines_if_changed() is called
+        Then: The original survives, the temp file is removed and the error propagates
+        """
+        target = tmp_path / "table.md"
+        target.write_text("old")
+
+        def lines():
+            yield "new"
+            raise ValueError("unresolved sentinel")
+
+        with pytest.raises(ValueError, match="unresolved sentinel"):
+            write_lines_if_changed(target, lines())
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestWriteJsonIfChanged:
+    """JSON documents streamed one top-level array item at a time."""
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            {},
+            {"empty": [], "none": None, "object": {}},
+            {"items": [{"id": "a", "nested": [1, [2, {}]]}, "plain", []], "meta": {"count": 2, "tags": ["x"]}},
+            {"text": ['Caf\u00e9 \u2014 "quoted"\nline'], "flag": True},
+        ],
+    )
+    def test_output_matches_indented_json_dumps(self, tmp_path, document):
+        """
+        Given: A document with empty, nested and non-ASCII values
+        When: write_json_if_changed() is called
+        Then: The file holds exactly json.dumps(document, indent=2) plus a trailing newline
+        """
+        target = tmp_path / "out" / "data.json"
+
+        assert write_json_if_changed(target, document) is True
+        assert target.read_text(encoding="utf-8") == json.dumps(document, indent=2) + "\n"
+
+    def test_identical_content_is_not_rewritten(self, tmp_path):
+        """
+        Given: A file that already holds the indented document
+        When: write_json_if_changed() streams the same document
+        Then: False is returned and the mtime is untouched
+        """
+        target = tmp_path / "data.json"
+        target.write_text(json.dumps({"items": [1, 2]}, indent=2) + "\n")
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+
+        assert write_json_if_changed(target, {"items": [1, 2]}) is False
+        assert target.stat().st_mtime_ns == 1_000_000_000
+
+    def test_check_item_sees_every_item_and_failure_keeps_original(self, tmp_path):
+        """
+        Given: An existing file and a check_item callback that rejects the last item
+        When: write_json_if_changed() is called
+        Then: The callback saw each array item with its key and index, the original
+              survives, the temp file is removed and the error propagates
+        """
+        target = tmp_path / "data.json"
+        target.write_text("old")
+        seen = []
+
+        def check_item(key, index, item):
+            seen.append((key, index, item))
+            if item == "bad":
+                raise ValueError("invalid record")
+
+        with pytest.raises(ValueError, match="invalid record"):
+            write_json_if_changed(target, {"meta": {"n": 1}, "ok": ["a"], "items": ["b", "bad"]}, check_item)
+
+        assert seen == [("ok", 0, "a"), ("items", 0, "b"), ("items", 1, "bad")]
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestAtomicFileWriter:
+    """Streamed writers that can be open side by side."""
+
+    def test_only_changed_files_are_replaced(self, tmp_path):
+        """
+        Given: Two writers open at once, one writing the bytes already on disk
+        When: Both blocks exit cleanly
+        Then: Only the other file is replaced and ``changed`` says which
+        """
+        same, new = tmp_path / "same.md", tmp_path / "new.csv"
+        same.write_text("a,b")
+
+        with AtomicFileWriter(same) as first, AtomicFileWriter(new) as second:
+            for part in ("a", ",b"):
+                first.write(part)
+                second.write(part)
+
+        assert (first.changed, second.changed) == (False, True)
+        assert new.read_text() == "a,b"
+        assert sorted(tmp_path.iterdir()) == [new, same]
+
+    def test_error_in_block_discards_temp_file(self, tmp_path):
+        """
+        Given: An existing file and a block that raises after writing
+        When: The writer exits
+        Then: The original survives, the temp file is removed and ``changed`` is False
+        """
+        target = tmp_path / "table.md"
+        target.write_text("old")
+
+        with pytest.raises(ValueError), AtomicFileWriter(target) as out:
+            out.write("new")
+            raise ValueError("boom")
+
+        assert out.changed is False
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestUserCacheDir:
+    """Hook cache directory resolution."""
+
+    def test_env_override_wins(self, tmp_path, monkeypatch):
+        """
+        Given: Both the hook's override variable and XDG_CACHE_HOME are set
+        When: user_cache_dir() is called
+        Then: The override path is returned unchanged
+        """
+        monkeypatch.setenv("HOOK_CACHE_DIR", str(tmp_path / "override"))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        assert user_cache_dir("HOOK_CACHE_DIR", "hook") == tmp_path / "override"
+
+    def test_xdg_cache_home_is_used_without_override(self, tmp_path, monkeypatch):
+        """
+        Given: The override variable is empty and XDG_CACHE_HOME is set
+        When: user_cache_dir() is called
+        Then: The directory is namespaced under $XDG_CACHE_HOME/secure-ai-tooling
+        """
+        monkeypatch.setenv("HOOK_CACHE_DIR", "")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        assert user_cache_dir("HOOK_CACHE_DIR", "hook") == tmp_path / "xdg" / "secure-ai-tooling" / "hook"
+
+    def test_home_cache_is_the_fallback(self, tmp_path, monkeypatch):
+        """
+        Given: Neither the override variable nor XDG_CACHE_HOME is set
+        When: user_cache_dir() is called
+        Then: The directory is under ~/.cache/secure-ai-tooling
+        """
+        monkeypatch.delenv("HOOK_CACHE_DIR", raising=False)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert user_cache_dir("HOOK_CACHE_DIR", "hook") == tmp_path / ".cache" / "secure-ai-tooling" / "hook"
+
+
+class TestArtifactWriter:
+    """Changed-path collection."""
+
+    def test_write_records_only_changed_paths(self, tmp_path):
+        """
+        Given: One up-to-date file and one stale file
+        When: Both are written through an ArtifactWriter
+        Then: Only the stale file is recorded as changed
+        """
+        fresh, stale = tmp_path / "fresh.md", tmp_path / "stale.md"
+        fresh.write_text("a")
+        stale.write_text("old")
+        writer = ArtifactWriter()
+
+        writer.write(fresh, "a")
+        writer.write(stale, "new")
+
+        assert writer.changed == [stale]
+
+    def test_watch_and_collect_detect_external_changes(self, tmp_path):
+        """
+        Given: Watched files that a generator then modifies, leaves alone, creates and deletes
+        When: collect() runs after the generator
+        Then: Modified, created and deleted files are changed; the untouched one is not
+        """
+        modified, untouched, created, deleted = (tmp_path / name for name in ("m", "u", "c", "d"))
+        modified.write_text("1")
+        untouched.write_text("1")
+        deleted.write_text("1")
+        writer = ArtifactWriter()
+        writer.watch([modified, untouched, created, deleted])
+
+        modified.write_text("2")
+        untouched.write_text("1")
+        created.write_text("new")
+        deleted.unlink()
+
+        assert writer.collect() == [modified, created, deleted]
+
+    def test_watched_directory_picks_up_new_files(self, tmp_path):
+        """
+        Given: A watched output directory
+        When: The generator adds a file and rewrites another with identical bytes
+        Then: Only the new file is collected
+        """
+        out_dir = tmp_path / "templates"
+        out_dir.mkdir()
+        (out_dir / "a.yml").write_text("a")
+        writer = ArtifactWriter()
+        writer.watch([out_dir])
+
+        (out_dir / "a.yml").write_text("a")
+        (out_dir / "b.yml").write_text("b")
+
+        assert writer.collect() == [out_dir / "b.yml"]
+
+
+class TestStaging:
+    """Single batched git add."""
+
+    def test_stage_without_changes_runs_no_git(self):
+        """
+        Given: An ArtifactWriter with no changed paths
+        When: stage() is called
+        Then: git is not invoked and 0 is returned
+        """
+        with patch("subprocess.run") as mock_run:
+            assert ArtifactWriter().stage() == 0
+
+        mock_run.assert_not_called()
+
+    def test_stage_adds_all_changed_paths_once(self, tmp_path):
+        """
+        Given: Two changed artifacts
+        When: stage() is called
+        Then: One git add lists both paths and its exit code is returned
+        """
+        writer = ArtifactWriter()
+        writer.write(tmp_path / "a.md", "a")
+        writer.write(tmp_path / "b.md", "b")
+
+        with patch("subprocess.run", return_value=MagicMock(returncode=3)) as mock_run:
+            assert writer.stage() == 3
+
+        mock_run.assert_called_once_with(["git", "add", str(tmp_path / "a.md"), str(tmp_path / "b.md")])
+
+    @pytest.fixture
+    def git_repo(self, tmp_path, monkeypatch):
+        """A git repository with one committed file, as the working directory."""
+        monkeypatch.chdir(tmp_path)
+        subprocess.run(["git", "init", "-q"], check=True)
+        Path("tracked.md").write_text("old")
+        subprocess.run(["git", "add", "tracked.md"], check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init"],
+            check=True,
+        )
+        return tmp_path
+
+    def _staged(self) -> list[str]:
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--name-status"], capture_output=True, text=True, check=True
+        )
+        return result.stdout.splitlines()
+
+    def test_deleted_tracked_output_is_staged_as_deletion(self, git_repo):
+        """
+        Given: A watched tracked file that the generator deleted, and a new output
+        When: stage() is called
+        Then: git add succeeds and stages the deletion next to the new file
+        """
+        writer = ArtifactWriter()
+        writer.watch(["tracked.md"])
+        Path("tracked.md").unlink()
+        writer.collect()
+        writer.write(Path("new.md"), "new")
+
+        assert writer.stage() == 0
+        assert self._staged() == ["A\tnew.md", "D\ttracked.md"]
+
+    def test_deleted_untracked_output_is_skipped(self, git_repo):
+        """
+        Given: A watched untracked file that the generator deleted
+        When: stage() is called
+        Then: It is left out of git add, which therefore does not run, and 0 is returned
+        """
+        Path("scratch.md").write_text("tmp")
+        writer = ArtifactWriter()
+        writer.watch(["scratch.md"])
+        Path("scratch.md").unlink()
+        assert writer.collect() == [Path("scratch.md")]
+
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            assert writer.stage() == 0
+
+        assert [call.args[0][:2] for call in mock_run.call_args_list] == [["git", "ls-files"]]
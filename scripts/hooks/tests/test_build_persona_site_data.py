@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import copy
+import gzip
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -15,18 +17,32 @@ import pytest
 REPO_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(REPO_ROOT))
 
+import scripts.build_persona_site_data as builder  # noqa: E402
 from scripts.build_persona_site_data import (  # noqa: E402
     GUIDED_QUESTION_THRESHOLD,
+    MANIFEST_NAME,
+    PRECOMPRESSED_SUFFIXES,
+    SEARCH_FIELD_WEIGHTS,
+    SHARD_DIR_NAME,
     _make_schema_registry,
+    _output_validator,
+    build_relation_index,
+    build_search_index,
     build_site_data,
+    build_site_shards,
+    decode_mask,
+    encode_mask,
     humanize_identifier,
     load_yaml,
     normalize_control_risk_ids,
     normalize_text_entries,
     parse_args,
     resolve_output_path,
+    validate_site_data,
     write_site_data,
+    write_site_shards,
 )
+from scripts.hooks._sentinel_expansion import UnresolvedSentinelsError  # noqa: E402
 
 
 def test_build_site_data_filters_deprecated_personas_and_preserves_active_order(
@@ -300,6 +316,15 @@ def _minimal_valid_site_data() -> dict:
         "controlCategories": [],
         "risks": [],
         "controls": [],
+        "relations": {
+            "personaIds": [],
+            "riskIds": [],
+            "controlIds": [],
+            "personaRiskMasks": [],
+            "personaControlMasks": [],
+            "riskPersonaMasks": [],
+            "controlPersonaMasks": [],
+        },
     }
 
 
@@ -343,6 +368,551 @@ def test_write_site_data_rejects_non_conforming_output(tmp_path: Path):
     )
 
 
+def test_write_site_data_matches_indented_json_dump(tmp_path: Path, corpus_site_data: dict):
+    """
+    Test that the streamed site data file keeps the established indented format.
+
+    Given: Site data built from the live corpus
+    When: write_site_data() streams it record by record
+    Then: The file is byte-identical to json.dumps(data, indent=2) plus a trailing newline
+    """
+    output_path = tmp_path / "out.json"
+
+    write_site_data(corpus_site_data, output_path)
+
+    assert output_path.read_text(encoding="utf-8") == json.dumps(corpus_site_data, indent=2) + "\n"
+
+
+def test_write_site_data_keeps_previous_file_when_a_record_fails(tmp_path: Path):
+    """
+    Test that a record failing validation mid-stream leaves the previous output in place.
+
+    Given: An existing output file and site data whose last category lacks its required title
+    When: write_site_data() is called
+    Then: ValidationError names the record and the previous file is left untouched,
+          with no temp file behind
+    """
+    output_path = tmp_path / "out.json"
+    output_path.write_text("previous build\n", encoding="utf-8")
+
+    with pytest.raises(jsonschema.ValidationError, match=r"\['riskCategories', 2\]"):
+        write_site_data(_categories_site_data("Data", "Model", None), output_path)
+
+    assert output_path.read_text(encoding="utf-8") == "previous build\n"
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_output_validator_is_compiled_once():
+    """
+    Test that the output-schema validator is built on first use and then reused.
+
+    Given: The builder module already imported
+    When: _output_validator() is called twice
+    Then: The same validator object is returned both times
+    """
+    assert _output_validator() is _output_validator()
+
+
+def _categories_site_data(*titles: str | None) -> dict:
+    """Return minimal site data with one risk category per title (None omits the required title)."""
+    data = _minimal_valid_site_data()
+    data["riskCategories"] = [
+        {"id": f"risks{index}"} if title is None else {"id": f"risks{index}", "title": title}
+        for index, title in enumerate(titles)
+    ]
+    return data
+
+
+@pytest.fixture
+def validated_records(monkeypatch) -> list[tuple[str, int]]:
+    """Record the key and index of every record handed to the schema validator."""
+    records: list[tuple[str, int]] = []
+    real_validate = builder._validate_record
+
+    def spy(key, index, record):
+        records.append((key, index))
+        real_validate(key, index, record)
+
+    monkeypatch.setattr(builder, "_validate_record", spy)
+    return records
+
+
+def test_validation_cache_skips_records_validated_before(tmp_path: Path, validated_records: list[tuple[str, int]]):
+    """
+    Test that the validation cache limits validation to records that changed.
+
+    Given: Site data with two risk categories validated once with a validation cache
+    When: The data is validated again with one category retitled
+    Then: The second validation sees only the retitled category, and a third,
+          unchanged validation sees no records at all
+    """
+    cache_path = tmp_path / "cache" / "validated.json"
+    validate_site_data(_categories_site_data("Data", "Model"), cache_path)
+    assert validated_records == [("riskCategories", 0), ("riskCategories", 1)]
+
+    validated_records.clear()
+    validate_site_data(_categories_site_data("Data", "Models"), cache_path)
+    assert validated_records == [("riskCategories", 1)]
+
+    validated_records.clear()
+    validate_site_data(_categories_site_data("Data", "Models"), cache_path)
+    assert validated_records == []
+
+
+def test_validation_cache_reports_index_in_full_data(tmp_path: Path):
+    """
+    Test that an invalid changed record is reported at its position in the full data.
+
+    Given: Three valid categories recorded in the validation cache
+    When: The middle category loses its required title and the data is validated again
+    Then: ValidationError names riskCategories index 1, not its index among the changed records,
+          and the cache is not updated with the invalid record
+    """
+    cache_path = tmp_path / "validated.json"
+    validate_site_data(_categories_site_data("Data", "Model", "Runtime"), cache_path)
+    cached = cache_path.read_text(encoding="utf-8")
+
+    with pytest.raises(jsonschema.ValidationError, match=r"\['riskCategories', 1\]"):
+        validate_site_data(_categories_site_data("Data", None, "Runtime"), cache_path)
+
+    assert cache_path.read_text(encoding="utf-8") == cached
+
+
+def test_validation_cache_is_discarded_when_schemas_change(
+    tmp_path: Path, monkeypatch, validated_records: list[tuple[str, int]]
+):
+    """
+    Test that editing a schema file revalidates every record.
+
+    Given: Two categories recorded in the validation cache
+    When: The schema fingerprint changes and the same data is validated again
+    Then: Both categories are validated
+    """
+    cache_path = tmp_path / "validated.json"
+    validate_site_data(_categories_site_data("Data", "Model"), cache_path)
+
+    validated_records.clear()
+    monkeypatch.setattr(builder, "_schema_fingerprint", lambda: "edited")
+    validate_site_data(_categories_site_data("Data", "Model"), cache_path)
+
+    assert validated_records == [("riskCategories", 0), ("riskCategories", 1)]
+
+
+@pytest.mark.parametrize(
+    "records",
+    [{"a": 1}, "digest", 7, None, [["nested"], 3]],
+    ids=["dict", "string", "int", "null", "non-string-items"],
+)
+def test_validation_cache_with_malformed_records_revalidates(
+    tmp_path: Path, records, validated_records: list[tuple[str, int]]
+):
+    """
+    Test that a validation cache whose records list is malformed counts as empty.
+
+    Given: A validation cache with the current schema fingerprint but malformed records
+    When: Site data is validated with it
+    Then: Validation succeeds, validates every record and rewrites the cache
+    """
+    cache_path = tmp_path / "validated.json"
+    cache_path.write_text(json.dumps({"schema": builder._schema_fingerprint(), "records": records}))
+
+    validate_site_data(_categories_site_data("Data", "Model"), cache_path)
+
+    assert validated_records == [("riskCategories", 0), ("riskCategories", 1)]
+    assert len(json.loads(cache_path.read_text(encoding="utf-8"))["records"]) == 2
+
+
+@pytest.fixture
+def corpus_yaml(personas_yaml_path: Path, risks_yaml_path: Path, controls_yaml_path: Path) -> list[dict]:
+    """Parsed personas, risks and controls YAML of the live corpus."""
+    return [load_yaml(path) for path in (personas_yaml_path, risks_yaml_path, controls_yaml_path)]
+
+
+@pytest.fixture
+def expanded_entities(monkeypatch) -> list[str]:
+    """Record "<kind>:<id>" of every entity whose prose the builder expands."""
+    expanded: list[str] = []
+    real_normalize_prose = builder._normalize_prose
+
+    def spy(kind, entity, field_prefix, intra_lookup):
+        expanded.append(f"{kind}:{entity['id']}")
+        return real_normalize_prose(kind, entity, field_prefix, intra_lookup)
+
+    monkeypatch.setattr(builder, "_normalize_prose", spy)
+    return expanded
+
+
+def test_record_cache_reproduces_uncached_build(
+    tmp_path: Path, corpus_yaml: list[dict], expanded_entities: list[str]
+):
+    """
+    Test that a build from the record cache is the build without it.
+
+    Given: The live corpus
+    When: It is built without a cache, then twice with the same record cache
+    Then: All three results are equal and the second cached build expands no prose
+    """
+    cache_path = tmp_path / "records.json"
+    uncached = build_site_data(*corpus_yaml)
+    first = build_site_data(*corpus_yaml, record_cache=cache_path)
+    expanded_entities.clear()
+
+    second = build_site_data(*corpus_yaml, record_cache=cache_path)
+
+    assert first == uncached
+    assert second == uncached
+    assert expanded_entities == []
+
+
+def test_record_cache_reexpands_edited_entity_and_entities_linking_to_it(
+    tmp_path: Path, corpus_yaml: list[dict], expanded_entities: list[str]
+):
+    """
+    Test that a title edit invalidates exactly the edited entity and its referrers.
+
+    Given: A record cache filled from the live corpus
+    When: The title of a control that other prose links to changes
+    Then: Only that control and the entities linking to it are expanded again, and the
+          result matches an uncached build of the edited corpus
+    """
+    cache_path = tmp_path / "records.json"
+    build_site_data(*corpus_yaml, record_cache=cache_path)
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))["records"]
+    referrers = {key: set(entry["refs"]) for key, entry in cached.items()}
+    target = next(
+        control["id"]
+        for control in corpus_yaml[2]["controls"]
+        if any(control["id"] in refs for refs in referrers.values())
+    )
+    edited = copy.deepcopy(corpus_yaml)
+    next(control for control in edited[2]["controls"] if control["id"] == target)["title"] += " (edited)"
+    expanded_entities.clear()
+
+    result = build_site_data(*edited, record_cache=cache_path)
+
+    assert set(expanded_entities) == {f"controls:{target}"} | {
+        key for key, refs in referrers.items() if target in refs
+    }
+    assert result == build_site_data(*edited)
+
+
+def test_record_cache_still_reports_unresolved_sentinels_in_edited_entities(
+    tmp_path: Path, corpus_yaml: list[dict]
+):
+    """
+    Test that reused entities do not hide a broken edit.
+
+    Given: A record cache filled from the live corpus
+    When: One risk's long description gains a sentinel naming no entity
+    Then: build_site_data() raises UnresolvedSentinelsError naming that risk's field
+    """
+    cache_path = tmp_path / "records.json"
+    build_site_data(*corpus_yaml, record_cache=cache_path)
+    edited = copy.deepcopy(corpus_yaml)
+    edited[1]["risks"][2]["longDescription"] = ["See {{riskDoesNotExist}}."]
+
+    with pytest.raises(UnresolvedSentinelsError, match=r"risks\[2\]\.longDescription"):
+        build_site_data(*edited, record_cache=cache_path)
+
+
+def test_record_cache_is_discarded_when_expansion_code_changes(
+    tmp_path: Path, monkeypatch, corpus_yaml: list[dict], expanded_entities: list[str]
+):
+    """
+    Test that editing the prose expansion code re-expands every entity.
+
+    Given: A record cache filled from the live corpus
+    When: The code fingerprint changes and the corpus is built again
+    Then: Every entity is expanded again
+    """
+    cache_path = tmp_path / "records.json"
+    build_site_data(*corpus_yaml, record_cache=cache_path)
+    expanded_before = list(expanded_entities)
+    expanded_entities.clear()
+
+    monkeypatch.setattr(builder, "_record_cache_fingerprint", lambda: "edited")
+    build_site_data(*corpus_yaml, record_cache=cache_path)
+
+    assert expanded_entities == expanded_before
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        None,
+        "cached",
+        {},
+        {"input": "digest", "refs": {}},
+        {"input": "digest", "refs": [], "prose": {}},
+        {"input": "digest", "refs": {}, "prose": {"description": "text"}},
+    ],
+    ids=["null", "string", "empty", "no-prose", "refs-list", "prose-field-not-list"],
+)
+def test_record_cache_treats_malformed_entries_as_misses(
+    tmp_path: Path, corpus_yaml: list[dict], expanded_entities: list[str], entry
+):
+    """
+    Test that a malformed record cache entry is re-expanded instead of crashing the build.
+
+    Given: A record cache filled from the live corpus, with one risk's entry replaced
+    When: The corpus is built again
+    Then: The build equals the uncached build and re-expands only that risk
+    """
+    cache_path = tmp_path / "records.json"
+    uncached = build_site_data(*corpus_yaml, record_cache=cache_path)
+    risk_id = corpus_yaml[1]["risks"][0]["id"]
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    cached["records"][f"risks:{risk_id}"] = entry
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+    expanded_entities.clear()
+
+    result = build_site_data(*corpus_yaml, record_cache=cache_path)
+
+    assert result == uncached
+    assert expanded_entities == [f"risks:{risk_id}"]
+
+
+@pytest.fixture
+def corpus_site_data(personas_yaml_path: Path, risks_yaml_path: Path, controls_yaml_path: Path) -> dict:
+    """Site data built from the live corpus."""
+    return build_site_data(
+        load_yaml(personas_yaml_path), load_yaml(risks_yaml_path), load_yaml(controls_yaml_path)
+    )
+
+
+def test_build_site_shards_splits_records_by_category(corpus_site_data: dict):
+    """
+    Test that the bootstrap and shards together hold exactly the site data.
+
+    Given: Site data built from the live corpus
+    When: build_site_shards() splits it
+    Then: The bootstrap holds every key except risks and controls, each shard holds the
+          records of one category and lists their IDs, and the shards cover every record once
+    """
+    manifest, files = build_site_shards(corpus_site_data)
+
+    bootstrap = json.loads(files[manifest["bootstrap"]])
+    assert bootstrap == {key: value for key, value in corpus_site_data.items() if key not in ("risks", "controls")}
+    for key in ("risks", "controls"):
+        sharded = []
+        for shard in manifest["shards"][key]:
+            records = json.loads(files[shard["path"]])
+            assert {record["category"] for record in records} == {shard["category"]}
+            assert shard["ids"] == [record["id"] for record in records]
+            sharded.extend(records)
+        assert sorted(sharded, key=lambda record: record["id"]) == sorted(
+            corpus_site_data[key], key=lambda record: record["id"]
+        )
+
+
+def test_build_site_shards_names_files_by_content(corpus_site_data: dict):
+    """
+    Test that shard file names change exactly when their content does.
+
+    Given: Shards built from the live corpus
+    When: One risk's title changes and the shards are built again
+    Then: Only that risk's category shard gets a new name; every other name is unchanged
+    """
+    manifest, _ = build_site_shards(corpus_site_data)
+    edited = copy.deepcopy(corpus_site_data)
+    edited["risks"][0]["title"] += " (edited)"
+
+    edited_manifest, _ = build_site_shards(edited)
+
+    before = {shard["path"] for shard in manifest["shards"]["risks"]}
+    after = {shard["path"] for shard in edited_manifest["shards"]["risks"]}
+    assert len(before - after) == len(after - before) == 1
+    assert (after - before).pop().startswith(f"{SHARD_DIR_NAME}/risks.{edited['risks'][0]['category']}.")
+    assert edited_manifest["bootstrap"] == manifest["bootstrap"]
+    assert edited_manifest["shards"]["controls"] == manifest["shards"]["controls"]
+
+
+def test_write_site_shards_replaces_stale_shards(tmp_path: Path, corpus_site_data: dict):
+    """
+    Test that rewriting shards leaves exactly the files the new manifest lists.
+
+    Given: Shards written for the live corpus
+    When: A risk changes and the shards are written again
+    Then: The shard directory holds only the files of the new manifest and their
+          precompressed copies, and the manifest on disk is the one returned
+    """
+    write_site_shards(corpus_site_data, tmp_path)
+    edited = copy.deepcopy(corpus_site_data)
+    edited["risks"][0]["title"] += " (edited)"
+
+    manifest = write_site_shards(edited, tmp_path)
+
+    listed = {manifest["bootstrap"], manifest["data"], manifest["search"]} | {
+        shard["path"] for shards in manifest["shards"].values() for shard in shards
+    }
+    on_disk = {f"{SHARD_DIR_NAME}/{path.name}" for path in (tmp_path / SHARD_DIR_NAME).iterdir()}
+    assert on_disk == {f"{path}{suffix}" for path in listed for suffix in ("", *PRECOMPRESSED_SUFFIXES)}
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8")) == manifest
+
+
+def test_write_site_shards_writes_minified_and_precompressed_copies(tmp_path: Path, corpus_site_data: dict):
+    """
+    Test that the full data set is published minified, and every hashed file precompressed.
+
+    Given: Site data built from the live corpus
+    When: write_site_shards() runs
+    Then: The manifest's data file is the whole site data as compact JSON, and each
+          hashed file's .gz copy decompresses to the file's exact bytes
+    """
+    manifest = write_site_shards(corpus_site_data, tmp_path)
+
+    minified = (tmp_path / manifest["data"]).read_bytes()
+    assert json.loads(minified) == corpus_site_data
+    assert b"\n" not in minified
+    assert "gz" in manifest["precompressed"]
+    for path in (tmp_path / SHARD_DIR_NAME).glob("*.json"):
+        assert gzip.decompress(path.with_name(f"{path.name}.gz").read_bytes()) == path.read_bytes()
+
+
+def test_write_site_shards_brotli_copies_round_trip(tmp_path: Path, corpus_site_data: dict):
+    """
+    Test that .br copies are written and decompress to the original bytes when brotli is installed.
+
+    Given: The optional brotli package
+    When: write_site_shards() runs
+    Then: The manifest lists br and each hashed file's .br copy round-trips
+    """
+    brotli = pytest.importorskip("brotli")
+
+    manifest = write_site_shards(corpus_site_data, tmp_path)
+
+    assert "br" in manifest["precompressed"]
+    for path in (tmp_path / SHARD_DIR_NAME).glob("*.json"):
+        assert brotli.decompress(path.with_name(f"{path.name}.br").read_bytes()) == path.read_bytes()
+
+
+def test_write_site_shards_does_not_recompress_existing_files(tmp_path: Path, monkeypatch, corpus_site_data: dict):
+    """
+    Test that a rebuild only compresses files whose content changed.
+
+    Given: Shards already written for the live corpus
+    When: One risk changes and the shards are written again
+    Then: Only the changed risk shard, the full data file and the search index are
+          compressed again
+    """
+    write_site_shards(corpus_site_data, tmp_path)
+    edited = copy.deepcopy(corpus_site_data)
+    edited["risks"][0]["title"] += " (edited)"
+    compressed: list[bytes] = []
+    real_precompress = builder._precompress
+    monkeypatch.setattr(
+        builder,
+        "_precompress",
+        lambda payload, suffix: compressed.append(payload) or real_precompress(payload, suffix),
+    )
+
+    write_site_shards(edited, tmp_path)
+
+    assert len(compressed) == 3 * len(PRECOMPRESSED_SUFFIXES)
+
+
+def test_build_search_index_scores_weighted_term_occurrences(corpus_site_data: dict):
+    """
+    Test that every posting matches a plain scan of the indexed fields.
+
+    Given: Site data built from the live corpus
+    When: build_search_index() indexes it
+    Then: Terms are sorted and unique, stopwords are not indexed, and each posting's
+          score is the field-weighted count of the term in that record
+    """
+    index = build_search_index(corpus_site_data)
+
+    assert index["terms"] == sorted(set(index["terms"]))
+    assert "the" not in index["terms"]
+    term = index["terms"].index("injection")
+
+    def text(value) -> str:
+        if isinstance(value, list):
+            return " ".join(text(item) for item in value)
+        return value["title"] if isinstance(value, dict) else value
+
+    expected = {}
+    for ordinal, risk in enumerate(corpus_site_data["risks"]):
+        score = sum(
+            weight * len(re.findall(r"\binjection\b", text(risk[field]).lower()))
+            for field, weight in SEARCH_FIELD_WEIGHTS["risks"].items()
+        )
+        if score:
+            expected[ordinal] = score
+    postings = index["risks"][term]
+    assert dict(zip(postings[::2], postings[1::2])) == expected
+
+
+def test_build_site_shards_lists_search_index(corpus_site_data: dict):
+    """
+    Test that the search index is a separate hashed file named by the manifest.
+
+    Given: Site data built from the live corpus
+    When: build_site_shards() splits it
+    Then: The manifest's search file holds the search index, and the bootstrap does not
+    """
+    manifest, files = build_site_shards(corpus_site_data)
+
+    assert manifest["search"].startswith(f"{SHARD_DIR_NAME}/search-index.")
+    assert json.loads(files[manifest["search"]]) == build_search_index(corpus_site_data)
+    assert "terms" not in json.loads(files[manifest["bootstrap"]])
+
+
+def test_encode_mask_sets_bits_least_significant_first():
+    """
+    Test the bit layout of encoded masks.
+
+    Given: Ordinals 0 and 9 in a 10-bit mask
+    When: encode_mask() encodes them
+    Then: Byte 0 has bit 0 set, byte 1 has bit 1 set, and decode_mask() returns the ordinals
+    """
+    encoded = encode_mask([9, 0], 10)
+
+    assert encoded == "AQI="
+    assert decode_mask(encoded) == [0, 9]
+    assert encode_mask([], 0) == ""
+
+
+def test_build_relation_index_matches_id_lists(corpus_site_data: dict):
+    """
+    Test that the relation masks answer every link query the ID lists do.
+
+    Given: Site data built from the live corpus
+    When: Its relation masks are decoded
+    Then: Ordinals follow site data order, persona masks give each persona's risk and
+          control lists, and record masks give each record's personas
+    """
+    relations = corpus_site_data["relations"]
+    personas = corpus_site_data["personas"]
+
+    assert relations["personaIds"] == [persona["id"] for persona in personas]
+    assert relations["riskIds"] == [risk["id"] for risk in corpus_site_data["risks"]]
+    assert relations["controlIds"] == [control["id"] for control in corpus_site_data["controls"]]
+    for persona, risk_mask, control_mask in zip(
+        personas, relations["personaRiskMasks"], relations["personaControlMasks"]
+    ):
+        assert [relations["riskIds"][ordinal] for ordinal in decode_mask(risk_mask)] == persona["riskIds"]
+        assert [relations["controlIds"][ordinal] for ordinal in decode_mask(control_mask)] == persona["controlIds"]
+    for risk, mask in zip(corpus_site_data["risks"], relations["riskPersonaMasks"]):
+        assert {relations["personaIds"][ordinal] for ordinal in decode_mask(mask)} == set(risk["personaIds"])
+
+
+def test_build_relation_index_rejects_inconsistent_links():
+    """
+    Test that the builder refuses masks that disagree with the ID lists.
+
+    Given: A persona listing a risk whose personaIds do not name it, in an order the
+           masks cannot reproduce
+    When: build_relation_index() runs
+    Then: ValueError names the persona
+    """
+    personas = [{"id": "personaA", "riskIds": ["riskTwo", "riskOne"], "controlIds": []}]
+    risks = [{"id": "riskOne", "personaIds": ["personaA"]}, {"id": "riskTwo", "personaIds": ["personaA"]}]
+
+    with pytest.raises(ValueError, match="personaA"):
+        build_relation_index(personas, risks, [])
+
+
 def test_persona_site_data_schema_matches_generated_output(
     risk_map_schemas_dir: Path,
     personas_yaml_path: Path,
@@ -697,6 +1267,8 @@ def test_main_produces_valid_json_when_invoked_as_subprocess(tmp_path: Path, rep
     output_json = site_dir / "generated" / "persona-site-data.json"
     assert output_json.exists(), f"Expected output file at {output_json}"
 
+    assert (site_dir / "generated" / MANIFEST_NAME).exists(), "main() should also write the shard manifest"
+
     data = json.loads(output_json.read_text(encoding="utf-8"))
     assert set(data.keys()) == {
         "personas",
@@ -706,6 +1278,7 @@ def test_main_produces_valid_json_when_invoked_as_subprocess(tmp_path: Path, rep
         "controlCategories",
         "risks",
         "controls",
+        "relations",
     }
 
 
@@ -717,8 +1290,9 @@ def test_parse_args_help_strings_present(monkeypatch):
     When: parse_args() is invoked with no user-supplied arguments and we
           introspect the resulting argparse.ArgumentParser via a captured
           reference to its __init__
-    Then: All five user-defined flags (--personas-path, --risks-path,
-          --controls-path, --site-dir, --output) have non-empty help strings,
+    Then: All seven user-defined flags (--personas-path, --risks-path,
+          --controls-path, --site-dir, --output, --record-cache, --validation-cache) have
+          non-empty help strings,
           so `--help` output is useful to operators (REC-11).
     """
     import argparse as _argparse
@@ -740,8 +1314,8 @@ def test_parse_args_help_strings_present(monkeypatch):
         action for action in parser._actions if action.option_strings and action.option_strings != ["-h", "--help"]
     ]
 
-    assert len(user_flags) == 5, (
-        f"expected 5 user-defined flags, got {len(user_flags)}: {[a.option_strings for a in user_flags]}"
+    assert len(user_flags) == 7, (
+        f"expected 7 user-defined flags, got {len(user_flags)}: {[a.option_strings for a in user_flags]}"
     )
 
     for action in user_flags:
@@ -642,6 +642,32 @@ class TestUnresolvedSentinelRaises:
         exc = exc_info.value
         assert exc.sentinel == "{{ref:unknown-ref-xyz}}"
 
+    def test_all_unresolved_sentinels_are_reported_together(self):
+        """
+        Test that build_site_data reports every unresolved sentinel in one error.
+
+        Given: A risk and a control, each with a typo'd intra sentinel
+        When: build_site_data is called
+        Then: UnresolvedSentinelsError lists both field paths; .sentinel is the first failure
+        """
+        _require_sentinel_module()
+        from scripts.hooks._sentinel_expansion import UnresolvedSentinelsError
+
+        risk = dict(_MINIMAL_RISK)
+        risk["longDescription"] = ["See {{riskTypoOne}}."]
+        control = dict(_MINIMAL_CONTROL)
+        control["description"] = ["Mitigates {{riskTypoTwo}}."]
+
+        with pytest.raises(UnresolvedSentinelsError) as exc_info:
+            _build(risks_data={"risks": [risk]}, controls_data={"controls": [control], "categories": []})
+
+        exc = exc_info.value
+        assert exc.sentinel == "{{riskTypoOne}}"
+        assert [error.field_path for error in exc.errors] == [
+            "risks[0].longDescription[0]",
+            "controls[0].description[0]",
+        ]
+
     def test_field_path_in_error_is_informative(self):
         """
         Test that the field_path in UnresolvedSentinelError identifies the entry and field.
@@ -676,10 +702,9 @@ class TestUnresolvedSentinelRaises:
 class TestSchemaValidationStillPasses:
     """Tests that write_site_data schema validation still passes with new shapes.
 
-    Note: write_site_data loads its schema via a module-level _OUTPUT_SCHEMA
-    constant at import time (build_persona_site_data.py:37), so no schemas-dir
-    fixture is needed in these tests — the on-disk schema is already cached by
-    the time any test method runs.
+    Note: write_site_data loads the on-disk schema through the builder's cached
+    _output_validator() on first use, so no schemas-dir fixture is needed in
+    these tests.
     """
 
     def test_write_site_data_accepts_output_with_ref_items(self, tmp_path: Path):
@@ -1298,7 +1323,7 @@ class TestIdentificationQuestionsSentinelExpansion:
 Test Summary
 ============
 Total test classes: 10
-Total tests: ~38
+Total tests: ~39
 
 - TestSentinelExpansionInPersonaProse (4):  intra ref in description, ref link in description,
                                              intra in responsibilities, plain prose unchanged
@@ -1307,9 +1332,9 @@ Total tests: ~38
 - TestSentinelExpansionInControlProse (3):  intra in description, ref in description,
                                              plain prose unchanged
 - TestExternalReferencesPassthrough (4):    persona, risk, control passthrough; absent key omitted
-- TestUnresolvedSentinelRaises (5):         intra typo in persona, ref typo in risk,
+- TestUnresolvedSentinelRaises (6):         intra typo in persona, ref typo in risk,
                                              intra typo in control, ref typo in responsibilities,
-                                             field_path is informative
+                                             all failures reported together, field_path is informative
 - TestSchemaValidationStillPasses (4):      ref items, link items, ext-refs, mixed plain+expanded
 - TestComponentsLookupSeeded (3):           component sentinel resolves, unknown raises, sig accepted
 - TestIntraLookupConstruction (3):          persona/risk/control ids all in lookup
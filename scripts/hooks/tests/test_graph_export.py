@@ -0,0 +1,309 @@
+"""
+Tests for structured graph export (JSON node-link and Graphviz DOT).
+
+Covers BaseGraph.to_node_link / to_json / write_json / to_dot on the three
+graph types and the serialisers in riskmap_validator.graphing.graph_export.
+
+Test Coverage:
+==============
+1. Node-link structure: groups, nodes and links mirror the Mermaid build
+2. Edge styles: linkStyle indices resolve to per-link style strings
+3. JSON: compact output, gzip round-trip, deterministic bytes
+4. DOT: clusters, styled edges, lhead anchors for group targets
+5. CLI: validate_riskmap.py --json-format / --gzip / --dot-format
+"""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from riskmap_validator.graphing import ComponentGraph, ControlGraph, RiskGraph
+from riskmap_validator.graphing.graph_export import (
+    node_link_to_dot,
+    parse_mermaid_style,
+    read_node_link,
+    write_node_link,
+)
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validate_riskmap import parse_args  # noqa: E402
+
+
+def _forward_map(components):
+    return {cid: node.to_edges for cid, node in components.items() if node.to_edges}
+
+
+class TestComponentGraphExport:
+    """Node-link export of the component dependency graph."""
+
+    def test_nodes_and_links_match_components(self, sample_components):
+        """
+        Given: A ComponentGraph built from sample components
+        When: to_node_link() is called
+        Then: Every component is a node and every forward edge is a dependency link
+        """
+        graph = ComponentGraph(_forward_map(sample_components), sample_components)
+        data = graph.to_node_link()
+
+        assert data["directed"] is True
+        assert data["graph"]["type"] == "component"
+        assert {n["id"] for n in data["nodes"]} == set(sample_components)
+        links = {(link["source"], link["target"]) for link in data["links"]}
+        assert ("componentDataSources", "componentDataValidation") in links
+        assert len(data["links"]) == sum(len(v) for v in _forward_map(sample_components).values())
+        assert all(link["kind"] == "dependency" for link in data["links"])
+
+    def test_nodes_reference_declared_groups(self, sample_components):
+        """
+        Given: A ComponentGraph
+        When: to_node_link() is called
+        Then: Every node's group is declared in the groups list
+        """
+        data = ComponentGraph(_forward_map(sample_components), sample_components).to_node_link()
+        group_ids = {g["id"] for g in data["groups"]}
+
+        assert all(n["group"] in group_ids for n in data["nodes"])
+
+    def test_subcategory_groups_nest_under_category(self, make_component):
+        """
+        Given: Components carrying subcategories
+        When: to_node_link() is called
+        Then: Subcategory groups name their parent category and hold the component
+        """
+        components = {
+            "componentA": make_component("Component A", "componentsModel", subcategory="modelTraining"),
+        }
+        data = ComponentGraph({}, components).to_node_link()
+        groups = {g["id"]: g for g in data["groups"]}
+
+        assert groups["modelTraining"]["parent"] == "componentsModel"
+        assert groups["modelTraining"]["kind"] == "subcategory"
+        assert data["nodes"][0]["group"] == "modelTraining"
+
+
+class TestControlGraphExport:
+    """Node-link export reusing ControlGraph's optimised mapping and edge styles."""
+
+    def test_universal_control_links_to_components_container(self, sample_controls, sample_components):
+        """
+        Given: A control mapped to "all" components
+        When: to_node_link() is called
+        Then: A single "all" link targets the components container with the allControlEdges style
+        """
+        graph = ControlGraph(sample_controls, sample_components)
+        data = graph.to_node_link()
+        universal = [link for link in data["links"] if link["source"] == "controlUniversalSecurity"]
+
+        assert len(universal) == 1
+        assert universal[0]["target"] == "components"
+        assert universal[0]["kind"] == "all"
+        assert universal[0]["style"] == graph._get_edge_style("allControlEdges")
+
+    def test_link_count_matches_mermaid_edges(self, sample_controls, sample_components):
+        """
+        Given: A ControlGraph
+        When: Links are exported
+        Then: The link count equals the number of control edges in the Mermaid output
+        """
+        graph = ControlGraph(sample_controls, sample_components)
+        mermaid_edges = [
+            line for line in graph.graph.splitlines() if line.strip().startswith("control") and "-" in line
+        ]
+
+        assert len(graph.to_node_link()["links"]) == len(mermaid_edges)
+
+    def test_containers_are_top_level_groups(self, sample_controls, sample_components):
+        """
+        Given: A ControlGraph
+        When: Groups are exported
+        Then: "controls" and "components" are parentless containers; categories nest beneath them
+        """
+        data = ControlGraph(sample_controls, sample_components).to_node_link()
+        groups = {g["id"]: g for g in data["groups"]}
+
+        assert groups["controls"]["kind"] == "container"
+        assert groups["components"]["parent"] is None
+        assert groups["controlsData"]["parent"] == "controls"
+
+    def test_multi_edge_controls_carry_cycling_styles(self, sample_components):
+        """
+        Given: A control with 3+ edges, some of which stay individual component edges
+        When: Links are exported
+        Then: Each individual component link carries a multiEdgeStyles style string
+        """
+        from riskmap_validator.models import ControlNode
+
+        controls = {
+            "controlWide": ControlNode(
+                title="Wide",
+                category="controlsData",
+                components=["componentDataSources", "componentModelTraining", "componentModelDeployment"],
+                risks=[],
+                personas=[],
+            )
+        }
+        graph = ControlGraph(controls, sample_components)
+        links = [link for link in graph.to_node_link()["links"] if link["kind"] == "component"]
+
+        assert links
+        assert all("style" in link for link in links)
+
+
+class TestRiskGraphExport:
+    """Node-link export of the three-layer risk graph."""
+
+    def test_contains_all_three_layers(self, sample_risks, sample_controls, sample_components):
+        """
+        Given: A RiskGraph
+        When: to_node_link() is called
+        Then: Nodes include risks, controls and components; links include mitigation edges
+        """
+        data = RiskGraph(sample_risks, sample_controls, sample_components).to_node_link()
+        kinds = {n["kind"] for n in data["nodes"]}
+
+        assert kinds == {"risk", "control", "component"}
+        assert any(link["kind"] == "mitigation" for link in data["links"])
+        assert any(link["kind"] == "all" for link in data["links"])
+
+    def test_mitigation_links_are_styled(self, sample_risks, sample_controls, sample_components):
+        """
+        Given: A RiskGraph with risk→control edges
+        When: Links are exported
+        Then: Every mitigation link carries the cycling risk-control style
+        """
+        data = RiskGraph(sample_risks, sample_controls, sample_components).to_node_link()
+        mitigations = [link for link in data["links"] if link["kind"] == "mitigation"]
+
+        assert mitigations
+        assert all(link.get("style", "").startswith("stroke:") for link in mitigations)
+
+
+class TestJsonSerialisation:
+    """Compact JSON and gzip output."""
+
+    def test_to_json_is_compact(self, sample_controls, sample_components):
+        """
+        Given: A ControlGraph
+        When: to_json() is called
+        Then: The output has no insignificant whitespace and round-trips to the node-link dict
+        """
+        graph = ControlGraph(sample_controls, sample_components)
+        text = graph.to_json()
+
+        assert ", " not in text and ": " not in text.replace("stroke-dasharray: ", "")
+        assert json.loads(text) == graph.to_node_link()
+
+    def test_gzip_round_trip_is_deterministic(self, tmp_path, sample_controls, sample_components):
+        """
+        Given: A node-link document
+        When: Written twice to a .json.gz path
+        Then: Bytes are identical and read_node_link() returns the original document
+        """
+        data = ControlGraph(sample_controls, sample_components).to_node_link()
+        first = write_node_link(data, tmp_path / "a.json.gz").read_bytes()
+        second = write_node_link(data, tmp_path / "b.json.gz").read_bytes()
+
+        assert first == second
+        assert json.loads(gzip.decompress(first)) == data
+        assert read_node_link(tmp_path / "a.json.gz") == data
+
+    def test_plain_json_written_without_gz_suffix(self, tmp_path, sample_components):
+        """
+        Given: A ComponentGraph
+        When: write_json() targets a .json path
+        Then: The file is plain UTF-8 JSON
+        """
+        graph = ComponentGraph(_forward_map(sample_components), sample_components)
+        path = graph.write_json(tmp_path / "graph.json")
+
+        assert json.loads(path.read_text(encoding="utf-8"))["graph"]["type"] == "component"
+
+
+class TestDotSerialisation:
+    """Graphviz DOT output."""
+
+    def test_dot_contains_clusters_and_edges(self, sample_controls, sample_components):
+        """
+        Given: A ControlGraph
+        When: to_dot() is called
+        Then: Groups render as clusters and styled edges carry colour attributes
+        """
+        dot = ControlGraph(sample_controls, sample_components).to_dot()
+
+        assert dot.startswith('digraph "control" {')
+        assert 'subgraph "cluster_controls"' in dot
+        assert '"controlInputValidation"' in dot
+        assert "color=" in dot
+        assert dot.rstrip().endswith("}")
+
+    def test_group_target_uses_lhead_anchor(self):
+        """
+        Given: A link that targets a group
+        When: Rendered to DOT
+        Then: The edge points at a node inside the group with lhead set to the cluster
+        """
+        data = {
+            "graph": {"type": "t"},
+            "groups": [{"id": "g", "title": "G", "kind": "category", "parent": None, "style": None}],
+            "nodes": [
+                {"id": "a", "title": "A", "kind": "control", "group": None},
+                {"id": "b", "title": "B", "kind": "component", "group": "g"},
+            ],
+            "links": [{"source": "a", "target": "g", "kind": "category"}],
+        }
+        dot = node_link_to_dot(data)
+
+        assert '"a" -> "b" [lhead="cluster_g"];' in dot
+
+    def test_labels_are_escaped(self):
+        """
+        Given: A node title containing a double quote
+        When: Rendered to DOT
+        Then: The quote is escaped
+        """
+        data = {"groups": [], "nodes": [{"id": "n", "title": 'Say "hi"', "group": None}], "links": []}
+
+        assert '[label="Say \\"hi\\""]' in node_link_to_dot(data)
+
+    def test_parse_mermaid_style(self):
+        """
+        Given: A Mermaid linkStyle string with a dash array
+        When: parse_mermaid_style() is called
+        Then: Properties are split and trimmed
+        """
+        assert parse_mermaid_style("stroke:#4285f4,stroke-width:3px,stroke-dasharray: 8 4") == {
+            "stroke": "#4285f4",
+            "stroke-width": "3px",
+            "stroke-dasharray": "8 4",
+        }
+
+
+class TestCliFlags:
+    """validate_riskmap.py export flags."""
+
+    def test_export_flags_default_off(self):
+        """
+        Given: No export flags
+        When: parse_args() is called
+        Then: json_format, gzip and dot_format are all False
+        """
+        with patch("sys.argv", ["script.py"]):
+            args = parse_args()
+
+        assert args.json_format is False
+        assert args.gzip is False
+        assert args.dot_format is False
+
+    def test_export_flags_parse(self):
+        """
+        Given: --json-format --gzip --dot-format
+        When: parse_args() is called
+        Then: All three flags are set
+        """
+        with patch("sys.argv", ["script.py", "--json-format", "--gzip", "--dot-format"]):
+            args = parse_args()
+
+        assert args.json_format and args.gzip and args.dot_format
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the pre-commit hook entry points.
+
+Every commit starts a fresh interpreter for each hook, so module-level imports
+are paid on every run whether or not the hook touches the files that need
+them. Heavy dependencies (jsonschema, referencing, ruamel.yaml, pandas) are
+imported inside the functions that use them; these tests keep it that way.
+
+Test Coverage:
+==============
+1. Budget: each python3 entry point in .pre-commit-config.yaml imports within its
+   budget, measured with ``python -X importtime`` and excluding interpreter startup
+2. Lazy dependencies: importing the framework-mapping hooks, the maintainer CLI,
+   the table generator, the persona-site hook and the issue-template validator loads
+   none of the heavy libraries
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Per-hook budget in milliseconds of summed import self-time, about three
+# times the time measured on a development machine so that slow CI runners
+# stay green. Hooks not listed get DEFAULT_BUDGET_MS.
+DEFAULT_BUDGET_MS = 150
+BUDGET_MS = {
+    # Loads the whole riskmap_validator package and its graph builders.
+    "scripts/hooks/validate_riskmap.py": 250,
+}
+
+HEAVY_MODULES = ("jsonschema", "referencing", "ruamel", "pandas", "tabulate")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$", re.MULTILINE)
+
+
+def _hook_entry_points() -> list[str]:
+    """Return the script of every ``python3 <script>`` hook entry, in config order."""
+    config = yaml.safe_load((REPO_ROOT / ".pre-commit-config.yaml").read_text(encoding="utf-8"))
+    scripts = []
+    for repo in config["repos"]:
+        for hook in repo.get("hooks", []):
+            entry = hook.get("entry", "").split()
+            if len(entry) >= 2 and entry[0] == "python3" and entry[1] not in scripts:
+                scripts.append(entry[1])
+    return scripts
+
+
+def _import_hook_code(script: str) -> str:
+    """Code that imports ``script`` as its hook run would, without calling main()."""
+    directory = os.path.dirname(script)
+    return (
+        f"import runpy, sys; sys.path.insert(0, {directory!r}); runpy.run_path({script!r}, run_name='__budget__')"
+    )
+
+
+def _self_times(code: str) -> dict[str, int]:
+    """Run ``code`` under -X importtime and return module -> self time in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {module: int(us) for us, module in _IMPORTTIME_LINE.findall(result.stderr)}
+
+
+def _import_ms(script: str, attempts: int = 3) -> float:
+    """Best of ``attempts`` summed self-times of the modules ``script`` adds to a bare interpreter."""
+    startup = _self_times("import runpy, sys")
+    totals = []
+    for _ in range(attempts):
+        times = _self_times(_import_hook_code(script))
+        totals.append(sum(us for module, us in times.items() if module not in startup))
+    return min(totals) / 1000
+
+
+@pytest.mark.slow
+class TestImportBudget:
+    """Hook entry points import within their budget."""
+
+    def test_budgets_name_existing_hooks(self):
+        """
+        Given: The per-hook budget table
+        When: Compared with the hook entry points
+        Then: Every budgeted script is still a hook
+        """
+        assert set(BUDGET_MS) <= set(_hook_entry_points())
+
+    @pytest.mark.parametrize("script", _hook_entry_points())
+    def test_hook_imports_within_budget(self, script):
+        """
+        Given: A python3 hook entry point
+        When: It is imported in a fresh interpreter under -X importtime
+        Then: The summed self-time of the modules it adds stays within its budget
+        """
+        budget = BUDGET_MS.get(script, DEFAULT_BUDGET_MS)
+
+        elapsed = _import_ms(script)
+
+        assert elapsed <= budget, f"{script} imports in {elapsed:.0f} ms, budget {budget} ms"
+
+
+class TestLazyDependencies:
+    """Heavy libraries are imported where they are used, not at module level."""
+
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "scripts/hooks/precommit/validate_mapping_drift.py",
+            "scripts/hooks/precommit/validate_mapping_purity.py",
+            "scripts/framework_mapping_maintainer.py",
+            "scripts/hooks/yaml_to_markdown.py",
+            "scripts/hooks/precommit/regenerate_tables.py",
+            "scripts/hooks/precommit/validate_persona_site_build.py",
+            "scripts/hooks/validate_issue_templates.py",
+        ],
+    )
+    def test_import_loads_no_heavy_module(self, script):
+        """
+        Given: A fresh interpreter
+        When: The script is imported without running main()
+        Then: None of jsonschema, referencing, ruamel.yaml, pandas or tabulate is loaded
+        """
+        code = _import_hook_code(script) + (
+            f"; print(sorted({{m.partition('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r})))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/hooks/_markdown_table.py
+
+The pipe-table writer replaces DataFrame.to_markdown(index=False) in
+yaml_to_markdown.py, so its layout must match tabulate's "pipe" format byte
+for byte on the tables the generators build.
+
+Test Coverage:
+==============
+1. Layout: header/separator/rows, minimum width, stripping, None cells
+2. Edge cases: header-only tables, wide characters, embedded line breaks
+3. Streaming: measured layouts, single-pass spooled rendering, lazy row consumption
+4. Golden parity: every committed table in risk-map/tables regenerates byte-identically,
+   both rendered to a string and streamed to files
+5. Dependencies: yaml_to_markdown imports neither pandas nor tabulate
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+import yaml_to_markdown  # noqa: E402
+
+from scripts.hooks._markdown_table import (  # noqa: E402
+    iter_pipe_table,
+    measure_pipe_table,
+    render_pipe_table,
+    stream_pipe_table,
+)
+
+YAML_DIR = REPO_ROOT / "risk-map" / "yaml"
+TABLES_DIR = REPO_ROOT / "risk-map" / "tables"
+
+GOLDEN_TABLES = [
+    (ytype, table_format)
+    for ytype in ("components", "controls", "risks", "personas")
+    for table_format in yaml_to_markdown.get_applicable_formats(ytype)
+]
+
+
+class TestLayout:
+    """Basic pipe-table layout."""
+
+    def test_left_aligned_table(self):
+        """
+        Given: Two columns with cells wider and narrower than their headers
+        When: render_pipe_table() is called
+        Then: Columns are padded to max(header + 2, widest cell) with ':---' separators
+        """
+        table = render_pipe_table(["ID", "Title"], [("riskA", "T"), ("b", "Longer title")])
+
+        assert table == (
+            "| ID    | Title        |\n"
+            "|:------|:-------------|\n"
+            "| riskA | T            |\n"
+            "| b     | Longer title |"
+        )
+
+    def test_cells_are_stripped_and_none_is_empty(self):
+        """
+        Given: Cells with surrounding whitespace and a None cell
+        When: The table is rendered
+        Then: Whitespace is stripped and None renders as an empty cell
+        """
+        table = render_pipe_table(["A", "B"], [("  x  ", None)])
+
+        assert table.splitlines()[2] == "| x   |     |"
+
+    def test_iter_pipe_table_yields_lines(self):
+        """
+        Given: A one-row table
+        When: iter_pipe_table() is consumed
+        Then: Header, separator and row lines are yielded without newlines
+        """
+        lines = list(iter_pipe_table(["A"], [("x",)]))
+
+        assert lines == ["| A   |", "|:----|", "| x   |"]
+
+
+class TestEdgeCases:
+    """Behaviour carried over from tabulate's pipe format."""
+
+    def test_header_only_table_has_plain_separator(self):
+        """
+        Given: Headers but no rows
+        When: The table is rendered
+        Then: The separator has no alignment colons
+        """
+        assert render_pipe_table(["ID", "Title"], []) == "| ID   | Title   |\n|------|---------|"
+
+    def test_wide_characters_use_visible_width(self):
+        """
+        Given: A cell of double-width characters
+        When: The table is rendered with wcwidth available
+        Then: Padding is based on display width, not code points
+        """
+        pytest.importorskip("wcwidth")
+
+        table = render_pipe_table(["Name"], [("中文",), ("abcdef",)])
+
+        assert table.splitlines()[2:] == ["| 中文   |", "| abcdef |"]
+
+    def test_line_breaks_split_into_visual_rows(self):
+        """
+        Given: A cell containing an embedded newline
+        When: The table is rendered
+        Then: The row spans two lines with blank padding in the other column
+        """
+        table = render_pipe_table(["A", "B"], [("x\ny", "z")])
+
+        assert table.splitlines()[2:] == ["| x   | z   |", "| y   |     |"]
+
+
+class TestStreaming:
+    """Tables rendered from a row generator without materializing it."""
+
+    ROWS = [("b", "x\ny"), ("a", None), ("wide", "  z  ")]
+
+    def test_measured_layout_matches_materialized_rendering(self):
+        """
+        Given: Rows with a multiline cell, a None cell and padding
+        When: The layout is measured from one generator and the table rendered from another
+        Then: The lines equal render_pipe_table() on the same rows
+        """
+        layout = measure_pipe_table(["ID", "Text"], (row for row in self.ROWS))
+
+        lines = list(iter_pipe_table(["ID", "Text"], (row for row in self.ROWS), layout))
+
+        assert layout.multiline is True
+        assert layout.row_count == 3
+        assert "\n".join(lines) == render_pipe_table(["ID", "Text"], self.ROWS)
+
+    def test_rows_are_consumed_as_lines_are_written(self):
+        """
+        Given: A measured layout and a generator recording which rows it produced
+        When: Only the first data line is taken from iter_pipe_table()
+        Then: Only the first row has been pulled from the generator
+        """
+        produced = []
+
+        def rows():
+            for row in [("a",), ("b",), ("c",)]:
+                produced.append(row)
+                yield row
+
+        layout = measure_pipe_table(["A"], [("a",), ("b",), ("c",)])
+        lines = iter_pipe_table(["A"], rows(), layout)
+
+        assert [next(lines) for _ in range(3)][2] == "| a   |"
+        assert produced == [("a",)]
+
+    @pytest.mark.parametrize("spool_bytes", [0, 1 << 20], ids=["spilled-to-disk", "in-memory"])
+    def test_stream_pipe_table_formats_each_row_once(self, spool_bytes):
+        """
+        Given: A row generator that counts how often it runs
+        When: stream_pipe_table() renders it, spooling in memory or on disk
+        Then: The generator runs once and the output equals render_pipe_table()
+        """
+        runs = []
+
+        def rows():
+            runs.append(1)
+            yield from self.ROWS
+
+        lines = list(stream_pipe_table(["ID", "Text"], rows(), spool_bytes=spool_bytes))
+
+        assert runs == [1]
+        assert "\n".join(lines) == render_pipe_table(["ID", "Text"], self.ROWS)
+
+    def test_stream_pipe_table_without_rows(self):
+        """
+        Given: An empty row generator
+        When: stream_pipe_table() renders it
+        Then: The header-only layout is produced
+        """
+        assert list(stream_pipe_table(["ID"], iter([]))) == ["| ID   |", "|------|"]
+
+
+@pytest.mark.live_corpus
+class TestGoldenParity:
+    """Committed tables regenerate byte-identically."""
+
+    @pytest.mark.parametrize(("ytype", "table_format"), GOLDEN_TABLES)
+    def test_table_matches_committed_file(self, ytype, table_format):
+        """
+        Given: A committed table in risk-map/tables
+        When: yaml_to_markdown_table() regenerates it from risk-map/yaml
+        Then: The output equals the committed file byte for byte
+        """
+        expected = (TABLES_DIR / f"{ytype}-{table_format}.md").read_text(encoding="utf-8")
+
+        result = yaml_to_markdown.yaml_to_markdown_table(YAML_DIR / f"{ytype}.yaml", ytype, table_format)
+
+        assert result == expected
+
+    def test_streamed_files_match_committed_files(self, tmp_path):
+        """
+        Given: Every committed table
+        When: convert_tables() streams them into an empty directory
+        Then: Each written file equals the committed one byte for byte
+        """
+        assert yaml_to_markdown.convert_tables(GOLDEN_TABLES, output_dir=tmp_path, quiet=True)
+
+        for ytype, table_format in GOLDEN_TABLES:
+            name = f"{ytype}-{table_format}.md"
+            assert (tmp_path / name).read_bytes() == (TABLES_DIR / name).read_bytes(), name
+
+    def test_every_committed_table_is_covered(self):
+        """
+        Given: The tables directory
+        When: Compared with the parity matrix
+        Then: Every committed table is exercised
+        """
+        committed = {path.stem for path in TABLES_DIR.glob("*.md")}
+
+        assert committed == {f"{ytype}-{table_format}" for ytype, table_format in GOLDEN_TABLES}
+
+
+class TestDependencies:
+    """pandas and tabulate stay optional."""
+
+    def test_yaml_to_markdown_does_not_import_pandas(self):
+        """
+        Given: A fresh interpreter
+        When: yaml_to_markdown is imported
+        Then: Neither pandas nor tabulate is loaded
+        """
+        code = (
+            "import sys; import yaml_to_markdown; "
+            "print(sorted(m for m in ('pandas', 'tabulate') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT / "scripts" / "hooks",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -31,6 +31,12 @@ Test Coverage:
    - String representations with empty category handling
    - Equality comparison (not implemented, testing basic behavior)
 
+4. Compact Storage:
+   - __slots__ (no per-instance __dict__)
+   - Interned IDs and IdTuple edges (immutable, list-equal, list-like repr)
+   - from_trusted() fast construction matches validated construction
+   - Tuple inputs accepted by the validated constructors
+
 Coverage Target: 95%+ for models.py (up from 65%)
 """
 
@@ -43,7 +49,7 @@ import pytest
 git_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(git_root / "scripts" / "hooks"))
 
-from riskmap_validator.models import ComponentNode, ControlNode, RiskNode  # noqa: E402
+from riskmap_validator.models import ComponentNode, ControlNode, IdTuple, RiskNode  # noqa: E402
 
 
 class TestComponentNode:
@@ -1005,3 +1011,98 @@ class TestRiskNode:
         str_output = str(risk)
 
         assert str_output == "Risk 'Test Risk' (Category: Unknown)"
+
+
+class TestCompactStorage:
+    """Slotted storage, interned IDs and the from_trusted() fast path."""
+
+    def test_nodes_have_no_instance_dict(self):
+        """
+        Given: One node of each type
+        When: Inspecting the instances
+        Then: None carries a __dict__ and unknown attributes cannot be set
+        """
+        nodes = [
+            ComponentNode("C", "componentsData", [], []),
+            ControlNode("K", "controlsData", [], [], []),
+            RiskNode("R"),
+        ]
+
+        for node in nodes:
+            assert not hasattr(node, "__dict__")
+            with pytest.raises(AttributeError):
+                node.extra = 1
+
+    def test_edges_are_interned_id_tuples(self):
+        """
+        Given: Two components whose edge IDs are built at runtime
+        When: The nodes are constructed
+        Then: Edges are IdTuples and equal IDs share one string object
+        """
+        first = ComponentNode("A", "componentsData", ["".join(["comp", "X"])], [])
+        second = ComponentNode("B", "componentsData", [], ["".join(["comp", "X"])])
+
+        assert isinstance(first.to_edges, IdTuple)
+        assert first.to_edges[0] is second.from_edges[0]
+        assert first.category is second.category
+
+    def test_edges_are_immutable(self):
+        """
+        Given: A control node
+        When: Attempting to mutate its components in place
+        Then: AttributeError is raised (tuple has no append)
+        """
+        control = ControlNode("K", "controlsData", ["comp1"], [], [])
+
+        with pytest.raises(AttributeError):
+            control.components.append("comp2")
+
+    def test_id_tuple_compares_and_reprs_like_list(self):
+        """
+        Given: An IdTuple
+        When: Compared with lists and tuples and converted to a string
+        Then: It equals both, stays hashable and reprs as a list
+        """
+        ids = IdTuple(["all"])
+
+        assert ids == ["all"]
+        assert ids == ("all",)
+        assert ids != ["none"]
+        assert hash(ids) == hash(("all",))
+        assert repr(ids) == "['all']"
+
+    def test_validated_constructor_accepts_tuples(self):
+        """
+        Given: Edges supplied as a tuple
+        When: ComponentNode is constructed
+        Then: The tuple is accepted like a list
+        """
+        node = ComponentNode("A", "componentsData", ("comp1",), ())
+
+        assert node.to_edges == ["comp1"]
+        assert node.from_edges == []
+
+    def test_from_trusted_matches_validated_construction(self):
+        """
+        Given: The same field values
+        When: Built via __init__ and via from_trusted()
+        Then: The resulting nodes are equal for every node type
+        """
+        assert ComponentNode.from_trusted("A", "componentsData", ["b"], ["c"], "sub") == ComponentNode(
+            "A", "componentsData", ["b"], ["c"], subcategory="sub"
+        )
+        assert ControlNode.from_trusted("K", "controlsData", ["all"], ["r"], ["p"]) == ControlNode(
+            "K", "controlsData", ["all"], ["r"], ["p"]
+        )
+        trusted_risk = RiskNode.from_trusted("R", "risks")
+        assert (trusted_risk.title, trusted_risk.category) == ("R", "risks")
+
+    def test_from_trusted_ignores_non_string_subcategory(self):
+        """
+        Given: A non-string subcategory
+        When: from_trusted() is called
+        Then: subcategory is None, mirroring __init__
+        """
+        node = ComponentNode.from_trusted("A", "componentsData", [], [], subcategory=123)
+
+        assert node.subcategory is None
@@ -604,23 +604,23 @@ class TestPersonaSiteBuildHookContracts:
             f"scripts/build_persona_site_data.py; got: {files_regex!r}"
         )
 
-    def test_validate_persona_site_build_does_not_match_components_yaml(self):
+    def test_validate_persona_site_build_matches_components_yaml(self):
         """
-        Test that the hook's files: regex does NOT match components.yaml.
+        Test that the hook's files: regex matches components.yaml.
 
         Given: the validate-persona-site-build hook
         When:  applying the files: regex against risk-map/yaml/components.yaml
-        Then:  the regex does NOT match
+        Then:  the regex matches
 
-        components.yaml is not in the builder's read set. Matching it would
-        cause unnecessary persona-site build re-runs on component-only commits.
-        This is an over-matching guard to keep the trigger precisely scoped.
+        build_site_data() loads components.yaml for component records and
+        {{id}} sentinel titles, so it is in the builder's read set (declared
+        in scripts/hooks/_artifact_graph.py).
         """
         hook = _hooks_by_id("validate-persona-site-build")[0]
         files_regex = hook.get("files", "")
-        assert not re.search(files_regex, "risk-map/yaml/components.yaml"), (
-            f"validate-persona-site-build files regex must NOT match "
-            f"risk-map/yaml/components.yaml (not in builder read set); "
+        assert re.search(files_regex, "risk-map/yaml/components.yaml"), (
+            f"validate-persona-site-build files regex must match "
+            f"risk-map/yaml/components.yaml (in builder read set); "
             f"got: {files_regex!r}"
         )
 
@@ -687,8 +687,8 @@ _LOCAL_VALIDATOR_TRIGGER_COVERAGE: dict[str, set[str] | None] = {
     # validate-persona-site-build: trigger coverage has two layers:
     #   (1) Three YAMLs opened per run via DEFAULT_*_PATH constants
     #       (build_persona_site_data.py:20-22; validate_persona_site_build.py:38-41).
-    #   (2) The output schema, opened at module-import time
-    #       (build_persona_site_data.py:31-37 _load_output_schema()).
+    #   (2) The output schema, opened on first validation
+    #       (build_persona_site_data.py _load_output_schema()).
     # Trigger-only (NOT in read set, intentionally — included in the trigger
     # for defensive re-run on edits but never opened by the builder):
     #   - risk-map/schemas/risks.schema.json: validated by check-jsonschema in
@@ -1293,10 +1293,11 @@ class TestRegenerateIssueTemplatesD9Trigger:
             f"Got: {files_regex!r}"
         )
 
-        # Additional over-match guards: a broad D9 widening (e.g., matching all of
-        # risk-map/yaml/) would silently catch controls.yaml and personas.yaml too,
-        # triggering unnecessary template regeneration on every controls or personas
-        # edit. D9 is a precise expansion — only components.yaml is added.
+        # Additional over-match guard: a broad D9 widening (e.g., matching all of
+        # risk-map/yaml/) would silently catch controls.yaml too, triggering
+        # unnecessary template regeneration on every controls edit. personas.yaml
+        # is matched on purpose: deprecated personas are filtered out of the
+        # persona checkboxes (see scripts/hooks/_artifact_graph.py).
         assert not re.search(files_regex, "risk-map/yaml/controls.yaml"), (
             f"regenerate-issue-templates files: regex must NOT match "
             f"risk-map/yaml/controls.yaml after D9 widening (over-match guard: "
@@ -1304,13 +1305,6 @@ class TestRegenerateIssueTemplatesD9Trigger:
             f"Got: {files_regex!r}"
         )
 
-        assert not re.search(files_regex, "risk-map/yaml/personas.yaml"), (
-            f"regenerate-issue-templates files: regex must NOT match "
-            f"risk-map/yaml/personas.yaml after D9 widening (over-match guard: "
-            f"personas.yaml does not contribute to the tuple-selector content). "
-            f"Got: {files_regex!r}"
-        )
-
 
 # ===========================================================================
 # Mapping-validator comparison-oracle trigger (#343 Work 6)
@@ -0,0 +1,233 @@
+"""
+Tests for the shared cross-reference graph used by referential validators.
+
+Test Coverage:
+==============
+1. Building: nodes with attributes, ordered relations, empty-but-declared sources
+2. Corpus loading: frameworks/risks/controls/personas YAML into typed relations
+3. Set queries: dangling(), inapplicable(), references_to(), relation_mismatches()
+4. Component placement: misplaced_components() against declared nesting
+5. Shared build: one graph drives every component check in validator.py
+"""
+
+from riskmap_validator.models import ComponentNode, ControlNode
+from riskmap_validator.reference_graph import (
+    COMPONENT,
+    COMPONENT_FROM,
+    COMPONENT_TO,
+    CONTROL_COMPONENT,
+    CONTROL_PERSONA,
+    CONTROL_RISK,
+    FRAMEWORK,
+    FRAMEWORK_APPLICABLE_TO,
+    PERSONA,
+    RISK_CONTROL,
+    RISK_FRAMEWORK,
+    ReferenceGraph,
+)
+from riskmap_validator.validator import (
+    category_subcategory_nesting_warnings,
+    controls_components_mirror_warnings,
+    edge_consistency_errors,
+)
+
+
+class TestBuilding:
+    """Node and relation registration."""
+
+    def test_relations_keep_insertion_order_and_dedupe(self):
+        """
+        Given: Edges added with a repeated target
+        When: pairs() is read
+        Then: Pairs appear once, in insertion order
+        """
+        graph = ReferenceGraph()
+        graph.add_edges(CONTROL_RISK, "c1", ["r2", "r1", "r2"])
+        graph.add_edges(CONTROL_RISK, "c0", ["r1"])
+
+        assert list(graph.pairs(CONTROL_RISK)) == [("c1", "r2"), ("c1", "r1"), ("c0", "r1")]
+
+    def test_source_without_targets_is_registered(self):
+        """
+        Given: A source added with no targets
+        When: adjacency() is read
+        Then: The source is present with an empty target set
+        """
+        graph = ReferenceGraph()
+        graph.add_edges(FRAMEWORK_APPLICABLE_TO, "fw", [])
+
+        assert graph.adjacency(FRAMEWORK_APPLICABLE_TO) == {"fw": {}}
+        assert graph.pairs(FRAMEWORK_APPLICABLE_TO) == {}
+
+    def test_unknown_kind_and_relation_are_empty(self):
+        """
+        Given: An empty graph
+        When: Querying an unknown kind or relation
+        Then: Empty results are returned
+        """
+        graph = ReferenceGraph()
+
+        assert graph.nodes("nothing") == {}
+        assert graph.targets("nothing") == set()
+        assert graph.dangling("nothing", COMPONENT) == []
+
+    def test_components_load_both_edge_directions(self):
+        """
+        Given: Components a → b declared on both ends
+        When: add_components() is called
+        Then: component.to and component.from hold the same a → b edge
+        """
+        graph = ReferenceGraph()
+        graph.add_components(
+            {
+                "a": ComponentNode("A", "cat", ["b"], []),
+                "b": ComponentNode("B", "cat", [], ["a"]),
+            }
+        )
+
+        assert list(graph.pairs(COMPONENT_TO)) == [("a", "b")]
+        assert list(graph.pairs(COMPONENT_FROM)) == [("a", "b")]
+        assert graph.relation_mismatches(COMPONENT_TO, COMPONENT_FROM) == ({}, {})
+
+
+class TestCorpusLoading:
+    """ReferenceGraph.from_corpus over parsed YAML documents."""
+
+    def test_from_corpus_loads_every_relation(self):
+        """
+        Given: Minimal frameworks, risks, controls and personas documents
+        When: from_corpus() is called
+        Then: Nodes and each cross-reference relation are populated
+        """
+        graph = ReferenceGraph.from_corpus(
+            frameworks={"frameworks": [{"id": "fw", "applicableTo": ["risks"]}, {"id": "bare"}]},
+            risks={"risks": [{"id": "r1", "controls": ["c1"], "mappings": {"fw": ["T1"]}}]},
+            controls={"controls": [{"id": "c1", "risks": "all", "components": ["comp"], "personas": ["p1"]}]},
+            personas={"personas": [{"id": "p1", "deprecated": True}]},
+        )
+
+        assert set(graph.nodes(FRAMEWORK)) == {"fw", "bare"}
+        assert set(graph.adjacency(FRAMEWORK_APPLICABLE_TO)) == {"fw"}
+        assert list(graph.pairs(RISK_FRAMEWORK)) == [("r1", "fw")]
+        assert list(graph.pairs(RISK_CONTROL)) == [("r1", "c1")]
+        assert list(graph.pairs(CONTROL_RISK)) == [("c1", "all")]
+        assert list(graph.pairs(CONTROL_COMPONENT)) == [("c1", "comp")]
+        assert list(graph.pairs(CONTROL_PERSONA)) == [("c1", "p1")]
+        assert graph.nodes(PERSONA)["p1"]["deprecated"] is True
+
+    def test_entities_without_id_are_skipped(self):
+        """
+        Given: A risk entry missing its id
+        When: from_corpus() is called
+        Then: No node or relation is created for it
+        """
+        graph = ReferenceGraph.from_corpus(risks={"risks": [{"mappings": {"fw": []}}]})
+
+        assert graph.nodes("risk") == {}
+        assert graph.pairs(RISK_FRAMEWORK) == {}
+
+
+class TestSetQueries:
+    """Checks expressed as set operations."""
+
+    def test_dangling_respects_ignore(self):
+        """
+        Given: Control→component edges to a real, a missing and an escape-hatch ID
+        When: dangling() is called with the escape hatch ignored
+        Then: Only the missing reference is returned
+        """
+        graph = ReferenceGraph()
+        graph.add_nodes(COMPONENT, ["real"])
+        graph.add_edges(CONTROL_COMPONENT, "c1", ["real", "ghost", "all"])
+
+        assert graph.dangling(CONTROL_COMPONENT, COMPONENT, ignore={"all"}) == [("c1", "ghost")]
+
+    def test_inapplicable_skips_undeclared_unless_required(self):
+        """
+        Given: One framework applicable to risks and one without applicableTo
+        When: inapplicable() runs with and without require_declared
+        Then: The undeclared framework is only reported when required
+        """
+        graph = ReferenceGraph()
+        graph.add_framework("risky", ["risks"])
+        graph.add_framework("bare")
+        graph.add_edges("persona.framework", "p1", ["risky", "bare", "ghost"])
+
+        assert graph.inapplicable("persona.framework", "personas") == [("p1", "risky")]
+        assert graph.inapplicable("persona.framework", "personas", require_declared=True) == [
+            ("p1", "risky"),
+            ("p1", "bare"),
+        ]
+
+    def test_references_to_filters_targets(self):
+        """
+        Given: Control→persona edges
+        When: references_to() asks for one persona
+        Then: Only edges to that persona are returned
+        """
+        graph = ReferenceGraph()
+        graph.add_edges(CONTROL_PERSONA, "c1", ["old", "new"])
+        graph.add_edges(CONTROL_PERSONA, "c2", ["old"])
+
+        assert graph.references_to(CONTROL_PERSONA, {"old"}) == [("c1", "old"), ("c2", "old")]
+
+    def test_relation_mismatches_is_symmetric_difference(self):
+        """
+        Given: Two relations sharing one edge
+        When: relation_mismatches() is called
+        Then: Each side's unique edges are returned separately
+        """
+        graph = ReferenceGraph()
+        graph.add_edges(COMPONENT_TO, "a", ["b", "c"])
+        graph.add_edges(COMPONENT_FROM, "a", ["b", "d"])
+
+        only_to, only_from = graph.relation_mismatches(COMPONENT_TO, COMPONENT_FROM)
+
+        assert list(only_to) == [("a", "c")]
+        assert list(only_from) == [("a", "d")]
+
+    def test_misplaced_components(self):
+        """
+        Given: Components with valid, mismatched and missing subcategories
+        When: misplaced_components() is called
+        Then: Only the invalid placements are returned, in component order
+        """
+        graph = ReferenceGraph()
+        graph.add_components(
+            {
+                "ok": ComponentNode("OK", "cat", [], [], subcategory="sub"),
+                "wrong": ComponentNode("Wrong", "cat", [], [], subcategory="other"),
+                "none": ComponentNode("None", "cat", [], []),
+            }
+        )
+        graph.add_category_nesting({"cat": {"sub"}})
+
+        assert graph.misplaced_components() == [("wrong", "cat", "other"), ("none", "cat", None)]
+
+
+class TestSharedBuild:
+    """One graph feeds every component-side check."""
+
+    def test_single_graph_serves_all_component_checks(self):
+        """
+        Given: One graph loaded with components, controls and category nesting
+        When: The edge, mirror and nesting checks run against it
+        Then: Each check reports its own issue from the shared build
+        """
+        graph = ReferenceGraph()
+        graph.add_components(
+            {
+                "a": ComponentNode("A", "cat", ["b"], [], subcategory="sub"),
+                "b": ComponentNode("B", "cat", [], [], subcategory="sub"),
+            }
+        )
+        graph.add_controls({"c1": ControlNode("C1", "ctl", ["a", "ghost", "none"], [], [])})
+        graph.add_category_nesting({"cat": {"sub"}})
+
+        assert edge_consistency_errors(graph) == [
+            "Component 'a' has outgoing edges but no corresponding incoming edges"
+        ]
+        assert controls_components_mirror_warnings(graph) == [
+            "Control 'c1' references component 'ghost' which does not exist in components.yaml"
+        ]
+        assert category_subcategory_nesting_warnings(graph) == []
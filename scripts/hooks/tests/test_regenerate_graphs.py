@@ -6,25 +6,34 @@ This module tests the pre-commit framework hook that regenerates Mermaid
 graph files whenever source YAML files change. The hook is invoked by the
 pre-commit framework with staged filenames as positional argv (pass_filenames:
 true) and must regenerate the appropriate graphs and git-add them so they land
-in the same commit as the source change (Mode B auto-stage pattern).
+in the same commit as the source change (Mode B auto-stage pattern). Only
+outputs whose bytes changed are staged, all in one git add; nothing is run
+through git when every output is unchanged.
 
-The three conditional regenerations and their triggers are:
+The three conditional regenerations and their triggers come from the
+artifact graph (scripts/hooks/_artifact_graph.py). Every graph labels its
+categories from both components.yaml and controls.yaml and is styled by
+mermaid-styles.yaml:
 
   Graph output pair                             | Trigger file(s)
   ----------------------------------------------|------------------------------
-  risk-map-graph.md + .mermaid                  | components.yaml
+  risk-map-graph.md + .mermaid                  | components.yaml OR controls.yaml
   controls-graph.md + .mermaid                  | components.yaml OR controls.yaml
   controls-to-risk-graph.md + .mermaid          | components.yaml OR controls.yaml OR risks.yaml
 
+Stale graphs are regenerated concurrently.
+
 Test Coverage:
 ==============
-Total Tests: 26
-- Trigger combinatorics:  7  (scenarios 1-7)
+Total Tests: 33
+- Trigger combinatorics:  8  (scenarios 1-7, mermaid-styles.yaml)
 - Failure modes:          6  (scenarios 8-11, partial-failure, second-fails-third-runs)
 - Exit-code verification: 3  (all-success, first-fails-rest-ok, all-fail)
 - Edge cases:             5  (whitespace, absolute paths, partial staging,
                               duplicate argv, mixed relevant+unrelated files)
 - Call-count guards:      5  (no double-generation, git-add alignment)
+- Unchanged outputs:      2  (no git add when nothing changed, only changed files staged)
+- SVG rendering:          4  (changed .mermaid renders its SVG, unchanged/failed graphs do not)
 
 Coverage Target: 90%+ of regenerate_graphs.py
 """
@@ -43,6 +52,7 @@ import pytest
 # ---------------------------------------------------------------------------
 sys.path.insert(0, str(Path(__file__).parent.parent / "precommit"))
 
+import regenerate_graphs  # noqa: E402  (intentional late import)
 from regenerate_graphs import main  # noqa: E402  (intentional late import)
 
 # ---------------------------------------------------------------------------
@@ -92,10 +102,10 @@ CMD_RISK_GRAPH = [
     "--quiet",
 ]
 
-# Expected git-add calls for each generation step
-GIT_ADD_RISK_MAP = ["git", "add", RISK_MAP_MD, RISK_MAP_MERMAID]
-GIT_ADD_CONTROLS = ["git", "add", CONTROLS_MD, CONTROLS_MERMAID]
-GIT_ADD_RISK_GRAPH = ["git", "add", RISK_GRAPH_MD, RISK_GRAPH_MERMAID]
+# Output pairs written by each generation step
+RISK_MAP_PAIR = [RISK_MAP_MD, RISK_MAP_MERMAID]
+CONTROLS_PAIR = [CONTROLS_MD, CONTROLS_MERMAID]
+RISK_GRAPH_PAIR = [RISK_GRAPH_MD, RISK_GRAPH_MERMAID]
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +120,58 @@ def _make_subprocess_mock(returncode: int = 0) -> MagicMock:
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _workspace(tmp_path, monkeypatch):
+    """Run every test in an empty working tree so emulated outputs never touch the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def svg_renders(monkeypatch):
+    """
+    Replace SVG rendering with a recorder and return the rendered artifact names.
+
+    By default every SVG is already current, so a render writes nothing.
+    """
+    renders = []
+
+    def render(svg):
+        renders.append(svg.name)
+        return 0
+
+    monkeypatch.setattr(regenerate_graphs, "_render_svg", render)
+    return renders
+
+
+def _fake_run(fail=(), git_returncode: int = 0, content: str = "graph"):
+    """
+    subprocess.run side effect emulating validate_riskmap.py and git.
+
+    A successful generation writes its .md output and the sibling .mermaid file;
+    commands listed in ``fail`` exit 1 without writing.
+    """
+
+    def side_effect(cmd, **kwargs):
+        if cmd[0] == "git":
+            return _make_subprocess_mock(git_returncode)
+        if cmd in fail:
+            return _make_subprocess_mock(1)
+        markdown = Path(cmd[3])
+        markdown.parent.mkdir(parents=True, exist_ok=True)
+        markdown.write_text(content)
+        markdown.with_suffix(".mermaid").write_text(content)
+        return _make_subprocess_mock(0)
+
+    return side_effect
+
+
+def _staged(mock_run) -> list[str]:
+    """Return the paths passed to the single git add call (empty when git was not run)."""
+    git_calls = [c.args[0] for c in mock_run.call_args_list if c.args[0][0] == "git"]
+    assert len(git_calls) <= 1, f"Expected at most one batched git add, got {git_calls}"
+    return git_calls[0][2:] if git_calls else []
+
+
 # ===========================================================================
 # Trigger Combinatorics — Which graphs are generated for which staged files
 # ===========================================================================
@@ -131,7 +193,7 @@ class TestTriggerCombinatorics:
         # for these patches to intercept calls. If you change patch target later, also
         # update to `patch("regenerate_graphs.subprocess.run")` for namespace specificity.
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([COMPONENTS_YAML])
 
@@ -143,21 +205,20 @@ class TestTriggerCombinatorics:
         assert CMD_RISK_MAP in subprocess_calls, "risk-map-graph generation missing"
         assert CMD_CONTROLS in subprocess_calls, "controls-graph generation missing"
         assert CMD_RISK_GRAPH in subprocess_calls, "controls-to-risk-graph generation missing"
-        assert GIT_ADD_RISK_MAP in subprocess_calls, "git add for risk-map-graph missing"
-        assert GIT_ADD_CONTROLS in subprocess_calls, "git add for controls-graph missing"
-        assert GIT_ADD_RISK_GRAPH in subprocess_calls, "git add for controls-to-risk-graph missing"
+        assert _staged(mock_run) == RISK_MAP_PAIR + CONTROLS_PAIR + RISK_GRAPH_PAIR, (
+            "all six graph files must be staged in one git add"
+        )
 
-    def test_controls_change_triggers_controls_and_risk_graphs_only(self):
+    def test_controls_change_triggers_all_three_graphs(self):
         """
-        Only controls.yaml staged generates controls-graph and risk-graph (NOT risk-map-graph).
+        Only controls.yaml staged generates all three graphs (category labels come from controls.yaml).
 
         Given: pre-commit framework passes ["risk-map/yaml/controls.yaml"]
         When: main() is called
-        Then: controls-graph and controls-to-risk-graph commands are run,
-              risk-map-graph command is NOT run, and main() returns 0
+        Then: all three generation commands are run and main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([CONTROLS_YAML])
 
@@ -167,9 +228,28 @@ class TestTriggerCombinatorics:
 
         assert CMD_CONTROLS in subprocess_calls, "controls-graph generation missing"
         assert CMD_RISK_GRAPH in subprocess_calls, "controls-to-risk-graph generation missing"
-        assert CMD_RISK_MAP not in subprocess_calls, (
-            "risk-map-graph should NOT be generated when only controls.yaml is staged"
-        )
+        assert CMD_RISK_MAP in subprocess_calls, "risk-map-graph reads controls.yaml category titles"
+
+    def test_mermaid_styles_change_triggers_all_three_graphs(self):
+        """
+        Only mermaid-styles.yaml staged regenerates every graph.
+
+        Given: pre-commit framework passes ["risk-map/yaml/mermaid-styles.yaml"]
+        When: main() is called
+        Then: all three generation commands are run and main() returns 0
+        """
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _fake_run()
+
+            result = main(["risk-map/yaml/mermaid-styles.yaml"])
+
+        assert result == 0
+        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
+        assert [cmd for cmd in subprocess_calls if cmd[0] == "python3"] == [
+            CMD_RISK_MAP,
+            CMD_CONTROLS,
+            CMD_RISK_GRAPH,
+        ]
 
     def test_risks_change_triggers_only_risk_graph(self):
         """
@@ -181,7 +261,7 @@ class TestTriggerCombinatorics:
               git-added, and main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([RISKS_YAML])
 
@@ -208,7 +288,7 @@ class TestTriggerCombinatorics:
               no command is duplicated, and main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([COMPONENTS_YAML, CONTROLS_YAML])
 
@@ -236,7 +316,7 @@ class TestTriggerCombinatorics:
               main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([COMPONENTS_YAML, CONTROLS_YAML, RISKS_YAML])
 
@@ -295,22 +375,13 @@ class TestFailureModes:
         When: main() is called
         Then: All three generation commands are attempted, main() returns non-zero
         """
-        call_count = {"n": 0}
-
-        def side_effect(cmd, **kwargs):
-            call_count["n"] += 1
-            mock = _make_subprocess_mock(0)
-            # The first validate invocation (risk-map-graph) fails
-            if cmd == CMD_RISK_MAP:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect):
+        # The first validate invocation (risk-map-graph) fails
+        with patch("subprocess.run", side_effect=_fake_run(fail=[CMD_RISK_MAP])) as mock_run:
             result = main([COMPONENTS_YAML])
 
         assert result != 0, "Should return non-zero when any generation fails"
         # All three generation commands must have been attempted
-        assert call_count["n"] >= 3, "Wrapper must attempt all generations even after an earlier failure"
+        assert mock_run.call_count >= 3, "Wrapper must attempt all generations even after an earlier failure"
 
     def test_generation_succeeds_but_git_add_fails_returns_nonzero(self):
         """
@@ -320,14 +391,7 @@ class TestFailureModes:
         When: main() is called
         Then: main() returns non-zero
         """
-
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd[0] == "git":
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect):
+        with patch("subprocess.run", side_effect=_fake_run(git_returncode=1)):
             result = main([RISKS_YAML])
 
         assert result != 0
@@ -341,7 +405,7 @@ class TestFailureModes:
         Then: main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([COMPONENTS_YAML])
 
@@ -387,14 +451,7 @@ class TestFailureModes:
         Then: Both controls-graph and risk-graph commands are attempted;
               main() returns non-zero (because one failed)
         """
-
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_CONTROLS:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
+        with patch("subprocess.run", side_effect=_fake_run(fail=[CMD_CONTROLS])) as mock_run:
             result = main([CONTROLS_YAML])
 
         assert result != 0
@@ -411,23 +468,13 @@ class TestFailureModes:
         Given: controls.yaml staged; controls-graph validation fails (rc=1) but
                risk-graph validation succeeds (rc=0)
         When: main() is called
-        Then: GIT_ADD_RISK_GRAPH is called, GIT_ADD_CONTROLS is NOT called,
-              and main() returns non-zero
+        Then: Only the risk-map and risk-graph pairs are staged, and main() returns non-zero
         """
-
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_CONTROLS:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
+        with patch("subprocess.run", side_effect=_fake_run(fail=[CMD_CONTROLS])) as mock_run:
             result = main([CONTROLS_YAML])
 
         assert result != 0
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_RISK_GRAPH in subprocess_calls, "git add must be called for succeeded graph"
-        assert GIT_ADD_CONTROLS not in subprocess_calls, "git add must not be called for failed graph"
+        assert _staged(mock_run) == RISK_MAP_PAIR + RISK_GRAPH_PAIR, "only the succeeded graphs may be staged"
 
 
 # ===========================================================================
@@ -447,11 +494,11 @@ class TestGitAddAlignment:
         Then: git add receives risk-map-graph.md and risk-map-graph.mermaid
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([COMPONENTS_YAML])
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_RISK_MAP in subprocess_calls
+        staged = _staged(mock_run)
+        assert staged[staged.index(RISK_MAP_PAIR[0]) :][:2] == RISK_MAP_PAIR
 
     def test_controls_graph_git_add_stages_correct_file_pair(self):
         """
@@ -462,11 +509,11 @@ class TestGitAddAlignment:
         Then: git add receives controls-graph.md and controls-graph.mermaid
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([CONTROLS_YAML])
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_CONTROLS in subprocess_calls
+        staged = _staged(mock_run)
+        assert staged[staged.index(CONTROLS_PAIR[0]) :][:2] == CONTROLS_PAIR
 
     def test_risk_graph_git_add_stages_correct_file_pair(self):
         """
@@ -477,11 +524,11 @@ class TestGitAddAlignment:
         Then: git add receives controls-to-risk-graph.md and controls-to-risk-graph.mermaid
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([RISKS_YAML])
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_RISK_GRAPH in subprocess_calls
+        staged = _staged(mock_run)
+        assert staged[staged.index(RISK_GRAPH_PAIR[0]) :][:2] == RISK_GRAPH_PAIR
 
     def test_git_add_not_called_for_unrelated_file(self):
         """
@@ -515,7 +562,7 @@ class TestEdgeCases:
         Then: All three graphs are generated (same as scenario 1)
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main(["risk-map/yaml/components.yaml"])
 
@@ -535,7 +582,7 @@ class TestEdgeCases:
         abs_path = "/workspace/repo/risk-map/yaml/components.yaml"
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([abs_path])
 
@@ -555,7 +602,7 @@ class TestEdgeCases:
         Then: Each generation command is invoked exactly once
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main([COMPONENTS_YAML, COMPONENTS_YAML])
 
@@ -581,7 +628,7 @@ class TestEdgeCases:
         spaced_path = "/workspace/my repo/risk-map/yaml/components.yaml"
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             # Must not raise — any exit code is acceptable here
             try:
@@ -607,7 +654,7 @@ class TestEdgeCases:
         Then: Only the risk-graph is generated; main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
             result = main(["README.md", RISKS_YAML, ".github/ISSUE_TEMPLATE/risk.yml"])
 
@@ -636,7 +683,7 @@ class TestSubprocessCallShape:
         Then: Every subprocess.run call receives a list as its first argument
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([COMPONENTS_YAML])
 
         for c in mock_run.call_args_list:
@@ -652,7 +699,7 @@ class TestSubprocessCallShape:
         Then: The git add call receives a list as its first argument
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([RISKS_YAML])
 
         git_calls = [c for c in mock_run.call_args_list if c.args[0][0] == "git"]
@@ -661,18 +708,16 @@ class TestSubprocessCallShape:
             cmd = c.args[0]
             assert isinstance(cmd, list), f"git add must be called with a list, got {type(cmd)}: {cmd!r}"
 
-    def test_generation_precedes_git_add_for_each_graph(self):
+    def test_generation_precedes_git_add(self):
         """
         For each graph, the generation command must be called BEFORE its git add.
 
         Given: components.yaml staged; all commands succeed
         When: main() is called
-        Then: In the call sequence, CMD_RISK_MAP appears before GIT_ADD_RISK_MAP,
-              CMD_CONTROLS appears before GIT_ADD_CONTROLS, and CMD_RISK_GRAPH
-              appears before GIT_ADD_RISK_GRAPH
+        Then: All three generation commands run before the single git add
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([COMPONENTS_YAML])
 
         calls = [c.args[0] for c in mock_run.call_args_list]
@@ -683,15 +728,121 @@ class TestSubprocessCallShape:
             except ValueError:
                 pytest.fail(f"Expected call {cmd!r} was not made")
 
-        assert index_of(CMD_RISK_MAP) < index_of(GIT_ADD_RISK_MAP), (
-            "risk-map-graph generation must happen before its git add"
-        )
-        assert index_of(CMD_CONTROLS) < index_of(GIT_ADD_CONTROLS), (
-            "controls-graph generation must happen before its git add"
-        )
-        assert index_of(CMD_RISK_GRAPH) < index_of(GIT_ADD_RISK_GRAPH), (
-            "controls-to-risk-graph generation must happen before its git add"
-        )
+        git_add = calls[-1]
+        assert git_add[:2] == ["git", "add"], "the batched git add must come last"
+        for cmd in (CMD_RISK_MAP, CMD_CONTROLS, CMD_RISK_GRAPH):
+            assert index_of(cmd) < index_of(git_add), f"{cmd[2]} generation must happen before git add"
+
+
+# ===========================================================================
+# Unchanged Outputs — Skip staging when regenerated bytes are identical
+# ===========================================================================
+
+
+class TestUnchangedOutputs:
+    """Tests that only outputs whose content changed are staged."""
+
+    def test_identical_outputs_run_no_git(self):
+        """
+        Given: risks.yaml staged; the risk-graph pair already holds the bytes the generator writes
+        When: main() is called
+        Then: The generation runs, git is never invoked and main() returns 0
+        """
+        for path in RISK_GRAPH_PAIR:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text("graph")
+
+        with patch("subprocess.run", side_effect=_fake_run(content="graph")) as mock_run:
+            result = main([RISKS_YAML])
+
+        assert result == 0
+        assert [c.args[0] for c in mock_run.call_args_list] == [CMD_RISK_GRAPH]
+
+    def test_only_changed_pair_is_staged(self):
+        """
+        Given: controls.yaml staged; the controls-graph pair is already current, the others are not
+        When: main() is called
+        Then: Only the risk-map and risk-graph pairs are staged
+        """
+        for path in CONTROLS_PAIR:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text("graph")
+
+        with patch("subprocess.run", side_effect=_fake_run(content="graph")) as mock_run:
+            main([CONTROLS_YAML])
+
+        assert _staged(mock_run) == RISK_MAP_PAIR + RISK_GRAPH_PAIR
+
+
+# ===========================================================================
+# SVG Rendering — SVGs follow regenerated .mermaid outputs
+# ===========================================================================
+
+
+class TestSvgRendering:
+    """Tests that a graph whose .mermaid output changed gets its SVG in the same run."""
+
+    def test_changed_mermaid_renders_its_svg_and_stages_it(self, monkeypatch, svg_renders):
+        """
+        Given: risks.yaml staged; the renderer writes a new SVG
+        When: main() is called
+        Then: The risk-graph SVG is rendered after its graph and staged in the same git add
+        """
+
+        def render(svg):
+            svg_renders.append(svg.name)
+            Path(svg.outputs[0]).parent.mkdir(parents=True, exist_ok=True)
+            Path(svg.outputs[0]).write_text("<svg/>")
+            return 0
+
+        monkeypatch.setattr(regenerate_graphs, "_render_svg", render)
+
+        with patch("subprocess.run", side_effect=_fake_run()) as mock_run:
+            result = main([RISKS_YAML])
+
+        assert result == 0
+        assert svg_renders == ["svg:controls-to-risk-graph"]
+        assert _staged(mock_run) == RISK_GRAPH_PAIR + ["risk-map/svg/controls-to-risk-graph.svg"]
+
+    def test_unchanged_mermaid_renders_no_svg(self, svg_renders):
+        """
+        Given: risks.yaml staged; the risk-graph pair already holds the bytes the generator writes
+        When: main() is called
+        Then: No SVG is rendered
+        """
+        for path in RISK_GRAPH_PAIR:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text("graph")
+
+        with patch("subprocess.run", side_effect=_fake_run(content="graph")):
+            assert main([RISKS_YAML]) == 0
+
+        assert svg_renders == []
+
+    def test_failed_graph_renders_no_svg(self, svg_renders):
+        """
+        Given: controls.yaml staged; the controls-graph generation fails
+        When: main() is called
+        Then: The SVGs of the other two graphs are rendered, not the failed one's
+        """
+        with patch("subprocess.run", side_effect=_fake_run(fail=[CMD_CONTROLS])):
+            assert main([CONTROLS_YAML]) != 0
+
+        assert sorted(svg_renders) == ["svg:controls-to-risk-graph", "svg:risk-map-graph"]
+
+    def test_svg_failure_fails_hook_but_stages_graphs(self, monkeypatch):
+        """
+        Given: risks.yaml staged; the SVG renderer fails
+        When: main() is called
+        Then: main() returns the renderer's exit code and the regenerated graph pair is still staged
+        """
+        monkeypatch.setattr(regenerate_graphs, "_render_svg", lambda svg: 3)
+
+        with patch("subprocess.run", side_effect=_fake_run()) as mock_run:
+            result = main([RISKS_YAML])
+
+        assert result == 3
+        assert _staged(mock_run) == RISK_GRAPH_PAIR
 
 
 # ===========================================================================
@@ -700,22 +851,27 @@ class TestSubprocessCallShape:
 """
 Test Summary
 ============
-Total Tests: 26
+Total Tests: 33
 - Trigger combinatorics:          7  (TestTriggerCombinatorics)
 - Failure modes / exit codes:     7  (TestFailureModes)
 - Git-add alignment:              4  (TestGitAddAlignment)
 - Edge cases:                     5  (TestEdgeCases)
 - Subprocess call shape / order:  3  (TestSubprocessCallShape)
+- Unchanged outputs:              2  (TestUnchangedOutputs)
+- SVG rendering:                  4  (TestSvgRendering)
 
 Coverage Areas:
 - components.yaml trigger (risk-map-graph + controls-graph + risk-graph)
-- controls.yaml trigger (controls-graph + risk-graph only)
+- controls.yaml trigger (risk-map-graph + controls-graph + risk-graph)
+- mermaid-styles.yaml trigger (all three graphs)
 - risks.yaml trigger (risk-graph only)
 - No double-generation when multiple triggers present in argv
 - Continue-on-error semantics (all generations attempted despite earlier failures)
 - git add not called when generation fails
 - Exit code 0 iff all attempted generations and git adds succeed
 - Subprocess list-form safety (no shell=True string interpolation)
-- Call ordering: generation precedes git add for each pair
+- Call ordering: every generation precedes the single batched git add
+- Unchanged outputs are not staged; git is not run when nothing changed
+- A changed .mermaid output gets its SVG rendered and staged in the same git add
 - Defensive behaviour: empty argv, unrelated files, duplicate argv, absolute paths
 """
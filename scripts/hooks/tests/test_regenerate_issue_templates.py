@@ -10,9 +10,10 @@ false` after the framework's `files:` regex matches any of:
   - risk-map/yaml/frameworks.yaml
 
 When invoked, the wrapper unconditionally runs
-`python3 scripts/generate_issue_templates.py` and git-adds the
-`.github/ISSUE_TEMPLATE` directory. argv is ignored — the framework is the
-scheduler.
+`python3 scripts/generate_issue_templates.py --fingerprint-file <cache>` and
+git-adds the files under `.github/ISSUE_TEMPLATE` whose content changed, in
+one call (git is not run when nothing changed). Skipping an up-to-date run is
+the generator's job. argv is ignored — the framework is the scheduler.
 
 Test coverage focuses on the subprocess call shape, the
 generation-then-stage ordering, and failure propagation. There is no
@@ -25,12 +26,21 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "precommit"))
 
 from regenerate_issue_templates import main  # noqa: E402
 
-CMD_GENERATE = ["python3", "scripts/generate_issue_templates.py"]
-GIT_ADD_TEMPLATES = ["git", "add", ".github/ISSUE_TEMPLATE"]
+CACHE_DIR = "issue-template-cache"
+CMD_GENERATE = [
+    "python3",
+    "scripts/generate_issue_templates.py",
+    "--fingerprint-file",
+    f"{CACHE_DIR}/fingerprint.json",
+]
+TEMPLATE_FILES = [".github/ISSUE_TEMPLATE/new_risk.yml", ".github/ISSUE_TEMPLATE/update_risk.yml"]
+GIT_ADD_TEMPLATES = ["git", "add", *TEMPLATE_FILES]
 
 
 def _make_subprocess_mock(returncode: int = 0) -> MagicMock:
@@ -40,11 +50,35 @@ def _make_subprocess_mock(returncode: int = 0) -> MagicMock:
     return mock
 
 
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Run the wrapper in an empty working tree so emulated templates never touch the repo."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ISSUE_TEMPLATE_CACHE_DIR", CACHE_DIR)
+    return tmp_path
+
+
+def _fake_run(generation_returncode: int = 0, git_returncode: int = 0, content: str = "name: template"):
+    """subprocess.run side effect emulating the generator (writes TEMPLATE_FILES on success) and git."""
+
+    def side_effect(cmd, **kwargs):
+        if cmd[0] == "git":
+            return _make_subprocess_mock(git_returncode)
+        if generation_returncode == 0:
+            for name in TEMPLATE_FILES:
+                Path(name).parent.mkdir(parents=True, exist_ok=True)
+                Path(name).write_text(content)
+        return _make_subprocess_mock(generation_returncode)
+
+    return side_effect
+
+
 # ===========================================================================
 # Happy path: unconditional regeneration when invoked
 # ===========================================================================
 
 
+@pytest.mark.usefixtures("workspace")
 class TestHappyPath:
     def test_empty_argv_still_regenerates_and_stages(self):
         """
@@ -58,7 +92,7 @@ class TestHappyPath:
         # Implementation must use `subprocess.run(...)` (not `from subprocess import run`)
         # for this patch target to intercept calls.
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             result = main([])
 
         assert result == 0
@@ -77,7 +111,7 @@ class TestHappyPath:
         Then: exit 0, still exactly one gen + one git add (argv ignored)
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             result = main(
                 [
                     "README.md",
@@ -95,19 +129,33 @@ class TestHappyPath:
 # ===========================================================================
 
 
+@pytest.mark.usefixtures("workspace")
 class TestSubprocessCommandShape:
     def test_generation_command_is_exact(self):
-        """Generation command must be ["python3", "scripts/generate_issue_templates.py"]."""
+        """Generation command must be generate_issue_templates.py with the cached fingerprint file."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([])
 
         assert mock_run.call_args_list[0].args[0] == CMD_GENERATE
 
+    def test_fingerprint_defaults_to_xdg_cache_home(self, monkeypatch):
+        """Without ISSUE_TEMPLATE_CACHE_DIR the fingerprint lives under $XDG_CACHE_HOME."""
+        monkeypatch.delenv("ISSUE_TEMPLATE_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", "xdg-cache")
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _fake_run()
+            main([])
+
+        assert (
+            mock_run.call_args_list[0].args[0][-1]
+            == "xdg-cache/secure-ai-tooling/issue-templates/fingerprint.json"
+        )
+
     def test_git_add_command_is_exact(self):
-        """git add command must be ["git", "add", ".github/ISSUE_TEMPLATE"]."""
+        """git add must list exactly the template files that changed."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([])
 
         assert mock_run.call_args_list[1].args[0] == GIT_ADD_TEMPLATES
@@ -115,7 +163,7 @@ class TestSubprocessCommandShape:
     def test_all_commands_use_list_form(self):
         """Every subprocess call must use list form (no shell=True)."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             main([])
 
         for call in mock_run.call_args_list:
@@ -128,6 +176,7 @@ class TestSubprocessCommandShape:
 # ===========================================================================
 
 
+@pytest.mark.usefixtures("workspace")
 class TestFailureModes:
     def test_generation_fails_git_add_not_called(self):
         """
@@ -135,13 +184,7 @@ class TestFailureModes:
         When: main() is called
         Then: git add is NOT called, exit code matches generation rc
         """
-
-        def side_effect(cmd, **kwargs):
-            if cmd == CMD_GENERATE:
-                return _make_subprocess_mock(2)
-            return _make_subprocess_mock(0)
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
+        with patch("subprocess.run", side_effect=_fake_run(generation_returncode=2)) as mock_run:
             result = main([])
 
         assert result == 2
@@ -155,13 +198,7 @@ class TestFailureModes:
         When: main() is called
         Then: exit code is the git add rc
         """
-
-        def side_effect(cmd, **kwargs):
-            if cmd == GIT_ADD_TEMPLATES:
-                return _make_subprocess_mock(5)
-            return _make_subprocess_mock(0)
-
-        with patch("subprocess.run", side_effect=side_effect):
+        with patch("subprocess.run", side_effect=_fake_run(git_returncode=5)):
             result = main([])
 
         assert result == 5
@@ -169,12 +206,28 @@ class TestFailureModes:
     def test_both_succeed_returns_zero(self):
         """Both subprocesses succeed → exit 0."""
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
             result = main([])
 
         assert result == 0
         assert mock_run.call_count == 2
 
+    def test_unchanged_templates_run_no_git(self):
+        """
+        Given: The templates already hold the generated content
+        When: main() is called
+        Then: generation runs, git is not invoked, exit 0
+        """
+        for name in TEMPLATE_FILES:
+            Path(name).parent.mkdir(parents=True, exist_ok=True)
+            Path(name).write_text("name: template")
+
+        with patch("subprocess.run", side_effect=_fake_run(content="name: template")) as mock_run:
+            result = main([])
+
+        assert result == 0
+        assert [c.args[0] for c in mock_run.call_args_list] == [CMD_GENERATE]
+
 
 # ===========================================================================
 # D6 structural-contract tests (ADR-026 D2, D3, D6)
@@ -11,38 +11,47 @@ in the same commit as the source change (Mode B auto-stage pattern).
 Trigger: any .mmd or .mermaid file under risk-map/diagrams/
 Output: risk-map/svg/<basename>.svg
 
-Each input file is converted independently. The puppeteer config written to a
-temp file controls Chromium settings; CHROMIUM_PATH env var optionally sets
-the browser executable path. The temp config file is cleaned up in a finally
+Cached diagrams (keyed by a hash of source, render flags, puppeteer config
+and renderer identity) skip the renderer; the remaining diagrams are rendered in one batched
+mmdc session, falling back to per-file rendering when the batch fails. The
+SVGs whose content changed are staged with one git add; git is not run when
+every SVG is already up to date. The puppeteer config written to a temp
+file controls Chromium settings; CHROMIUM_PATH env var optionally sets the
+browser executable path. The temp config file is cleaned up in a finally
 block regardless of outcome.
 
 Test Coverage:
 ==============
-Total Tests: 42
+Total Tests: 52
 - Helper functions:         13  (TestPuppeteerConfig, TestPathMatching)
-- Happy path / main:         5  (TestMainHappyPath)
+- Happy path / main:         6  (TestMainHappyPath)
 - Filtering:                 3  (TestFiltering)
 - Failure modes:             4  (TestFailureModes)
 - Env handling:              3  (TestEnvHandling)
 - Cleanup:                   1  (TestCleanup)
 - Subprocess call shape:     2  (TestSubprocessCallShape)
 - Chromium discovery:       11  (TestChromiumDiscovery)
+- Batched/cached rendering:  9  (TestBatchedCachedRendering, stub renderer)
 
 Coverage Target: 90%+ of regenerate_svgs.py
 """
 
 import json
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # ---------------------------------------------------------------------------
 # Add scripts/hooks/precommit to the import path so that the module under
 # test can be imported as `regenerate_svgs` regardless of working directory.
 # ---------------------------------------------------------------------------
 sys.path.insert(0, str(Path(__file__).parent.parent / "precommit"))
 
+import regenerate_svgs  # noqa: E402  (late import after sys.path mutation)
 from regenerate_svgs import (  # noqa: E402  (late import after sys.path mutation)
     _build_puppeteer_config,
     _discover_chromium,
@@ -81,6 +90,63 @@ def _make_subprocess_mock(returncode: int = 0) -> MagicMock:
     return mock
 
 
+def _install_mermaid_cli(node_modules: Path, version: str) -> None:
+    """Write a mermaid-cli package.json under ``node_modules`` reporting ``version``."""
+    package_dir = node_modules / "@mermaid-js" / "mermaid-cli"
+    package_dir.mkdir(parents=True, exist_ok=True)
+    (package_dir / "package.json").write_text(json.dumps({"version": version}), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_svg_cache(tmp_path, monkeypatch):
+    """
+    Point the SVG render cache at a per-test directory and use the default renderer.
+
+    mermaid-cli is "installed" in a per-test node_modules so the renderer identity is read
+    from disk and no ``--version`` call reaches the mocked subprocess.run.
+    """
+    monkeypatch.setenv("SVG_RENDER_CACHE_DIR", str(tmp_path / "svg-cache"))
+    monkeypatch.delenv("MERMAID_RENDERER", raising=False)
+    _install_mermaid_cli(tmp_path / "node_modules", "11.16.0")
+    monkeypatch.setattr(regenerate_svgs, "_NODE_MODULES", tmp_path / "node_modules")
+
+
+class _DiagramRepo:
+    """A temporary working tree with risk-map/diagrams and risk-map/svg directories."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        (root / DIAGRAMS_DIR).mkdir(parents=True)
+        (root / SVG_DIR).mkdir(parents=True)
+
+    def write(self, name: str, source: str) -> str:
+        """Write a diagram source and return its repo-relative path."""
+        (self.root / DIAGRAMS_DIR / name).write_text(source, encoding="utf-8")
+        return f"{DIAGRAMS_DIR}/{name}"
+
+
+@pytest.fixture
+def diagram_repo(tmp_path, monkeypatch):
+    """Chdir into a temporary working tree for tests that need real diagram sources."""
+    repo = _DiagramRepo(tmp_path / "repo")
+    monkeypatch.chdir(repo.root)
+    return repo
+
+
+def _fake_mmdc(cmd, **kwargs):
+    """subprocess.run side effect that emulates mmdc output (including markdown batch mode)."""
+    if cmd[0] == "npx":
+        input_path = Path(cmd[cmd.index("-i") + 1])
+        output_path = Path(cmd[cmd.index("-o") + 1])
+        if input_path.suffix == ".md":
+            blocks = input_path.read_text(encoding="utf-8").count("```mermaid")
+            for n in range(1, blocks + 1):
+                output_path.with_name(f"{output_path.stem}-{n}.svg").write_text("<svg/>", encoding="utf-8")
+        else:
+            output_path.write_text("<svg/>", encoding="utf-8")
+    return _make_subprocess_mock(0)
+
+
 def _mmdc_cmd(input_path: str, output_path: str, config_path: str) -> list:
     """Return the expected mmdc command for a given input/output/config path."""
     return [
@@ -272,7 +338,7 @@ class TestPathMatching:
 class TestMainHappyPath:
     """Tests verifying the happy path through main() for single and multiple files."""
 
-    def test_single_mmd_file_makes_one_mmdc_call_and_one_git_add(self):
+    def test_single_mmd_file_makes_one_mmdc_call_and_one_git_add(self, diagram_repo):
         """
         A single .mmd file in argv triggers exactly 1 mmdc call and 1 git add.
 
@@ -280,11 +346,11 @@ class TestMainHappyPath:
         When: main() is called
         Then: subprocess.run is called twice (mmdc + git add), main() returns 0
         """
+        diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
+
         # Implementation must use `subprocess.run(...)` (not `from subprocess import run`)
         # for these patches to intercept calls. Patch target: `subprocess.run`.
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
             result = main([SAMPLE_MMD])
 
         assert result == 0
@@ -320,7 +386,7 @@ class TestMainHappyPath:
         assert mmdc_cmd[10] == "-p"
         assert len(mmdc_cmd) == 12
 
-    def test_git_add_invoked_with_svg_output_path(self):
+    def test_git_add_invoked_with_svg_output_path(self, diagram_repo):
         """
         After successful mmdc, git add is called with the SVG output path.
 
@@ -328,9 +394,9 @@ class TestMainHappyPath:
         When: main() is called
         Then: git add is called with "risk-map/svg/foo.svg"
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
 
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
             main([SAMPLE_MMD])
 
         calls = [c.args[0] for c in mock_run.call_args_list]
@@ -338,35 +404,60 @@ class TestMainHappyPath:
         assert len(git_calls) == 1, "Expected exactly one git add call"
         assert git_calls[0] == _git_add_cmd(SAMPLE_SVG_FROM_MMD), f"git add called with wrong path: {git_calls[0]}"
 
-    def test_two_mmd_files_make_two_mmdc_calls_and_two_git_adds(self):
+    def test_up_to_date_svg_is_not_staged(self, diagram_repo):
+        """
+        An SVG that already holds the rendered bytes is neither rewritten nor staged.
+
+        Given: foo.mmd rendered once (SVG on disk and cached)
+        When: main() is called again with the unchanged source
+        Then: no subprocess runs, the SVG keeps its mtime, main() returns 0
         """
-        Two .mmd files in argv trigger 2 mmdc calls and 2 git adds.
+        path = diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
+        with patch("subprocess.run", side_effect=_fake_mmdc):
+            main([path])
+        svg = diagram_repo.root / SAMPLE_SVG_FROM_MMD
+        mtime = svg.stat().st_mtime_ns
 
-        Given: pre-commit passes two .mmd files
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
+            result = main([path])
+
+        assert result == 0
+        mock_run.assert_not_called()
+        assert svg.stat().st_mtime_ns == mtime
+
+    def test_two_mmd_files_make_one_batched_mmdc_call_and_one_git_add(self, diagram_repo):
+        """
+        Two readable .mmd files are rendered in one batched mmdc session and staged together.
+
+        Given: two .mmd sources on disk; the renderer produces every batch output
         When: main() is called
-        Then: 4 total subprocess calls (2 mmdc + 2 git add), returns 0
+        Then: 2 total subprocess calls (1 batched mmdc + 1 git add of both SVGs), returns 0
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
+        diagram_repo.write("baz.mmd", "graph TD\n    C --> D\n")
 
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
             result = main(["risk-map/diagrams/foo.mmd", "risk-map/diagrams/baz.mmd"])
 
         assert result == 0
-        assert mock_run.call_count == 4, (
-            f"Expected 4 subprocess calls (2x mmdc + 2x git add), got {mock_run.call_count}"
+        assert mock_run.call_count == 2, (
+            f"Expected 2 subprocess calls (1 batched mmdc + 1 git add), got {mock_run.call_count}"
         )
+        git_cmd = mock_run.call_args_list[-1].args[0]
+        assert git_cmd == ["git", "add", "risk-map/svg/foo.svg", "risk-map/svg/baz.svg"]
 
-    def test_mmd_and_mermaid_and_txt_only_two_conversions(self):
+    def test_mmd_and_mermaid_and_txt_only_two_conversions(self, diagram_repo):
         """
         Mixed argv (.mmd + .mermaid + .txt) triggers 2 conversions; .txt is ignored.
 
         Given: argv contains one .mmd, one .mermaid, one .txt (all in risk-map/diagrams/)
         When: main() is called
-        Then: 4 total subprocess calls (2 mmdc + 2 git add), .txt ignored, returns 0
+        Then: both SVGs are produced by a single batched mmdc call, .txt ignored, returns 0
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
+        diagram_repo.write("bar.mermaid", "graph LR\n    C --> D\n")
 
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
             result = main(
                 [
                     "risk-map/diagrams/foo.mmd",
@@ -376,7 +467,9 @@ class TestMainHappyPath:
             )
 
         assert result == 0
-        assert mock_run.call_count == 4, f"Expected 4 subprocess calls (2 valid files), got {mock_run.call_count}"
+        assert mock_run.call_count == 2, f"Expected 2 subprocess calls (2 valid files), got {mock_run.call_count}"
+        assert (diagram_repo.root / "risk-map/svg/foo.svg").exists()
+        assert (diagram_repo.root / "risk-map/svg/bar.svg").exists()
 
 
 # ===========================================================================
@@ -464,7 +557,7 @@ class TestFailureModes:
         npx_calls = [c for c in mock_run.call_args_list if c.args[0][0] == "npx"]
         assert len(npx_calls) == 2, "Both mmdc calls must be attempted even after the first failure"
 
-    def test_mmdc_succeeds_but_git_add_fails_returns_nonzero(self):
+    def test_mmdc_succeeds_but_git_add_fails_returns_nonzero(self, diagram_repo):
         """
         If mmdc succeeds but git add fails, main() returns non-zero.
 
@@ -472,12 +565,12 @@ class TestFailureModes:
         When: main() is called
         Then: main() returns non-zero
         """
+        diagram_repo.write("foo.mmd", "graph TD\n    A --> B\n")
 
         def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
             if cmd[0] == "git":
-                mock.returncode = 1
-            return mock
+                return _make_subprocess_mock(1)
+            return _fake_mmdc(cmd, **kwargs)
 
         with patch("subprocess.run", side_effect=side_effect):
             result = main([SAMPLE_MMD])
@@ -702,17 +795,18 @@ class TestSubprocessCallShape:
             cmd = c.args[0]
             assert isinstance(cmd, list), f"subprocess.run must be called with a list, got {type(cmd)}: {cmd!r}"
 
-    def test_mmdc_precedes_git_add_for_each_file(self):
+    def test_mmdc_precedes_single_git_add(self, diagram_repo):
         """
-        For each file, the mmdc conversion must be called before the git add.
+        All rendering finishes before the single batched git add.
 
         Given: two .mmd files staged; all commands succeed
         When: main() is called
-        Then: the mmdc call for each file appears before its corresponding git add
-              in the subprocess.run call sequence
+        Then: the mmdc call precedes the one git add, which stages both outputs
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        diagram_repo.write("alpha.mmd", "graph TD\n    A --> B\n")
+        diagram_repo.write("beta.mmd", "graph TD\n    C --> D\n")
+
+        with patch("subprocess.run", side_effect=_fake_mmdc) as mock_run:
             main(
                 [
                     "risk-map/diagrams/alpha.mmd",
@@ -725,12 +819,10 @@ class TestSubprocessCallShape:
         npx_indices = [i for i, c in enumerate(calls) if c[0] == "npx"]
         git_indices = [i for i, c in enumerate(calls) if c[0] == "git"]
 
-        assert len(npx_indices) == 2, "Expected 2 mmdc calls"
-        assert len(git_indices) == 2, "Expected 2 git add calls"
-
-        # First mmdc must precede first git add; second mmdc must precede second git add
-        assert npx_indices[0] < git_indices[0], "First mmdc call must precede first git add"
-        assert npx_indices[1] < git_indices[1], "Second mmdc call must precede second git add"
+        assert len(npx_indices) == 1, "Expected 1 batched mmdc call"
+        assert len(git_indices) == 1, "Expected 1 git add call"
+        assert npx_indices[0] < git_indices[0], "mmdc call must precede git add"
+        assert calls[git_indices[0]][2:] == ["risk-map/svg/alpha.svg", "risk-map/svg/beta.svg"]
 
 
 # ===========================================================================
@@ -1059,3 +1151,180 @@ Coverage Areas:
 - _discover_chromium: PLAYWRIGHT_BROWSERS_PATH env controls cache root
 - _discover_chromium: default ~/.cache/ms-playwright used when PLAYWRIGHT_BROWSERS_PATH unset
 """
+
+
+# ===========================================================================
+# Batched, Cached Rendering — end-to-end with a stub renderer executable
+# ===========================================================================
+
+STUB_RENDERER = Path(__file__).parent / "fixtures" / "stub_renderer" / "stub_mmdc.py"
+
+
+class TestBatchedCachedRendering:
+    """End-to-end tests that run a stub mmdc executable via MERMAID_RENDERER."""
+
+    @pytest.fixture
+    def stub(self, diagram_repo, tmp_path, monkeypatch):
+        """Route rendering through the stub renderer and stub out git add; return the call log path."""
+        log_path = tmp_path / "stub-mmdc.log"
+        monkeypatch.setenv("MERMAID_RENDERER", f"{sys.executable} {STUB_RENDERER}")
+        monkeypatch.setenv("STUB_MMDC_LOG", str(log_path))
+        monkeypatch.setattr(regenerate_svgs, "_discover_chromium", lambda: None)
+
+        real_run = subprocess.run
+
+        def run(cmd, **kwargs):
+            if cmd[0] == "git":
+                return _make_subprocess_mock(0)
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(regenerate_svgs.subprocess, "run", run)
+        return log_path
+
+    @staticmethod
+    def _invocations(log_path: Path) -> list[list[str]]:
+        if not log_path.exists():
+            return []
+        return [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+
+    def test_three_diagrams_rendered_in_one_session(self, diagram_repo, stub):
+        """
+        Given: three new diagrams and an empty cache
+        When: main() is called
+        Then: the renderer runs once and all three SVGs are written
+        """
+        paths = [diagram_repo.write(f"d{i}.mermaid", f"graph TD\n    N{i} --> M{i}\n") for i in range(3)]
+
+        assert main(paths) == 0
+
+        assert len(self._invocations(stub)) == 1
+        for i in range(3):
+            assert (diagram_repo.root / SVG_DIR / f"d{i}.svg").read_text(encoding="utf-8").startswith("<svg")
+
+    def test_unchanged_diagrams_never_hit_renderer(self, diagram_repo, stub):
+        """
+        Given: diagrams already rendered once (cache populated)
+        When: main() is called again with identical sources and the SVGs deleted
+        Then: the renderer is not invoked and the SVGs are restored from cache
+        """
+        paths = [
+            diagram_repo.write("a.mermaid", "graph TD\n A-->B\n"),
+            diagram_repo.write("b.mermaid", "graph TD\n C-->D\n"),
+        ]
+        main(paths)
+        first = (diagram_repo.root / SVG_DIR / "a.svg").read_bytes()
+        for svg in (diagram_repo.root / SVG_DIR).iterdir():
+            svg.unlink()
+
+        assert main(paths) == 0
+
+        assert len(self._invocations(stub)) == 1, "Second run must be served entirely from cache"
+        assert (diagram_repo.root / SVG_DIR / "a.svg").read_bytes() == first
+
+    def test_only_changed_diagram_is_rendered(self, diagram_repo, stub):
+        """
+        Given: two cached diagrams, one of which is then edited
+        When: main() is called with both
+        Then: only the edited diagram is rendered, with a direct single-file invocation
+        """
+        a = diagram_repo.write("a.mermaid", "graph TD\n A-->B\n")
+        b = diagram_repo.write("b.mermaid", "graph TD\n C-->D\n")
+        main([a, b])
+        diagram_repo.write("b.mermaid", "graph TD\n C-->E\n")
+
+        main([a, b])
+
+        invocations = self._invocations(stub)
+        assert len(invocations) == 2
+        assert invocations[1][invocations[1].index("-i") + 1] == b
+
+    def test_puppeteer_config_change_invalidates_cache(self, diagram_repo, stub, monkeypatch):
+        """
+        Given: a cached diagram
+        When: the puppeteer config changes (different Chromium path)
+        Then: the diagram is rendered again
+        """
+        path = diagram_repo.write("a.mermaid", "graph TD\n A-->B\n")
+        main([path])
+        monkeypatch.setattr(regenerate_svgs, "_discover_chromium", lambda: "/opt/chromium")
+
+        main([path])
+
+        assert len(self._invocations(stub)) == 2
+
+    def test_batch_failure_falls_back_to_per_file(self, diagram_repo, stub):
+        """
+        Given: three diagrams, one of which the renderer rejects
+        When: main() is called
+        Then: the batch fails, each file is retried alone, good SVGs land and exit code is non-zero
+        """
+        good1 = diagram_repo.write("good1.mermaid", "graph TD\n A-->B\n")
+        bad = diagram_repo.write("bad.mermaid", "graph TD\n FAIL\n")
+        good2 = diagram_repo.write("good2.mermaid", "graph TD\n C-->D\n")
+
+        assert main([good1, bad, good2]) != 0
+
+        assert len(self._invocations(stub)) == 4, "1 failed batch + 3 single-file retries"
+        assert (diagram_repo.root / SVG_DIR / "good1.svg").exists()
+        assert (diagram_repo.root / SVG_DIR / "good2.svg").exists()
+        assert not (diagram_repo.root / SVG_DIR / "bad.svg").exists()
+
+    def test_failed_render_is_not_cached(self, diagram_repo, stub):
+        """
+        Given: a diagram the renderer rejects
+        When: main() is called twice
+        Then: the renderer is invoked both times
+        """
+        bad = diagram_repo.write("bad.mermaid", "graph TD\n FAIL\n")
+
+        main([bad])
+        main([bad])
+
+        assert len(self._invocations(stub)) == 2
+
+    def test_batch_and_single_outputs_are_identical(self, diagram_repo, stub, tmp_path, monkeypatch):
+        """
+        Given: the same diagram rendered in a batch and alone
+        When: the SVGs are compared
+        Then: the bytes match
+        """
+        a = diagram_repo.write("a.mermaid", "graph TD\n A-->B\n")
+        b = diagram_repo.write("b.mermaid", "graph TD\n C-->D\n")
+        main([a, b])
+        batched = (diagram_repo.root / SVG_DIR / "a.svg").read_bytes()
+
+        monkeypatch.setenv("SVG_RENDER_CACHE_DIR", str(tmp_path / "fresh-cache"))
+        (diagram_repo.root / SVG_DIR / "a.svg").unlink()
+        main([a])
+
+        assert (diagram_repo.root / SVG_DIR / "a.svg").read_bytes() == batched
+
+    def test_mermaid_cli_upgrade_invalidates_cache(self, diagram_repo, stub, tmp_path):
+        """
+        Given: a diagram cached by mermaid-cli 11.16.0
+        When: node_modules is upgraded to 11.17.0
+        Then: the diagram is rendered again
+        """
+        path = diagram_repo.write("a.mermaid", "graph TD\n A-->B\n")
+        main([path])
+        _install_mermaid_cli(tmp_path / "node_modules", "11.17.0")
+
+        main([path])
+
+        assert len(self._invocations(stub)) == 2
+
+    def test_renderer_version_is_asked_without_node_modules(self, diagram_repo, stub, tmp_path, monkeypatch):
+        """
+        Given: no mermaid-cli under node_modules and a cached diagram
+        When: the renderer's --version output changes
+        Then: the diagram is rendered again; the --version calls are not renders
+        """
+        monkeypatch.setattr(regenerate_svgs, "_NODE_MODULES", tmp_path / "missing")
+        path = diagram_repo.write("a.mermaid", "graph TD\n A-->B\n")
+        main([path])
+        main([path])
+        monkeypatch.setenv("STUB_MMDC_VERSION", "9.9.9")
+
+        main([path])
+
+        assert len(self._invocations(stub)) == 2
@@ -8,34 +8,35 @@ pre-commit framework with staged filenames as positional argv (pass_filenames:
 true) and must regenerate the appropriate tables and git-add them so they land
 in the same commit as the source change (Mode B auto-stage pattern).
 
-The 8 generation rules across 4 triggers (yaml_to_markdown.py is the
-generator; outputs go to risk-map/tables/):
+Tables affected by each trigger come from the artifact graph
+(scripts/hooks/_artifact_graph.py); yaml_to_markdown.py is the generator and
+outputs go to risk-map/tables/. Every full and summary table expands {{id}}
+sentinels with titles from all four corpus files, so it reads all of them:
 
   Trigger: components.yaml
-    - components --all-formats --quiet  -> components-*.md
-    - controls --format xref-components --quiet  -> controls-xref-components.md
+    - every full/summary table, controls:xref-components
   Trigger: risks.yaml
-    - risks --all-formats --quiet  -> risks-*.md
-    - controls --format xref-risks --quiet  -> controls-xref-risks.md
-    - personas --format xref-risks --quiet  -> personas-xref-risks.md
+    - every full/summary table, controls:xref-risks, personas:xref-risks
   Trigger: controls.yaml
-    - controls --all-formats --quiet  -> controls-*.md
-    - personas --format xref-controls --quiet  -> personas-xref-controls.md
+    - every full/summary table, controls:xref-risks,
+      controls:xref-components, personas:xref-controls
   Trigger: personas.yaml
-    - personas --all-formats --quiet  -> personas-*.md
+    - every full/summary table, personas:xref-controls, personas:xref-risks
 
-No dedup across triggers: if components.yaml AND controls.yaml are both staged,
-both `controls --format xref-components` (components trigger) AND
-`controls --all-formats` (controls trigger) are run — parity with bash hook.
+All affected tables are rendered by ONE yaml_to_markdown.py invocation
+(`--table TYPE:FORMAT ... --jobs 0 --quiet`), so a table affected by several
+staged triggers is rendered once. If generation succeeded, the tables whose
+content changed are staged with a single `git add` of exact filenames; git is
+not run at all when every table was already up to date.
 
 Test Coverage:
 ==============
-Total Tests: 25
-- Trigger combinatorics:  9  (TestTriggerCombinatorics)
-- Git-add alignment:      4  (TestGitAddAlignment)
-- Failure modes:          6  (TestFailureModes)
-- Edge cases:             4  (TestEdgeCases)
-- Subprocess call shape:  2  (TestSubprocessCallShape)
+Total Tests: 24
+- Affected tables:        9  (TestAffectedTables)
+- Generation command:     4  (TestGenerationCommand)
+- Git-add alignment:      5  (TestGitAddAlignment)
+- Failure modes:          3  (TestFailureModes)
+- Edge cases:             3  (TestEdgeCases)
 
 Coverage Target: 90%+ of regenerate_tables.py
 """
@@ -54,11 +55,10 @@ import pytest
 # ---------------------------------------------------------------------------
 sys.path.insert(0, str(Path(__file__).parent.parent / "precommit"))
 
-from regenerate_tables import main  # noqa: E402  (intentional late import)
+from regenerate_tables import affected_tables, main  # noqa: E402  (intentional late import)
 
 # ---------------------------------------------------------------------------
-# Constants mirroring what the implementation is expected to export/use.
-# Tests reference these so that a single change here propagates everywhere.
+# Constants mirroring what the implementation is expected to use.
 # ---------------------------------------------------------------------------
 
 COMPONENTS_YAML = "risk-map/yaml/components.yaml"
@@ -68,77 +68,42 @@ PERSONAS_YAML = "risk-map/yaml/personas.yaml"
 
 YAML_TO_MD = "scripts/hooks/yaml_to_markdown.py"
 
-# Generation commands — must match the spec table exactly
-CMD_COMPONENTS_ALL_FORMATS = [
-    "python3",
-    YAML_TO_MD,
-    "components",
-    "--all-formats",
-    "--quiet",
-]
-CMD_CONTROLS_XREF_COMPONENTS = [
-    "python3",
-    YAML_TO_MD,
-    "controls",
-    "--format",
-    "xref-components",
-    "--quiet",
-]
-CMD_RISKS_ALL_FORMATS = [
-    "python3",
-    YAML_TO_MD,
-    "risks",
-    "--all-formats",
-    "--quiet",
-]
-CMD_CONTROLS_XREF_RISKS = [
-    "python3",
-    YAML_TO_MD,
-    "controls",
-    "--format",
-    "xref-risks",
-    "--quiet",
-]
-CMD_PERSONAS_XREF_RISKS = [
-    "python3",
-    YAML_TO_MD,
-    "personas",
-    "--format",
-    "xref-risks",
-    "--quiet",
-]
-CMD_CONTROLS_ALL_FORMATS = [
-    "python3",
-    YAML_TO_MD,
-    "controls",
-    "--all-formats",
-    "--quiet",
-]
-CMD_PERSONAS_XREF_CONTROLS = [
-    "python3",
-    YAML_TO_MD,
-    "personas",
-    "--format",
-    "xref-controls",
-    "--quiet",
-]
-CMD_PERSONAS_ALL_FORMATS = [
-    "python3",
-    YAML_TO_MD,
-    "personas",
-    "--all-formats",
-    "--quiet",
+# Every table, in artifact-graph order.
+ALL_TABLES = [
+    ("components", "full"),
+    ("components", "summary"),
+    ("risks", "full"),
+    ("risks", "summary"),
+    ("controls", "full"),
+    ("controls", "summary"),
+    ("controls", "xref-risks"),
+    ("controls", "xref-components"),
+    ("personas", "full"),
+    ("personas", "summary"),
+    ("personas", "xref-controls"),
+    ("personas", "xref-risks"),
 ]
+# Full and summary tables read the whole corpus (sentinel titles).
+PROSE_TABLES = [table for table in ALL_TABLES if table[1] in ("full", "summary")]
+
+
+def _tables(*xrefs: tuple[str, str]) -> list[tuple[str, str]]:
+    """Return the prose tables plus the given xref tables, in artifact-graph order."""
+    return [table for table in ALL_TABLES if table in PROSE_TABLES or table in xrefs]
+
+
+COMPONENTS_TABLES = _tables(("controls", "xref-components"))
+RISKS_TABLES = _tables(("controls", "xref-risks"), ("personas", "xref-risks"))
+CONTROLS_TABLES = _tables(
+    ("controls", "xref-risks"), ("controls", "xref-components"), ("personas", "xref-controls")
+)
+PERSONAS_TABLES = _tables(("personas", "xref-controls"), ("personas", "xref-risks"))
+
+
+def _selected(argv: list[str]) -> list[tuple[str, str]]:
+    """Return the (type, format) pairs of the tables affected_tables() selects for argv."""
+    return [tuple(table.target.split(":")) for table in affected_tables(argv)]
 
-# git add targets — glob patterns are expanded by git itself
-GIT_ADD_COMPONENTS_TABLES = ["git", "add", "risk-map/tables/components-*.md"]
-GIT_ADD_CONTROLS_XREF_COMPONENTS = ["git", "add", "risk-map/tables/controls-xref-components.md"]
-GIT_ADD_RISKS_TABLES = ["git", "add", "risk-map/tables/risks-*.md"]
-GIT_ADD_CONTROLS_XREF_RISKS = ["git", "add", "risk-map/tables/controls-xref-risks.md"]
-GIT_ADD_PERSONAS_XREF_RISKS = ["git", "add", "risk-map/tables/personas-xref-risks.md"]
-GIT_ADD_CONTROLS_TABLES = ["git", "add", "risk-map/tables/controls-*.md"]
-GIT_ADD_PERSONAS_XREF_CONTROLS = ["git", "add", "risk-map/tables/personas-xref-controls.md"]
-GIT_ADD_PERSONAS_TABLES = ["git", "add", "risk-map/tables/personas-*.md"]
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -152,491 +117,340 @@ def _make_subprocess_mock(returncode: int = 0) -> MagicMock:
     return mock
 
 
-# ===========================================================================
-# Trigger Combinatorics — Which tables are generated for which staged files
-# ===========================================================================
+@pytest.fixture(autouse=True)
+def _workspace(tmp_path, monkeypatch):
+    """Run every test in an empty working tree so emulated outputs never touch the repo."""
+    monkeypatch.chdir(tmp_path)
 
 
-class TestTriggerCombinatorics:
-    """Tests verifying that each staged file triggers the correct generation(s)."""
+def _fake_run(generation_returncode: int = 0, git_returncode: int = 0, content: str = "table"):
+    """
+    subprocess.run side effect emulating yaml_to_markdown.py and git.
 
-    def test_only_components_yaml_staged_runs_two_generations(self):
-        """
-        Only components.yaml staged triggers exactly 2 generations and 2 git-adds.
+    A successful generation writes every requested ``--table`` output with ``content``.
+    """
 
-        Given: pre-commit framework passes ["risk-map/yaml/components.yaml"]
-        When: main() is called
-        Then: CMD_COMPONENTS_ALL_FORMATS and CMD_CONTROLS_XREF_COMPONENTS are run,
-              their git-adds are called, total subprocess calls == 4, returns 0
-        """
-        # Implementation must use `subprocess.run(...)` (not `from subprocess import run`)
-        # for these patches to intercept calls. Patch target: `subprocess.run`.
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+    def side_effect(cmd, **kwargs):
+        if cmd[0] == "git":
+            return _make_subprocess_mock(git_returncode)
+        if generation_returncode == 0:
+            for spec in (cmd[i + 1] for i, arg in enumerate(cmd) if arg == "--table"):
+                ytype, table_format = spec.split(":")
+                output = Path(f"risk-map/tables/{ytype}-{table_format}.md")
+                output.parent.mkdir(parents=True, exist_ok=True)
+                output.write_text(content)
+        return _make_subprocess_mock(generation_returncode)
 
-            result = main([COMPONENTS_YAML])
+    return side_effect
 
-        assert result == 0
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
+def _generation_command(tables: list[tuple[str, str]]) -> list[str]:
+    """Return the yaml_to_markdown.py command expected for the given tables."""
+    command = ["python3", YAML_TO_MD]
+    for ytype, table_format in tables:
+        command += ["--table", f"{ytype}:{table_format}"]
+    return command + ["--jobs", "0", "--quiet"]
 
-        assert CMD_COMPONENTS_ALL_FORMATS in subprocess_calls, "components --all-formats generation missing"
-        assert CMD_CONTROLS_XREF_COMPONENTS in subprocess_calls, "controls xref-components generation missing"
-        assert GIT_ADD_COMPONENTS_TABLES in subprocess_calls, "git add for components-*.md missing"
-        assert GIT_ADD_CONTROLS_XREF_COMPONENTS in subprocess_calls, (
-            "git add for controls-xref-components.md missing"
-        )
-        assert len(subprocess_calls) == 4, (
-            f"Expected exactly 4 subprocess calls for components.yaml, got {len(subprocess_calls)}"
-        )
-
-    def test_only_risks_yaml_staged_runs_three_generations(self):
-        """
-        Only risks.yaml staged triggers exactly 3 generations and 3 git-adds.
 
-        Given: pre-commit framework passes ["risk-map/yaml/risks.yaml"]
-        When: main() is called
-        Then: CMD_RISKS_ALL_FORMATS, CMD_CONTROLS_XREF_RISKS, and
-              CMD_PERSONAS_XREF_RISKS are run with their git-adds (6 total calls),
-              returns 0
-        """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+def _git_add_command(tables: list[tuple[str, str]]) -> list[str]:
+    """Return the git add command expected for the given tables."""
+    return ["git", "add"] + [f"risk-map/tables/{ytype}-{table_format}.md" for ytype, table_format in tables]
 
-            result = main([RISKS_YAML])
 
-        assert result == 0
+# ===========================================================================
+# Affected Tables — Which tables are generated for which staged files
+# ===========================================================================
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
 
-        assert CMD_RISKS_ALL_FORMATS in subprocess_calls, "risks --all-formats missing"
-        assert CMD_CONTROLS_XREF_RISKS in subprocess_calls, "controls xref-risks missing"
-        assert CMD_PERSONAS_XREF_RISKS in subprocess_calls, "personas xref-risks missing"
-        assert GIT_ADD_RISKS_TABLES in subprocess_calls
-        assert GIT_ADD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert GIT_ADD_PERSONAS_XREF_RISKS in subprocess_calls
-        assert len(subprocess_calls) == 6, (
-            f"Expected exactly 6 subprocess calls for risks.yaml, got {len(subprocess_calls)}"
-        )
+class TestAffectedTables:
+    """Tests verifying that each staged file selects the correct tables."""
 
-    def test_only_controls_yaml_staged_runs_two_generations(self):
+    def test_components_yaml_selects_prose_tables_and_controls_xref(self):
         """
-        Only controls.yaml staged triggers exactly 2 generations and 2 git-adds.
-
-        Given: pre-commit framework passes ["risk-map/yaml/controls.yaml"]
-        When: main() is called
-        Then: CMD_CONTROLS_ALL_FORMATS and CMD_PERSONAS_XREF_CONTROLS are run,
-              total subprocess calls == 4, returns 0
+        Given: Only components.yaml is staged
+        When: affected_tables() is called
+        Then: Every full/summary table and controls xref-components are selected
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        assert _selected([COMPONENTS_YAML]) == COMPONENTS_TABLES
 
-            result = main([CONTROLS_YAML])
-
-        assert result == 0
-
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-
-        assert CMD_CONTROLS_ALL_FORMATS in subprocess_calls, "controls --all-formats missing"
-        assert CMD_PERSONAS_XREF_CONTROLS in subprocess_calls, "personas xref-controls missing"
-        assert GIT_ADD_CONTROLS_TABLES in subprocess_calls
-        assert GIT_ADD_PERSONAS_XREF_CONTROLS in subprocess_calls
-        assert len(subprocess_calls) == 4, (
-            f"Expected exactly 4 subprocess calls for controls.yaml, got {len(subprocess_calls)}"
-        )
+    def test_risks_yaml_selects_prose_tables_and_both_xref_risks(self):
+        """
+        Given: Only risks.yaml is staged
+        When: affected_tables() is called
+        Then: Every full/summary table plus controls and personas xref-risks are selected
+        """
+        assert _selected([RISKS_YAML]) == RISKS_TABLES
 
-    def test_only_personas_yaml_staged_runs_one_generation(self):
+    def test_controls_yaml_selects_prose_tables_and_controls_xrefs(self):
         """
-        Only personas.yaml staged triggers exactly 1 generation and 1 git-add.
+        Given: Only controls.yaml is staged
+        When: affected_tables() is called
+        Then: Every full/summary table, both controls xrefs and personas xref-controls are selected
+        """
+        assert _selected([CONTROLS_YAML]) == CONTROLS_TABLES
 
-        Given: pre-commit framework passes ["risk-map/yaml/personas.yaml"]
-        When: main() is called
-        Then: CMD_PERSONAS_ALL_FORMATS is run, GIT_ADD_PERSONAS_TABLES is called,
-              total subprocess calls == 2, returns 0
+    def test_personas_yaml_selects_prose_tables_and_personas_xrefs(self):
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        Given: Only personas.yaml is staged
+        When: affected_tables() is called
+        Then: Every full/summary table and both personas xrefs are selected
+        """
+        assert _selected([PERSONAS_YAML]) == PERSONAS_TABLES
 
-            result = main([PERSONAS_YAML])
+    def test_all_four_yaml_select_every_table_once(self):
+        """
+        Given: All four source YAML files are staged
+        When: affected_tables() is called
+        Then: Each of the 12 committed tables is selected exactly once
+        """
+        tables = _selected([PERSONAS_YAML, CONTROLS_YAML, RISKS_YAML, COMPONENTS_YAML])
 
-        assert result == 0
+        assert tables == ALL_TABLES
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
+    def test_overlapping_triggers_keep_graph_order(self):
+        """
+        Given: risks.yaml and components.yaml, which both affect every full/summary table
+        When: affected_tables() is called
+        Then: Shared tables appear once and the result follows artifact-graph order, not argv order
+        """
+        tables = _selected([RISKS_YAML, COMPONENTS_YAML])
 
-        assert CMD_PERSONAS_ALL_FORMATS in subprocess_calls, "personas --all-formats missing"
-        assert GIT_ADD_PERSONAS_TABLES in subprocess_calls
-        assert len(subprocess_calls) == 2, (
-            f"Expected exactly 2 subprocess calls for personas.yaml, got {len(subprocess_calls)}"
+        assert tables == _tables(
+            ("controls", "xref-risks"), ("controls", "xref-components"), ("personas", "xref-risks")
         )
 
-    def test_all_four_yaml_staged_runs_eight_generations_in_order(self):
+    def test_mermaid_styles_selects_no_table(self):
+        """
+        Given: Only mermaid-styles.yaml (a graph input) is staged
+        When: affected_tables() is called
+        Then: No table is selected
         """
-        All four YAML files staged triggers all 8 generations and 8 git-adds (16 total).
+        assert _selected(["risk-map/yaml/mermaid-styles.yaml"]) == []
 
-        Given: pre-commit passes all four YAML filenames
-        When: main() is called
-        Then: All 8 generation commands and their 8 git-adds are called, with
-              components triggers first, then risks, then controls, then personas.
-              Total subprocess calls == 16, returns 0
+    def test_unrelated_file_selects_nothing(self):
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+        Given: A non-trigger file is staged
+        When: affected_tables() is called
+        Then: No table is selected
+        """
+        assert _selected(["README.md"]) == []
 
-            result = main([COMPONENTS_YAML, RISKS_YAML, CONTROLS_YAML, PERSONAS_YAML])
+    def test_empty_argv_selects_nothing(self):
+        """
+        Given: No staged files
+        When: affected_tables() is called
+        Then: No table is selected
+        """
+        assert _selected([]) == []
 
-        assert result == 0
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-
-        # All 8 generation commands present
-        assert CMD_COMPONENTS_ALL_FORMATS in subprocess_calls
-        assert CMD_CONTROLS_XREF_COMPONENTS in subprocess_calls
-        assert CMD_RISKS_ALL_FORMATS in subprocess_calls
-        assert CMD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert CMD_PERSONAS_XREF_RISKS in subprocess_calls
-        assert CMD_CONTROLS_ALL_FORMATS in subprocess_calls
-        assert CMD_PERSONAS_XREF_CONTROLS in subprocess_calls
-        assert CMD_PERSONAS_ALL_FORMATS in subprocess_calls
-
-        # All 8 git-adds present
-        assert GIT_ADD_COMPONENTS_TABLES in subprocess_calls
-        assert GIT_ADD_CONTROLS_XREF_COMPONENTS in subprocess_calls
-        assert GIT_ADD_RISKS_TABLES in subprocess_calls
-        assert GIT_ADD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert GIT_ADD_PERSONAS_XREF_RISKS in subprocess_calls
-        assert GIT_ADD_CONTROLS_TABLES in subprocess_calls
-        assert GIT_ADD_PERSONAS_XREF_CONTROLS in subprocess_calls
-        assert GIT_ADD_PERSONAS_TABLES in subprocess_calls
-
-        # Verify trigger groups execute in spec order: components → risks → controls → personas
-        def index_of(target):
-            return next(i for i, c in enumerate(subprocess_calls) if c == target)
-
-        assert index_of(CMD_COMPONENTS_ALL_FORMATS) < index_of(CMD_RISKS_ALL_FORMATS), (
-            "Components trigger group must run before risks trigger group"
-        )
-        assert index_of(CMD_RISKS_ALL_FORMATS) < index_of(CMD_CONTROLS_ALL_FORMATS), (
-            "Risks trigger group must run before controls trigger group"
-        )
-        assert index_of(CMD_CONTROLS_ALL_FORMATS) < index_of(CMD_PERSONAS_ALL_FORMATS), (
-            "Controls trigger group must run before personas trigger group"
-        )
+# ===========================================================================
+# Generation Command — One batched yaml_to_markdown.py invocation
+# ===========================================================================
 
-        assert len(subprocess_calls) == 16, (
-            f"Expected 16 subprocess calls for all 4 YAMLs, got {len(subprocess_calls)}"
-        )
 
-    def test_components_and_controls_staged_runs_both_controls_generations(self):
-        """
-        components.yaml + controls.yaml both staged triggers controls xref-components
-        AND controls --all-formats (no dedup — parity with bash hook).
+class TestGenerationCommand:
+    """Tests for the single yaml_to_markdown.py invocation."""
 
-        Given: pre-commit passes components.yaml and controls.yaml
+    def test_single_generation_renders_every_affected_table(self):
+        """
+        Given: components.yaml staged; all commands succeed
         When: main() is called
-        Then: Both CMD_CONTROLS_XREF_COMPONENTS (from components trigger) AND
-              CMD_CONTROLS_ALL_FORMATS (from controls trigger) are run; returns 0
+        Then: One generation command lists every affected table, followed by one git add
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
-            result = main([COMPONENTS_YAML, CONTROLS_YAML])
+            result = main([COMPONENTS_YAML])
 
         assert result == 0
+        assert [c.args[0] for c in mock_run.call_args_list] == [
+            _generation_command(COMPONENTS_TABLES),
+            _git_add_command(COMPONENTS_TABLES),
+        ]
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-
-        assert CMD_CONTROLS_XREF_COMPONENTS in subprocess_calls, (
-            "controls xref-components (from components trigger) must still run"
-        )
-        assert CMD_CONTROLS_ALL_FORMATS in subprocess_calls, (
-            "controls --all-formats (from controls trigger) must also run"
-        )
-        assert len(subprocess_calls) == 8, (
-            f"Expected 8 subprocess calls for components+controls, got {len(subprocess_calls)}"
-        )
-
-    def test_risks_and_personas_staged_runs_three_risks_plus_one_personas_generation(self):
+    def test_all_triggers_share_one_generation(self):
         """
-        risks.yaml + personas.yaml staged triggers all 3 risks generations
-        plus 1 personas generation.
-
-        Given: pre-commit passes risks.yaml and personas.yaml
+        Given: All four YAML files staged
         When: main() is called
-        Then: CMD_RISKS_ALL_FORMATS, CMD_CONTROLS_XREF_RISKS, CMD_PERSONAS_XREF_RISKS,
-              and CMD_PERSONAS_ALL_FORMATS are all run; returns 0
+        Then: Exactly one yaml_to_markdown.py invocation renders all 12 tables
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-
-            result = main([RISKS_YAML, PERSONAS_YAML])
+            mock_run.side_effect = _fake_run()
 
-        assert result == 0
+            main([COMPONENTS_YAML, RISKS_YAML, CONTROLS_YAML, PERSONAS_YAML])
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
+        generations = [c.args[0] for c in mock_run.call_args_list if YAML_TO_MD in c.args[0]]
+        assert len(generations) == 1
+        assert generations[0].count("--table") == 12
 
-        assert CMD_RISKS_ALL_FORMATS in subprocess_calls
-        assert CMD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert CMD_PERSONAS_XREF_RISKS in subprocess_calls
-        assert CMD_PERSONAS_ALL_FORMATS in subprocess_calls
-        assert len(subprocess_calls) == 8, (
-            f"Expected 8 subprocess calls for risks+personas, got {len(subprocess_calls)}"
-        )
-
-    def test_unrelated_file_in_argv_triggers_no_generation(self):
+    def test_generation_uses_process_pool(self):
         """
-        An unrelated file passed by pre-commit triggers no generation.
-
-        Given: argv contains "README.md" (not a recognised YAML trigger)
+        Given: risks.yaml staged
         When: main() is called
-        Then: subprocess.run is never called, main() returns 0
+        Then: The generator is asked for one worker per CPU and quiet output
         """
         with patch("subprocess.run") as mock_run:
-            result = main(["README.md"])
+            mock_run.side_effect = _fake_run()
 
-        assert result == 0
-        mock_run.assert_not_called()
+            main([RISKS_YAML])
 
-    def test_empty_argv_triggers_no_generation(self):
-        """
-        Empty argv triggers no generation and exits 0.
+        command = mock_run.call_args_list[0].args[0]
+        assert command[-3:] == ["--jobs", "0", "--quiet"]
 
-        Given: main() is called with an empty list
-        When: main([]) is called
-        Then: subprocess.run is never called, main() returns 0
+    def test_all_commands_use_list_form_not_shell_strings(self):
+        """
+        Given: All four YAML files staged; all commands succeed
+        When: main() is called
+        Then: Every subprocess.run call receives a list as its first argument
         """
         with patch("subprocess.run") as mock_run:
-            result = main([])
+            mock_run.side_effect = _fake_run()
+            main([COMPONENTS_YAML, RISKS_YAML, CONTROLS_YAML, PERSONAS_YAML])
 
-        assert result == 0
-        mock_run.assert_not_called()
+        for c in mock_run.call_args_list:
+            cmd = c.args[0]
+            assert isinstance(cmd, list), f"subprocess.run must be called with a list, got {type(cmd)}: {cmd!r}"
 
 
 # ===========================================================================
-# Git-Add Alignment — Each successful generation stages exactly its target
+# Git-Add Alignment — Exact output files are staged
 # ===========================================================================
 
 
 class TestGitAddAlignment:
-    """Tests that git add is called with the correct pathspec after each generation."""
+    """Tests that git add stages exactly the regenerated tables."""
 
-    def test_components_generation_git_add_uses_glob_pattern(self):
+    def test_git_add_uses_exact_filenames_not_globs(self):
         """
-        After components --all-formats succeeds, git add uses the glob pattern.
-
-        Given: components.yaml staged; all commands succeed
+        Given: personas.yaml staged
         When: main() is called
-        Then: git add is called with "risk-map/tables/components-*.md"
+        Then: git add lists each regenerated personas table by name
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-            main([COMPONENTS_YAML])
+            mock_run.side_effect = _fake_run()
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_COMPONENTS_TABLES in subprocess_calls
+            main([PERSONAS_YAML])
+
+        git_add = mock_run.call_args_list[-1].args[0]
+        assert git_add == _git_add_command(PERSONAS_TABLES)
+        assert not any("*" in arg for arg in git_add)
 
-    def test_xref_generation_git_add_uses_exact_filename_not_glob(self):
+    def test_unchanged_tables_run_no_git(self):
+        """
+        Given: personas.yaml staged; every personas table already holds the generated content
+        When: main() is called
+        Then: Only the generation runs and main() returns 0
         """
-        After each xref generation, git add is called with the exact filename.
+        for ytype, table_format in PERSONAS_TABLES:
+            output = Path(f"risk-map/tables/{ytype}-{table_format}.md")
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text("table")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _fake_run(content="table")
 
-        Given: risks.yaml staged; all commands succeed
+            result = main([PERSONAS_YAML])
+
+        assert result == 0
+        assert [c.args[0] for c in mock_run.call_args_list] == [_generation_command(PERSONAS_TABLES)]
+
+    def test_only_changed_tables_are_staged(self):
+        """
+        Given: risks.yaml staged; the full/summary tables are already current, the xref tables are not
         When: main() is called
-        Then: git add for controls-xref-risks.md uses the exact filename (not a glob),
-              and git add for personas-xref-risks.md also uses an exact filename
+        Then: git add lists only the two xref tables
         """
+        for ytype, table_format in PROSE_TABLES:
+            output = Path(f"risk-map/tables/{ytype}-{table_format}.md")
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text("table")
+
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run(content="table")
+
             main([RISKS_YAML])
 
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert GIT_ADD_PERSONAS_XREF_RISKS in subprocess_calls
-        # Exact filenames — no wildcards
-        assert "controls-xref-risks.md" in GIT_ADD_CONTROLS_XREF_RISKS[-1]
-        assert "*" not in GIT_ADD_CONTROLS_XREF_RISKS[-1]
-        assert "*" not in GIT_ADD_PERSONAS_XREF_RISKS[-1]
+        assert mock_run.call_args_list[-1].args[0] == _git_add_command(
+            [("controls", "xref-risks"), ("personas", "xref-risks")]
+        )
 
-    def test_git_add_not_called_when_generation_fails(self):
+    def test_git_add_follows_generation(self):
         """
-        git add is NOT called when its preceding generation fails.
-
-        Given: personas.yaml staged; CMD_PERSONAS_ALL_FORMATS returns rc=1
+        Given: controls.yaml staged
         When: main() is called
-        Then: GIT_ADD_PERSONAS_TABLES is never called
+        Then: The generation runs first and the git add second
         """
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _fake_run()
 
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_PERSONAS_ALL_FORMATS:
-                mock.returncode = 1
-            return mock
+            main([CONTROLS_YAML])
 
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
-            main([PERSONAS_YAML])
-
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_PERSONAS_TABLES not in subprocess_calls, "git add must not be called when generation fails"
+        calls = [c.args[0] for c in mock_run.call_args_list]
+        assert calls[0][:2] == ["python3", YAML_TO_MD]
+        assert calls[1][:2] == ["git", "add"]
 
     def test_git_add_not_called_for_unrelated_file(self):
         """
-        No git add is called when only an unrelated file is passed.
-
-        Given: argv contains only "risk-map/yaml/something-else.yaml"
+        Given: Only an unrelated file is staged
         When: main() is called
-        Then: subprocess.run is never called
+        Then: subprocess.run is never called and main() returns 0
         """
         with patch("subprocess.run") as mock_run:
-            main(["risk-map/yaml/something-else.yaml"])
+            result = main(["scripts/hooks/some_script.py"])
 
+        assert result == 0
         mock_run.assert_not_called()
 
 
 # ===========================================================================
-# Failure Modes — Subprocess failures and exit-code propagation
+# Failure Modes — Exit codes and staging on failure
 # ===========================================================================
 
 
 class TestFailureModes:
-    """Tests verifying correct failure propagation and continue-on-error behaviour."""
+    """Tests for exit codes when generation or git add fails."""
 
-    def test_first_generation_failure_continues_to_subsequent_generations(self):
+    def test_generation_failure_skips_git_add(self):
         """
-        If the first generation fails, the wrapper still attempts the remaining ones.
-
-        Given: components.yaml staged; CMD_COMPONENTS_ALL_FORMATS fails (rc=1),
-               CMD_CONTROLS_XREF_COMPONENTS succeeds
+        Given: yaml_to_markdown.py exits 2
         When: main() is called
-        Then: Both generation commands are attempted, main() returns non-zero
+        Then: git add is not called and main() returns 2
         """
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _fake_run(generation_returncode=2)
 
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_COMPONENTS_ALL_FORMATS:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
-            result = main([COMPONENTS_YAML])
+            result = main([RISKS_YAML])
 
-        assert result != 0, "Should return non-zero when any generation fails"
-
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert CMD_CONTROLS_XREF_COMPONENTS in subprocess_calls, (
-            "Second generation must still be attempted after first failure"
-        )
+        assert result == 2
+        assert mock_run.call_count == 1
 
     def test_generation_succeeds_but_git_add_fails_returns_nonzero(self):
         """
-        If generation succeeds but git add fails, exit code is non-zero.
-
-        Given: personas.yaml staged; CMD_PERSONAS_ALL_FORMATS exits 0 but git add exits 1
-        When: main() is called
-        Then: main() returns non-zero
-        """
-
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd[0] == "git":
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect):
-            result = main([PERSONAS_YAML])
-
-        assert result != 0
-
-    def test_all_generations_succeed_returns_zero(self):
-        """
-        All generations and git adds succeed → exit code 0.
-
-        Given: components.yaml staged; all subprocess calls return 0
+        Given: Generation succeeds but git add exits 128
         When: main() is called
-        Then: main() returns 0
+        Then: main() returns git's exit code
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run(git_returncode=128)
 
             result = main([COMPONENTS_YAML])
 
-        assert result == 0
+        assert result == 128
 
-    def test_all_generations_fail_git_add_never_called(self):
+    def test_all_succeed_returns_zero(self):
         """
-        When all generation commands fail, git add is never called.
-
-        Given: risks.yaml staged; all three generation commands return rc=1
+        Given: All four YAML files staged; generation and git add succeed
         When: main() is called
-        Then: No git add call is made, main() returns non-zero
+        Then: main() returns 0 after exactly two subprocess calls
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(1)
-
-            result = main([RISKS_YAML])
-
-        assert result != 0
-        git_add_calls = [c for c in mock_run.call_args_list if c.args[0][0] == "git"]
-        assert len(git_add_calls) == 0, "git add must not be called when generation fails"
-
-    def test_failure_in_components_trigger_does_not_skip_subsequent_triggers(self):
-        """
-        Given: components.yaml + risks.yaml + controls.yaml + personas.yaml all staged;
-               components-trigger first generation (CMD_COMPONENTS_ALL_FORMATS) fails (rc=1)
-        When: main() is called
-        Then: all subsequent triggers (risks, controls, personas) still execute their
-              generations; final exit code is non-zero.
-        """
+            mock_run.side_effect = _fake_run()
 
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_COMPONENTS_ALL_FORMATS:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
             result = main([COMPONENTS_YAML, RISKS_YAML, CONTROLS_YAML, PERSONAS_YAML])
 
-        assert result != 0
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        # All 8 generations must still be attempted
-        assert CMD_COMPONENTS_ALL_FORMATS in subprocess_calls
-        assert CMD_CONTROLS_XREF_COMPONENTS in subprocess_calls
-        assert CMD_RISKS_ALL_FORMATS in subprocess_calls
-        assert CMD_CONTROLS_XREF_RISKS in subprocess_calls
-        assert CMD_PERSONAS_XREF_RISKS in subprocess_calls
-        assert CMD_CONTROLS_ALL_FORMATS in subprocess_calls
-        assert CMD_PERSONAS_XREF_CONTROLS in subprocess_calls
-        assert CMD_PERSONAS_ALL_FORMATS in subprocess_calls
-
-    def test_mixed_failure_git_add_called_only_for_successes(self):
-        """
-        When some generations fail and others succeed, git add is called only
-        for the successful ones.
-
-        Given: risks.yaml staged; CMD_RISKS_ALL_FORMATS succeeds (rc=0),
-               CMD_CONTROLS_XREF_RISKS fails (rc=1), CMD_PERSONAS_XREF_RISKS succeeds (rc=0)
-        When: main() is called
-        Then: git add called for risks and personas-xref-risks, NOT for controls-xref-risks;
-              main() returns non-zero
-        """
-
-        def side_effect(cmd, **kwargs):
-            mock = _make_subprocess_mock(0)
-            if cmd == CMD_CONTROLS_XREF_RISKS:
-                mock.returncode = 1
-            return mock
-
-        with patch("subprocess.run", side_effect=side_effect) as mock_run:
-            result = main([RISKS_YAML])
-
-        assert result != 0
-
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert GIT_ADD_RISKS_TABLES in subprocess_calls, "git add must be called for succeeded risks generation"
-        assert GIT_ADD_PERSONAS_XREF_RISKS in subprocess_calls, (
-            "git add must be called for succeeded personas-xref-risks generation"
-        )
-        assert GIT_ADD_CONTROLS_XREF_RISKS not in subprocess_calls, (
-            "git add must not be called for failed controls-xref-risks generation"
-        )
+        assert result == 0
+        assert mock_run.call_count == 2
 
 
 # ===========================================================================
@@ -649,73 +463,33 @@ class TestEdgeCases:
 
     def test_absolute_path_to_trigger_yaml_triggers_correctly(self):
         """
-        pre-commit may pass absolute paths. The wrapper must use endswith() matching.
-
         Given: argv contains "/workspace/repo/risk-map/yaml/components.yaml"
         When: main() is called
-        Then: components.yaml triggers fire correctly, returns 0
+        Then: The components-triggered tables are generated via suffix matching
         """
-        abs_path = "/workspace/repo/risk-map/yaml/components.yaml"
-
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
-            result = main([abs_path])
+            result = main(["/workspace/repo/risk-map/yaml/components.yaml"])
 
         assert result == 0
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert CMD_COMPONENTS_ALL_FORMATS in subprocess_calls, (
-            "Absolute path to components.yaml must trigger generation"
-        )
+        assert mock_run.call_args_list[0].args[0] == _generation_command(COMPONENTS_TABLES)
 
     def test_duplicate_argv_entries_do_not_cause_double_generation(self):
         """
-        Duplicate entries in argv must not cause any generation to run more than once.
-
         Given: argv contains components.yaml twice
         When: main() is called
-        Then: Each generation command is invoked exactly once, returns 0
-        """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-
-            result = main([COMPONENTS_YAML, COMPONENTS_YAML])
-
-        assert result == 0
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        # NOTE: This dedup is for duplicate argv values (same file passed twice by
-        # pre-commit). It is distinct from the inter-trigger no-dedup rule: when
-        # *different* trigger YAMLs both produce the same generation command (e.g.,
-        # components + controls both producing controls output), those MUST both run.
-        # See test_components_and_controls_staged_runs_both_controls_generations.
-        assert subprocess_calls.count(CMD_COMPONENTS_ALL_FORMATS) == 1, (
-            "components --all-formats must not run twice for duplicate argv"
-        )
-        assert subprocess_calls.count(CMD_CONTROLS_XREF_COMPONENTS) == 1, (
-            "controls xref-components must not run twice for duplicate argv"
-        )
-
-    def test_path_with_prefix_triggers_correctly(self):
-        """
-        Paths with a leading "./" prefix must still trigger via endswith().
-
-        Given: argv contains "./risk-map/yaml/risks.yaml"
-        When: main() is called
-        Then: All 3 risks.yaml generations are triggered, returns 0
+        Then: Each table is requested exactly once
         """
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
+            mock_run.side_effect = _fake_run()
 
-            result = main(["./risk-map/yaml/risks.yaml"])
+            main([COMPONENTS_YAML, COMPONENTS_YAML])
 
-        assert result == 0
-        subprocess_calls = [c.args[0] for c in mock_run.call_args_list]
-        assert CMD_RISKS_ALL_FORMATS in subprocess_calls, "risks.yaml with ./ prefix must trigger generation"
+        assert mock_run.call_args_list[0].args[0] == _generation_command(COMPONENTS_TABLES)
 
     def test_non_trigger_yaml_in_directory_does_not_generate(self):
         """
-        A YAML file in the same directory but not in the trigger set generates nothing.
-
         Given: argv contains "risk-map/yaml/something-else.yaml"
         When: main() is called
         Then: subprocess.run is never called, main() returns 0
@@ -725,86 +499,3 @@ class TestEdgeCases:
 
         assert result == 0
         mock_run.assert_not_called()
-
-
-# ===========================================================================
-# Subprocess Call Shape and Ordering
-# ===========================================================================
-
-
-class TestSubprocessCallShape:
-    """Tests that subprocess calls use the correct form and ordering."""
-
-    def test_all_commands_use_list_form_not_shell_strings(self):
-        """
-        All subprocess.run calls must use list form (never shell=True with strings).
-
-        Given: all four YAML files staged; all commands succeed
-        When: main() is called
-        Then: Every subprocess.run call receives a list as its first argument
-        """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-            main([COMPONENTS_YAML, RISKS_YAML, CONTROLS_YAML, PERSONAS_YAML])
-
-        for c in mock_run.call_args_list:
-            cmd = c.args[0]
-            assert isinstance(cmd, list), f"subprocess.run must be called with a list, got {type(cmd)}: {cmd!r}"
-
-    def test_generation_precedes_git_add_for_each_rule(self):
-        """
-        For each rule, the generation command must appear before its git add.
-
-        Given: components.yaml staged; all commands succeed
-        When: main() is called
-        Then: CMD_COMPONENTS_ALL_FORMATS precedes GIT_ADD_COMPONENTS_TABLES,
-              CMD_CONTROLS_XREF_COMPONENTS precedes GIT_ADD_CONTROLS_XREF_COMPONENTS
-        """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = _make_subprocess_mock(0)
-            main([COMPONENTS_YAML])
-
-        calls = [c.args[0] for c in mock_run.call_args_list]
-
-        def index_of(cmd):
-            try:
-                return calls.index(cmd)
-            except ValueError:
-                pytest.fail(f"Expected call {cmd!r} was not made")
-
-        assert index_of(CMD_COMPONENTS_ALL_FORMATS) < index_of(GIT_ADD_COMPONENTS_TABLES), (
-            "components generation must happen before its git add"
-        )
-        assert index_of(CMD_CONTROLS_XREF_COMPONENTS) < index_of(GIT_ADD_CONTROLS_XREF_COMPONENTS), (
-            "controls xref-components generation must happen before its git add"
-        )
-
-
-# ===========================================================================
-# Test Summary
-# ===========================================================================
-"""
-Test Summary
-============
-Total Tests: 25
-- Trigger combinatorics:    9  (TestTriggerCombinatorics)
-- Git-add alignment:        4  (TestGitAddAlignment)
-- Failure modes:            6  (TestFailureModes)
-- Edge cases:               4  (TestEdgeCases)
-- Subprocess call shape:    2  (TestSubprocessCallShape)
-
-Coverage Areas:
-- components.yaml trigger (components --all-formats + controls xref-components)
-- risks.yaml trigger (risks --all-formats + controls xref-risks + personas xref-risks)
-- controls.yaml trigger (controls --all-formats + personas xref-controls)
-- personas.yaml trigger (personas --all-formats)
-- No dedup across triggers: components + controls both staged → both controls
-  generations run (xref-components AND --all-formats)
-- Continue-on-error: all generations attempted despite earlier failures
-- git add not called when generation fails
-- Exit code 0 iff all attempted generations and git adds succeed
-- Subprocess list-form safety (no shell=True string interpolation)
-- Call ordering: generation precedes git add for each rule
-- Defensive behaviour: empty argv, unrelated files, duplicate argv,
-  absolute paths, ./-prefixed paths
-"""
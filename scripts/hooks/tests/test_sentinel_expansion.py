@@ -13,6 +13,9 @@ Public API under test:
   expand_sentinels_to_text(text, *, intra_lookup, ref_lookup, field_path,
                             link_format=lambda title, url: f"[{title}]({url})")
   expand_sentinels_to_items(text, *, intra_lookup, ref_lookup, field_path)
+  parse_prose(text) -> tuple[str | Sentinel, ...]   (cached per distinct text)
+  build_intra_lookup(entities_by_type)
+  find_unresolved_sentinels(entities_by_type, intra_lookup) / check_sentinels(...)
 
 Wire-format sentinel examples used in fixtures (real tokenizer forms):
   {{riskPromptInjection}}                    intra; id = "riskPromptInjection"
@@ -50,9 +53,15 @@ sys.path.insert(0, str(REPO_ROOT))
 _IMPORT_ERROR: ImportError | None = None
 try:
     from scripts.hooks._sentinel_expansion import (  # noqa: E402
+        Sentinel,
         UnresolvedSentinelError,
+        UnresolvedSentinelsError,
+        build_intra_lookup,
+        check_sentinels,
         expand_sentinels_to_items,
         expand_sentinels_to_text,
+        find_unresolved_sentinels,
+        parse_prose,
     )
 except ImportError as _e:
     _IMPORT_ERROR = _e
@@ -857,13 +866,136 @@ class TestPartitionInvariant:
         assert result == ["Hello, world."]
 
 
+# ============================================================================
+# TestParseProse
+# ============================================================================
+
+
+class TestParseProse:
+    """Tests for parse_prose, the cached segment list both expanders format from."""
+
+    def test_segments_and_cache(self):
+        """
+        Test that prose is split into merged text runs and sentinels, once per distinct string.
+
+        Given: Text with bold markup, an intra sentinel and a ref sentinel
+        When: parse_prose is called twice with equal strings
+        Then: Adjacent text tokens are merged, sentinels carry their key and kind,
+              and the second call returns the cached tuple
+        """
+        _require_module()
+        text = "A **bold** {{riskPromptInjection}} and {{ref:cwe-89}}."
+
+        segments = parse_prose(text)
+
+        assert segments == (
+            "A **bold** ",
+            Sentinel("{{riskPromptInjection}}", "riskPromptInjection", False),
+            " and ",
+            Sentinel("{{ref:cwe-89}}", "cwe-89", True),
+            ".",
+        )
+        assert parse_prose("".join(["A **bold** ", "{{riskPromptInjection}} and {{ref:cwe-89}}."])) is segments
+
+
+# ============================================================================
+# TestCorpusPass
+# ============================================================================
+
+
+class TestCorpusPass:
+    """Tests for the one-time corpus pass that reports every unresolved sentinel."""
+
+    def test_build_intra_lookup_skips_incomplete_entities(self):
+        """
+        Test that the corpus-wide lookup maps every titled entity id and tolerates gaps.
+
+        Given: Entity lists for two types, one entry without a title, and a missing type
+        When: build_intra_lookup is called
+        Then: Only entities with both id and title are mapped
+        """
+        _require_module()
+        lookup = build_intra_lookup(
+            {
+                "risks": [{"id": "riskA", "title": "Risk A"}, {"id": "riskNoTitle"}],
+                "controls": [{"id": "controlB", "title": "Control B"}],
+                "personas": None,
+            }
+        )
+        assert lookup == {"riskA": "Risk A", "controlB": "Control B"}
+
+    def test_every_failure_is_collected_with_its_field_path(self):
+        """
+        Test that the pass keeps going after the first unresolved sentinel.
+
+        Given: Two risks with three unresolved sentinels across scalar, list and nested-list fields,
+               and a ref that only resolves on the entry declaring it
+        When: find_unresolved_sentinels is called
+        Then: All three failures are returned in corpus order with precise field paths
+        """
+        _require_module()
+        risks = [
+            {
+                "id": "riskA",
+                "description": "Uses {{riskTypo}}.",
+                "longDescription": ["Fine: {{ref:cwe-89}}", ["nested {{controlTypo}}"]],
+                "externalReferences": [{"id": "cwe-89", "title": "CWE-89", "url": "https://example.com/89"}],
+            },
+            {"id": "riskB", "examples": ["ok {{riskPromptInjection}}", "borrowed {{ref:cwe-89}}"]},
+        ]
+
+        errors = find_unresolved_sentinels({"risks": risks}, INTRA_LOOKUP)
+
+        assert [(error.field_path, error.sentinel) for error in errors] == [
+            ("risks[0].description", "{{riskTypo}}"),
+            ("risks[0].longDescription[1][0]", "{{controlTypo}}"),
+            ("risks[1].examples[1]", "{{ref:cwe-89}}"),
+        ]
+
+    def test_check_sentinels_raises_one_aggregate_error(self):
+        """
+        Test that check_sentinels reports all failures in a single exception.
+
+        Given: A persona with unresolved sentinels in description and identificationQuestions
+        When: check_sentinels is called
+        Then: UnresolvedSentinelsError (an UnresolvedSentinelError) lists both, and its
+              .sentinel/.field_path are those of the first failure
+        """
+        _require_module()
+        persona = {
+            "id": "personaX",
+            "description": ["About {{riskTypo}}."],
+            "identificationQuestions": ["Do you use {{componentTypo}}?"],
+        }
+
+        with pytest.raises(UnresolvedSentinelError) as exc_info:
+            check_sentinels({"personas": [persona]}, INTRA_LOOKUP)
+
+        exc = exc_info.value
+        assert isinstance(exc, UnresolvedSentinelsError)
+        assert len(exc.errors) == 2
+        assert (exc.sentinel, exc.field_path) == ("{{riskTypo}}", "personas[0].description[0]")
+        assert "personas[0].identificationQuestions[0]: {{componentTypo}}" in str(exc)
+
+    def test_check_sentinels_passes_clean_corpus(self):
+        """
+        Test that a corpus whose sentinels all resolve passes silently.
+
+        Given: A control referencing a known risk
+        When: check_sentinels is called
+        Then: No exception is raised
+        """
+        _require_module()
+        check_sentinels({"controls": [{"id": "controlA", "description": "{{riskPromptInjection}}"}]}, INTRA_LOOKUP)
+
+
 # ============================================================================
 # Test summary
 # ============================================================================
 """
 Test Summary
 ============
-Total tests: ~40 (across 4 test classes)
+Total tests: ~45 (across 6 test classes)
 - TestExpandSentinelsToText (11):       plain passthrough, intra/ref substitution,
                                          custom link_format, multiple sentinels,
                                          whitespace preservation (critical regression),
@@ -879,6 +1011,9 @@ Total tests: ~40 (across 4 test classes)
 - TestPartitionInvariant (5):            _to_text reconstructs modulo substitution,
                                          _to_items reconstruction, no empty strings,
                                          whitespace-only passthrough, text-only unchanged
+- TestParseProse (1):                    merged text runs, sentinel kinds, per-text cache
+- TestCorpusPass (4):                    intra lookup, every failure collected with field paths,
+                                         one aggregate error, clean corpus passes
 
 Coverage target: 90%+ on scripts/hooks/_sentinel_expansion.py
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/hooks/_table_ir.py
+
+Test Coverage:
+==============
+1. Emitters: Markdown identical to the pipe-table writer, CSV quoting, JSON Lines records
+2. emit_table(): one pass over the rows feeds every format; only changed paths are returned
+3. Failure: a row source that raises leaves every output untouched
+4. Paths: Markdown keeps the given path, other formats swap the suffix
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.hooks._markdown_table import render_pipe_table  # noqa: E402
+from scripts.hooks._table_ir import Table, emit_table, emitter_paths, markdown_lines  # noqa: E402
+
+COLUMNS = ("ID", "Title", "Description")
+ROWS = [
+    ("riskA", "Risk A", "First line<br><br>Second, with a comma"),
+    ("riskB", 'Ünïcode "quoted"', None),
+]
+
+
+def _outputs(tmp_path: Path, formats=("md", "csv", "jsonl")) -> dict[str, Path]:
+    return emitter_paths(tmp_path / "risks-full.md", formats)
+
+
+class TestEmitters:
+    """Each format written from the same Table."""
+
+    def test_markdown_matches_pipe_table_and_sections(self, tmp_path):
+        """
+        Given: A table with a trailing References section
+        When: It is emitted as Markdown
+        Then: The file is the pipe table followed by the section, as markdown_lines() yields it
+        """
+        sections = ["", "## References for riskA", "", "1. ref"]
+
+        emit_table(Table(COLUMNS, iter(ROWS), iter(sections)), _outputs(tmp_path, ("md",)))
+
+        expected = "\n".join([render_pipe_table(COLUMNS, ROWS), *sections])
+        assert (tmp_path / "risks-full.md").read_text() == expected
+        assert "\n".join(markdown_lines(Table(COLUMNS, ROWS, sections))) == expected
+
+    def test_csv_round_trips_cells(self, tmp_path):
+        """
+        Given: Cells with commas, quotes, non-ASCII text and None
+        When: The table is emitted as CSV
+        Then: csv.reader reads back the header and every cell, None as an empty field
+        """
+        emit_table(Table(COLUMNS, ROWS, ["## prose"]), _outputs(tmp_path, ("csv",)))
+
+        with (tmp_path / "risks-full.csv").open(newline="", encoding="utf-8") as handle:
+            records = list(csv.reader(handle))
+        assert records == [list(COLUMNS), list(ROWS[0]), ["riskB", ROWS[1][1], ""]]
+
+    def test_jsonl_records_are_keyed_by_column(self, tmp_path):
+        """
+        Given: The same table
+        When: It is emitted as JSON Lines
+        Then: Each line is one object keyed by column name, None as null, and sections are omitted
+        """
+        emit_table(Table(COLUMNS, ROWS, ["## prose"]), _outputs(tmp_path, ("jsonl",)))
+
+        lines = (tmp_path / "risks-full.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [dict(zip(COLUMNS, row)) for row in ROWS]
+
+
+class TestEmitTable:
+    """Single-pass, change-detecting writes of several formats."""
+
+    def test_rows_are_consumed_once_for_all_formats(self, tmp_path):
+        """
+        Given: A row generator that counts how often it is started
+        When: The table is emitted in three formats
+        Then: The generator runs once and all three paths are reported as changed
+        """
+        starts = []
+
+        def rows():
+            starts.append(1)
+            yield from ROWS
+
+        changed = emit_table(Table(COLUMNS, rows()), _outputs(tmp_path))
+
+        assert starts == [1]
+        assert changed == list(_outputs(tmp_path).values())
+
+    def test_unchanged_formats_are_not_reported(self, tmp_path):
+        """
+        Given: All three files already generated
+        When: The table is emitted again unchanged, then with a row removed
+        Then: The unchanged emit reports no path; the changed one reports all three
+        """
+        emit_table(Table(COLUMNS, ROWS), _outputs(tmp_path))
+
+        assert emit_table(Table(COLUMNS, ROWS), _outputs(tmp_path)) == []
+        assert len(emit_table(Table(COLUMNS, ROWS[:1]), _outputs(tmp_path))) == 3
+
+    def test_failing_rows_touch_no_output(self, tmp_path):
+        """
+        Given: Existing outputs and a row source that raises part-way through
+        When: The table is emitted
+        Then: The error propagates, every file keeps its content and no temp file is left behind
+        """
+        emit_table(Table(COLUMNS, ROWS), _outputs(tmp_path))
+        before = {path: path.read_bytes() for path in tmp_path.iterdir()}
+
+        def rows():
+            yield ROWS[0]
+            raise ValueError("unresolved sentinel")
+
+        with pytest.raises(ValueError, match="unresolved sentinel"):
+            emit_table(Table(COLUMNS, rows()), _outputs(tmp_path))
+
+        assert {path: path.read_bytes() for path in tmp_path.iterdir()} == before
+
+
+class TestEmitterPaths:
+    """Output path for each format."""
+
+    def test_suffixes(self, tmp_path):
+        """
+        Given: A Markdown output path
+        When: Paths are derived for md, csv and jsonl
+        Then: Markdown keeps the path and the others replace its suffix
+        """
+        assert emitter_paths(tmp_path / "a" / "risks-full.md", ["jsonl", "md", "csv"]) == {
+            "jsonl": tmp_path / "a" / "risks-full.jsonl",
+            "md": tmp_path / "a" / "risks-full.md",
+            "csv": tmp_path / "a" / "risks-full.csv",
+        }
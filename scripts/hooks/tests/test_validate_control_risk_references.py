@@ -10,7 +10,7 @@ system used as a git pre-commit hook. The validator ensures that:
 
 Test Coverage:
 ==============
-Total Tests: 68 across 13 test classes
+Total Tests: 71 across 14 test classes
 Coverage Target: 95%+ of validate_control_risk_references.py
 
 ORIGINAL TEST CLASSES (48 tests):
@@ -105,6 +105,11 @@ NEW TEST CLASSES FOR UNIVERSAL CONTROLS FIX (20 tests):
     - Test 18: All special keyword combinations tested
     - Test 19: End-to-end with 7 universal controls (no violations)
     - Test 20: End-to-end catches universal violations
+
+14. TestCompareControlMapsScaling - Set-algebra diff ordering and scale - 3 tests
+    - Diagnostics follow controls.yaml order, then risks.yaml order
+    - Reordered but equal risk lists produce no errors
+    - 100x synthetic corpus built from the live YAML reports exactly the injected defects (slow)
 """
 
 import subprocess
@@ -1734,3 +1739,78 @@ class TestMain:
         assert "Force checking control-to-risk references" in captured.out
 
         assert exc_info.value.code == 0
+
+
+class TestCompareControlMapsScaling:
+    """Tests for the set-algebra implementation of compare_control_maps()."""
+
+    def test_errors_follow_file_order(self):
+        """
+        Test that diagnostics are deterministic and follow source file order.
+
+        Given: Mismatched controls in a known controls.yaml order and a risks-only control
+        When: compare_control_maps() is called
+        Then: Errors appear in controls.yaml order, then the risks-only control last
+        """
+        controls = {"CTL-B": ["RSK-1"], "CTL-A": ["RSK-2"]}
+        risks = {"CTL-Z": ["RSK-9"], "CTL-A": ["RSK-3"], "CTL-B": ["RSK-4"]}
+
+        errors = compare_control_maps(controls, risks)
+
+        controls_mentioned = [next(c for c in ("CTL-A", "CTL-B", "CTL-Z") if f"'{c}'" in e) for e in errors]
+        assert controls_mentioned == ["CTL-B", "CTL-B", "CTL-A", "CTL-A", "CTL-Z"]
+
+    def test_reordered_equal_lists_produce_no_errors(self):
+        """
+        Test that list order and duplicates do not create false mismatches.
+
+        Given: The same risk set listed in different orders, with a duplicate
+        When: compare_control_maps() is called
+        Then: Returns empty error list
+        """
+        controls = {"CTL-001": ["RSK-002", "RSK-001"]}
+        risks = {"CTL-001": ["RSK-001", "RSK-002", "RSK-001"]}
+
+        assert compare_control_maps(controls, risks) == []
+
+    @pytest.mark.slow
+    def test_synthetic_100x_corpus_reports_only_injected_defects(self, controls_yaml_path, risks_yaml_path):
+        """
+        Test the diff on a 100x synthetic corpus derived from the live YAML.
+
+        Given: controls.yaml and risks.yaml replicated 100 times with suffixed IDs,
+               with one risk→control back-reference dropped in 50 replicas
+        When: compare_control_maps() is called
+        Then: Exactly one "claims to address" error is reported per injected defect
+        """
+        with open(controls_yaml_path, encoding="utf-8") as f:
+            controls_yaml = yaml.safe_load(f)
+        with open(risks_yaml_path, encoding="utf-8") as f:
+            risks_yaml = yaml.safe_load(f)
+
+        baseline = compare_control_maps(extract_controls_data(controls_yaml), extract_risks_data(risks_yaml))
+        target_risk = next(r for r in risks_yaml["risks"] if r.get("controls"))
+        dropped_control = target_risk["controls"][0]
+
+        scaled_controls: list[dict] = []
+        scaled_risks: list[dict] = []
+        for replica in range(100):
+            suffix = f"-x{replica}"
+            for control in controls_yaml["controls"]:
+                risks_value = control.get("risks", [])
+                if isinstance(risks_value, list):
+                    risks_value = [risk_id + suffix for risk_id in risks_value]
+                scaled_controls.append({"id": control["id"] + suffix, "risks": risks_value})
+            for risk in risks_yaml["risks"]:
+                controls_value = [control_id + suffix for control_id in risk.get("controls", [])]
+                if replica % 2 == 0 and risk is target_risk:
+                    controls_value.remove(dropped_control + suffix)
+                scaled_risks.append({"id": risk["id"] + suffix, "controls": controls_value})
+
+        errors = compare_control_maps(
+            extract_controls_data({"controls": scaled_controls}), extract_risks_data({"risks": scaled_risks})
+        )
+
+        assert len(errors) == 100 * len(baseline) + 50
+        injected = [e for e in errors if f"'{dropped_control}-x" in e and "claims to address" in e]
+        assert len(injected) == 50
@@ -3,8 +3,8 @@
 Tests for validate_issue_templates.py
 
 This test suite validates the GitHub config file validator that uses
-check-jsonschema to validate issue forms, config, and dependabot.yml
-against official schemas.
+check-jsonschema's bundled schemas, in-process, to validate issue forms,
+config, and dependabot.yml against official schemas.
 
 Test Coverage:
 ==============
@@ -56,18 +56,18 @@ Coverage Target: 85%+ of validate_issue_templates.py
 6. TestExitCodes - Exit code behavior (5 tests)
    - Exit 0 when all validations pass
    - Exit 1 when any validation fails
-   - Exit 1 when check-jsonschema not found
+   - Exit 1 when check-jsonschema not installed
    - Exit 0 when no files to validate
    - Exit 2 on unexpected errors
 
-7. TestCheckJsonSchemaIntegration - Subprocess calls (7 tests)
-   - Calls check-jsonschema with correct arguments
+7. TestCheckJsonSchemaIntegration - In-process validation (7 tests)
+   - Validates without spawning a process
    - Uses vendor.github-issue-forms for issue templates
    - Uses vendor.github-issue-config for config file
    - Handles check-jsonschema not installed
-   - Handles check-jsonschema execution errors
-   - Passes correct file paths
-   - Handles check-jsonschema timeout
+   - Handles an unknown schema name
+   - Reports errors with their JSON paths
+   - Compiles each schema once per run
 
 8. TestEdgeCases - Edge case handling (7 tests)
    - Empty template directory
@@ -89,7 +89,7 @@ Coverage Target: 85%+ of validate_issue_templates.py
 
 Implementation Notes:
 - Script will be: /workspaces/secure-ai-tooling/scripts/hooks/validate_issue_templates.py
-- Uses check-jsonschema CLI tool for validation
+- Uses check-jsonschema's bundled schemas in-process (no subprocess per file)
 - Integrates with git pre-commit hooks
 - Supports both force mode (all files) and normal mode (staged files only)
 """
@@ -160,21 +160,15 @@ def mock_git_staged_output() -> str:
 """
 
 
-@pytest.fixture
-def mock_check_jsonschema_success() -> subprocess.CompletedProcess:
-    """Provide mock successful check-jsonschema result."""
-    return subprocess.CompletedProcess(args=["check-jsonschema"], returncode=0, stdout="ok", stderr="")
-
-
-@pytest.fixture
-def mock_check_jsonschema_failure() -> subprocess.CompletedProcess:
-    """Provide mock failed check-jsonschema result."""
-    return subprocess.CompletedProcess(
-        args=["check-jsonschema"],
-        returncode=1,
-        stdout="",
-        stderr="ValidationError: 'name' is a required property",
-    )
+# Smallest issue form that passes vendor.github-issue-forms.
+VALID_ISSUE_FORM = """name: Test
+description: Test
+body:
+  - type: input
+    id: title
+    attributes:
+      label: Title
+"""
 
 
 # ============================================================================
@@ -421,19 +415,15 @@ class TestGitHubSchemaValidation:
 
         Given: Valid issue form YAML file
         When: Validation is run against vendor.github-issue-forms
-        Then: Validation passes with exit code 0
+        Then: Validation passes
         """
         from validate_issue_templates import validate_with_schema
 
         template_file = mock_template_dir / "new_component.yml"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            result = validate_with_schema(template_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(template_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is True
-        mock_run.assert_called_once()
 
     def test_validate_config_with_valid_config_succeeds(self, mock_template_dir: Path):
         """
@@ -441,16 +431,13 @@ class TestGitHubSchemaValidation:
 
         Given: Valid config.yml file
         When: Validation is run against vendor.github-issue-config
-        Then: Validation passes with exit code 0
+        Then: Validation passes
         """
         from validate_issue_templates import validate_with_schema
 
         config_file = mock_template_dir / "config.yml"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            result = validate_with_schema(config_file, "vendor.github-issue-config", quiet=True)
+        result = validate_with_schema(config_file, "vendor.github-issue-config", quiet=True)
 
         assert result is True
 
@@ -460,21 +447,17 @@ class TestGitHubSchemaValidation:
 
         Given: Issue form with invalid YAML syntax
         When: Validation is run
-        Then: Validation fails with exit code 1
+        Then: Validation fails with a parse error
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import schema_errors, validate_with_schema
 
         invalid_file = tmp_path / "invalid.yml"
         invalid_file.write_text("invalid: yaml: syntax:")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="YAML parse error"
-            )
-
-            result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is False
+        assert schema_errors(invalid_file, "vendor.github-issue-forms")[0] == "Failed to parse invalid.yml"
 
     def test_validate_issue_form_missing_required_field_fails(self, tmp_path: Path):
         """
@@ -484,19 +467,15 @@ class TestGitHubSchemaValidation:
         When: Validation is run
         Then: Validation fails with descriptive error
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import schema_errors, validate_with_schema
 
         invalid_file = tmp_path / "missing_name.yml"
-        invalid_file.write_text("description: Test\\nbody:\\n  - type: input")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="'name' is a required property"
-            )
+        invalid_file.write_text(VALID_ISSUE_FORM.replace("name: Test\n", ""))
 
-            result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is False
+        assert schema_errors(invalid_file, "vendor.github-issue-forms") == ["$: 'name' is a required property"]
 
     def test_validate_issue_form_invalid_field_type_fails(self, tmp_path: Path):
         """
@@ -506,65 +485,49 @@ class TestGitHubSchemaValidation:
         When: Validation is run
         Then: Validation fails with type error
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import schema_errors, validate_with_schema
 
         invalid_file = tmp_path / "invalid_type.yml"
-        invalid_file.write_text("name: 123\\ndescription: Test")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="123 is not of type 'string'"
-            )
+        invalid_file.write_text(VALID_ISSUE_FORM.replace("name: Test", "name: 123"))
 
-            result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is False
+        assert schema_errors(invalid_file, "vendor.github-issue-forms") == ["$.name: 123 is not of type 'string'"]
 
     def test_validate_uses_correct_schema_for_issue_forms(self, tmp_path: Path):
         """
         Test issue forms use vendor.github-issue-forms schema.
 
         Given: Issue form file (not config.yml)
-        When: Validation is run
-        Then: check-jsonschema called with --builtin-schema vendor.github-issue-forms
+        When: Validation is run against each schema
+        Then: Only vendor.github-issue-forms accepts it
         """
         from validate_issue_templates import validate_with_schema
 
         form_file = tmp_path / "form.yml"
-        form_file.write_text("name: Test")
+        form_file.write_text(VALID_ISSUE_FORM)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-
-            validate_with_schema(form_file, "vendor.github-issue-forms", quiet=True)
-
-        # Check the call includes the schema
-        call_args = mock_run.call_args[0][0]
-        assert "vendor.github-issue-forms" in call_args
+        assert validate_with_schema(form_file, "vendor.github-issue-forms", quiet=True) is True
+        assert validate_with_schema(form_file, "vendor.github-issue-config", quiet=True) is False
 
     def test_validate_uses_correct_schema_for_config(self, tmp_path: Path):
         """
         Test config.yml uses vendor.github-issue-config schema.
 
         Given: config.yml file
-        When: Validation is run
-        Then: check-jsonschema called with --builtin-schema vendor.github-issue-config
+        When: Validation is run against each schema
+        Then: Only vendor.github-issue-config accepts it
         """
         from validate_issue_templates import validate_with_schema
 
         config_file = tmp_path / "config.yml"
         config_file.write_text("blank_issues_enabled: false")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
-
-            validate_with_schema(config_file, "vendor.github-issue-config", quiet=True)
-
-        # Check the call includes the schema
-        call_args = mock_run.call_args[0][0]
-        assert "vendor.github-issue-config" in call_args
+        assert validate_with_schema(config_file, "vendor.github-issue-config", quiet=True) is True
+        assert validate_with_schema(config_file, "vendor.github-issue-forms", quiet=True) is False
 
-    def test_validate_reports_multiple_errors_in_single_file(self, tmp_path: Path):
+    def test_validate_reports_multiple_errors_in_single_file(self, tmp_path: Path, capsys):
         """
         Test multiple validation errors are reported.
 
@@ -577,14 +540,12 @@ class TestGitHubSchemaValidation:
         invalid_file = tmp_path / "multi_error.yml"
         invalid_file.write_text("invalid: yaml")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="Error 1: missing 'name'\\nError 2: missing 'description'"
-            )
-
-            result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(invalid_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is False
+        captured = capsys.readouterr()
+        for field in ("name", "description", "body"):
+            assert f"$: '{field}' is a required property" in captured.out
 
 
 class TestFileDetection:
@@ -878,12 +839,9 @@ class TestOutputMessaging:
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
+        test_file.write_text(VALID_ISSUE_FORM)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
+        validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
 
         captured = capsys.readouterr()
         assert "✅" in captured.out
@@ -901,12 +859,7 @@ class TestOutputMessaging:
         test_file = tmp_path / "test.yml"
         test_file.write_text("invalid: yaml")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="ValidationError"
-            )
-
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
+        validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
 
         captured = capsys.readouterr()
         assert "❌" in captured.out
@@ -922,37 +875,35 @@ class TestOutputMessaging:
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "my_template.yml"
-        test_file.write_text("name: Test")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
+        test_file.write_text(VALID_ISSUE_FORM)
 
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
+        validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
 
         captured = capsys.readouterr()
         assert "my_template.yml" in captured.out
 
-    def test_output_shows_which_schema_is_being_used(self, tmp_path: Path):
+    def test_output_shows_which_schema_is_being_used(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test output indicates schema being used.
 
-        Given: File is validated
+        Given: Issue form and config.yml in the template directory
         When: Validation runs
         Then: Output mentions schema type (issue-forms vs issue-config)
         """
-        from validate_issue_templates import validate_with_schema
-
-        test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
+        from validate_issue_templates import main
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
+        monkeypatch.chdir(tmp_path)
+        template_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
+        template_dir.mkdir(parents=True)
+        (template_dir / "test.yml").write_text(VALID_ISSUE_FORM)
+        (template_dir / "config.yml").write_text("blank_issues_enabled: false\n")
 
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
+        with patch("sys.argv", ["script.py", "--force"]):
+            main()
 
-            # Check that schema was passed to check-jsonschema
-            call_args = mock_run.call_args[0][0]
-            assert "vendor.github-issue-forms" in call_args
+        captured = capsys.readouterr()
+        assert "test.yml against vendor.github-issue-forms" in captured.out
+        assert "config.yml against vendor.github-issue-config" in captured.out
 
     def test_multiple_file_validation_output_formatting(self, tmp_path: Path, capsys):
         """
@@ -966,14 +917,11 @@ class TestOutputMessaging:
 
         file1 = tmp_path / "template1.yml"
         file2 = tmp_path / "template2.yml"
-        file1.write_text("name: Test1")
-        file2.write_text("name: Test2")
+        file1.write_text(VALID_ISSUE_FORM)
+        file2.write_text(VALID_ISSUE_FORM)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            validate_with_schema(file1, "vendor.github-issue-forms", quiet=False)
-            validate_with_schema(file2, "vendor.github-issue-forms", quiet=False)
+        validate_with_schema(file1, "vendor.github-issue-forms", quiet=False)
+        validate_with_schema(file2, "vendor.github-issue-forms", quiet=False)
 
         captured = capsys.readouterr()
         # Both file names should appear in output
@@ -991,12 +939,9 @@ class TestOutputMessaging:
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
+        test_file.write_text(VALID_ISSUE_FORM)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+        validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
 
         captured = capsys.readouterr()
         # In quiet mode, success messages should be suppressed
@@ -1022,13 +967,10 @@ class TestExitCodes:
         # Create template directory
         template_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
         template_dir.mkdir(parents=True)
-        (template_dir / "test.yml").write_text("name: Test")
+        (template_dir / "test.yml").write_text(VALID_ISSUE_FORM)
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-                exit_code = main()
+            exit_code = main()
 
         assert exit_code == 0
 
@@ -1050,13 +992,7 @@ class TestExitCodes:
         (template_dir / "test.yml").write_text("invalid: yaml")
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                # Mock validation failure
-                mock_run.return_value = subprocess.CompletedProcess(
-                    args=[], returncode=1, stdout="", stderr="ValidationError"
-                )
-
-                exit_code = main()
+            exit_code = main()
 
         assert exit_code == 1
 
@@ -1064,7 +1000,7 @@ class TestExitCodes:
         """
         Test exits with 1 when check-jsonschema not installed.
 
-        Given: check-jsonschema command not found
+        Given: check-jsonschema package cannot be imported
         When: Script tries to run validation
         Then: Exits with code 1 and prints error
         """
@@ -1075,13 +1011,10 @@ class TestExitCodes:
         # Create template directory
         template_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
         template_dir.mkdir(parents=True)
-        (template_dir / "test.yml").write_text("name: Test")
+        (template_dir / "test.yml").write_text(VALID_ISSUE_FORM)
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                # Mock check-jsonschema not found
-                mock_run.side_effect = FileNotFoundError("check-jsonschema not found")
-
+            with patch.dict(sys.modules, {"check_jsonschema.parsers": None}):
                 exit_code = main()
 
         assert exit_code == 1
@@ -1136,167 +1069,144 @@ class TestExitCodes:
 
 
 class TestCheckJsonSchemaIntegration:
-    """Test integration with check-jsonschema subprocess."""
+    """Test in-process validation with check-jsonschema's bundled schemas."""
 
-    def test_calls_check_jsonschema_with_correct_arguments(
-        self, mock_check_jsonschema_success: subprocess.CompletedProcess, tmp_path: Path
-    ):
+    def test_validates_without_spawning_a_process(self, tmp_path: Path):
         """
-        Test subprocess call has correct arguments.
+        Test validation runs in-process.
 
         Given: Issue form file to validate
-        When: check-jsonschema is invoked
-        Then: Called with correct schema and file arguments
+        When: Validation is run
+        Then: File passes without any subprocess being started
         """
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
+        test_file.write_text(VALID_ISSUE_FORM)
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = mock_check_jsonschema_success
-
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        assert "check-jsonschema" in call_args
-        assert "--builtin-schema" in call_args
-        assert "vendor.github-issue-forms" in call_args
-        assert str(test_file) in call_args
+        assert result is True
+        mock_run.assert_not_called()
 
     def test_uses_vendor_github_issue_forms_schema(self, tmp_path: Path):
         """
         Test uses vendor.github-issue-forms for issue templates.
 
-        Given: Issue form file (not config.yml)
-        When: check-jsonschema is invoked
-        Then: Uses --builtin-schema vendor.github-issue-forms
+        Given: Issue form file with only a name
+        When: Validated against vendor.github-issue-forms
+        Then: Errors name the issue-form properties that are missing
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import schema_errors
 
         test_file = tmp_path / "new_component.yml"
         test_file.write_text("name: Test")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+        errors = schema_errors(test_file, "vendor.github-issue-forms")
 
-        call_args = mock_run.call_args[0][0]
-        assert "vendor.github-issue-forms" in call_args
+        assert errors == ["$: 'description' is a required property", "$: 'body' is a required property"]
 
     def test_uses_vendor_github_issue_config_schema(self, tmp_path: Path):
         """
         Test uses vendor.github-issue-config for config.yml.
 
-        Given: config.yml file
-        When: check-jsonschema is invoked
-        Then: Uses --builtin-schema vendor.github-issue-config
+        Given: config.yml with a string where the schema wants a boolean
+        When: Validated against vendor.github-issue-config
+        Then: Error names the mistyped config property
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import schema_errors
 
         config_file = tmp_path / "config.yml"
-        config_file.write_text("blank_issues_enabled: false")
+        config_file.write_text('blank_issues_enabled: "no"')
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            validate_with_schema(config_file, "vendor.github-issue-config", quiet=True)
+        errors = schema_errors(config_file, "vendor.github-issue-config")
 
-        call_args = mock_run.call_args[0][0]
-        assert "vendor.github-issue-config" in call_args
+        assert errors == ["$.blank_issues_enabled: 'no' is not of type 'boolean'"]
 
     def test_handles_check_jsonschema_not_installed(self, tmp_path: Path, capsys):
         """
-        Test handles FileNotFoundError when tool not installed.
+        Test handles check-jsonschema not being importable.
 
         Given: check-jsonschema is not installed
-        When: Script tries to run it
-        Then: Catches exception and prints helpful error message
+        When: Validation is run
+        Then: Prints helpful error message and fails
         """
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("check-jsonschema not found")
+        test_file.write_text(VALID_ISSUE_FORM)
 
+        with patch.dict(sys.modules, {"check_jsonschema.parsers": None}):
             result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
 
         assert result is False
         captured = capsys.readouterr()
         assert "check-jsonschema not found" in captured.out
 
-    def test_handles_check_jsonschema_execution_errors(self, tmp_path: Path):
+    def test_handles_unknown_schema_name(self, tmp_path: Path, capsys):
         """
-        Test handles CalledProcessError from check-jsonschema.
+        Test handles a schema name check-jsonschema does not bundle.
 
-        Given: check-jsonschema returns non-zero exit code
-        When: Subprocess completes
-        Then: Error is handled and reported correctly
+        Given: Schema name with no bundled schema
+        When: Validation is run
+        Then: Error is caught and reported as a validation error
         """
         from validate_issue_templates import validate_with_schema
 
         test_file = tmp_path / "test.yml"
-        test_file.write_text("invalid: yaml")
-
-        with patch("subprocess.run") as mock_run:
-            # Return non-zero exit code
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="ValidationError"
-            )
+        test_file.write_text(VALID_ISSUE_FORM)
 
-            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(test_file, "vendor.no-such-schema", quiet=True)
 
         assert result is False
+        captured = capsys.readouterr()
+        assert "test.yml validation error" in captured.out
 
-    def test_passes_correct_file_paths_to_check_jsonschema(self, tmp_path: Path):
+    def test_reports_errors_with_json_paths(self, tmp_path: Path, capsys):
         """
-        Test file paths are passed correctly.
+        Test errors point at the offending field.
 
-        Given: Template file at .github/ISSUE_TEMPLATE/new_component.yml
-        When: check-jsonschema is invoked
-        Then: Full path is passed as argument
+        Given: Template whose first body item has an unknown type
+        When: Validation is run
+        Then: Output names the JSON path and the allowed values
         """
         from validate_issue_templates import validate_with_schema
 
         template_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
         template_dir.mkdir(parents=True)
         template_file = template_dir / "new_component.yml"
-        template_file.write_text("name: Test")
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
+        template_file.write_text(VALID_ISSUE_FORM.replace("type: input", "type: bogus"))
 
-            validate_with_schema(template_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(template_file, "vendor.github-issue-forms", quiet=True)
 
-        # Verify the full path was passed
-        call_args = mock_run.call_args[0][0]
-        assert str(template_file) in call_args
+        assert result is False
+        captured = capsys.readouterr()
+        assert "❌ new_component.yml failed validation" in captured.out
+        assert "      $.body[0].type: 'bogus' is not one of" in captured.out
 
-    def test_handles_check_jsonschema_timeout(self, tmp_path: Path, capsys):
+    def test_compiles_each_schema_once(self, tmp_path: Path):
         """
-        Test handles subprocess timeout gracefully.
+        Test one compiled validator is shared by every file of a schema.
 
-        Given: check-jsonschema takes too long
-        When: Timeout is reached
-        Then: Exception is caught and reported
+        Given: Three issue forms and a config file
+        When: Each is validated against its schema
+        Then: Only two validators are built
         """
-        from validate_issue_templates import validate_with_schema
+        from validate_issue_templates import _schema_validator, validate_with_schema
 
-        test_file = tmp_path / "test.yml"
-        test_file.write_text("name: Test")
+        forms = [tmp_path / f"form{i}.yml" for i in range(3)]
+        for form in forms:
+            form.write_text(VALID_ISSUE_FORM)
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("blank_issues_enabled: false")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("check-jsonschema", 30)
+        _schema_validator.cache_clear()
+        for form in forms:
+            assert validate_with_schema(form, "vendor.github-issue-forms", quiet=True) is True
+        assert validate_with_schema(config_file, "vendor.github-issue-config", quiet=True) is True
 
-            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=False)
-
-        assert result is False
-        captured = capsys.readouterr()
-        assert "timeout" in captured.out.lower()
+        assert _schema_validator.cache_info().misses == 2
 
 
 class TestEdgeCases:
@@ -1324,7 +1234,7 @@ class TestEdgeCases:
         # Empty directory should exit with 0
         assert exit_code == 0
 
-    def test_template_files_with_syntax_errors_fail_validation(self, tmp_path: Path):
+    def test_template_files_with_syntax_errors_fail_validation(self, tmp_path: Path, capsys):
         """
         Test YAML syntax errors are caught.
 
@@ -1337,15 +1247,11 @@ class TestEdgeCases:
         test_file = tmp_path / "invalid.yml"
         test_file.write_text("invalid: yaml: syntax:")
 
-        with patch("subprocess.run") as mock_run:
-            # Mock YAML parse error
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=[], returncode=1, stdout="", stderr="YAML parse error"
-            )
-
-            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is False
+        captured = capsys.readouterr()
+        assert "Failed to parse invalid.yml" in captured.out
 
     def test_very_large_template_files_are_validated(self, tmp_path: Path):
         """
@@ -1359,13 +1265,10 @@ class TestEdgeCases:
 
         # Create a large file (not actually 1MB for performance, but conceptually large)
         test_file = tmp_path / "large.yml"
-        large_content = "name: Test\n" + "description: " + ("x" * 10000) + "\n"
+        large_content = VALID_ISSUE_FORM.replace("description: Test", "description: " + ("x" * 10000))
         test_file.write_text(large_content)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-
-            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+        result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
 
         assert result is True
 
@@ -1415,11 +1318,7 @@ class TestEdgeCases:
         test_file.chmod(0o000)
 
         try:
-            with patch("subprocess.run") as mock_run:
-                # Mock will likely not even be called due to permission error
-                mock_run.side_effect = PermissionError("Permission denied")
-
-                result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
+            result = validate_with_schema(test_file, "vendor.github-issue-forms", quiet=True)
 
             # Should handle the error gracefully
             assert result is False
@@ -1490,13 +1389,13 @@ class TestEdgeCases:
 class TestDependabotValidation:
     """Test dependabot.yml validation using vendor.dependabot schema."""
 
-    def test_validates_dependabot_yml_with_vendor_dependabot_schema(self, tmp_path: Path, monkeypatch):
+    def test_validates_dependabot_yml_with_vendor_dependabot_schema(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test dependabot.yml is validated with vendor.dependabot schema in force mode.
 
         Given: .github/dependabot.yml exists
         When: Script runs in force mode
-        Then: check-jsonschema is called with vendor.dependabot schema
+        Then: dependabot.yml is validated against vendor.dependabot and passes
         """
         from validate_issue_templates import main
 
@@ -1511,15 +1410,12 @@ class TestDependabotValidation:
         dependabot_file.write_text("version: 2\nupdates: []\n")
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-                main()
+            exit_code = main()
 
-        # Find the call that used vendor.dependabot
-        dependabot_calls = [c for c in mock_run.call_args_list if "vendor.dependabot" in c[0][0]]
-        assert len(dependabot_calls) == 1, "Should call check-jsonschema with vendor.dependabot"
-        # Script uses relative path ".github/dependabot.yml"
-        assert ".github/dependabot.yml" in dependabot_calls[0][0][0][-1]
+        assert exit_code == 0
+        captured = capsys.readouterr()
+        assert "Validating dependabot.yml against vendor.dependabot" in captured.out
+        assert "✅ dependabot.yml passed validation" in captured.out
 
     def test_skips_dependabot_validation_when_file_missing(self, tmp_path: Path, monkeypatch, capsys):
         """
@@ -1541,15 +1437,12 @@ class TestDependabotValidation:
         # No dependabot.yml created
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-                main()
+            main()
 
-        # No call should use vendor.dependabot
-        dependabot_calls = [c for c in mock_run.call_args_list if "vendor.dependabot" in c[0][0]]
-        assert len(dependabot_calls) == 0, "Should not validate dependabot when file missing"
+        captured = capsys.readouterr()
+        assert "vendor.dependabot" not in captured.out, "Should not validate dependabot when file missing"
 
-    def test_reports_failure_when_dependabot_yml_invalid(self, tmp_path: Path, monkeypatch):
+    def test_reports_failure_when_dependabot_yml_invalid(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test reports failure for invalid dependabot.yml.
 
@@ -1570,22 +1463,13 @@ class TestDependabotValidation:
         dependabot_file.write_text("invalid: content\n")
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                # Issue templates: no files to validate (empty dir)
-                # Dependabot: validation fails
-                def side_effect(cmd, **kwargs):
-                    if "vendor.dependabot" in cmd:
-                        return subprocess.CompletedProcess(
-                            args=cmd, returncode=1, stdout="", stderr="ValidationError: 'version' is required"
-                        )
-                    return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="ok", stderr="")
-
-                mock_run.side_effect = side_effect
-                exit_code = main()
+            exit_code = main()
 
         assert exit_code == 1
+        captured = capsys.readouterr()
+        assert "$: 'version' is a required property" in captured.out
 
-    def test_only_validates_dependabot_when_staged_in_normal_mode(self, tmp_path: Path, monkeypatch):
+    def test_only_validates_dependabot_when_staged_in_normal_mode(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test dependabot.yml is only validated when staged in normal (non-force) mode.
 
@@ -1610,28 +1494,18 @@ class TestDependabotValidation:
 
         with patch("sys.argv", ["script.py"]):
             with patch("subprocess.run") as mock_run:
-
-                def side_effect(cmd, **kwargs):
-                    # git diff returns only an issue template (not dependabot.yml)
-                    if cmd[0] == "git":
-                        return subprocess.CompletedProcess(
-                            args=cmd, returncode=0, stdout=".github/ISSUE_TEMPLATE/test.yml\n", stderr=""
-                        )
-                    # check-jsonschema calls succeed
-                    return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="ok", stderr="")
-
-                mock_run.side_effect = side_effect
+                # git diff returns only an issue template (not dependabot.yml)
+                mock_run.return_value = subprocess.CompletedProcess(
+                    args=[], returncode=0, stdout=".github/ISSUE_TEMPLATE/test.yml\n", stderr=""
+                )
                 main()
 
-        # No call should use vendor.dependabot (not staged)
-        dependabot_calls = [
-            c
-            for c in mock_run.call_args_list
-            if len(c[0][0]) > 0 and c[0][0][0] == "check-jsonschema" and "vendor.dependabot" in c[0][0]
-        ]
-        assert len(dependabot_calls) == 0
+        # dependabot.yml is not validated (not staged)
+        captured = capsys.readouterr()
+        assert "Validating test.yml" in captured.out
+        assert "vendor.dependabot" not in captured.out
 
-    def test_validates_dependabot_when_staged_in_normal_mode(self, tmp_path: Path, monkeypatch):
+    def test_validates_dependabot_when_staged_in_normal_mode(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test dependabot.yml is validated when staged in normal mode.
 
@@ -1653,28 +1527,17 @@ class TestDependabotValidation:
 
         with patch("sys.argv", ["script.py"]):
             with patch("subprocess.run") as mock_run:
+                # git diff returns dependabot.yml as staged
+                mock_run.return_value = subprocess.CompletedProcess(
+                    args=[], returncode=0, stdout=".github/dependabot.yml\n", stderr=""
+                )
+                exit_code = main()
 
-                def side_effect(cmd, **kwargs):
-                    # git diff returns dependabot.yml as staged
-                    if cmd[0] == "git":
-                        return subprocess.CompletedProcess(
-                            args=cmd, returncode=0, stdout=".github/dependabot.yml\n", stderr=""
-                        )
-                    # check-jsonschema calls succeed
-                    return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="ok", stderr="")
-
-                mock_run.side_effect = side_effect
-                main()
-
-        # Should have a call with vendor.dependabot
-        dependabot_calls = [
-            c
-            for c in mock_run.call_args_list
-            if len(c[0][0]) > 0 and c[0][0][0] == "check-jsonschema" and "vendor.dependabot" in c[0][0]
-        ]
-        assert len(dependabot_calls) == 1
+        assert exit_code == 0
+        captured = capsys.readouterr()
+        assert "Validating dependabot.yml against vendor.dependabot" in captured.out
 
-    def test_validates_dependabot_without_issue_template_dir(self, tmp_path: Path, monkeypatch):
+    def test_validates_dependabot_without_issue_template_dir(self, tmp_path: Path, monkeypatch, capsys):
         """
         Test dependabot.yml is validated even when ISSUE_TEMPLATE dir is missing.
 
@@ -1693,13 +1556,13 @@ class TestDependabotValidation:
         dependabot_file.write_text("version: 2\nupdates: []\n")
 
         with patch("sys.argv", ["script.py", "--force"]):
-            with patch("subprocess.run") as mock_run:
-                mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
-                exit_code = main()
+            exit_code = main()
 
         assert exit_code == 0
-        dependabot_calls = [c for c in mock_run.call_args_list if "vendor.dependabot" in c[0][0]]
-        assert len(dependabot_calls) == 1, "Should validate dependabot.yml without ISSUE_TEMPLATE dir"
+        captured = capsys.readouterr()
+        assert "✅ dependabot.yml passed validation" in captured.out, (
+            "Should validate dependabot.yml without ISSUE_TEMPLATE dir"
+        )
 
     def test_integration_validates_real_dependabot_yml(self):
         """
@@ -2178,7 +2041,7 @@ Coverage Areas:
 - Argument parsing (argparse)
 - File discovery (pathlib)
 - Git integration (subprocess for git commands)
-- Schema validation (subprocess for check-jsonschema)
+- Schema validation (check-jsonschema's bundled schemas, in-process)
 - Output formatting (print with emoji)
 - Error handling (FileNotFoundError, CalledProcessError, etc.)
 - Exit codes (0, 1, 2)
@@ -7,20 +7,23 @@ hook is invoked by the pre-commit framework with `pass_filenames: false`, so
 positional argv is informational only and MUST NOT influence the build.
 
 On a clean tree the hook must return 0 without polluting the working tree:
-the module is expected to write its JSON output into a
-`tempfile.TemporaryDirectory()` so nothing leaks into `site/generated/`.
-On any pipeline failure (malformed YAML, missing inputs, schema rejection,
+the build and schema validation run in memory, with only the builder's record
+and validation caches written, to PERSONA_SITE_CACHE_DIR, so nothing leaks
+into `site/generated/`. On any pipeline failure (malformed YAML, missing inputs, schema rejection,
 etc.) the hook must return a non-zero exit code and surface a clear error
 message on stderr.
 
 Test Coverage:
 ==============
-Total Tests: 8
+Total Tests: 11
 
 - Happy path:                2  (current YAML succeeds; argv is ignored)
+- Caches:                    2  (caches land in PERSONA_SITE_CACHE_DIR; a warm
+                                 cache still fails a broken edit)
 - Argv contract:             1  (variety of argv payloads behave identically)
-- Failure modes:             4  (broken YAML, missing YAML, schema rejection,
-                                 stderr/stdout contract on failure)
+- Failure modes:             5  (broken YAML, missing YAML, schema rejection,
+                                 sharding/search-index failure, stderr/stdout
+                                 contract on failure)
 - Working-tree isolation:    1  (repo `site/generated/` is untouched)
 
 Coverage Target: 85%+ of validate_persona_site_build.py
@@ -39,6 +42,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from jsonschema import Draft7Validator
 
 # ---------------------------------------------------------------------------
 # Make both the precommit hook module AND the scripts package importable.
@@ -52,6 +56,15 @@ sys.path.insert(0, str(REPO_ROOT / "scripts" / "hooks" / "precommit"))
 
 from validate_persona_site_build import main  # noqa: E402  (intentional late import)
 
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep the hook's caches out of the user's cache directory."""
+    path = tmp_path / "persona-site-cache"
+    monkeypatch.setenv("PERSONA_SITE_CACHE_DIR", str(path))
+    return path
+
+
 # ---------------------------------------------------------------------------
 # Constants & helpers
 # ---------------------------------------------------------------------------
@@ -61,8 +74,8 @@ from validate_persona_site_build import main  # noqa: E402  (intentional late im
 # broken framework YAML without touching the real files on disk.
 BUILDER_MODULE = "scripts.build_persona_site_data"
 
-# Output file written by the builder. The hook must route this into a temp
-# directory so the repo's site/generated/ tree is never mutated.
+# Output file written by the builder CLI. The hook must never write it, so the
+# repo's site/generated/ tree is never mutated.
 GENERATED_JSON_REL = Path("site") / "generated" / "persona-site-data.json"
 
 
@@ -130,6 +143,42 @@ def test_main_ignores_argv_filenames():
     assert main(argv) == 0
 
 
+# ===========================================================================
+# Caches
+# ===========================================================================
+
+
+def test_main_keeps_caches_in_cache_dir(cache_dir):
+    """
+    The hook must write its record and validation caches only to the cache directory.
+
+    Given: PERSONA_SITE_CACHE_DIR points at an empty temp directory
+    When: main([]) is invoked twice
+    Then: Both runs return 0 and the directory holds the two cache files
+    """
+    assert main([]) == 0
+    assert main([]) == 0
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["records.json", "validated-records.json"]
+
+
+def test_main_with_warm_cache_still_fails_on_broken_yaml(tmp_path, monkeypatch, capsys):
+    """
+    A warm cache must not hide a broken edit.
+
+    Given: A successful run has filled the caches
+    When: risks.yaml is replaced by one with an unsupported nesting depth and main([]) runs again
+    Then: The hook returns non-zero with an error on stderr
+    """
+    assert main([]) == 0
+    monkeypatch.setattr(f"{BUILDER_MODULE}.DEFAULT_RISKS_PATH", _write_broken_risks_yaml(tmp_path))
+
+    result = main([])
+
+    assert result != 0
+    assert "TypeError" in capsys.readouterr().err
+
+
 # ===========================================================================
 # Argv contract
 # ===========================================================================
@@ -215,8 +264,8 @@ def test_main_returns_nonzero_on_schema_validation_failure(tmp_path, monkeypatch
     """
     A builder output that fails the output schema must exit non-zero.
 
-    Given: The builder's in-memory _OUTPUT_SCHEMA is monkeypatched to a schema
-           that requires a top-level key the real builder never emits
+    Given: The builder's output-schema validator is monkeypatched to one whose
+           schema requires a top-level key the real builder never emits
     When: main([]) is invoked
     Then: The return code is non-zero AND stderr is non-empty
 
@@ -229,7 +278,7 @@ def test_main_returns_nonzero_on_schema_validation_failure(tmp_path, monkeypatch
         "type": "object",
         "required": ["nonExistentKey"],
     }
-    monkeypatch.setattr(f"{BUILDER_MODULE}._OUTPUT_SCHEMA", rejecting_schema)
+    monkeypatch.setattr(f"{BUILDER_MODULE}._output_validator", lambda: Draft7Validator(rejecting_schema))
 
     result = main([])
 
@@ -238,6 +287,26 @@ def test_main_returns_nonzero_on_schema_validation_failure(tmp_path, monkeypatch
     assert captured.err.strip() != "", "failure path must write an error to stderr"
 
 
+def test_main_returns_nonzero_when_sharding_fails(monkeypatch, capsys):
+    """
+    A failure after validation, while sharding or indexing, must exit non-zero.
+
+    Given: build_search_index() (called by build_site_shards()) is monkeypatched to raise
+    When: main([]) is invoked
+    Then: The return code is non-zero AND stderr names the error
+    """
+
+    def broken_index(data):
+        raise KeyError("title")
+
+    monkeypatch.setattr(f"{BUILDER_MODULE}.build_search_index", broken_index)
+
+    result = main([])
+
+    assert result != 0, "a sharding or search-index failure must cause a non-zero exit"
+    assert "KeyError" in capsys.readouterr().err
+
+
 def test_main_failure_leaves_stdout_free_of_success_marker(tmp_path, monkeypatch, capsys):
     """
     On failure, stdout must not contain the builder's success marker.
@@ -273,12 +342,12 @@ def test_main_does_not_write_into_repo_site_generated():
            inside site/generated/
     When: main([]) is invoked on a clean tree
     Then: The mtime of site/generated/persona-site-data.json is
-          unchanged — i.e. the hook routed its build into a temp directory
-          rather than touching the committed artifact
+          unchanged — i.e. the hook validated its build in memory rather
+          than touching the committed artifact
 
-    This guards against a regression where a future refactor drops the
-    tempfile.TemporaryDirectory() sandbox and starts overwriting the
-    committed JSON on every commit (which would either trip the pre-commit
+    This guards against a regression where a future refactor starts
+    writing the build output and overwriting the committed JSON on every
+    commit (which would either trip the pre-commit
     framework's modify-and-fail detector or silently churn the tree).
     """
     committed_json = REPO_ROOT / GENERATED_JSON_REL
@@ -304,23 +373,28 @@ def test_main_does_not_write_into_repo_site_generated():
 """
 Test Summary
 ============
-Total Tests: 8
+Total Tests: 11
 
 - test_main_returns_zero_on_current_yaml
 - test_main_ignores_argv_filenames
+- test_main_keeps_caches_in_cache_dir
+- test_main_with_warm_cache_still_fails_on_broken_yaml
 - test_main_argv_contract_is_ignored (parametrized x4)
 - test_main_returns_nonzero_on_broken_yaml
 - test_main_returns_nonzero_on_missing_yaml
 - test_main_returns_nonzero_on_schema_validation_failure
+- test_main_returns_nonzero_when_sharding_fails
 - test_main_failure_leaves_stdout_free_of_success_marker
 - test_main_does_not_write_into_repo_site_generated
 
 Coverage Areas:
 - main([]) returns 0 on current framework YAML
 - argv is ignored (pass_filenames: false contract)
+- Record and validation caches stay in PERSONA_SITE_CACHE_DIR and never mask failures
 - Non-zero exit + stderr on TypeError raised by normalize_text_entries
 - Non-zero exit + stderr when an input YAML is missing
 - Non-zero exit + stderr on output schema validation failure
+- Non-zero exit + stderr when sharding or search indexing raises
 - Failure stdout does not contain the builder's "Wrote ..." success marker
 - Working tree isolation: committed site/generated/ JSON is never touched
 """
@@ -113,7 +113,7 @@ Dependencies Checked:
 - Node.js >= 22
 - npm
 - git
-- pip packages: check-jsonschema, pytest, pytest-cov, pytest-timeout, PyYAML, ruff, pandas, tabulate
+- pip packages: Brotli, check-jsonschema, pytest, pytest-cov, pytest-timeout, PyYAML, ruff
 - npx prettier
 - npx mmdc (mermaid-cli)
 - ruff (command-line)
@@ -447,7 +447,7 @@ class TestMissingPipPackage:
     Test script behavior when required pip packages are missing.
 
     Creates a stub python3 and pip that report packages as not installed.
-    Tests check for key packages: check-jsonschema, pytest, PyYAML, ruff, pandas.
+    Tests check for key packages: check-jsonschema, pytest, PyYAML, ruff.
     """
 
     def test_missing_pip_package_fails(self, tmp_path):
@@ -902,7 +902,7 @@ Dependencies Validated:
 - Python >= 3.14
 - Node.js >= 22
 - npm, git, ruff, check-jsonschema, act
-- pip packages: check-jsonschema, pytest, pytest-cov, pytest-timeout, PyYAML, ruff, pandas, tabulate
+- pip packages: Brotli, check-jsonschema, pytest, pytest-cov, pytest-timeout, PyYAML, ruff
 - npx prettier, npx mmdc
 - Chromium (Playwright or system)
 
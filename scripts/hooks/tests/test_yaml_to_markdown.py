@@ -9,7 +9,7 @@ Test Coverage:
 ==============
 1. Core Conversion Logic:
    - YAML file loading and parsing
-   - DataFrame generation from YAML data
+   - Table row generation from YAML data
    - Column-specific formatting (edges, descriptions, lists, dicts)
    - Markdown table generation
 
@@ -32,7 +32,7 @@ Test Coverage:
    - List formatting
    - Dictionary formatting (tourContent)
    - Mappings formatting (metadata mappings)
-   - Pandas NaN handling for all formatters
+   - Missing-value (None/NaN) handling for all formatters, plus pandas NA from external callers
 
 5. End-to-End Workflows:
    - Single type conversion
@@ -41,20 +41,49 @@ Test Coverage:
    - Custom file paths
    - Error scenarios
 
+6. Render Sessions:
+   - Each YAML file parsed once across all (type, format) renders
+   - Session output identical to one-shot yaml_to_markdown_table calls
+
+7. Batch Conversion (--table / --jobs):
+   - Table spec parsing and validation
+   - Process-pool output identical to serial output
+   - Deterministic, request-ordered error reporting
+   - Unchanged tables are not rewritten
+
+8. Sharded Output (--shard-by-category):
+   - One shard per category plus an index table
+   - Editing one entry rewrites only its shard; vanished categories are removed
+   - Shards in formats not requested are kept, or dropped with their index
+   - Categories without a title get their humanized ID
+   - Tables without per-entry categories are written whole
+
+9. Multi-Format Output (--emit):
+   - Format list parsing and validation
+   - CSV and JSON Lines written next to byte-identical Markdown, shards included
+   - Shard indexes in CSV and JSON Lines name the shard file instead of linking it
+
 The tests use temporary files and pytest fixtures to ensure isolation
 and reproducibility.
 """
 
+import argparse
+import json
+import os
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-import pandas as pd
 import pytest
 import yaml
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; NA checks then cover float NaN only
+    pd = None
+
 
 def get_git_root():
     """Get the git repository root directory."""
@@ -78,6 +107,9 @@ sys.path.insert(0, str(git_root / "scripts" / "hooks"))
 # Import the module under test
 import yaml_to_markdown  # noqa: E402
 
+# NaN-like values the formatters must treat as missing
+MISSING_VALUES = [float("nan")] + ([pd.NA] if pd is not None else [])
+
 
 class TestFormattingFunctions:
     """
@@ -200,36 +232,24 @@ class TestFormattingFunctions:
 
     # NaN handling tests
     def test_format_edges_with_nan(self):
-        """Test format_edges handles pandas NaN values correctly."""
-        result = yaml_to_markdown.format_edges(pd.NA)  # pyright: ignore[reportArgumentType]
-        assert result == ""
-
-        result = yaml_to_markdown.format_edges(float("nan"))  # pyright: ignore[reportArgumentType]
-        assert result == ""
+        """Test format_edges handles NaN-like missing values correctly."""
+        for value in MISSING_VALUES:
+            assert yaml_to_markdown.format_edges(value) == ""  # pyright: ignore[reportArgumentType]
 
     def test_format_list_with_nan(self):
-        """Test format_list handles pandas NaN values correctly."""
-        result = yaml_to_markdown.format_list(pd.NA)
-        assert result == ""
-
-        result = yaml_to_markdown.format_list(float("nan"))
-        assert result == ""
+        """Test format_list handles NaN-like missing values correctly."""
+        for value in MISSING_VALUES:
+            assert yaml_to_markdown.format_list(value) == ""
 
     def test_format_dict_with_nan(self):
-        """Test format_dict handles pandas NaN values correctly."""
-        result = yaml_to_markdown.format_dict(pd.NA)
-        assert result == ""
-
-        result = yaml_to_markdown.format_dict(float("nan"))
-        assert result == ""
+        """Test format_dict handles NaN-like missing values correctly."""
+        for value in MISSING_VALUES:
+            assert yaml_to_markdown.format_dict(value) == ""
 
     def test_collapse_column_with_nan(self):
-        """Test collapse_column handles pandas NaN values correctly."""
-        result = yaml_to_markdown.collapse_column(pd.NA)
-        assert result == ""
-
-        result = yaml_to_markdown.collapse_column(float("nan"))
-        assert result == ""
+        """Test collapse_column handles NaN-like missing values correctly."""
+        for value in MISSING_VALUES:
+            assert yaml_to_markdown.collapse_column(value) == ""
 
     def test_format_mappings_simple(self):
         """Test formatting a simple mappings dictionary."""
@@ -256,12 +276,9 @@ class TestFormattingFunctions:
         assert yaml_to_markdown.format_mappings(None) == ""
 
     def test_format_mappings_with_nan(self):
-        """Test format_mappings handles pandas NaN values correctly."""
-        result = yaml_to_markdown.format_mappings(pd.NA)
-        assert result == ""
-
-        result = yaml_to_markdown.format_mappings(float("nan"))
-        assert result == ""
+        """Test format_mappings handles NaN-like missing values correctly."""
+        for value in MISSING_VALUES:
+            assert yaml_to_markdown.format_mappings(value) == ""
 
     def test_format_mappings_non_dict(self):
         """Test format_mappings with non-dict input returns empty string."""
@@ -338,7 +355,7 @@ class TestYamlToMarkdownTable:
     """
     Test the main yaml_to_markdown_table conversion function.
 
-    Tests YAML parsing, DataFrame creation, column formatting,
+    Tests YAML parsing, row building, column formatting,
     and markdown table generation.
     """
 
@@ -1285,16 +1302,16 @@ class TestPersonaTableGenerators:
                '\\n', exactly as PyYAML produces when loading a '>' folded block
         When: PersonaFullDetailTableGenerator.generate() is called
         Then:
-          - tabulate does not split cells on embedded newlines, producing phantom
-            rows that have the persona ID column empty — every data row that starts
+          - _markdown_table does not split cells on embedded newlines, producing
+            phantom rows that have the persona ID column empty — every data row that starts
             with '|' and is not the header or separator must contain the persona ID
             or a <br> continuation token, not an entirely empty first cell
           - All identification questions appear in the output
 
-        Note: tabulate splits cell content on '\\n', turning one logical row into
-        multiple visual rows. The broken rows show up as '|' lines with empty first
-        cells and <br>-prefixed content in later columns — exactly the symptom this
-        test targets.
+        Note: _markdown_table lays out cells containing '\\n' line by line,
+        turning one logical row into multiple visual rows. The broken rows show up
+        as '|' lines with empty first cells and <br>-prefixed content in later
+        columns — exactly the symptom this test targets.
         """
         # Simulate what PyYAML returns for a '>' folded block scalar in a list:
         # each item gets a trailing '\n'.
@@ -1322,7 +1339,7 @@ class TestPersonaTableGenerators:
         # Every remaining non-empty '|'-prefixed line is a data row.
         data_rows = [line for line in lines[2:] if line.startswith("|")]
 
-        # A phantom row produced by tabulate splitting on '\n' has an empty first
+        # A phantom row produced by _markdown_table splitting on '\n' has an empty first
         # cell: it looks like '|               | ...'. The first cell of every
         # legitimate data row must not be entirely whitespace.
         for row in data_rows:
@@ -1331,7 +1348,7 @@ class TestPersonaTableGenerators:
             # cells[1] is the first column value.
             first_cell = cells[1].strip() if len(cells) > 1 else ""
             assert first_cell != "", (
-                f"Phantom table row detected — tabulate split a cell on an embedded '\\n'. Row: {row!r}"
+                f"Phantom table row detected — _markdown_table split a cell on an embedded '\\n'. Row: {row!r}"
             )
 
         # Both questions must survive intact in the output.
@@ -2560,3 +2577,514 @@ class TestFlatFlag:
         data_rows = [line for line in lines[2:] if line.strip()]
         for row in data_rows:
             assert "<br>" not in row, f"Flat output should not contain <br> tags, found in: {row}"
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    """Write a minimal four-file corpus with a cross-entity sentinel."""
+    docs = {
+        "components": {"components": [{"id": "componentA", "title": "Component A", "category": "c"}]},
+        "risks": {
+            "risks": [
+                {
+                    "id": "riskA",
+                    "title": "Risk A",
+                    "shortDescription": ["Affects {{componentA}}."],
+                    "personas": ["personaA"],
+                }
+            ]
+        },
+        "controls": {
+            "controls": [
+                {
+                    "id": "controlA",
+                    "title": "Control A",
+                    "components": ["componentA"],
+                    "risks": ["riskA"],
+                    "personas": ["personaA"],
+                }
+            ]
+        },
+        "personas": {"personas": [{"id": "personaA", "title": "Persona A", "description": ["Owns {{riskA}}."]}]},
+    }
+    for name, data in docs.items():
+        (tmp_path / f"{name}.yaml").write_text(yaml.safe_dump(data))
+    return tmp_path
+
+
+class TestRenderSession:
+    """
+    Test RenderSession, the parse-once cache behind --all --all-formats.
+    """
+
+    def test_each_file_parsed_once(self, corpus_dir):
+        """
+        Given: A RenderSession and a four-file corpus
+        When: Every applicable (type, format) table is rendered
+        Then: yaml.safe_load runs once per file
+        """
+        session = yaml_to_markdown.RenderSession()
+
+        with patch("yaml_to_markdown.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            for ytype in ("components", "controls", "risks", "personas"):
+                for table_format in yaml_to_markdown.get_applicable_formats(ytype):
+                    session.render(corpus_dir / f"{ytype}.yaml", ytype, table_format)
+
+        assert safe_load.call_count == 4
+
+    def test_session_output_matches_one_shot(self, corpus_dir):
+        """
+        Given: A shared RenderSession
+        When: Tables are rendered through it and through yaml_to_markdown_table() alone
+        Then: The outputs are identical, including expanded sentinels
+        """
+        session = yaml_to_markdown.RenderSession()
+
+        for ytype in ("components", "controls", "risks", "personas"):
+            for table_format in yaml_to_markdown.get_applicable_formats(ytype):
+                yaml_file = corpus_dir / f"{ytype}.yaml"
+                shared = yaml_to_markdown.yaml_to_markdown_table(yaml_file, ytype, table_format, session=session)
+                assert shared == yaml_to_markdown.yaml_to_markdown_table(yaml_file, ytype, table_format)
+
+        risks_summary = session.render(corpus_dir / "risks.yaml", "risks", "summary")
+        assert "Affects Component A." in risks_summary
+
+    def test_convert_all_formats_reuses_passed_session(self, corpus_dir, tmp_path):
+        """
+        Given: A session that has already parsed the corpus
+        When: convert_all_formats() is called with it
+        Then: No YAML file is parsed again
+        """
+        session = yaml_to_markdown.RenderSession()
+        session.render(corpus_dir / "controls.yaml", "controls", "full")
+        out_dir = tmp_path / "out"
+
+        with patch("yaml_to_markdown.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            result = yaml_to_markdown.convert_all_formats(
+                "controls", corpus_dir / "controls.yaml", out_dir, quiet=True, session=session
+            )
+
+        assert result is True
+        assert safe_load.call_count == 0
+        assert len(list(out_dir.glob("controls-*.md"))) == 4
+
+
+ALL_TABLES = [
+    (ytype, table_format)
+    for ytype in ("components", "controls", "risks", "personas")
+    for table_format in yaml_to_markdown.get_applicable_formats(ytype)
+]
+
+
+class TestBatchConversion:
+    """
+    Test convert_tables(), the --table / --jobs batch renderer.
+    """
+
+    def test_parse_table_spec(self):
+        """
+        Given: --table values with and without a format
+        When: parse_table_spec() is called
+        Then: TYPE expands to every applicable format and TYPE:FORMAT to one table
+        """
+        assert yaml_to_markdown.parse_table_spec("components") == [
+            ("components", "full"),
+            ("components", "summary"),
+        ]
+        assert yaml_to_markdown.parse_table_spec("personas:xref-risks") == [("personas", "xref-risks")]
+
+    @pytest.mark.parametrize("spec", ["widgets", "risks:xref-components", "controls:bogus"])
+    def test_parse_table_spec_rejects_invalid(self, spec):
+        """
+        Given: An unknown type or a format that does not apply to the type
+        When: parse_table_spec() is called
+        Then: argparse.ArgumentTypeError is raised
+        """
+        with pytest.raises(argparse.ArgumentTypeError):
+            yaml_to_markdown.parse_table_spec(spec)
+
+    def test_pool_output_matches_serial(self, corpus_dir, tmp_path):
+        """
+        Given: Every applicable table of a four-file corpus
+        When: convert_tables() runs serially and on a two-worker pool
+        Then: Both runs write identical files
+        """
+        with patch("yaml_to_markdown.DEFAULT_INPUT_DIR", corpus_dir):
+            assert yaml_to_markdown.convert_tables(ALL_TABLES, output_dir=tmp_path / "serial", quiet=True)
+            assert yaml_to_markdown.convert_tables(ALL_TABLES, output_dir=tmp_path / "pool", quiet=True, jobs=2)
+
+        for ytype, table_format in ALL_TABLES:
+            name = f"{ytype}-{table_format}.md"
+            assert (tmp_path / "pool" / name).read_text() == (tmp_path / "serial" / name).read_text()
+
+    def test_errors_reported_in_request_order(self, corpus_dir, tmp_path, capsys):
+        """
+        Given: A batch mixing a missing input, a valid table and a malformed input
+        When: convert_tables() runs on a pool
+        Then: It returns False, writes the valid table and reports errors in request order
+        """
+        (corpus_dir / "risks.yaml").write_text("not_risks: []\n")
+        (corpus_dir / "controls.yaml").unlink()
+        tables = [("controls", "full"), ("components", "full"), ("risks", "summary")]
+
+        with patch("yaml_to_markdown.DEFAULT_INPUT_DIR", corpus_dir):
+            result = yaml_to_markdown.convert_tables(tables, output_dir=tmp_path / "out", quiet=True, jobs=2)
+
+        assert result is False
+        assert (tmp_path / "out" / "components-full.md").exists()
+        errors = [line for line in capsys.readouterr().out.splitlines() if line.startswith("❌")]
+        assert len(errors) == 2
+        assert errors[0].startswith("❌ Error converting controls (full format): Input file not found")
+        assert errors[1].startswith("❌ Error converting risks (summary format):")
+
+    def test_unchanged_tables_are_not_rewritten(self, corpus_dir, tmp_path, capsys):
+        """
+        Given: Tables already generated from an unchanged corpus
+        When: convert_tables() runs again
+        Then: No file is rewritten (mtimes are kept) and each table is reported up to date
+        """
+        out_dir = tmp_path / "out"
+        tables = [("components", "full"), ("risks", "summary")]
+        with patch("yaml_to_markdown.DEFAULT_INPUT_DIR", corpus_dir):
+            yaml_to_markdown.convert_tables(tables, output_dir=out_dir, quiet=True)
+            mtimes = {path: path.stat().st_mtime_ns for path in out_dir.iterdir()}
+            capsys.readouterr()
+
+            assert yaml_to_markdown.convert_tables(tables, output_dir=out_dir)
+
+        assert {path: path.stat().st_mtime_ns for path in out_dir.iterdir()} == mtimes
+        assert capsys.readouterr().out.count("✅ Up to date:") == 2
+
+    def test_main_table_and_jobs_flags(self, corpus_dir, tmp_path):
+        """
+        Given: --table and --jobs on the command line
+        When: main() runs
+        Then: Exactly the requested tables are written and the exit code is 0
+        """
+        argv = [
+            "yaml_to_markdown.py",
+            "--table",
+            "controls",
+            "--table",
+            "personas:xref-risks",
+            "--jobs",
+            "2",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--quiet",
+        ]
+        with patch("sys.argv", argv), patch("yaml_to_markdown.DEFAULT_INPUT_DIR", corpus_dir):
+            with pytest.raises(SystemExit) as exc_info:
+                yaml_to_markdown.main()
+
+        assert exc_info.value.code == 0
+        written = sorted(path.name for path in (tmp_path / "out").iterdir())
+        assert written == [
+            "controls-full.md",
+            "controls-summary.md",
+            "controls-xref-components.md",
+            "controls-xref-risks.md",
+            "personas-xref-risks.md",
+        ]
+
+
+@pytest.fixture
+def categorized_dir(tmp_path):
+    """Write a controls corpus with two titled categories and one uncategorized control."""
+    controls = {
+        "categories": [
+            {"id": "controlsData", "title": "Data Controls"},
+            {"id": "controlsModel", "title": "Model Controls"},
+        ],
+        "controls": [
+            {"id": "controlB", "title": "Control B", "description": "b", "category": "controlsModel"},
+            {"id": "controlA", "title": "Control A", "description": "a", "category": "controlsData"},
+            {"id": "controlC", "title": "Control C", "description": "c", "category": "controlsData"},
+            {"id": "controlD", "title": "Control D", "description": "d"},
+        ],
+    }
+    yaml_dir = tmp_path / "yaml"
+    yaml_dir.mkdir()
+    (yaml_dir / "controls.yaml").write_text(yaml.safe_dump(controls))
+    (yaml_dir / "risks.yaml").write_text(yaml.safe_dump({"risks": []}))
+    (yaml_dir / "components.yaml").write_text(yaml.safe_dump({"components": []}))
+    return yaml_dir
+
+
+class TestShardedOutput:
+    """
+    Test --shard-by-category: one table per category plus an index.
+    """
+
+    def _shard(self, yaml_dir, out_dir, table_format="full", formats=("md",)):
+        return yaml_to_markdown.convert_type(
+            "controls",
+            table_format,
+            yaml_dir / "controls.yaml",
+            output_dir=out_dir,
+            quiet=True,
+            shard=True,
+            formats=formats,
+        )
+
+    def test_shards_and_index_are_written(self, categorized_dir, tmp_path):
+        """
+        Given: Controls in two categories plus one without a category
+        When: The full table is converted with sharding
+        Then: Each category gets a shard holding exactly its rows and the index links to every shard
+        """
+        out_dir = tmp_path / "out"
+
+        assert self._shard(categorized_dir, out_dir)
+
+        shard_dir = out_dir / "controls-full"
+        assert sorted(path.name for path in shard_dir.iterdir()) == [
+            "controlsData.md",
+            "controlsModel.md",
+            "uncategorized.md",
+        ]
+        lines = (shard_dir / "controlsData.md").read_text().splitlines()
+        id_column = [cell.strip() for cell in lines[0].split("|")].index("id")
+        assert [row.split("|")[id_column].strip() for row in lines[2:]] == ["controlA", "controlC"]
+        index = (out_dir / "controls-full.md").read_text()
+        assert "[Data Controls](controls-full/controlsData.md)" in index
+        assert "[uncategorized](controls-full/uncategorized.md)" in index
+
+    def test_shards_share_the_monolithic_columns(self, categorized_dir, tmp_path):
+        """
+        Given: The same corpus rendered whole and sharded
+        When: The header lines are compared
+        Then: Every shard has the monolithic table's columns
+        """
+        whole = yaml_to_markdown.yaml_to_markdown_table(categorized_dir / "controls.yaml", "controls", "full")
+        self._shard(categorized_dir, tmp_path / "out")
+
+        header = [cell.strip() for cell in whole.splitlines()[0].split("|")]
+        for shard in (tmp_path / "out" / "controls-full").iterdir():
+            assert [cell.strip() for cell in shard.read_text().splitlines()[0].split("|")] == header
+
+    def test_edit_rewrites_only_its_shard(self, categorized_dir, tmp_path):
+        """
+        Given: Sharded tables already generated
+        When: One control in controlsModel is edited and the table regenerated
+        Then: Only that category's shard is rewritten
+        """
+        out_dir = tmp_path / "out"
+        self._shard(categorized_dir, out_dir)
+        files = [out_dir / "controls-full.md", *sorted((out_dir / "controls-full").iterdir())]
+        for path in files:
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        controls_yaml = categorized_dir / "controls.yaml"
+        controls_yaml.write_text(controls_yaml.read_text().replace("description: b", "description: edited"))
+        assert self._shard(categorized_dir, out_dir)
+
+        rewritten = [path.name for path in files if path.stat().st_mtime_ns != 1_000_000_000]
+        assert rewritten == ["controlsModel.md"]
+
+    def test_removed_category_shard_is_deleted(self, categorized_dir, tmp_path):
+        """
+        Given: Sharded tables already generated
+        When: The last control without a category is removed
+        Then: Its shard is deleted and dropped from the index
+        """
+        out_dir = tmp_path / "out"
+        self._shard(categorized_dir, out_dir)
+
+        controls_yaml = categorized_dir / "controls.yaml"
+        data = yaml.safe_load(controls_yaml.read_text())
+        data["controls"] = [control for control in data["controls"] if "category" in control]
+        controls_yaml.write_text(yaml.safe_dump(data))
+        assert self._shard(categorized_dir, out_dir)
+
+        assert not (out_dir / "controls-full" / "uncategorized.md").exists()
+        assert "uncategorized" not in (out_dir / "controls-full.md").read_text()
+
+    def test_rerun_without_extra_format_keeps_its_shards(self, categorized_dir, tmp_path):
+        """
+        Given: Shards and index written as Markdown and CSV
+        When: The table is regenerated as Markdown only
+        Then: The CSV shards and index are kept, still matching each other
+        """
+        out_dir = tmp_path / "out"
+        self._shard(categorized_dir, out_dir, formats=("md", "csv"))
+        csv_files = sorted((out_dir / "controls-full").glob("*.csv")) + [out_dir / "controls-full.csv"]
+        before = {path: path.read_bytes() for path in csv_files}
+
+        self._shard(categorized_dir, out_dir)
+
+        assert {path: path.read_bytes() for path in csv_files} == before
+
+    def test_removed_category_drops_formats_not_requested(self, categorized_dir, tmp_path):
+        """
+        Given: Shards and index written as Markdown and CSV
+        When: A category disappears and the table is regenerated as Markdown only
+        Then: Every CSV shard and the CSV index are removed, so no index lists a missing shard
+        """
+        out_dir = tmp_path / "out"
+        self._shard(categorized_dir, out_dir, formats=("md", "csv"))
+
+        controls_yaml = categorized_dir / "controls.yaml"
+        data = yaml.safe_load(controls_yaml.read_text())
+        data["controls"] = [control for control in data["controls"] if "category" in control]
+        controls_yaml.write_text(yaml.safe_dump(data))
+        assert self._shard(categorized_dir, out_dir)
+
+        assert sorted(path.name for path in (out_dir / "controls-full").iterdir()) == [
+            "controlsData.md",
+            "controlsModel.md",
+        ]
+        assert not (out_dir / "controls-full.csv").exists()
+
+    def test_untitled_category_gets_humanized_id(self, categorized_dir, tmp_path):
+        """
+        Given: A category with no entry in the categories block
+        When: The sharded index is written
+        Then: Its link text is the humanized category ID without the type prefix
+        """
+        controls_yaml = categorized_dir / "controls.yaml"
+        data = yaml.safe_load(controls_yaml.read_text())
+        data["controls"][0]["category"] = "controlsRuntimeSecurity"
+        controls_yaml.write_text(yaml.safe_dump(data))
+
+        self._shard(categorized_dir, tmp_path / "out")
+
+        index = (tmp_path / "out" / "controls-full.md").read_text()
+        assert "[Runtime Security](controls-full/controlsRuntimeSecurity.md)" in index
+
+    def test_xref_tables_are_written_whole(self, categorized_dir, tmp_path):
+        """
+        Given: Sharding requested for a cross-reference table
+        When: It is converted
+        Then: The usual single file is written and no shard directory is created
+        """
+        out_dir = tmp_path / "out"
+
+        assert self._shard(categorized_dir, out_dir, "xref-risks")
+
+        assert [path.name for path in out_dir.iterdir()] == ["controls-xref-risks.md"]
+
+    def test_main_shard_flag_with_jobs(self, categorized_dir, tmp_path):
+        """
+        Given: --shard-by-category with --table and --jobs
+        When: main() runs
+        Then: The summary shards and index are written by the batch renderer
+        """
+        argv = [
+            "yaml_to_markdown.py",
+            "--table",
+            "controls:summary",
+            "--shard-by-category",
+            "--jobs",
+            "2",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--quiet",
+        ]
+        with patch("sys.argv", argv), patch("yaml_to_markdown.DEFAULT_INPUT_DIR", categorized_dir):
+            with pytest.raises(SystemExit) as exc_info:
+                yaml_to_markdown.main()
+
+        assert exc_info.value.code == 0
+        assert (tmp_path / "out" / "controls-summary.md").exists()
+        assert len(list((tmp_path / "out" / "controls-summary").glob("*.md"))) == 3
+
+
+class TestEmitFormats:
+    """
+    Test --emit: CSV and JSON Lines next to the Markdown tables.
+    """
+
+    def test_parse_emit_formats(self):
+        """
+        Given: Comma-separated format lists
+        When: parse_emit_formats() parses them
+        Then: Known formats are returned once each, in order; unknown ones are rejected
+        """
+        assert yaml_to_markdown.parse_emit_formats("csv, md,csv") == ("csv", "md")
+        with pytest.raises(argparse.ArgumentTypeError, match="valid: md, csv, jsonl"):
+            yaml_to_markdown.parse_emit_formats("md,pdf")
+        with pytest.raises(argparse.ArgumentTypeError):
+            yaml_to_markdown.parse_emit_formats(",")
+
+    def test_all_formats_written_from_one_render(self, categorized_dir, tmp_path):
+        """
+        Given: The summary table requested as md, csv and jsonl
+        When: It is converted
+        Then: The Markdown matches a Markdown-only run and the other files hold the same rows
+        """
+        controls_yaml = categorized_dir / "controls.yaml"
+        assert yaml_to_markdown.convert_type(
+            "controls", "summary", controls_yaml, output_dir=tmp_path / "md", quiet=True
+        )
+        assert yaml_to_markdown.convert_type(
+            "controls",
+            "summary",
+            controls_yaml,
+            output_dir=tmp_path / "all",
+            quiet=True,
+            formats=("md", "csv", "jsonl"),
+        )
+
+        out_dir = tmp_path / "all"
+        assert (out_dir / "controls-summary.md").read_bytes() == (
+            tmp_path / "md" / "controls-summary.md"
+        ).read_bytes()
+        csv_lines = (out_dir / "controls-summary.csv").read_text().splitlines()
+        records = [json.loads(line) for line in (out_dir / "controls-summary.jsonl").read_text().splitlines()]
+        assert csv_lines[0] == "ID,Title,Description,Category"
+        assert len(csv_lines) - 1 == len(records) == 4
+        assert records[0]["ID"] == "controlA"
+
+    def test_main_emit_with_shards(self, categorized_dir, tmp_path):
+        """
+        Given: --emit csv with --shard-by-category
+        When: main() runs
+        Then: The index and every shard are written as CSV only
+        """
+        argv = [
+            "yaml_to_markdown.py",
+            "controls",
+            "--shard-by-category",
+            "--emit",
+            "csv",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--quiet",
+        ]
+        with patch("sys.argv", argv), patch("yaml_to_markdown.DEFAULT_INPUT_DIR", categorized_dir):
+            with pytest.raises(SystemExit) as exc_info:
+                yaml_to_markdown.main()
+
+        assert exc_info.value.code == 0
+        assert [path.name for path in (tmp_path / "out").glob("*.*")] == ["controls-full.csv"]
+        assert len(list((tmp_path / "out" / "controls-full").glob("*.csv"))) == 3
+        assert not list((tmp_path / "out" / "controls-full").glob("*.md"))
+
+    def test_shard_index_names_files_outside_markdown(self, categorized_dir, tmp_path):
+        """
+        Given: Sharded output requested as Markdown, CSV and JSON Lines
+        When: The indexes are read
+        Then: Markdown links each title to its shard; CSV and JSON Lines give the title and file name
+        """
+        out_dir = tmp_path / "out"
+        yaml_to_markdown.convert_type(
+            "controls",
+            "full",
+            categorized_dir / "controls.yaml",
+            output_dir=out_dir,
+            quiet=True,
+            shard=True,
+            formats=("md", "csv", "jsonl"),
+        )
+
+        assert "[Data Controls](controls-full/controlsData.md)" in (out_dir / "controls-full.md").read_text()
+        csv_lines = (out_dir / "controls-full.csv").read_text().splitlines()
+        assert csv_lines[:2] == ["Category,ID,Entries,File", "Data Controls,controlsData,2,controlsData.csv"]
+        first = json.loads((out_dir / "controls-full.jsonl").read_text().splitlines()[0])
+        assert first == {
+            "Category": "Data Controls",
+            "ID": "controlsData",
+            "Entries": 2,
+            "File": "controlsData.jsonl",
+        }
@@ -1138,6 +1138,42 @@ class TestConvertTypeSurfacing:
             f"Expected sentinel id in error output; got stdout:\n{captured.out!r}"
         )
 
+    def test_convert_type_reports_every_unresolved_sentinel(self, tmp_path: Path, capsys):
+        """
+        Test that all unresolved sentinels in the document are reported in one error.
+
+        Given: Two risks with unresolved sentinels in different fields
+        When: convert_type renders the summary table
+        Then: Returns False and stdout names both sentinels with their field paths,
+              and no output file is written
+        """
+        _require_sentinel_module()
+
+        import yaml as _yaml
+
+        risk = {"title": "Risk", "category": "riskCatTest", "personas": [], "controls": []}
+        yaml_data = {
+            "risks": [
+                {**risk, "id": "riskOne", "shortDescription": ["See {{riskTypoOne}}."]},
+                {**risk, "id": "riskTwo", "examples": ["ok", "See {{ref:missing-ref}}."]},
+            ]
+        }
+        input_file = tmp_path / "risks.yaml"
+        input_file.write_text(_yaml.dump(yaml_data), encoding="utf-8")
+        _write_sibling_yamls(tmp_path)
+        output_file = tmp_path / "out.md"
+
+        result = _ytm.convert_type(
+            ytype="risks", table_format="summary", input_file=input_file, output_file=output_file
+        )
+        captured = capsys.readouterr()
+
+        assert result is False
+        assert "2 unresolved sentinel(s)" in captured.out
+        assert "risks[0].shortDescription[0]: {{riskTypoOne}}" in captured.out
+        assert "risks[1].examples[1]: {{ref:missing-ref}}" in captured.out
+        assert not output_file.exists()
+
 
 # ============================================================================
 # TestExternalReferencesIntegration
@@ -1773,7 +1809,7 @@ class TestPerEntryRefLookupCollision:
 Test Summary
 ============
 Total test classes: 7
-Total tests:        41
+Total tests:        42
 
 - TestCollapseColumnSentinelExpansion (13):
     plain text passthrough (no kwargs), newlines normalised (no kwargs),
@@ -1799,9 +1835,10 @@ Total tests:        41
     ref typo in description raises, field_path names entry+field,
     SummaryTableGenerator also propagates error
 
-- TestConvertTypeSurfacing (2):
+- TestConvertTypeSurfacing (3):
     convert_type returns False on unresolved sentinel,
-    error message stdout contains sentinel id
+    error message stdout contains sentinel id,
+    every unresolved sentinel in the document reported together
 
 - TestExternalReferencesIntegration (5):
     single risk with refs → sub-section with two bullets,
@@ -194,34 +194,59 @@ def compare_control_maps(controls: dict[str, str | list[str]], risks: dict[str,
         - controls.yaml explicitly lists which risks each control addresses
         - risks.yaml lists which controls address each risk (reverse mapping)
         - These two perspectives must be consistent
+
+    The check is the symmetric difference of the two (control_id, risk_id)
+    relations, computed per control so identical rows cost one list comparison.
+    Only controls that appear in the difference (or in just one file) are
+    visited to build diagnostics, so the check is linear in the number of
+    mappings. Errors are reported in controls.yaml order, then risks.yaml order
+    for controls missing from controls.yaml.
     """
     errors = []
 
-    # Get all control IDs mentioned in either file
-    all_control_ids = set(controls.keys()) | set(risks.keys())
-
-    # Identify universal controls (those with risks="all")
-    universal_controls = {
-        control_id for control_id, risks_value in controls.items() if is_universal_control(risks_value)
-    }
-
-    # Check if any risks explicitly list universal controls
-    if universal_controls:
-        for control_id in universal_controls:
-            if control_id in risks:
-                # risks[control_id] = list of risk IDs that reference this control
-                violating_risks = risks[control_id]
-                for risk_id in violating_risks:
-                    errors.append(
-                        f"[ISSUE: risks.yaml] "
-                        f"Risk '{risk_id}' explicitly lists universal control '{control_id}' "
-                        f"in its 'controls' field.\n\tUniversal controls (those with 'risks: all' "
-                        f"in controls.yaml) apply implicitly to all risks and should NOT be "
-                        f"explicitly listed.\n\tACTION: Please remove '{control_id}' from the 'controls' "
-                        f"list for risk '{risk_id}'."
-                    )
-
-    for control_id in all_control_ids:
+    # Check if any risks explicitly list universal controls (those with risks="all")
+    for control_id, risks_value in controls.items():
+        if is_universal_control(risks_value) and control_id in risks:
+            # risks[control_id] = list of risk IDs that reference this control
+            for risk_id in risks[control_id]:
+                errors.append(
+                    f"[ISSUE: risks.yaml] "
+                    f"Risk '{risk_id}' explicitly lists universal control '{control_id}' "
+                    f"in its 'controls' field.\n\tUniversal controls (those with 'risks: all' "
+                    f"in controls.yaml) apply implicitly to all risks and should NOT be "
+                    f"explicitly listed.\n\tACTION: Please remove '{control_id}' from the 'controls' "
+                    f"list for risk '{risk_id}'."
+                )
+
+    # Symmetric difference of the (control, risk) relations, partitioned by control.
+    # Pairs of controls present in only one file are reported via Cases 1/2 below,
+    # and rows whose lists are identical cancel out without building any sets.
+    # "all"/"none" rows are handled by the universal check and the skip logic.
+    missing_from_risks_yaml: dict[str, set[str]] = {}
+    extra_in_risks_yaml: dict[str, set[str]] = {}
+    for control_id in controls.keys() & risks.keys():
+        claimed = controls[control_id]
+        referenced = risks[control_id]
+        if not isinstance(claimed, list) or claimed == referenced:
+            continue
+        claimed_set = set(claimed)
+        referenced_set = set(referenced)
+        if claimed_set == referenced_set:
+            continue
+        if missing := claimed_set - referenced_set:
+            missing_from_risks_yaml[control_id] = missing
+        if extra := referenced_set - claimed_set:
+            extra_in_risks_yaml[control_id] = extra
+
+    # Controls needing a diagnostic: present in only one file, or with mismatched pairs
+    flagged = controls.keys() ^ risks.keys()
+    flagged |= missing_from_risks_yaml.keys() | extra_in_risks_yaml.keys()
+    ordered_control_ids = [control_id for control_id in controls if control_id in flagged]
+    ordered_control_ids += [
+        control_id for control_id in risks if control_id in flagged and control_id not in controls
+    ]
+
+    for control_id in ordered_control_ids:
         # Get risk lists from both perspectives
         risks_per_control_yaml = controls.get(control_id, [])  # What controls.yaml says
         risks_per_risks_yaml = risks.get(control_id, [])  # What we derive from risks.yaml
@@ -231,7 +256,7 @@ def compare_control_maps(controls: dict[str, str | list[str]], risks: dict[str,
             continue
 
         # Case 1: Control in controls.yaml but not referenced in risks.yaml
-        if control_id in controls and control_id not in risks:
+        if control_id not in risks:
             errors.append(
                 f"[ISSUE: risks.yaml] "
                 f"Control '{control_id}' lists risks '{risks_per_control_yaml}' in controls.yaml, "
@@ -240,7 +265,7 @@ def compare_control_maps(controls: dict[str, str | list[str]], risks: dict[str,
             continue
 
         # Case 2: Control referenced in risks.yaml but missing from controls.yaml
-        if control_id not in controls and control_id in risks:
+        if control_id not in controls:
             errors.append(
                 f"[ISSUE: controls.yaml] "
                 f"Control '{control_id}' is referenced by risks '{risks_per_risks_yaml}' in risks.yaml, "
@@ -248,31 +273,25 @@ def compare_control_maps(controls: dict[str, str | list[str]], risks: dict[str,
             )
             continue
 
-        # Case 3: Control exists in both but risk lists don't match
-        # Skip if control has special keyword (already handled above)
-        if isinstance(risks_per_control_yaml, str):
-            # Special keywords "all"/"none" handled by skip logic or universal check
+        # Case 3: Control exists in both but risk sets differ.
+        # Special keywords "all"/"none" are handled by skip logic or universal check.
+        if not isinstance(risks_per_control_yaml, list):
             continue
 
-        # Safe to compare - both are lists
-        if sorted(risks_per_control_yaml) != sorted(risks_per_risks_yaml):
-            missing_from_risks_yaml = set(risks_per_control_yaml) - set(risks_per_risks_yaml)
-            extra_in_risks_yaml = set(risks_per_risks_yaml) - set(risks_per_control_yaml)
-
-            if missing_from_risks_yaml:
-                errors.append(
-                    f"[ISSUE: risks.yaml] "
-                    f"Control '{control_id}' claims to address risks '{sorted(missing_from_risks_yaml)}' "
-                    f"in controls.yaml, but the risk(s) don't list this control in their 'controls' "
-                    f"section in risks.yaml"
-                )
+        if control_id in missing_from_risks_yaml:
+            errors.append(
+                f"[ISSUE: risks.yaml] "
+                f"Control '{control_id}' claims to address risks '{sorted(missing_from_risks_yaml[control_id])}' "
+                f"in controls.yaml, but the risk(s) don't list this control in their 'controls' "
+                f"section in risks.yaml"
+            )
 
-            if extra_in_risks_yaml:
-                errors.append(
-                    f"[ISSUE: controls.yaml] "
-                    f"Risks {sorted(extra_in_risks_yaml)} reference control '{control_id}' in risks.yaml, "
-                    f"but this control doesn't list these risks in its 'risks' section in controls.yaml"
-                )
+        if control_id in extra_in_risks_yaml:
+            errors.append(
+                f"[ISSUE: controls.yaml] "
+                f"Risks {sorted(extra_in_risks_yaml[control_id])} reference control '{control_id}' in risks.yaml, "
+                f"but this control doesn't list these risks in its 'risks' section in controls.yaml"
+            )
 
     return errors
 
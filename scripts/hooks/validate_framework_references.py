@@ -10,6 +10,9 @@ This script validates that:
 - Deprecated persona usage is flagged with warnings
 - Identifies any framework references to non-existent frameworks
 
+All checks run as set operations over one ReferenceGraph built from the four
+YAML files; the dict-based functions below build a graph for one-off use.
+
 Only runs when framework-related YAML files are modified in the commit.
 Provides -f/--force option to run validation regardless of git status.
 """
@@ -21,6 +24,16 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from riskmap_validator.reference_graph import (
+    CONTROL_FRAMEWORK,
+    CONTROL_PERSONA,
+    FRAMEWORK,
+    PERSONA,
+    PERSONA_FRAMEWORK,
+    RISK_FRAMEWORK,
+    RISK_PERSONA,
+    ReferenceGraph,
+)
 
 
 def get_staged_yaml_files(force_check: bool = False) -> list[Path]:
@@ -202,27 +215,33 @@ def validate_framework_references(
     Returns:
         List of error messages (empty if all valid)
     """
-    errors = []
+    graph = ReferenceGraph()
+    graph.add_nodes(FRAMEWORK, valid_framework_ids)
+    graph.add_adjacency(RISK_FRAMEWORK, risk_frameworks)
+    graph.add_adjacency(CONTROL_FRAMEWORK, control_frameworks)
 
-    # Validate risk framework references
-    for risk_id, framework_ids in risk_frameworks.items():
-        for framework_id in framework_ids:
-            if framework_id not in valid_framework_ids:
-                errors.append(
-                    f"[ISSUE: frameworks.yaml] "
-                    f"Risk '{risk_id}' references framework '{framework_id}' "
-                    f"which does not exist in frameworks.yaml"
-                )
+    return framework_reference_errors(graph)
 
-    # Validate control framework references
-    for control_id, framework_ids in control_frameworks.items():
-        for framework_id in framework_ids:
-            if framework_id not in valid_framework_ids:
-                errors.append(
-                    f"[ISSUE: frameworks.yaml] "
-                    f"Control '{control_id}' references framework '{framework_id}' "
-                    f"which does not exist in frameworks.yaml"
-                )
+
+def framework_reference_errors(graph: ReferenceGraph) -> list[str]:
+    """
+    Report risk/control framework references that are not framework nodes.
+
+    Args:
+        graph: Reference graph holding framework nodes and entity→framework relations
+
+    Returns:
+        Same errors as validate_framework_references()
+    """
+    errors = []
+
+    for entity_label, relation in (("Risk", RISK_FRAMEWORK), ("Control", CONTROL_FRAMEWORK)):
+        for entity_id, framework_id in graph.dangling(relation, FRAMEWORK):
+            errors.append(
+                f"[ISSUE: frameworks.yaml] "
+                f"{entity_label} '{entity_id}' references framework '{framework_id}' "
+                f"which does not exist in frameworks.yaml"
+            )
 
     return errors
 
@@ -243,39 +262,42 @@ def validate_framework_applicability(
     Returns:
         List of error messages (empty if all valid)
     """
-    errors = []
+    graph = ReferenceGraph()
+    for framework_id, applicable_to in frameworks_applicability.items():
+        graph.add_framework(framework_id, applicable_to)
+    graph.add_adjacency(RISK_FRAMEWORK, risk_frameworks)
+    graph.add_adjacency(CONTROL_FRAMEWORK, control_frameworks)
 
-    # Validate control framework applicability
-    for control_id, framework_ids in control_frameworks.items():
-        for framework_id in framework_ids:
-            # Skip frameworks not in applicability dict (validated by validate_framework_references)
-            if framework_id not in frameworks_applicability:
-                continue
+    return framework_applicability_errors(graph)
 
-            applicable_to = frameworks_applicability[framework_id]
-            # Check if "controls" is in the applicableTo array
-            if "controls" not in applicable_to:
-                errors.append(
-                    f"[ISSUE: frameworks.yaml] "
-                    f"Control '{control_id}' references framework '{framework_id}' "
-                    f"which is not applicable to controls (applicableTo: {applicable_to})"
-                )
 
-    # Validate risk framework applicability
-    for risk_id, framework_ids in risk_frameworks.items():
-        for framework_id in framework_ids:
-            # Skip frameworks not in applicability dict (validated by validate_framework_references)
-            if framework_id not in frameworks_applicability:
-                continue
+def framework_applicability_errors(graph: ReferenceGraph) -> list[str]:
+    """
+    Report control/risk references to frameworks whose applicableTo excludes them.
 
-            applicable_to = frameworks_applicability[framework_id]
-            # Check if "risks" is in the applicableTo array
-            if "risks" not in applicable_to:
-                errors.append(
-                    f"[ISSUE: frameworks.yaml] "
-                    f"Risk '{risk_id}' references framework '{framework_id}' "
-                    f"which is not applicable to risks (applicableTo: {applicable_to})"
-                )
+    Frameworks without applicableTo, and unknown frameworks, are skipped; the
+    latter are reported by framework_reference_errors().
+
+    Args:
+        graph: Reference graph holding framework.applicableTo and entity→framework relations
+
+    Returns:
+        Same errors as validate_framework_applicability()
+    """
+    errors = []
+    frameworks = graph.nodes(FRAMEWORK)
+
+    for entity_label, relation, entity_type in (
+        ("Control", CONTROL_FRAMEWORK, "controls"),
+        ("Risk", RISK_FRAMEWORK, "risks"),
+    ):
+        for entity_id, framework_id in graph.inapplicable(relation, entity_type):
+            applicable_to = frameworks[framework_id]["applicableTo"]
+            errors.append(
+                f"[ISSUE: frameworks.yaml] "
+                f"{entity_label} '{entity_id}' references framework '{framework_id}' "
+                f"which is not applicable to {entity_type} (applicableTo: {applicable_to})"
+            )
 
     return errors
 
@@ -318,27 +340,36 @@ def validate_persona_framework_applicability(
     Returns:
         List of error messages for any non-applicable framework references
     """
-    errors = []
+    graph = ReferenceGraph()
+    graph.add_frameworks(frameworks_data)
+    graph.add_adjacency(PERSONA_FRAMEWORK, persona_frameworks)
 
-    # Build applicability lookup from frameworks data
-    frameworks_applicability = {}
-    if frameworks_data and "frameworks" in frameworks_data:
-        for framework in frameworks_data["frameworks"]:
-            fw_id = framework.get("id")
-            if fw_id:
-                frameworks_applicability[fw_id] = framework.get("applicableTo", [])
-
-    for persona_id, framework_ids in persona_frameworks.items():
-        for framework_id in framework_ids:
-            if framework_id not in frameworks_applicability:
-                errors.append(f"Persona '{persona_id}' references framework '{framework_id}' which does not exist")
-                continue
-            applicable_to = frameworks_applicability[framework_id]
-            if "personas" not in applicable_to:
-                errors.append(
-                    f"Persona '{persona_id}' references framework '{framework_id}' "
-                    f"which is not applicable to personas"
-                )
+    return persona_framework_applicability_errors(graph)
+
+
+def persona_framework_applicability_errors(graph: ReferenceGraph) -> list[str]:
+    """
+    Report persona references to unknown frameworks or frameworks not applicable to personas.
+
+    A framework without applicableTo is treated as applicable to nothing.
+
+    Args:
+        graph: Reference graph holding framework nodes/applicability and persona.framework
+
+    Returns:
+        Same errors as validate_persona_framework_applicability()
+    """
+    unknown = set(graph.dangling(PERSONA_FRAMEWORK, FRAMEWORK))
+    not_applicable = set(graph.inapplicable(PERSONA_FRAMEWORK, "personas", require_declared=True))
+
+    errors = []
+    for persona_id, framework_id in graph.pairs(PERSONA_FRAMEWORK):
+        if (persona_id, framework_id) in unknown:
+            errors.append(f"Persona '{persona_id}' references framework '{framework_id}' which does not exist")
+        elif (persona_id, framework_id) in not_applicable:
+            errors.append(
+                f"Persona '{persona_id}' references framework '{framework_id}' which is not applicable to personas"
+            )
     return errors
 
 
@@ -357,33 +388,31 @@ def check_deprecated_persona_usage(
     Returns:
         List of warning messages for deprecated persona usage
     """
-    warnings = []
+    return deprecated_persona_warnings(
+        ReferenceGraph.from_corpus(personas=personas_data, controls=controls_data, risks=risks_data)
+    )
+
+
+def deprecated_persona_warnings(graph: ReferenceGraph) -> list[str]:
+    """
+    Report control/risk persona references that land on deprecated persona nodes.
 
-    # Build set of deprecated persona IDs
-    deprecated_personas = set()
-    if personas_data and "personas" in personas_data:
-        for persona in personas_data["personas"]:
-            if persona.get("deprecated", False):
-                persona_id = persona.get("id")
-                if persona_id:
-                    deprecated_personas.add(persona_id)
+    Args:
+        graph: Reference graph holding persona nodes and control/risk.persona relations
 
+    Returns:
+        Same warnings as check_deprecated_persona_usage()
+    """
+    deprecated_personas = {
+        persona_id for persona_id, attrs in graph.nodes(PERSONA).items() if attrs.get("deprecated")
+    }
     if not deprecated_personas:
-        return warnings
-
-    # Check controls
-    if controls_data and "controls" in controls_data:
-        for control in controls_data["controls"]:
-            for persona_id in control.get("personas", []):
-                if persona_id in deprecated_personas:
-                    warnings.append(f"Control '{control.get('id')}' uses deprecated persona '{persona_id}'")
-
-    # Check risks
-    if risks_data and "risks" in risks_data:
-        for risk in risks_data["risks"]:
-            for persona_id in risk.get("personas", []):
-                if persona_id in deprecated_personas:
-                    warnings.append(f"Risk '{risk.get('id')}' uses deprecated persona '{persona_id}'")
+        return []
+
+    warnings = []
+    for entity_label, relation in (("Control", CONTROL_PERSONA), ("Risk", RISK_PERSONA)):
+        for entity_id, persona_id in graph.references_to(relation, deprecated_personas):
+            warnings.append(f"{entity_label} '{entity_id}' uses deprecated persona '{persona_id}'")
 
     return warnings
 
@@ -467,11 +496,14 @@ def validate_frameworks(file_paths: list[Path], block_deprecated_personas: bool
     # Validate framework consistency first
     consistency_errors = validate_framework_consistency(frameworks_yaml_data)
 
-    # Extract framework IDs
-    valid_framework_ids = extract_framework_ids(frameworks_yaml_data)
-
-    # Extract framework applicability
-    frameworks_applicability = extract_framework_applicability(frameworks_yaml_data)
+    # One graph build serves every reference check below
+    graph = ReferenceGraph.from_corpus(
+        frameworks=frameworks_yaml_data,
+        risks=risks_yaml_data,
+        controls=controls_yaml_data,
+        personas=personas_yaml_data,
+    )
+    valid_framework_ids = graph.nodes(FRAMEWORK).keys()
 
     if not valid_framework_ids:
         print("  ℹ️  No frameworks found in frameworks.yaml - skipping reference validation")
@@ -482,26 +514,22 @@ def validate_frameworks(file_paths: list[Path], block_deprecated_personas: bool
             return False
         return True
 
-    # Extract framework references from risks, controls, and personas
-    risk_frameworks = extract_risk_framework_references(risks_yaml_data)
-    control_frameworks = extract_control_framework_references(controls_yaml_data)
-    persona_frameworks = extract_persona_framework_references(personas_yaml_data)
+    # Entities with framework mappings, for the summary below
+    risk_frameworks = graph.adjacency(RISK_FRAMEWORK)
+    control_frameworks = graph.adjacency(CONTROL_FRAMEWORK)
+    persona_frameworks = graph.adjacency(PERSONA_FRAMEWORK)
 
     # Validate references
-    reference_errors = validate_framework_references(valid_framework_ids, risk_frameworks, control_frameworks)
+    reference_errors = framework_reference_errors(graph)
 
     # Validate applicability for controls and risks
-    applicability_errors = validate_framework_applicability(
-        frameworks_applicability, risk_frameworks, control_frameworks
-    )
+    applicability_errors = framework_applicability_errors(graph)
 
     # Validate persona framework applicability
-    persona_applicability_errors = validate_persona_framework_applicability(
-        frameworks_yaml_data, persona_frameworks
-    )
+    persona_applicability_errors = persona_framework_applicability_errors(graph)
 
     # Check for deprecated persona usage (warnings only, don't fail validation)
-    deprecation_warnings = check_deprecated_persona_usage(personas_yaml_data, controls_yaml_data, risks_yaml_data)
+    deprecation_warnings = deprecated_persona_warnings(graph)
 
     # Report results
     success = True
@@ -3,7 +3,9 @@
 Validate GitHub config files using check-jsonschema.
 
 This script validates GitHub YAML config files against official schemas
-to ensure they conform to the expected structure.
+to ensure they conform to the expected structure. The schemas are the copies
+bundled with check-jsonschema, loaded in-process: each is compiled once per
+run and shared by every file it validates, and nothing is downloaded.
 
 Validates:
 - Issue form templates against vendor.github-issue-forms schema
@@ -23,7 +25,15 @@ Usage:
 import argparse
 import subprocess
 import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # check-jsonschema (and jsonschema, ruamel.yaml under it) is imported where
+    # a file is first validated, so a hook run with nothing to validate stays cheap.
+    import jsonschema
+    from check_jsonschema.parsers import ParserSet
 
 
 def parse_args() -> argparse.Namespace:
@@ -147,9 +157,70 @@ def get_template_files(
         return (issue_forms, config_file if config_exists else None)
 
 
+@cache
+def _schema_validator(schema: str) -> "jsonschema.protocols.Validator":
+    """
+    Compile a check-jsonschema builtin schema once per run.
+
+    Uses the CLI's defaults for `--builtin-schema`: format checking enabled and
+    ECMAScript regex semantics for `pattern` keywords.
+    """
+    from check_jsonschema.formats import FormatOptions
+    from check_jsonschema.regex_variants import RegexImplementation, RegexVariantName
+    from check_jsonschema.schema_loader import BuiltinSchemaLoader
+
+    regex_impl = RegexImplementation(RegexVariantName.default)
+    return BuiltinSchemaLoader(schema).get_validator(
+        schema, {}, FormatOptions(regex_impl=regex_impl), regex_impl, False
+    )
+
+
+@cache
+def _parsers() -> "ParserSet":
+    """Return check-jsonschema's file parsers, so YAML loads exactly as the CLI loads it."""
+    from check_jsonschema.parsers import ParserSet
+
+    return ParserSet()
+
+
+def schema_errors(file_path: Path, schema: str) -> list[str]:
+    """
+    Validate a file against a GitHub schema and describe what is wrong with it.
+
+    Args:
+        file_path: Path to file to validate
+        schema: Schema name ('vendor.github-issue-forms', 'vendor.github-issue-config',
+            or 'vendor.dependabot')
+
+    Returns:
+        One line per parse or validation error, in check-jsonschema's
+        `<json path>: <message>` form; empty if the file is valid.
+
+    Raises:
+        ImportError: If check-jsonschema is not installed.
+    """
+    from check_jsonschema.parsers import ParseError
+    from jsonschema.exceptions import best_match
+
+    try:
+        document = _parsers().parse_file(file_path, "yaml")
+    except ParseError as e:
+        cause = e.__cause__ or e
+        details = f"{type(cause).__name__}: {cause}".splitlines()
+        return [f"Failed to parse {file_path.name}", *(line.rstrip() for line in details)]
+
+    errors = []
+    for error in _schema_validator(schema).iter_errors(document):
+        errors.append(f"{error.json_path}: {error.message}")
+        if error.context:
+            match = best_match(error.context)
+            errors.append(f"  Best match: {match.json_path}: {match.message}")
+    return errors
+
+
 def validate_with_schema(file_path: Path, schema: str, quiet: bool = False) -> bool:
     """
-    Validate a file against a GitHub schema using check-jsonschema.
+    Validate a file against a GitHub schema using check-jsonschema's bundled copy.
 
     Args:
         file_path: Path to file to validate
@@ -161,43 +232,28 @@ def validate_with_schema(file_path: Path, schema: str, quiet: bool = False) -> b
         True if validation passed, False otherwise
     """
     try:
-        # Run check-jsonschema subprocess
-        result = subprocess.run(
-            ["check-jsonschema", "--builtin-schema", schema, str(file_path)],
-            capture_output=True,
-            text=True,
-            timeout=30,  # 30s timeout allows for schema download and validation
-        )
-
-        if result.returncode == 0:
-            if not quiet:
-                print(f"   ✅ {file_path.name} passed validation")
-            return True
-        else:
-            # Validation failed - show error details
-            print(f"   ❌ {file_path.name} failed validation")
-            if result.stderr:
-                # Indent error output for readability
-                for line in result.stderr.strip().split("\n"):
-                    print(f"      {line}")
-            return False
-
-    except FileNotFoundError:
+        errors = schema_errors(file_path, schema)
+    except ImportError:
         # check-jsonschema not installed
         print("   ❌ check-jsonschema not found")
         print("      Install with: pip install check-jsonschema")
         return False
-
-    except subprocess.TimeoutExpired:
-        # Validation took too long
-        print(f"   ❌ {file_path.name} validation timeout")
-        return False
-
     except Exception as e:
-        # Unexpected error during validation
+        # Unreadable file or unusable schema
         print(f"   ❌ {file_path.name} validation error: {e}")
         return False
 
+    if not errors:
+        if not quiet:
+            print(f"   ✅ {file_path.name} passed validation")
+        return True
+
+    # Validation failed - show error details, indented for readability
+    print(f"   ❌ {file_path.name} failed validation")
+    for line in errors:
+        print(f"      {line}")
+    return False
+
 
 def main() -> int:
     """
@@ -20,6 +20,9 @@ Options:
     --quiet, -q         Minimal output
     --debug             Include debug annotations in graphs
     --mermaid-format    Save additional .mermaid format files
+    --json-format       Save additional compact JSON node-link (.json) files
+    --gzip              Gzip the JSON node-link output (.json.gz)
+    --dot-format        Save additional Graphviz DOT (.dot) files
 """
 
 import argparse
@@ -34,9 +37,9 @@ from riskmap_validator.graphing import ComponentGraph, ControlGraph, RiskGraph
 from riskmap_validator.utils import get_staged_yaml_files, parse_controls_yaml, parse_risks_yaml
 from riskmap_validator.validator import (
     ComponentEdgeValidator,
-    check_category_subcategory_nesting,
-    check_controls_components_mirror,
+    category_subcategory_nesting_warnings,
     check_lifecycle_stage_order_uniqueness,
+    controls_components_mirror_warnings,
 )
 
 
@@ -57,6 +60,8 @@ Examples:
   %(prog)s --to-controls-graph controls.md          # Output control-to-component graph
   %(prog)s --to-risk-graph risk.md                  # Output risk-to-control-to-component graph
   %(prog)s --to-graph graph.md --mermaid-format     # Output both .md and .mermaid formats
+  %(prog)s --to-graph graph.md --json-format --gzip # Also output graph.json.gz (node-link)
+  %(prog)s --to-risk-graph risk.md --dot-format     # Also output risk.dot (Graphviz)
   %(prog)s --quiet                                  # Minimal output
   %(prog)s --help                                   # Show this help
 
@@ -125,6 +130,25 @@ Exit Codes:
         help="Save graphs in '.mermaid' format in addition to markdown code block",
     )
 
+    parser.add_argument(
+        "--json-format",
+        "-j",
+        action="store_true",
+        help="Save graphs as compact JSON node-link files ('.json') in addition to markdown code block",
+    )
+
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the JSON node-link output ('.json.gz'); implies --json-format",
+    )
+
+    parser.add_argument(
+        "--dot-format",
+        action="store_true",
+        help="Save graphs in Graphviz '.dot' format in addition to markdown code block",
+    )
+
     parser.add_argument(
         "--mode",
         choices=["default", "lifecycle"],
@@ -139,6 +163,27 @@ Exit Codes:
     return parser.parse_args()
 
 
+def _write_structured_formats(graph, output_path: Path, args: argparse.Namespace) -> None:
+    """
+    Write the optional JSON node-link and DOT exports next to a graph output file.
+
+    Args:
+        graph: Built ComponentGraph, ControlGraph or RiskGraph
+        output_path: The markdown output path; exports reuse its stem
+        args: Parsed CLI arguments carrying the format flags
+    """
+    if args.json_format or args.gzip:
+        json_file = output_path.with_suffix(".json.gz" if args.gzip else ".json")
+        graph.write_json(json_file, compress=args.gzip)
+        print(f"   JSON node-link format saved to {json_file}")
+
+    if args.dot_format:
+        dot_file = output_path.with_suffix(".dot")
+        with open(dot_file, "w", encoding="utf-8") as f:
+            f.write(graph.to_dot())
+        print(f"   DOT format saved to {dot_file}")
+
+
 def _run_lifecycle_mode(args: argparse.Namespace) -> int:
     """
     Run the dedicated lifecycle-stage order-uniqueness short-circuit.
@@ -291,9 +336,9 @@ def main() -> None:
             # rather than crashing the script. SystemExit is excluded so the
             # block-mode exit below propagates correctly.
             try:
-                controls = parse_controls_yaml(controls_path)
-                component_ids = set(validator.components.keys())
-                mirror_warnings = check_controls_components_mirror(controls, component_ids)
+                # Reuse the reference graph built during edge validation
+                validator.graph.add_controls(parse_controls_yaml(controls_path))
+                mirror_warnings = controls_components_mirror_warnings(validator.graph)
                 if mirror_warnings:
                     label = "❌" if args.block else "⚠️"
                     print(f"   {label} Controls↔components mirror check found {len(mirror_warnings)} issue(s):")
@@ -324,9 +369,8 @@ def main() -> None:
                     category_to_subcategories[_cat_id] = {
                         _sub.get("id") for _sub in _cat.get("subcategory", []) if isinstance(_sub.get("id"), str)
                     }
-                nesting_warnings = check_category_subcategory_nesting(
-                    validator.components, category_to_subcategories
-                )
+                validator.graph.add_category_nesting(category_to_subcategories)
+                nesting_warnings = category_subcategory_nesting_warnings(validator.graph)
                 if nesting_warnings:
                     label = "❌" if args.block else "⚠️"
                     print(f"   {label} Category/subcategory nesting check found {len(nesting_warnings)} issue(s):")
@@ -364,6 +408,8 @@ def main() -> None:
                     with open(mermaid_file, "w", encoding="utf-8") as f:
                         f.write(mermaid_output)
                     print(f"   Mermaid format saved to {mermaid_file}")
+
+                _write_structured_formats(graph, args.to_graph, args)
             except Exception as e:
                 print(f"⚠️  Failed to generate graph: {e}")
 
@@ -388,6 +434,8 @@ def main() -> None:
                     with open(mermaid_file, "w", encoding="utf-8") as f:
                         f.write(mermaid_output)
                     print(f"   Mermaid format saved to {mermaid_file}")
+
+                _write_structured_formats(control_graph, args.to_controls_graph, args)
             except Exception as e:
                 print(f"⚠️  Failed to generate controls graph: {e}")
 
@@ -413,6 +461,8 @@ def main() -> None:
                     with open(mermaid_file, "w", encoding="utf-8") as f:
                         f.write(mermaid_output)
                     print(f"   Mermaid format saved to {mermaid_file}")
+
+                _write_structured_formats(risk_graph, args.to_risk_graph, args)
             except Exception as e:
                 print(f"⚠️  Failed to generate risk graph: {e}")
 
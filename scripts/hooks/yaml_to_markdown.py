@@ -16,15 +16,19 @@ Usage:
     python yaml_to_markdown.py controls --format summary     # Summary table
     python yaml_to_markdown.py controls --format xref-risks  # Cross-reference table
     python yaml_to_markdown.py --all --format full           # All types, full format
+    python yaml_to_markdown.py --all --all-formats --jobs 0  # Every table, one worker per CPU
 """
 
 import argparse
+import os
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
-import pandas as pd
 import yaml
 
 # Ensure repo root is on sys.path so scripts.hooks._sentinel_expansion resolves
@@ -33,19 +37,46 @@ _REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
-from scripts.hooks._sentinel_expansion import expand_sentinels_to_text  # noqa: E402
+from scripts.hooks._identifiers import humanize_identifier  # noqa: E402
+from scripts.hooks._sentinel_expansion import (  # noqa: E402
+    build_intra_lookup,
+    check_sentinels,
+    expand_sentinels_to_text,
+)
+from scripts.hooks._sentinel_expansion import build_ref_lookup as _build_ref_lookup  # noqa: E402
+from scripts.hooks._table_ir import EMITTERS, Table, emit_table, emitter_paths, markdown_lines  # noqa: E402
 
 # Configuration: easily modifiable paths
 DEFAULT_INPUT_DIR = Path("risk-map/yaml")
 DEFAULT_OUTPUT_DIR = Path("risk-map/tables")
 INPUT_FILE_PATTERN = "{type}.yaml"  # e.g., "components.yaml"
 OUTPUT_FILE_PATTERN = "{type}-{format}.md"  # e.g., "controls-summary.md"
+VALID_TYPES = ("components", "controls", "risks", "personas")
+SHARD_FILE_PATTERN = "{category}.md"  # e.g., "risks-full/risksRuntimeDataSecurity.md"
+UNCATEGORIZED = "uncategorized"  # shard for entries without a category
+PROSE_FORMATS = ("full", "summary")  # formats that expand sentinels in prose fields
+
+
+def _is_missing(value) -> bool:
+    """
+    Return True for None and NaN-like scalars.
+
+    Parsed YAML only yields None and float NaN. pandas NA/NaT can reach the
+    public formatters solely from external callers that pass DataFrame values.
+    """
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        # NA from an external caller compares to NA, whose truth value is ambiguous
+        return True
 
 
 def format_edges(edges: dict | None) -> str:
     """Format edges dictionary into readable markdown."""
-    # Handle pandas NaN values - check type first to avoid array ambiguity
-    if not isinstance(edges, dict) and pd.isna(edges):
+    # Handle missing (None/NaN) values - check type first to avoid array ambiguity
+    if not isinstance(edges, dict) and _is_missing(edges):
         return ""
 
     if not edges or not isinstance(edges, dict):
@@ -73,8 +104,8 @@ def format_list(entry, prefix: str = "") -> str:
     Returns:
         HTML-formatted string with items separated by <br>
     """
-    # Handle pandas NaN values - check type first to avoid array ambiguity
-    if not isinstance(entry, list) and pd.isna(entry):
+    # Handle missing (None/NaN) values - check type first to avoid array ambiguity
+    if not isinstance(entry, list) and _is_missing(entry):
         return ""
 
     if not entry or not isinstance(entry, list):
@@ -89,8 +120,8 @@ def format_list(entry, prefix: str = "") -> str:
 
 def format_dict(entry) -> str:
     """Format dictionary entries with HTML formatting."""
-    # Handle pandas NaN values - check type first to avoid array ambiguity
-    if not isinstance(entry, dict) and pd.isna(entry):
+    # Handle missing (None/NaN) values - check type first to avoid array ambiguity
+    if not isinstance(entry, dict) and _is_missing(entry):
         return ""
 
     if not entry or not isinstance(entry, dict):
@@ -110,8 +141,8 @@ def format_dict(entry) -> str:
 
 def format_mappings(entry) -> str:
     """Format mappings dictionary for metadata fields."""
-    # Handle pandas NaN values - check type first to avoid array ambiguity
-    if not isinstance(entry, dict) and pd.isna(entry):
+    # Handle missing (None/NaN) values - check type first to avoid array ambiguity
+    if not isinstance(entry, dict) and _is_missing(entry):
         return ""
 
     if not entry or not isinstance(entry, dict):
@@ -166,16 +197,6 @@ def _references_bullets_only(refs: list[dict] | None) -> str:
     return rendered
 
 
-def _build_ref_lookup(entry: dict) -> dict[str, dict]:
-    """Build a ref-id -> {"title", "url"} map from a single entity's externalReferences.
-
-    Per ADR-016 D6 rule 3, ref-id resolution scope is per-entry: a ref id
-    declared on one entry must not resolve from a sibling entry's
-    externalReferences. Mirrors scripts/build_persona_site_data.py's helper.
-    """
-    return {ref["id"]: {"title": ref["title"], "url": ref["url"]} for ref in entry.get("externalReferences", [])}
-
-
 def collapse_column(
     entry,
     *,
@@ -198,8 +219,8 @@ def collapse_column(
         ref_lookup: ref-id -> {title, url} map; None means no expansion
         field_path: location string for error messages (e.g. "risks[0].longDescription[0]")
     """
-    # Handle pandas NaN values - check type first to avoid array ambiguity
-    if not isinstance(entry, (str, list)) and pd.isna(entry):
+    # Handle missing (None/NaN) values - check type first to avoid array ambiguity
+    if not isinstance(entry, (str, list)) and _is_missing(entry):
         return ""
 
     # Assemble raw text before any HTML conversion, then optionally expand sentinels.
@@ -230,12 +251,26 @@ def collapse_column(
 # ============================================================================
 
 
+def _reference_sections(sorted_entries: Iterable[dict]) -> Iterator[str]:
+    """Yield a "## References for {id}" sub-section for each entry with externalReferences."""
+    for entry in sorted_entries:
+        refs = entry.get("externalReferences")
+        if refs:
+            yield f"\n## References for {entry['id']}\n{_references_bullets_only(refs)}"
+
+
 class TableGenerator(ABC):
     """
     Base class for table generation strategies.
 
     Each subclass implements a specific table format (full, summary, xref, etc.)
     and defines how to transform YAML data into markdown tables.
+
+    Subclasses describe their output once, as a Table (scripts/hooks/_table_ir.py)
+    whose rows are formatted lazily from the source entries. iter_lines()
+    streams it as Markdown and emit_table() writes it in several formats from
+    one pass, without holding all of its rows, lines or text in memory.
+    generate() joins the Markdown lines into a string.
     """
 
     def __init__(
@@ -270,7 +305,6 @@ class TableGenerator(ABC):
             return local
         return self.ref_lookup or {}
 
-    @abstractmethod
     def generate(self, yaml_data: dict, ytype: str) -> str:
         """
         Generate markdown table from YAML data.
@@ -282,7 +316,33 @@ class TableGenerator(ABC):
         Returns:
             Formatted markdown table string
         """
-        pass
+        return "\n".join(self.iter_lines(yaml_data, ytype))
+
+    def iter_lines(self, yaml_data: dict, ytype: str) -> Iterator[str]:
+        """
+        Yield the markdown document generate() would return, line by line.
+
+        Joined with newlines, the yielded strings are exactly generate()'s
+        output. Sub-sections after the table may be yielded as one multi-line
+        string.
+        """
+        return markdown_lines(self.table(yaml_data, ytype))
+
+    @abstractmethod
+    def table(self, yaml_data: dict, ytype: str) -> Table:
+        """
+        Describe the table as an intermediate representation.
+
+        Rows (and trailing sections) are generators, formatted as an emitter
+        consumes them; argument errors are raised here, before any row.
+
+        Args:
+            yaml_data: Parsed YAML data dictionary
+            ytype: Type of data (components, controls, risks)
+
+        Returns:
+            Table with the column names, lazy rows and trailing Markdown sections
+        """
 
     def _load_yaml(self, filename: str) -> dict:
         """
@@ -315,7 +375,59 @@ class TableGenerator(ABC):
         return {item["id"]: item["title"] for item in items if "id" in item and "title" in item}
 
 
-class FullDetailTableGenerator(TableGenerator):
+class EntryTableGenerator(TableGenerator):
+    """
+    Base class for tables with one row per entry of ``ytype`` (full and summary).
+
+    Such a table can be rendered for any subset of the entries, which is how
+    sharded output writes one table per category from a single pass.
+    """
+
+    def table(self, yaml_data: dict, ytype: str) -> Table:
+        """Describe the table of every entry; see entry_table()."""
+        return self.entry_table(yaml_data, ytype, list(enumerate(yaml_data.get(ytype) or [])))
+
+    @abstractmethod
+    def entry_table(self, yaml_data: dict, ytype: str, numbered: list[tuple[int, dict]]) -> Table:
+        """
+        Describe the table of a subset of the entries.
+
+        Args:
+            yaml_data: Parsed YAML data dictionary
+            ytype: Type of data (components, controls, risks)
+            numbered: (index in yaml_data[ytype], entry) pairs to render; the
+                index keeps error messages pointing at the source entry
+
+        Returns:
+            Table of the entries, with any References sub-sections
+        """
+
+    def group_by_category(self, yaml_data: dict, ytype: str) -> dict[str, list[tuple[int, dict]]]:
+        """
+        Group the entries by their ``category`` field, in category-id order.
+
+        Returns:
+            category id (UNCATEGORIZED when missing) -> (index, entry) pairs in source order
+        """
+        groups: dict[str, list[tuple[int, dict]]] = {}
+        for idx, entry in enumerate(yaml_data.get(ytype) or []):
+            groups.setdefault(entry.get("category") or UNCATEGORIZED, []).append((idx, entry))
+        return dict(sorted(groups.items()))
+
+    def category_titles(self, yaml_data: dict, ytype: str, categories: Iterable[str]) -> dict[str, str]:
+        """
+        Map each of ``categories`` to its display title.
+
+        Titles come from the ``categories`` block of ``yaml_data``; a category
+        without one (risks.yaml has no such block) gets its humanized ID, with
+        the ``ytype`` prefix dropped ("risksRuntimeDataSecurity" -> "Runtime
+        Data Security").
+        """
+        titles = self._create_id_to_title_lookup(yaml_data, "categories")
+        return {category: titles.get(category) or humanize_identifier(category, ytype) for category in categories}
+
+
+class FullDetailTableGenerator(EntryTableGenerator):
     """
     Generates full detail tables with all columns.
 
@@ -323,149 +435,131 @@ class FullDetailTableGenerator(TableGenerator):
     from the YAML with column-specific formatting.
     """
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    collapsable = ("description", "shortDescription", "longDescription", "examples")
+
+    def _format_cell(self, entry: dict, col: str, ytype: str, row_idx: int) -> str:
+        """Format one field of one entry; missing fields render as empty cells."""
+        value = entry.get(col)
+        if col in self.collapsable:
+            if self.intra_lookup is not None and self.ref_lookup is not None:
+                # Per-row expansion: thread row index into field_path for error messages.
+                return collapse_column(
+                    value,
+                    intra_lookup=self.intra_lookup,
+                    ref_lookup=self._ref_lookup_for_entry(entry),
+                    field_path=f"{ytype}[{row_idx}].{col}",
+                )
+            return collapse_column(value)
+        if col == "edges":
+            return format_edges(value)
+        if col == "tourContent":
+            return format_dict(value)
+        if col == "mappings":
+            return format_mappings(value)
+        return format_list(value)
+
+    def entry_table(self, yaml_data: dict, ytype: str, numbered: list[tuple[int, dict]]) -> Table:
         """
-        Generate full detail markdown table.
+        Describe the full detail markdown table.
 
         When intra_lookup and ref_lookup are set on the instance, sentinel spans
-        in collapsable fields are expanded per-row before the table is rendered.
+        in collapsable fields are expanded per-row as each row is formatted.
         Entries with a non-empty externalReferences array get a "## References for {id}"
         sub-section appended after the main table.
 
         Args:
             yaml_data: Parsed YAML data dictionary
             ytype: Type of data (components, controls, risks)
+            numbered: (source index, entry) pairs to render
 
         Returns:
-            Formatted markdown table string, followed by any References sub-sections
+            Table of the entries, with any References sub-sections
         """
-        collapsable = ["description", "shortDescription", "longDescription", "examples"]
-
         entries = yaml_data.get(ytype) or []
-        sorted_entries = sorted(entries, key=lambda e: e.get("id", ""))
-
-        # Convert to DataFrame; drop externalReferences — it's rendered as sub-sections below.
-        df = pd.DataFrame(entries)
-        if "externalReferences" in df.columns:
-            df = df.drop(columns=["externalReferences"])
-
-        # Apply column-specific formatting; use per-row sentinel expansion for prose fields.
-        for col in df.columns:
-            if col in collapsable:
-                if self.intra_lookup is not None and self.ref_lookup is not None:
-                    # Per-row expansion: thread row index into field_path for error messages.
-                    # entries[row_idx] aligns with df.at[row_idx, col] because df is built
-                    # from `entries` (insertion order, line above) and sort_values on
-                    # df_filled runs only after this loop completes.
-                    df = df.reset_index(drop=True)
-                    for row_idx in range(len(df)):
-                        df.at[row_idx, col] = collapse_column(
-                            df.at[row_idx, col],
-                            intra_lookup=self.intra_lookup,
-                            ref_lookup=self._ref_lookup_for_entry(entries[row_idx]),
-                            field_path=f"{ytype}[{row_idx}].{col}",
-                        )
-                else:
-                    df[col] = df[col].apply(collapse_column)
-            elif col == "edges":
-                df[col] = df[col].apply(format_edges)
-            elif col == "tourContent":
-                df[col] = df[col].apply(format_dict)
-            elif col == "mappings":
-                df[col] = df[col].apply(format_mappings)
-            else:
-                df[col] = df[col].apply(format_list)
 
-        df_filled = df.fillna("").sort_values("id")
-        table = df_filled.to_markdown(index=False)
+        # Columns in first-appearance order across all entries, so every shard has the
+        # same columns; drop externalReferences — it's rendered as sub-sections below.
+        columns = [col for col in dict.fromkeys(chain.from_iterable(entries)) if col != "externalReferences"]
+
+        # Rows are ordered by their rendered ID cell; the source index is kept for field paths.
+        numbered = list(numbered)
+        if "id" in columns:
+            numbered.sort(key=lambda pair: format_list(pair[1].get("id")))
 
-        # Append per-entry References sub-sections for entries with externalReferences.
-        sections = [table]
-        for entry in sorted_entries:
-            refs = entry.get("externalReferences")
-            if refs:
-                sections.append(f"\n## References for {entry['id']}\n{_references_bullets_only(refs)}")
+        def rows():
+            for row_idx, entry in numbered:
+                yield tuple(self._format_cell(entry, col, ytype, row_idx) for col in columns)
 
-        return "\n".join(sections)
+        return Table(
+            tuple(columns),
+            rows(),
+            _reference_sections(sorted((entry for _, entry in numbered), key=lambda e: e.get("id", ""))),
+        )
 
 
-class SummaryTableGenerator(TableGenerator):
+class SummaryTableGenerator(EntryTableGenerator):
     """
     Generates summary tables with condensed information.
 
     Includes: ID, Title, Description/ShortDescription, Category
     """
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def entry_table(self, yaml_data: dict, ytype: str, numbered: list[tuple[int, dict]]) -> Table:
         """
-        Generate summary markdown table.
+        Describe the summary markdown table.
 
         When intra_lookup and ref_lookup are set on the instance, sentinel spans
-        in the description field are expanded before the table is rendered.
+        in the description field are expanded as each row is formatted.
         Entries with a non-empty externalReferences array get a "## References for {id}"
         sub-section appended after the main table.
 
         Args:
             yaml_data: Parsed YAML data dictionary
             ytype: Type of data (components, controls, risks)
+            numbered: (source index, entry) pairs to render
 
         Returns:
-            Formatted markdown table string, followed by any References sub-sections
+            Table of the entries, with any References sub-sections
         """
-        items = yaml_data.get(ytype, []) or []
-        sorted_items = sorted(items, key=lambda e: e.get("id", ""))
-
-        rows = []
-        for row_idx, item in enumerate(items):
-            # Prefer shortDescription over description
-            desc = item.get("shortDescription") or item.get("description", "")
-
-            if desc and self.intra_lookup is not None and self.ref_lookup is not None:
-                # Expand sentinels; field_path points at the source field and row.
-                field_name = "shortDescription" if item.get("shortDescription") else "description"
-                collapsed = collapse_column(
-                    desc,
-                    intra_lookup=self.intra_lookup,
-                    ref_lookup=self._ref_lookup_for_entry(item),
-                    field_path=f"{ytype}[{row_idx}].{field_name}",
-                )
-            else:
-                collapsed = collapse_column(desc) if desc else ""
-
-            row = {
-                "ID": item.get("id", ""),
-                "Title": item.get("title", ""),
-                "Description": collapsed,
-                "Category": item.get("category", ""),
-            }
-            rows.append(row)
-
-        df = pd.DataFrame(rows).sort_values("ID")
-        table = df.to_markdown(index=False)
+        numbered = sorted(numbered, key=lambda pair: pair[1].get("id", ""))
+
+        def rows():
+            for row_idx, item in numbered:
+                # Prefer shortDescription over description
+                desc = item.get("shortDescription") or item.get("description", "")
+
+                if desc and self.intra_lookup is not None and self.ref_lookup is not None:
+                    # Expand sentinels; field_path points at the source field and row.
+                    field_name = "shortDescription" if item.get("shortDescription") else "description"
+                    collapsed = collapse_column(
+                        desc,
+                        intra_lookup=self.intra_lookup,
+                        ref_lookup=self._ref_lookup_for_entry(item),
+                        field_path=f"{ytype}[{row_idx}].{field_name}",
+                    )
+                else:
+                    collapsed = collapse_column(desc) if desc else ""
 
-        # Append per-entry References sub-sections for entries with externalReferences.
-        sections = [table]
-        for entry in sorted_items:
-            refs = entry.get("externalReferences")
-            if refs:
-                sections.append(f"\n## References for {entry['id']}\n{_references_bullets_only(refs)}")
+                yield (item.get("id", ""), item.get("title", ""), collapsed, item.get("category", ""))
 
-        return "\n".join(sections)
+        return Table(
+            ("ID", "Title", "Description", "Category"), rows(), _reference_sections(item for _, item in numbered)
+        )
 
 
 class PersonaSummaryTableGenerator(TableGenerator):
     """Generates summary tables for personas (no Category column)."""
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate persona summary markdown table.
+        Describe the persona summary markdown table.
 
         Args:
             yaml_data: Parsed YAML data dictionary
             ytype: Type of data (must be "personas")
 
         Returns:
-            Formatted markdown table string
+            Table of the entries, with any References sub-sections
 
         Raises:
             ValueError: If ytype is not "personas"
@@ -474,59 +568,93 @@ class PersonaSummaryTableGenerator(TableGenerator):
             raise ValueError(f"PersonaSummaryTableGenerator only works with 'personas', got '{ytype}'")
 
         items = yaml_data.get("personas", [])
-        rows = []
-        for idx, item in enumerate(items):
-            desc = item.get("description", "")
-            if desc and self.intra_lookup is not None and self.ref_lookup is not None:
-                # Expand sentinels in description; field_path uses insertion-order index.
-                collapsed = collapse_column(
-                    desc,
-                    intra_lookup=self.intra_lookup,
-                    ref_lookup=self._ref_lookup_for_entry(item),
-                    field_path=f"personas[{idx}].description",
-                )
-            else:
-                collapsed = collapse_column(desc) if desc else ""
-            row = {
-                "ID": item.get("id", ""),
-                "Title": item.get("title", ""),
-                "Description": collapsed,
-                "Status": "Deprecated" if item.get("deprecated", False) else "",
-            }
-            rows.append(row)
-
-        # Handle empty list case
-        if not rows:
-            df = pd.DataFrame(columns=["ID", "Title", "Description", "Status"])
-        else:
-            df = pd.DataFrame(rows).sort_values("ID")
-        table = df.to_markdown(index=False)
-
-        # Append per-persona References sub-sections in id-sorted order so they
-        # follow the table's row order (the DataFrame is sort_values("ID") above).
-        sorted_items = sorted(items, key=lambda e: e.get("id", ""))
-        sections = [table]
-        for entry in sorted_items:
-            refs = entry.get("externalReferences")
-            if refs:
-                sections.append(f"\n## References for {entry['id']}\n{_references_bullets_only(refs)}")
-
-        return "\n".join(sections)
+        numbered = sorted(enumerate(items), key=lambda pair: pair[1].get("id", ""))
+
+        def rows():
+            for idx, item in numbered:
+                desc = item.get("description", "")
+                if desc and self.intra_lookup is not None and self.ref_lookup is not None:
+                    # Expand sentinels in description; field_path uses insertion-order index.
+                    collapsed = collapse_column(
+                        desc,
+                        intra_lookup=self.intra_lookup,
+                        ref_lookup=self._ref_lookup_for_entry(item),
+                        field_path=f"personas[{idx}].description",
+                    )
+                else:
+                    collapsed = collapse_column(desc) if desc else ""
+                status = "Deprecated" if item.get("deprecated", False) else ""
+                yield (item.get("id", ""), item.get("title", ""), collapsed, status)
+
+        # An empty personas list renders a header-only table; References
+        # sub-sections follow the table's (id-sorted) row order.
+        return Table(
+            ("ID", "Title", "Description", "Status"), rows(), _reference_sections(item for _, item in numbered)
+        )
 
 
 class PersonaFullDetailTableGenerator(TableGenerator):
     """Generates full detail tables for personas with all fields."""
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def _row(self, idx: int, item: dict) -> tuple:
+        """Format one persona as a table row, expanding sentinels when lookups are set."""
+        desc = item.get("description", "")
+        if self.intra_lookup is not None and self.ref_lookup is not None:
+            # Build per-entry lookup once and reuse across all three expansion sites.
+            row_ref_lookup = self._ref_lookup_for_entry(item)
+            # Expand sentinels in description; field_path uses insertion-order index.
+            collapsed_desc = collapse_column(
+                desc,
+                intra_lookup=self.intra_lookup,
+                ref_lookup=row_ref_lookup,
+                field_path=f"personas[{idx}].description",
+            )
+            # Expand sentinels in each responsibilities item before passing to format_list.
+            expanded_resp = [
+                expand_sentinels_to_text(
+                    r,
+                    intra_lookup=self.intra_lookup,
+                    ref_lookup=row_ref_lookup,
+                    field_path=f"personas[{idx}].responsibilities[{i}]",
+                )
+                for i, r in enumerate(item.get("responsibilities", []))
+            ]
+            # Expand sentinels in each identificationQuestions item.
+            expanded_idq = [
+                expand_sentinels_to_text(
+                    q,
+                    intra_lookup=self.intra_lookup,
+                    ref_lookup=row_ref_lookup,
+                    field_path=f"personas[{idx}].identificationQuestions[{i}]",
+                )
+                for i, q in enumerate(item.get("identificationQuestions", []))
+            ]
+        else:
+            # No lookups: pass through unchanged (pre-A7 backward compat).
+            collapsed_desc = collapse_column(desc)
+            expanded_resp = item.get("responsibilities", [])
+            expanded_idq = item.get("identificationQuestions", [])
+
+        return (
+            item.get("id", ""),
+            item.get("title", ""),
+            collapsed_desc,
+            "Deprecated" if item.get("deprecated", False) else "",
+            format_list(expanded_resp, prefix="- "),
+            format_list(expanded_idq, prefix="- "),
+            format_mappings(item.get("mappings", {})),
+        )
+
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate persona full detail markdown table.
+        Describe the persona full detail markdown table.
 
         Args:
             yaml_data: Parsed YAML data dictionary
             ytype: Type of data (must be "personas")
 
         Returns:
-            Formatted markdown table string
+            Table of the entries, with any References sub-sections
 
         Raises:
             ValueError: If ytype is not "personas"
@@ -535,83 +663,23 @@ class PersonaFullDetailTableGenerator(TableGenerator):
             raise ValueError(f"PersonaFullDetailTableGenerator only works with 'personas', got '{ytype}'")
 
         items = yaml_data.get("personas", [])
-        rows = []
-        for idx, item in enumerate(items):
-            desc = item.get("description", "")
-            if self.intra_lookup is not None and self.ref_lookup is not None:
-                # Build per-entry lookup once and reuse across all three expansion sites.
-                row_ref_lookup = self._ref_lookup_for_entry(item)
-                # Expand sentinels in description; field_path uses insertion-order index.
-                collapsed_desc = collapse_column(
-                    desc,
-                    intra_lookup=self.intra_lookup,
-                    ref_lookup=row_ref_lookup,
-                    field_path=f"personas[{idx}].description",
-                )
-                # Expand sentinels in each responsibilities item before passing to format_list.
-                expanded_resp = [
-                    expand_sentinels_to_text(
-                        r,
-                        intra_lookup=self.intra_lookup,
-                        ref_lookup=row_ref_lookup,
-                        field_path=f"personas[{idx}].responsibilities[{i}]",
-                    )
-                    for i, r in enumerate(item.get("responsibilities", []))
-                ]
-                # Expand sentinels in each identificationQuestions item.
-                expanded_idq = [
-                    expand_sentinels_to_text(
-                        q,
-                        intra_lookup=self.intra_lookup,
-                        ref_lookup=row_ref_lookup,
-                        field_path=f"personas[{idx}].identificationQuestions[{i}]",
-                    )
-                    for i, q in enumerate(item.get("identificationQuestions", []))
-                ]
-            else:
-                # No lookups: pass through unchanged (pre-A7 backward compat).
-                collapsed_desc = collapse_column(desc)
-                expanded_resp = item.get("responsibilities", [])
-                expanded_idq = item.get("identificationQuestions", [])
-
-            row = {
-                "ID": item.get("id", ""),
-                "Title": item.get("title", ""),
-                "Description": collapsed_desc,
-                "Status": "Deprecated" if item.get("deprecated", False) else "",
-                "Responsibilities": format_list(expanded_resp, prefix="- "),
-                "Identification Questions": format_list(expanded_idq, prefix="- "),
-                "Mappings": format_mappings(item.get("mappings", {})),
-            }
-            rows.append(row)
-
-        # Handle empty list case
-        if not rows:
-            df = pd.DataFrame(
-                columns=[
-                    "ID",
-                    "Title",
-                    "Description",
-                    "Status",
-                    "Responsibilities",
-                    "Identification Questions",
-                    "Mappings",
-                ]
-            )
-        else:
-            df = pd.DataFrame(rows).sort_values("ID")
-        table = df.to_markdown(index=False)
-
-        # Append per-persona References sub-sections in id-sorted order so they
-        # follow the table's row order (the DataFrame is sort_values("ID") above).
-        sorted_items = sorted(items, key=lambda e: e.get("id", ""))
-        sections = [table]
-        for entry in sorted_items:
-            refs = entry.get("externalReferences")
-            if refs:
-                sections.append(f"\n## References for {entry['id']}\n{_references_bullets_only(refs)}")
-
-        return "\n".join(sections)
+        numbered = sorted(enumerate(items), key=lambda pair: pair[1].get("id", ""))
+
+        # An empty personas list renders a header-only table; References
+        # sub-sections follow the table's (id-sorted) row order.
+        return Table(
+            (
+                "ID",
+                "Title",
+                "Description",
+                "Status",
+                "Responsibilities",
+                "Identification Questions",
+                "Mappings",
+            ),
+            (self._row(idx, item) for idx, item in numbered),
+            _reference_sections(item for _, item in numbered),
+        )
 
 
 class PersonaXRefTableGenerator(TableGenerator):
@@ -628,16 +696,29 @@ class PersonaXRefTableGenerator(TableGenerator):
     id_column: str = ""  # e.g., "Control IDs"
     title_column: str = ""  # e.g., "Control Titles"
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def _persona_items(self) -> dict[str, list[tuple[str, str]]]:
+        """Invert the cross-referenced file's persona lists: persona_id -> [(item_id, item_title), ...]."""
+        xref_data = self._load_yaml(self.yaml_file)
+        persona_items = {}
+
+        for item in xref_data.get(self.data_key, []):
+            for persona_id in item.get("personas", []):
+                if persona_id not in persona_items:
+                    persona_items[persona_id] = []
+                persona_items[persona_id].append((item.get("id", ""), item.get("title", "")))
+
+        return persona_items
+
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate persona cross-reference table.
+        Describe the persona cross-reference table.
 
         Args:
             yaml_data: Parsed YAML data dictionary (must be personas)
             ytype: Type of data (must be "personas")
 
         Returns:
-            Formatted markdown table string
+            Table with one row per persona
 
         Raises:
             ValueError: If ytype is not "personas"
@@ -645,37 +726,23 @@ class PersonaXRefTableGenerator(TableGenerator):
         if ytype != "personas":
             raise ValueError(f"{self.__class__.__name__} only works with 'personas', got '{ytype}'")
 
-        # Load cross-reference YAML and invert persona references
-        xref_data = self._load_yaml(self.yaml_file)
-        persona_items = {}  # persona_id -> [(item_id, item_title), ...]
-
-        for item in xref_data.get(self.data_key, []):
-            for persona_id in item.get("personas", []):
-                if persona_id not in persona_items:
-                    persona_items[persona_id] = []
-                persona_items[persona_id].append((item.get("id", ""), item.get("title", "")))
-
-        # Build rows from personas
-        rows = []
-        for persona in yaml_data.get("personas", []):
-            pid = persona.get("id", "")
-            # Sort items alphabetically by ID to ensure consistent output
-            items_list = sorted(persona_items.get(pid, []), key=lambda x: x[0])
-            rows.append(
-                {
-                    "Persona ID": pid,
-                    "Persona Title": persona.get("title", ""),
-                    self.id_column: format_list([i[0] for i in items_list]),
-                    self.title_column: format_list([i[1] for i in items_list]),
-                }
-            )
+        persona_items = self._persona_items()
+        personas = sorted(yaml_data.get("personas", []), key=lambda p: p.get("id", ""))
+
+        def rows():
+            for persona in personas:
+                pid = persona.get("id", "")
+                # Sort items alphabetically by ID to ensure consistent output
+                items_list = sorted(persona_items.get(pid, []), key=lambda x: x[0])
+                yield (
+                    pid,
+                    persona.get("title", ""),
+                    format_list([i[0] for i in items_list]),
+                    format_list([i[1] for i in items_list]),
+                )
 
-        # Handle empty list case
-        if not rows:
-            df = pd.DataFrame(columns=["Persona ID", "Persona Title", self.id_column, self.title_column])
-        else:
-            df = pd.DataFrame(rows).sort_values("Persona ID")
-        return df.to_markdown(index=False)
+        # An empty personas list renders a header-only table
+        return Table(("Persona ID", "Persona Title", self.id_column, self.title_column), rows())
 
 
 class PersonaControlXRefTableGenerator(PersonaXRefTableGenerator):
@@ -700,7 +767,7 @@ class FlatPersonaXRefTableGenerator(PersonaXRefTableGenerator):
     """
     Base class for flat persona cross-reference generators.
 
-    Overrides PersonaXRefTableGenerator.generate() to emit one row per
+    Overrides PersonaXRefTableGenerator.table() to emit one row per
     persona-item mapping instead of grouping multiple items per persona.
     Subclasses configure via class attributes (yaml_file, data_key,
     id_column, title_column) inherited from PersonaXRefTableGenerator.
@@ -710,16 +777,16 @@ class FlatPersonaXRefTableGenerator(PersonaXRefTableGenerator):
     id_column: str = ""  # e.g., "Control ID"
     title_column: str = ""  # e.g., "Control Title"
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate flat persona cross-reference table with one row per mapping.
+        Describe the flat persona cross-reference table, one row per mapping.
 
         Args:
             yaml_data: Parsed YAML data dictionary (must be personas)
             ytype: Type of data (must be "personas")
 
         Returns:
-            Formatted markdown table with one row per persona-item mapping
+            Table with one row per persona-item mapping
 
         Raises:
             ValueError: If ytype is not "personas"
@@ -727,17 +794,10 @@ class FlatPersonaXRefTableGenerator(PersonaXRefTableGenerator):
         if ytype != "personas":
             raise ValueError(f"{self.__class__.__name__} only works with 'personas', got '{ytype}'")
 
-        # Load cross-reference YAML and invert persona references
-        xref_data = self._load_yaml(self.yaml_file)
-        persona_items = {}  # persona_id -> [(item_id, item_title), ...]
+        persona_items = self._persona_items()
 
-        for item in xref_data.get(self.data_key, []):
-            for persona_id in item.get("personas", []):
-                if persona_id not in persona_items:
-                    persona_items[persona_id] = []
-                persona_items[persona_id].append((item.get("id", ""), item.get("title", "")))
-
-        # Build flat rows: one row per persona-item mapping
+        # Build flat rows: one row per persona-item mapping. Cells are the source
+        # strings themselves, so the rows add little beyond the parsed YAML.
         rows = []
         for persona in yaml_data.get("personas", []):
             pid = persona.get("id", "")
@@ -745,21 +805,11 @@ class FlatPersonaXRefTableGenerator(PersonaXRefTableGenerator):
             items_list = sorted(persona_items.get(pid, []), key=lambda x: x[0])
 
             for item_id, item_title in items_list:
-                rows.append(
-                    {
-                        "Persona ID": pid,
-                        "Persona Title": ptitle,
-                        self.id_column: item_id,
-                        self.title_column: item_title,
-                    }
-                )
+                rows.append((pid, ptitle, item_id, item_title))
 
-        if rows:
-            df = pd.DataFrame(rows).sort_values(["Persona ID", self.id_column])
-        else:
-            df = pd.DataFrame(columns=["Persona ID", "Persona Title", self.id_column, self.title_column])
-
-        return df.to_markdown(index=False)
+        # Stable sort by (Persona ID, item ID); no mappings renders a header-only table
+        rows.sort(key=itemgetter(0, 2))
+        return Table(("Persona ID", "Persona Title", self.id_column, self.title_column), rows)
 
 
 class FlatPersonaControlXRefTableGenerator(FlatPersonaXRefTableGenerator):
@@ -788,16 +838,16 @@ class RiskXRefTableGenerator(TableGenerator):
     Only applicable to controls.yaml.
     """
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate control-to-risk cross-reference table.
+        Describe the control-to-risk cross-reference table.
 
         Args:
             yaml_data: Parsed YAML data dictionary (must be controls)
             ytype: Type of data (must be "controls")
 
         Returns:
-            Formatted markdown table string
+            Table with one row per control
 
         Raises:
             ValueError: If ytype is not "controls"
@@ -809,41 +859,34 @@ class RiskXRefTableGenerator(TableGenerator):
         risks_data = self._load_yaml("risks.yaml")
         risks_lookup = self._create_id_to_title_lookup(risks_data, "risks")
 
-        controls = yaml_data.get("controls", [])
-        rows = []
+        controls = sorted(yaml_data.get("controls", []), key=lambda c: c.get("id", ""))
 
-        for control in controls:
-            control_id = control.get("id", "")
-            control_title = control.get("title", "")
-            risk_ids = control.get("risks", [])
+        def rows():
+            for control in controls:
+                control_id = control.get("id", "")
+                control_title = control.get("title", "")
+                risk_ids = control.get("risks", [])
 
-            # Handle special case: risks: "all" or risks: all
-            is_all = risk_ids == "all" or (
-                isinstance(risk_ids, list) and len(risk_ids) == 1 and risk_ids[0] == "all"
-            )
-            if is_all:
-                risk_ids_display = "all"
-                risk_titles_display = "All Risks"
-            elif isinstance(risk_ids, list):
-                # Resolve risk titles
-                risk_titles = [risks_lookup.get(rid, f"Unknown ({rid})") for rid in risk_ids]
-                risk_ids_display = format_list(risk_ids)
-                risk_titles_display = format_list(risk_titles)
-            else:
-                # Handle unexpected format
-                risk_ids_display = str(risk_ids) if risk_ids else ""
-                risk_titles_display = ""
-
-            row = {
-                "Control ID": control_id,
-                "Control Title": control_title,
-                "Risk IDs": risk_ids_display,
-                "Risk Titles": risk_titles_display,
-            }
-            rows.append(row)
+                # Handle special case: risks: "all" or risks: all
+                is_all = risk_ids == "all" or (
+                    isinstance(risk_ids, list) and len(risk_ids) == 1 and risk_ids[0] == "all"
+                )
+                if is_all:
+                    risk_ids_display = "all"
+                    risk_titles_display = "All Risks"
+                elif isinstance(risk_ids, list):
+                    # Resolve risk titles
+                    risk_titles = [risks_lookup.get(rid, f"Unknown ({rid})") for rid in risk_ids]
+                    risk_ids_display = format_list(risk_ids)
+                    risk_titles_display = format_list(risk_titles)
+                else:
+                    # Handle unexpected format
+                    risk_ids_display = str(risk_ids) if risk_ids else ""
+                    risk_titles_display = ""
+
+                yield (control_id, control_title, risk_ids_display, risk_titles_display)
 
-        df = pd.DataFrame(rows).sort_values("Control ID")
-        return df.to_markdown(index=False)
+        return Table(("Control ID", "Control Title", "Risk IDs", "Risk Titles"), rows())
 
 
 class ComponentXRefTableGenerator(TableGenerator):
@@ -854,16 +897,16 @@ class ComponentXRefTableGenerator(TableGenerator):
     Only applicable to controls.yaml.
     """
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate control-to-component cross-reference table.
+        Describe the control-to-component cross-reference table.
 
         Args:
             yaml_data: Parsed YAML data dictionary (must be controls)
             ytype: Type of data (must be "controls")
 
         Returns:
-            Formatted markdown table string
+            Table with one row per control
 
         Raises:
             ValueError: If ytype is not "controls"
@@ -875,41 +918,34 @@ class ComponentXRefTableGenerator(TableGenerator):
         components_data = self._load_yaml("components.yaml")
         components_lookup = self._create_id_to_title_lookup(components_data, "components")
 
-        controls = yaml_data.get("controls", [])
-        rows = []
+        controls = sorted(yaml_data.get("controls", []), key=lambda c: c.get("id", ""))
 
-        for control in controls:
-            control_id = control.get("id", "")
-            control_title = control.get("title", "")
-            component_ids = control.get("components", [])
+        def rows():
+            for control in controls:
+                control_id = control.get("id", "")
+                control_title = control.get("title", "")
+                component_ids = control.get("components", [])
 
-            # Handle special case: components: "all" or components: all
-            is_all = component_ids == "all" or (
-                isinstance(component_ids, list) and len(component_ids) == 1 and component_ids[0] == "all"
-            )
-            if is_all:
-                component_ids_display = "all"
-                component_titles_display = "All Components"
-            elif isinstance(component_ids, list):
-                # Resolve component titles
-                component_titles = [components_lookup.get(cid, f"Unknown ({cid})") for cid in component_ids]
-                component_ids_display = format_list(component_ids)
-                component_titles_display = format_list(component_titles)
-            else:
-                # Handle unexpected format
-                component_ids_display = str(component_ids) if component_ids else ""
-                component_titles_display = ""
-
-            row = {
-                "Control ID": control_id,
-                "Control Title": control_title,
-                "Component IDs": component_ids_display,
-                "Component Titles": component_titles_display,
-            }
-            rows.append(row)
+                # Handle special case: components: "all" or components: all
+                is_all = component_ids == "all" or (
+                    isinstance(component_ids, list) and len(component_ids) == 1 and component_ids[0] == "all"
+                )
+                if is_all:
+                    component_ids_display = "all"
+                    component_titles_display = "All Components"
+                elif isinstance(component_ids, list):
+                    # Resolve component titles
+                    component_titles = [components_lookup.get(cid, f"Unknown ({cid})") for cid in component_ids]
+                    component_ids_display = format_list(component_ids)
+                    component_titles_display = format_list(component_titles)
+                else:
+                    # Handle unexpected format
+                    component_ids_display = str(component_ids) if component_ids else ""
+                    component_titles_display = ""
+
+                yield (control_id, control_title, component_ids_display, component_titles_display)
 
-        df = pd.DataFrame(rows).sort_values("Control ID")
-        return df.to_markdown(index=False)
+        return Table(("Control ID", "Control Title", "Component IDs", "Component Titles"), rows())
 
 
 class FlatControlXRefTableGenerator(TableGenerator):
@@ -929,16 +965,16 @@ class FlatControlXRefTableGenerator(TableGenerator):
     title_column: str = ""  # e.g., "Risk Title"
     all_title: str = ""  # e.g., "All Risks"
 
-    def generate(self, yaml_data: dict, ytype: str) -> str:
+    def table(self, yaml_data: dict, ytype: str) -> Table:
         """
-        Generate flat control cross-reference table with one row per mapping.
+        Describe the flat control cross-reference table, one row per mapping.
 
         Args:
             yaml_data: Parsed YAML data dictionary (must be controls)
             ytype: Type of data (must be "controls")
 
         Returns:
-            Formatted markdown table with one row per control-item mapping
+            Table with one row per control-item mapping
 
         Raises:
             ValueError: If ytype is not "controls"
@@ -951,6 +987,7 @@ class FlatControlXRefTableGenerator(TableGenerator):
         lookup = self._create_id_to_title_lookup(xref_data, self.xref_data_key)
 
         controls = yaml_data.get("controls", [])
+        # Cells are mostly the source strings themselves, so the rows add little beyond the parsed YAML.
         rows = []
 
         for control in controls:
@@ -963,32 +1000,15 @@ class FlatControlXRefTableGenerator(TableGenerator):
                 isinstance(item_ids, list) and len(item_ids) == 1 and item_ids[0] == "all"
             )
             if is_all:
-                rows.append(
-                    {
-                        "Control ID": control_id,
-                        "Control Title": control_title,
-                        self.id_column: "all",
-                        self.title_column: self.all_title,
-                    }
-                )
+                rows.append((control_id, control_title, "all", self.all_title))
             elif isinstance(item_ids, list):
                 for item_id in sorted(item_ids):
                     item_title = lookup.get(item_id, f"Unknown ({item_id})")
-                    rows.append(
-                        {
-                            "Control ID": control_id,
-                            "Control Title": control_title,
-                            self.id_column: item_id,
-                            self.title_column: item_title,
-                        }
-                    )
-
-        if rows:
-            df = pd.DataFrame(rows).sort_values(["Control ID", self.id_column])
-        else:
-            df = pd.DataFrame(columns=["Control ID", "Control Title", self.id_column, self.title_column])
+                    rows.append((control_id, control_title, item_id, item_title))
 
-        return df.to_markdown(index=False)
+        # Stable sort by (Control ID, item ID); no mappings renders a header-only table
+        rows.sort(key=itemgetter(0, 2))
+        return Table(("Control ID", "Control Title", self.id_column, self.title_column), rows)
 
 
 class FlatRiskXRefTableGenerator(FlatControlXRefTableGenerator):
@@ -1022,7 +1042,282 @@ TABLE_GENERATORS = {
 }
 
 
-def yaml_to_markdown_table(yaml_file, ytype, table_format: str = "full", flat: bool = True):
+class RenderSession:
+    """
+    Parse-once corpus cache for rendering many tables in one process.
+
+    Each YAML file is parsed at most once per session, the intra-document
+    sentinel lookup is built once per input directory and each document's
+    sentinels are checked once (see check_sentinels()). Generators created by
+    the session share the parsed sibling files through their YAML cache, so
+    ``--all --all-formats`` reads each corpus file a single time. Parsed
+    documents are shared between renders and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._documents: dict[Path, dict] = {}  # resolved input dir -> {filename: parsed YAML}
+        self._intra_lookups: dict[Path, dict[str, str]] = {}
+        self._sentinel_checks: set[tuple[Path, str]] = set()
+
+    def _directory_cache(self, input_dir: Path) -> dict:
+        return self._documents.setdefault(Path(input_dir).resolve(), {})
+
+    def load(self, yaml_file: Path):
+        """Return the parsed contents of ``yaml_file``, parsing it on first use."""
+        yaml_file = Path(yaml_file)
+        cache = self._directory_cache(yaml_file.parent)
+        if yaml_file.name not in cache:
+            with open(yaml_file, "r") as f:
+                cache[yaml_file.name] = yaml.safe_load(f)
+        return cache[yaml_file.name]
+
+    def intra_lookup(self, input_dir: Path) -> dict[str, str]:
+        """
+        Return the entity-id -> title map for sentinel expansion in ``input_dir``.
+
+        Built from all four corpus files; missing siblings are tolerated.
+        """
+        key = Path(input_dir).resolve()
+        if key not in self._intra_lookups:
+            entities = {}
+            for fname, data_key in (
+                ("risks.yaml", "risks"),
+                ("controls.yaml", "controls"),
+                ("components.yaml", "components"),
+                ("personas.yaml", "personas"),
+            ):
+                fpath = Path(input_dir) / fname
+                if fpath.exists():
+                    entities[data_key] = (self.load(fpath) or {}).get(data_key)
+            self._intra_lookups[key] = build_intra_lookup(entities)
+        return self._intra_lookups[key]
+
+    def check_sentinels(self, yaml_file, ytype) -> None:
+        """
+        Resolve every sentinel in the prose of ``yaml_file``'s ``ytype`` entries, once per session.
+
+        Raises:
+            UnresolvedSentinelsError: Listing every unresolved sentinel in the
+                document, with its field path
+        """
+        key = (Path(yaml_file).resolve(), ytype)
+        if key not in self._sentinel_checks:
+            data = self.load(yaml_file) or {}
+            check_sentinels({ytype: data.get(ytype)}, self.intra_lookup(Path(yaml_file).parent))
+            self._sentinel_checks.add(key)
+
+    def render(self, yaml_file, ytype, table_format: str = "full", flat: bool = True):
+        """
+        Render one table from the session's parsed corpus.
+
+        Arguments, return value and errors are those of yaml_to_markdown_table().
+        """
+        return "\n".join(self.iter_lines(yaml_file, ytype, table_format, flat))
+
+    def write(
+        self,
+        out_file: Path,
+        yaml_file,
+        ytype,
+        table_format: str = "full",
+        flat: bool = True,
+        formats: Sequence[str] = ("md",),
+    ) -> bool:
+        """
+        Stream one table into ``out_file`` and its sibling formats with emit_table().
+
+        Every format is written from the same pass over the rows; formats
+        other than Markdown replace the suffix of ``out_file``
+        (``risks-full.md`` -> ``risks-full.csv``). Arguments and errors are
+        those of render(); nothing is written if rendering fails.
+
+        Args:
+            formats: Output formats, keys of EMITTERS (default: Markdown only)
+
+        Returns:
+            True if any file was written, False if all were already up to date
+        """
+        table = self.table(yaml_file, ytype, table_format, flat)
+        return bool(emit_table(table, emitter_paths(out_file, formats)))
+
+    def write_shards(
+        self,
+        out_file: Path,
+        yaml_file,
+        ytype,
+        table_format: str = "full",
+        flat: bool = True,
+        formats: Sequence[str] = ("md",),
+    ) -> int:
+        """
+        Write one table per category plus an index table linking to them.
+
+        Shards go to ``out_file`` without its suffix, as a directory
+        (``risks-full.md`` -> ``risks-full/<category>.md``); the index takes
+        ``out_file`` itself. Each entry is rendered once, into its category's
+        shard, and each file is only replaced when its bytes change, so
+        editing one entry rewrites only its shard. Shards of categories that
+        no longer exist are removed in every format; shards in formats not
+        requested this run are otherwise kept, unless a category of theirs was
+        removed, in which case that format is dropped along with its index so
+        no index lists a missing shard. Tables that are not one row per
+        categorized entry (personas, cross-references) are written whole, as
+        by write(). Every shard and the index are written in each of
+        ``formats``: the Markdown index links each category title to its
+        shard, the other formats give the plain title and the shard's file
+        name.
+
+        Arguments and errors are those of write().
+
+        Returns:
+            Number of files written or removed (0 if everything was up to date)
+        """
+        generator, data = self._generator(yaml_file, ytype, table_format, flat)
+        if not isinstance(generator, EntryTableGenerator):
+            return len(emit_table(generator.table(data, ytype), emitter_paths(out_file, formats)))
+
+        out_file = Path(out_file)
+        shard_dir = out_file.with_suffix("")
+        groups = generator.group_by_category(data, ytype)
+        shards = {category: shard_dir / SHARD_FILE_PATTERN.format(category=category) for category in groups}
+
+        changed = 0
+        for category, numbered in groups.items():
+            outputs = emitter_paths(shards[category], formats)
+            changed += len(emit_table(generator.entry_table(data, ytype, numbered), outputs))
+        for stale in _stale_shard_files(out_file, shard_dir, set(groups), formats):
+            stale.unlink()
+            changed += 1
+
+        titles = generator.category_titles(data, ytype, groups)
+        for fmt, index_file in emitter_paths(out_file, formats).items():
+            files = {category: path.with_suffix(EMITTERS[fmt].suffix).name for category, path in shards.items()}
+            if fmt == "md":
+                index = Table(
+                    ("Category", "ID", "Entries"),
+                    (
+                        (f"[{titles[category]}]({shard_dir.name}/{files[category]})", category, len(numbered))
+                        for category, numbered in groups.items()
+                    ),
+                )
+            else:
+                index = Table(
+                    ("Category", "ID", "Entries", "File"),
+                    (
+                        (titles[category], category, len(numbered), files[category])
+                        for category, numbered in groups.items()
+                    ),
+                )
+            changed += len(emit_table(index, {fmt: index_file}))
+        return changed
+
+    def table(self, yaml_file, ytype, table_format: str = "full", flat: bool = True) -> Table:
+        """
+        Describe one table as a Table whose rows are formatted as they are consumed.
+
+        The format and the YAML file are checked before this returns; errors
+        in the entries themselves (e.g. unresolved sentinels) surface while
+        the rows are consumed.
+        """
+        generator, data = self._generator(yaml_file, ytype, table_format, flat)
+        return generator.table(data, ytype)
+
+    def iter_lines(self, yaml_file, ytype, table_format: str = "full", flat: bool = True) -> Iterator[str]:
+        """Return an iterator over the Markdown lines of one table; see table()."""
+        return markdown_lines(self.table(yaml_file, ytype, table_format, flat))
+
+    def _generator(self, yaml_file, ytype, table_format: str, flat: bool) -> tuple[TableGenerator, dict]:
+        """Validate the request and return the generator for it with the parsed ``yaml_file``."""
+        # Persona-specific formats handled separately below
+        persona_formats = {"full", "summary", "xref-controls", "xref-risks"}
+
+        # Validate format (defer persona-specific validation until we check ytype)
+        if table_format not in TABLE_GENERATORS and table_format not in persona_formats:
+            valid_formats = ", ".join(TABLE_GENERATORS.keys())
+            raise ValueError(f"Invalid table format '{table_format}'. Valid formats: {valid_formats}")
+
+        # Load YAML data
+        data = self.load(yaml_file)
+
+        # Validate ytype exists in YAML data
+        if ytype not in data:
+            raise ValueError(f"YAML file does not contain '{ytype}' key. Available keys: {', '.join(data.keys())}")
+
+        # Get input directory for cross-reference lookups
+        input_dir = Path(yaml_file).parent
+
+        # XRef generators don't expand prose, but passing lookups here is harmless.
+        intra_lookup = self.intra_lookup(input_dir)
+        if table_format in PROSE_FORMATS:
+            # Report every unresolved sentinel in the document at once, before rendering.
+            self.check_sentinels(yaml_file, ytype)
+
+        # ref_lookup is built per-entry by the generator via _ref_lookup_for_entry;
+        # this matches build_persona_site_data.py's _build_ref_lookup pattern
+        # (ADR-016 D6 rule 3, per-entry resolution scope). The empty dict here makes
+        # any sentinel that escapes per-entry lookup hard-fail.
+        ref_lookup: dict[str, dict] = {}
+
+        # Create generator instance and generate table
+        # Handle persona-specific generators
+        if ytype == "personas":
+            persona_generators = {
+                "full": PersonaFullDetailTableGenerator,
+                "summary": PersonaSummaryTableGenerator,
+                "xref-controls": PersonaControlXRefTableGenerator,
+                "xref-risks": PersonaRiskXRefTableGenerator,
+            }
+            # Use flat generators if flat=True and format is xref
+            if flat:
+                persona_generators["xref-controls"] = FlatPersonaControlXRefTableGenerator
+                persona_generators["xref-risks"] = FlatPersonaRiskXRefTableGenerator
+
+            if table_format not in persona_generators:
+                valid = ", ".join(persona_generators.keys())
+                raise ValueError(f"Invalid table format '{table_format}' for personas. Valid: {valid}")
+            generator_class = persona_generators[table_format]
+        else:
+            # Handle flat control xref generators
+            if flat and table_format == "xref-risks":
+                generator_class = FlatRiskXRefTableGenerator
+            elif flat and table_format == "xref-components":
+                generator_class = FlatComponentXRefTableGenerator
+            else:
+                generator_class = TABLE_GENERATORS[table_format]
+
+        generator = generator_class(input_dir=input_dir, intra_lookup=intra_lookup, ref_lookup=ref_lookup)
+        # Share parsed sibling files (risks.yaml, components.yaml, ...) across generators.
+        generator._yaml_cache = self._directory_cache(input_dir)
+
+        return generator, data
+
+
+def _stale_shard_files(
+    out_file: Path, shard_dir: Path, categories: set[str], formats: Sequence[str]
+) -> list[Path]:
+    """
+    Return the shard and index files write_shards() must remove.
+
+    A shard whose category is not in ``categories`` is stale in every format.
+    A format not in ``formats`` that holds such a shard is dropped whole,
+    shards and index, since its index would otherwise list the removed
+    shards; its files are kept while they still match the categories.
+    """
+    existing = sorted(shard_dir.iterdir()) if shard_dir.is_dir() else []
+    stale = []
+    for fmt, emitter in EMITTERS.items():
+        files = [path for path in existing if path.suffix == emitter.suffix]
+        removed = [path for path in files if path.stem not in categories]
+        if fmt not in formats and removed:
+            index_file = emitter_paths(out_file, (fmt,))[fmt]
+            removed = files + ([index_file] if index_file.is_file() else [])
+        stale += removed
+    return stale
+
+
+def yaml_to_markdown_table(
+    yaml_file, ytype, table_format: str = "full", flat: bool = True, session: RenderSession | None = None
+):
     """
     Convert YAML data to formatted Markdown table using specified format.
 
@@ -1031,6 +1326,8 @@ def yaml_to_markdown_table(yaml_file, ytype, table_format: str = "full", flat: b
         ytype: Type of data to extract (components, controls, risks)
         table_format: Format type (full, summary, xref-risks, xref-components)
         flat: Use flat xref tables with one row per mapping (default True; xref formats only)
+        session: Optional RenderSession to reuse parsed YAML across calls; a fresh
+            session (re-reading every file) is used when omitted
 
     Returns:
         Formatted markdown table string
@@ -1038,79 +1335,9 @@ def yaml_to_markdown_table(yaml_file, ytype, table_format: str = "full", flat: b
     Raises:
         ValueError: If table_format is not recognized or incompatible with ytype
     """
-    # Persona-specific formats handled separately below
-    persona_formats = {"full", "summary", "xref-controls", "xref-risks"}
-
-    # Validate format (defer persona-specific validation until we check ytype)
-    if table_format not in TABLE_GENERATORS and table_format not in persona_formats:
-        valid_formats = ", ".join(TABLE_GENERATORS.keys())
-        raise ValueError(f"Invalid table format '{table_format}'. Valid formats: {valid_formats}")
-
-    # Load YAML data
-    with open(yaml_file, "r") as f:
-        data = yaml.safe_load(f)
-
-    # Validate ytype exists in YAML data
-    if ytype not in data:
-        raise ValueError(f"YAML file does not contain '{ytype}' key. Available keys: {', '.join(data.keys())}")
-
-    # Get input directory for cross-reference lookups
-    input_dir = Path(yaml_file).parent
-
-    # Build intra_lookup from all four corpus files; tolerate missing siblings.
-    # XRef generators don't expand prose, but passing lookups here is harmless.
-    intra_lookup: dict[str, str] = {}
-    for fname, key in (
-        ("risks.yaml", "risks"),
-        ("controls.yaml", "controls"),
-        ("components.yaml", "components"),
-        ("personas.yaml", "personas"),
-    ):
-        fpath = input_dir / fname
-        if not fpath.exists():
-            continue
-        with open(fpath) as fh:
-            sibling = yaml.safe_load(fh) or {}
-        for item in sibling.get(key, []) or []:
-            if isinstance(item, dict) and "id" in item and "title" in item:
-                intra_lookup[item["id"]] = item["title"]
-
-    # ref_lookup is built per-entry by the generator via _ref_lookup_for_entry;
-    # this matches build_persona_site_data.py's _build_ref_lookup pattern
-    # (ADR-016 D6 rule 3, per-entry resolution scope). The empty dict here makes
-    # any sentinel that escapes per-entry lookup hard-fail.
-    ref_lookup: dict[str, dict] = {}
-
-    # Create generator instance and generate table
-    # Handle persona-specific generators
-    if ytype == "personas":
-        persona_generators = {
-            "full": PersonaFullDetailTableGenerator,
-            "summary": PersonaSummaryTableGenerator,
-            "xref-controls": PersonaControlXRefTableGenerator,
-            "xref-risks": PersonaRiskXRefTableGenerator,
-        }
-        # Use flat generators if flat=True and format is xref
-        if flat:
-            persona_generators["xref-controls"] = FlatPersonaControlXRefTableGenerator
-            persona_generators["xref-risks"] = FlatPersonaRiskXRefTableGenerator
-
-        if table_format not in persona_generators:
-            valid = ", ".join(persona_generators.keys())
-            raise ValueError(f"Invalid table format '{table_format}' for personas. Valid: {valid}")
-        generator_class = persona_generators[table_format]
-    else:
-        # Handle flat control xref generators
-        if flat and table_format == "xref-risks":
-            generator_class = FlatRiskXRefTableGenerator
-        elif flat and table_format == "xref-components":
-            generator_class = FlatComponentXRefTableGenerator
-        else:
-            generator_class = TABLE_GENERATORS[table_format]
-
-    generator = generator_class(input_dir=input_dir, intra_lookup=intra_lookup, ref_lookup=ref_lookup)
-
-    return generator.generate(data, ytype)
+    if session is None:
+        session = RenderSession()
+    return session.render(yaml_file, ytype, table_format, flat)
 
 
 def parse_args() -> argparse.Namespace:
@@ -1134,6 +1361,10 @@ Examples:
   %(prog)s --all --all-formats --output-dir /tmp/tables  # Generate to custom directory
   %(prog)s controls --file custom/controls.yaml          # Custom input file
   %(prog)s components --quiet                            # Minimal output
+  %(prog)s --all --all-formats --jobs 4                  # Render all tables on 4 worker processes
+  %(prog)s --table controls --table personas:xref-risks  # Explicit table list (TYPE or TYPE:FORMAT)
+  %(prog)s risks --shard-by-category                     # risks-full.md index + risks-full/<category>.md
+  %(prog)s --all --all-formats --emit md,csv,jsonl       # Also write risks-full.csv, risks-full.jsonl, ...
 
 Available Types:
   components    - AI system building blocks
@@ -1218,9 +1449,98 @@ Exit Codes:
         help="Custom output directory for generated tables (overrides default location)",
     )
 
+    parser.add_argument(
+        "--table",
+        dest="tables",
+        action="append",
+        type=parse_table_spec,
+        default=[],
+        metavar="TYPE[:FORMAT]",
+        help="Render a specific table; TYPE alone means all applicable formats (repeatable)",
+    )
+
+    parser.add_argument(
+        "--shard-by-category",
+        dest="shard",
+        action="store_true",
+        help=(
+            "Write full and summary tables of components, controls and risks as one file per category "
+            "(in a directory named after the table) plus an index table at the usual path"
+        ),
+    )
+
+    parser.add_argument(
+        "--emit",
+        dest="formats",
+        type=parse_emit_formats,
+        default=("md",),
+        metavar="FORMAT[,FORMAT...]",
+        help=(
+            "Output formats written for every table, from one pass over its rows "
+            f"({', '.join(EMITTERS)}; default: md). Other formats replace the .md suffix"
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Render tables on N worker processes (0 = one per CPU, default: 1)",
+    )
+
     return parser.parse_args()
 
 
+def parse_table_spec(spec: str) -> list[tuple[str, str]]:
+    """
+    Parse a --table value into (type, format) pairs.
+
+    Args:
+        spec: "TYPE" for every applicable format of TYPE, or "TYPE:FORMAT"
+
+    Returns:
+        List of (type, format) pairs in get_applicable_formats() order
+
+    Raises:
+        argparse.ArgumentTypeError: If the type is unknown or the format does not apply to it
+    """
+    ytype, _, table_format = spec.partition(":")
+    if ytype not in VALID_TYPES:
+        raise argparse.ArgumentTypeError(f"invalid type '{ytype}' (valid: {', '.join(VALID_TYPES)})")
+
+    applicable = get_applicable_formats(ytype)
+    if not table_format:
+        return [(ytype, fmt) for fmt in applicable]
+    if table_format not in applicable:
+        raise argparse.ArgumentTypeError(
+            f"format '{table_format}' does not apply to '{ytype}' (applicable: {', '.join(applicable)})"
+        )
+    return [(ytype, table_format)]
+
+
+def parse_emit_formats(spec: str) -> tuple[str, ...]:
+    """
+    Parse an --emit value into output format names.
+
+    Args:
+        spec: Comma-separated format names, e.g. "md,csv"
+
+    Returns:
+        The formats in the order given, each listed once
+
+    Raises:
+        argparse.ArgumentTypeError: If a format is unknown or none is given
+    """
+    formats = tuple(dict.fromkeys(fmt.strip() for fmt in spec.split(",") if fmt.strip()))
+    unknown = [fmt for fmt in formats if fmt not in EMITTERS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"invalid format(s) '{spec}' (valid: {', '.join(EMITTERS)}, comma-separated)"
+        )
+    return formats
+
+
 def get_default_paths(ytype: str, table_format: str = "full", output_dir: Path = None) -> tuple[Path, Path]:
     """
     Get default input and output file paths for a given type and format.
@@ -1272,7 +1592,14 @@ def get_applicable_formats(ytype: str) -> list[str]:
 
 
 def convert_all_formats(
-    ytype: str, input_file: Path = None, output_dir: Path = None, quiet: bool = False, flat: bool = True
+    ytype: str,
+    input_file: Path = None,
+    output_dir: Path = None,
+    quiet: bool = False,
+    flat: bool = True,
+    session: RenderSession | None = None,
+    shard: bool = False,
+    formats: Sequence[str] = ("md",),
 ) -> bool:
     """
     Convert a single YAML type to all applicable markdown table formats.
@@ -1283,6 +1610,10 @@ def convert_all_formats(
         output_dir: Optional custom output directory
         quiet: Whether to suppress output messages
         flat: Use flat xref tables with one row per mapping (default True)
+        session: Optional RenderSession shared with other conversions; one is
+            created here so every format reuses the same parsed YAML
+        shard: Write full and summary tables as per-category shards plus an index
+        formats: Output formats written for each table (keys of EMITTERS)
 
     Returns:
         True if all conversions successful, False if any failed
@@ -1293,9 +1624,14 @@ def convert_all_formats(
         format_list = ", ".join(applicable_formats)
         print(f"📐 Generating {len(applicable_formats)} format(s) for {ytype}: {format_list}")
 
+    if session is None:
+        session = RenderSession()
+
     all_successful = True
     for table_format in applicable_formats:
-        if not convert_type(ytype, table_format, input_file, None, output_dir, quiet, flat):
+        if not convert_type(
+            ytype, table_format, input_file, None, output_dir, quiet, flat, session, shard, formats
+        ):
             all_successful = False
 
     return all_successful
@@ -1309,6 +1645,9 @@ def convert_type(
     output_dir: Path = None,
     quiet: bool = False,
     flat: bool = True,
+    session: RenderSession | None = None,
+    shard: bool = False,
+    formats: Sequence[str] = ("md",),
 ) -> bool:
     """
     Convert a single YAML type to markdown table.
@@ -1321,6 +1660,11 @@ def convert_type(
         output_dir: Optional custom output directory
         quiet: Whether to suppress output messages
         flat: Use flat xref tables with one row per mapping (default True)
+        session: Optional RenderSession to reuse parsed YAML across conversions
+        shard: Write full and summary tables as per-category shards plus an index
+            (see RenderSession.write_shards())
+        formats: Output formats written for the table (keys of EMITTERS); formats
+            other than Markdown replace the suffix of the output file
 
     Returns:
         True if successful, False otherwise
@@ -1354,17 +1698,16 @@ def convert_type(
         if not quiet:
             print(f"🔄 Converting {ytype} ({table_format} format): {in_file} → {out_file}")
 
-        # Convert and write
-        result = yaml_to_markdown_table(yaml_file=in_file, ytype=ytype, table_format=table_format, flat=flat)
-
-        # Create output directory if needed
-        out_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(out_file, mode="w") as of:
-            of.write(result)
+        # Convert and stream to the output file
+        if session is None:
+            session = RenderSession()
+        if shard:
+            written = session.write_shards(out_file, in_file, ytype, table_format, flat, formats)
+        else:
+            written = session.write(out_file, in_file, ytype, table_format, flat, formats)
 
         if not quiet:
-            print(f"✅ Successfully wrote {out_file}")
+            print(f"✅ Successfully wrote {out_file}" if written else f"✅ Up to date: {out_file}")
 
         return True
 
@@ -1373,6 +1716,153 @@ def convert_type(
         return False
 
 
+# Session shared by every render in a pool worker, installed once by _init_render_worker().
+_worker_session: RenderSession | None = None
+
+
+def _init_render_worker(session: RenderSession) -> None:
+    global _worker_session
+    _worker_session = session
+
+
+def _render_job(
+    session: RenderSession,
+    yaml_file: Path,
+    out_file: Path,
+    ytype: str,
+    table_format: str,
+    flat: bool,
+    shard: bool = False,
+    formats: Sequence[str] = ("md",),
+):
+    """
+    Render one table straight into its output file(s), returning (ok, written_or_error_message).
+
+    Errors are returned as text rather than raised so that serial and pooled
+    runs report them identically (exception objects need not survive pickling).
+    """
+    try:
+        if shard:
+            return True, session.write_shards(out_file, yaml_file, ytype, table_format, flat, formats) > 0
+        return True, session.write(out_file, yaml_file, ytype, table_format, flat, formats)
+    except Exception as e:
+        return False, str(e)
+
+
+def _render_in_worker(
+    yaml_file: Path, out_file: Path, ytype: str, table_format: str, flat: bool, shard: bool, formats: Sequence[str]
+):
+    return _render_job(_worker_session, yaml_file, out_file, ytype, table_format, flat, shard, formats)
+
+
+def _job_args(plan: tuple) -> tuple:
+    """Map a convert_tables() plan (type, format, input, output, error) to _render_job() arguments."""
+    ytype, table_format, in_file, out_file, _ = plan
+    return in_file, out_file, ytype, table_format
+
+
+def convert_tables(
+    tables: list[tuple[str, str]],
+    input_file: Path = None,
+    output_dir: Path = None,
+    quiet: bool = False,
+    flat: bool = True,
+    jobs: int = 1,
+    session: RenderSession | None = None,
+    shard: bool = False,
+    formats: Sequence[str] = ("md",),
+) -> bool:
+    """
+    Render a batch of tables, optionally on a process pool, and write each changed one atomically.
+
+    The corpus is parsed once in this process; with jobs > 1 the resulting
+    RenderSession snapshot is handed to each worker once (inherited on fork,
+    pickled otherwise) and the workers only render. Full-detail tables, which
+    dominate the cost, are submitted first. Each table is streamed straight
+    into its output file by whichever process renders it (so no table text
+    crosses the process boundary), and results are reported in the order of
+    ``tables`` whatever order the workers finish in, so output and error
+    messages are deterministic. A table whose bytes already match the file on
+    disk is not rewritten.
+
+    Args:
+        tables: (type, format) pairs to render; duplicates are rendered once
+        input_file: Optional custom input file (used for every type)
+        output_dir: Optional custom output directory
+        quiet: Whether to suppress output messages
+        flat: Use flat xref tables with one row per mapping (default True)
+        jobs: Number of worker processes; 0 means one per CPU, 1 renders in-process
+        session: Optional RenderSession to reuse parsed YAML across calls
+        shard: Write full and summary tables as per-category shards plus an index
+        formats: Output formats written for each table (keys of EMITTERS)
+
+    Returns:
+        True if every table was written, False if any failed
+    """
+    tables = list(dict.fromkeys(tables))
+    if session is None:
+        session = RenderSession()
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    # (type, format, input, output, error) per table, in request order
+    plans = []
+    for ytype, table_format in tables:
+        default_input, out_file = get_default_paths(ytype, table_format, output_dir)
+        in_file = input_file or default_input
+        error = None
+        if table_format not in get_applicable_formats(ytype):
+            error = f"Format '{table_format}' does not apply to '{ytype}'"
+        elif not in_file.exists():
+            error = f"Input file not found: {in_file}"
+        else:
+            try:
+                # Parse the table's input and every sibling it may cross-reference up front,
+                # so the snapshot handed to workers is complete.
+                session.load(in_file)
+                session.intra_lookup(in_file.parent)
+                if table_format in PROSE_FORMATS:
+                    session.check_sentinels(in_file, ytype)
+            except Exception as e:
+                error = str(e)
+        plans.append((ytype, table_format, in_file, out_file, error))
+
+    pending = [index for index, plan in enumerate(plans) if plan[4] is None]
+    workers = min(jobs, len(pending))
+    if not quiet:
+        print(f"🔄 Rendering {len(pending)} table(s) with {max(workers, 1)} worker(s)")
+
+    results: dict[int, tuple[bool, bool | str]] = {}
+    if workers > 1:
+        pending.sort(key=lambda index: plans[index][1] != "full")
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker, initargs=(session,)
+        ) as pool:
+            futures = {
+                index: pool.submit(_render_in_worker, *_job_args(plans[index]), flat, shard, formats)
+                for index in pending
+            }
+            results = {index: future.result() for index, future in futures.items()}
+    else:
+        for index in pending:
+            results[index] = _render_job(session, *_job_args(plans[index]), flat, shard, formats)
+
+    all_successful = True
+    for index, (ytype, table_format, _, out_file, error) in enumerate(plans):
+        written = False
+        if error is None:
+            ok, written = results[index]
+            if not ok:
+                error = written
+        if error is not None:
+            print(f"❌ Error converting {ytype} ({table_format} format): {error}")
+            all_successful = False
+        elif not quiet:
+            print(f"✅ Successfully wrote {out_file}" if written else f"✅ Up to date: {out_file}")
+
+    return all_successful
+
+
 def main() -> None:
     """
     Main entry point for YAML to Markdown converter.
@@ -1381,7 +1871,7 @@ def main() -> None:
         args = parse_args()
 
         # Validate arguments
-        if not args.all and not args.types:
+        if not args.all and not args.types and not args.tables:
             print("❌ Error: Must specify at least one type or use --all")
             print("   Run with --help for usage information")
             sys.exit(1)
@@ -1401,7 +1891,7 @@ def main() -> None:
             print("   --output-dir: Specify output directory (for multiple files)")
             sys.exit(1)
 
-        if args.output and (args.all or len(args.types) > 1 or args.all_formats):
+        if args.output and (args.all or len(args.types) > 1 or args.all_formats or args.tables or args.jobs != 1):
             print("❌ Error: --output can only be used when converting a single type with a single format")
             sys.exit(1)
 
@@ -1433,9 +1923,37 @@ def main() -> None:
                 print(f"   Cannot use with: {', '.join(non_persona_types)}")
                 sys.exit(1)
 
+        if args.jobs < 0:
+            print("❌ Error: --jobs must be 0 (one per CPU) or a positive number")
+            sys.exit(1)
+
         # Determine which types to convert
         types_to_convert = ["components", "controls", "risks", "personas"] if args.all else args.types
 
+        # Explicit table lists and worker pools go through the batch renderer
+        if args.tables or args.jobs != 1:
+            tables = [
+                (ytype, table_format)
+                for ytype in types_to_convert
+                for table_format in (get_applicable_formats(ytype) if args.all_formats else [args.format])
+            ]
+            tables.extend(chain.from_iterable(args.tables))
+            if not convert_tables(
+                tables,
+                args.file,
+                args.output_dir,
+                args.quiet,
+                args.flat,
+                args.jobs,
+                shard=args.shard,
+                formats=args.formats,
+            ):
+                print("\n⚠️  Some conversions failed")
+                sys.exit(2)
+            if not args.quiet:
+                print("\n✅ All conversions completed successfully")
+            sys.exit(0)
+
         if not args.quiet:
             type_list = ", ".join(types_to_convert)
             print(f"📋 Converting {len(types_to_convert)} type(s): {type_list}")
@@ -1444,18 +1962,32 @@ def main() -> None:
             else:
                 print(f"📐 Format: {args.format}\n")
 
-        # Convert each type
+        # Convert each type; one session parses each YAML file once for every table
+        session = RenderSession()
         all_successful = True
         for ytype in types_to_convert:
             if args.all_formats:
                 # Generate all applicable formats for this type
-                if not convert_all_formats(ytype, args.file, args.output_dir, args.quiet, args.flat):
+                if not convert_all_formats(
+                    ytype, args.file, args.output_dir, args.quiet, args.flat, session, args.shard, args.formats
+                ):
                     all_successful = False
             else:
                 # Use custom output only if converting single type with single format
                 output = args.output if len(types_to_convert) == 1 else None
 
-                if not convert_type(ytype, args.format, args.file, output, args.output_dir, args.quiet, args.flat):
+                if not convert_type(
+                    ytype,
+                    args.format,
+                    args.file,
+                    output,
+                    args.output_dir,
+                    args.quiet,
+                    args.flat,
+                    session,
+                    args.shard,
+                    args.formats,
+                ):
                     all_successful = False
 
             if not args.quiet and ytype != types_to_convert[-1]:
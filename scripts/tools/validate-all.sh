@@ -117,7 +117,7 @@ check_generated_tables() {
 
     mkdir -p "$generated_table_dir"
 
-    if ! python3 scripts/hooks/yaml_to_markdown.py --all --all-formats --output-dir "$generated_table_dir" --quiet; then
+    if ! python3 scripts/hooks/yaml_to_markdown.py --all --all-formats --jobs 0 --output-dir "$generated_table_dir" --quiet; then
         fail_msg "Markdown table generation check failed"
         return 1
     fi
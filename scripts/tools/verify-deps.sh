@@ -84,8 +84,9 @@ else
     fail_msg "git not found"
 fi
 
-# Check 5: pip packages (all 8 from requirements.txt)
-PIP_PACKAGES=("check-jsonschema" "pytest" "pytest-cov" "pytest-timeout" "PyYAML" "ruff" "pandas" "tabulate")
+# Check 5: pip packages (from requirements.txt)
+# Brotli is required so local builds publish the same .br site assets as CI.
+PIP_PACKAGES=("Brotli" "check-jsonschema" "pytest" "pytest-cov" "pytest-timeout" "PyYAML" "ruff")
 for package in "${PIP_PACKAGES[@]}"; do
     if python3 -m pip show "$package" &>/dev/null; then
         pass_msg "pip package: $package"
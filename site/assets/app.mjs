@@ -1,8 +1,11 @@
 import { buildResultsModel } from "./persona-logic.mjs";
 import { renderProse } from "./sanitizer.mjs";
+import { applySearch, searchIndex } from "./search.mjs";
+import { addShardRecords, createBootstrapData, findShardsForPersonas, shardLoadStatus } from "./site-data.mjs";
 
 const APP_NAME = "CoSAI Risk Map Explorer";
-const DATA_PATH = "./generated/persona-site-data.json";
+const GENERATED_DIR = "./generated/";
+const MANIFEST_PATH = `${GENERATED_DIR}persona-site-manifest.json`;
 const STEP_TITLES = ["Introduction", "Persona questions", "Matched persona summary", "Risks and controls"];
 
 const state = {
@@ -10,15 +13,26 @@ const state = {
   answers: {},
   data: null,
   errorMessage: "",
+  errorRetry: false,
   errorSteps: [],
+  errorTitle: "",
   loading: true,
+  manifest: null,
   manualSelectedIds: new Set(),
   personaOverrides: {},
+  searchIndex: null,
+  searchQuery: "",
+  // Shard path -> "pending", "loaded" or "failed". Shard names are content-hashed,
+  // so a shard loaded once stays valid for the whole session.
+  shardStates: new Map(),
   step: 0,
 };
 
 const appElement = document.querySelector("[data-app]");
 
+// The search index is fetched the first time the user types a query.
+let searchIndexRequest = null;
+
 function escapeHtml(value) {
   return String(value).replace(/[&<>"']/g, (character) => {
     const replacements = {
@@ -40,7 +54,7 @@ function announceStatus(message) {
   }
 }
 
-function renderStatusCard({ eyebrow, title, copy, steps = [], note = "" }) {
+function renderStatusCard({ eyebrow, title, copy, steps = [], note = "", retry = false }) {
   return `
     <section class="loading-card">
       <p class="eyebrow">${escapeHtml(eyebrow)}</p>
@@ -54,6 +68,13 @@ function renderStatusCard({ eyebrow, title, copy, steps = [], note = "" }) {
           : ""
       }
       ${note ? `<p class="status-note">${escapeHtml(note)}</p>` : ""}
+      ${
+        retry
+          ? `<div class="button-row">
+              <button class="primary-button" data-retry-shards type="button">Try again</button>
+            </div>`
+          : ""
+      }
     </section>
   `;
 }
@@ -570,7 +591,51 @@ function renderControlGroups(resultsModel) {
     .join("");
 }
 
+function getSearchMatches() {
+  if (!state.searchIndex || !state.searchQuery) {
+    return null;
+  }
+
+  return searchIndex(state.searchIndex, state.data.relations, state.searchQuery);
+}
+
+function renderSearchEmpty(label) {
+  return `
+    <div class="empty-state">
+      <p class="eyebrow">No matches</p>
+      <h2>No ${label} in your results match "${escapeHtml(state.searchQuery)}".</h2>
+      <p>Try fewer or shorter words, or clear the search to see every result.</p>
+    </div>
+  `;
+}
+
+function renderShardsLoading() {
+  return `
+    <div class="empty-state">
+      <p class="eyebrow">Loading</p>
+      <h2>Loading the risks and controls for the selected personas.</h2>
+    </div>
+  `;
+}
+
+function renderResultsContent(resultsModel, matches) {
+  // Until every shard the personas need has arrived, missing records would
+  // read as an empty or partial result.
+  if (shardLoadStatus(state.manifest, resultsModel.includedPersonas, state.shardStates) !== "loaded") {
+    return renderShardsLoading();
+  }
+
+  if (state.activeTab === "risks") {
+    return matches && !resultsModel.risks.length ? renderSearchEmpty("risks") : renderRiskGroups(resultsModel);
+  }
+
+  return matches && !resultsModel.controls.length ? renderSearchEmpty("controls") : renderControlGroups(resultsModel);
+}
+
 function renderResults(resultsModel) {
+  const matches = getSearchMatches();
+  const visibleModel = matches ? applySearch(resultsModel, matches) : resultsModel;
+
   return `
     <section class="step-panel">
       <div class="step-header">
@@ -612,6 +677,27 @@ function renderResults(resultsModel) {
           : ""
       }
 
+      <div class="search-row">
+        <label class="search-field">
+          <span class="eyebrow">Search these results</span>
+          <input
+            autocomplete="off"
+            data-search-input
+            placeholder="Search titles, descriptions and examples"
+            type="search"
+            value="${escapeHtml(state.searchQuery)}"
+          />
+        </label>
+        ${
+          matches
+            ? `<p class="empty-copy">
+                ${visibleModel.risks.length} of ${resultsModel.risks.length} risks and
+                ${visibleModel.controls.length} of ${resultsModel.controls.length} controls match.
+              </p>`
+            : ""
+        }
+      </div>
+
       <div class="tab-row" role="tablist" aria-label="Results views">
         <button
           aria-selected="${state.activeTab === "risks"}"
@@ -634,7 +720,7 @@ function renderResults(resultsModel) {
       </div>
 
       <div class="content-stack">
-        ${state.activeTab === "risks" ? renderRiskGroups(resultsModel) : renderControlGroups(resultsModel)}
+        ${renderResultsContent(visibleModel, matches)}
       </div>
 
       <div class="button-row">
@@ -662,10 +748,11 @@ function renderApp() {
 
   if (state.errorMessage) {
     appElement.innerHTML = renderStatusCard({
-      eyebrow: "Build required",
-      title: "Generated site data is missing.",
+      eyebrow: state.errorRetry ? "Loading failed" : "Build required",
+      title: state.errorTitle,
       copy: state.errorMessage,
       steps: state.errorSteps,
+      retry: state.errorRetry,
     });
     return;
   }
@@ -701,21 +788,110 @@ function resetSession() {
   state.answers = {};
   state.manualSelectedIds = new Set();
   state.personaOverrides = {};
+  state.searchQuery = "";
   state.step = 0;
 }
 
-async function loadSiteData() {
+async function fetchJson(path, cache) {
+  const response = await fetch(path, { cache });
+
+  if (!response.ok) {
+    throw new Error(`Failed to load ${path}`);
+  }
+
+  return response.json();
+}
+
+async function loadResultShards() {
+  const resultsModel = getResultsModel();
+  if (!resultsModel) {
+    return;
+  }
+
+  // Failed shards are left out of the requested set, so they are fetched again.
+  const requestedPaths = new Set(
+    [...state.shardStates].filter(([, shardState]) => shardState !== "failed").map(([path]) => path),
+  );
+  const shards = findShardsForPersonas(state.manifest, resultsModel.includedPersonas, requestedPaths);
+  if (!shards.length) {
+    return;
+  }
+
+  const results = await Promise.allSettled(
+    shards.map(async ({ key, path }) => {
+      state.shardStates.set(path, "pending");
+      try {
+        // Hashed names never change content: let the HTTP cache answer without revalidating.
+        addShardRecords(state.data, key, await fetchJson(`${GENERATED_DIR}${path}`, "force-cache"));
+        state.shardStates.set(path, "loaded");
+      } catch (error) {
+        state.shardStates.set(path, "failed");
+        throw error;
+      }
+    }),
+  );
+
+  const failures = results.filter((result) => result.status === "rejected");
+  if (failures.length) {
+    state.errorTitle = "Some risks and controls could not be loaded.";
+    state.errorMessage = "Check your connection, then try again. Your answers are kept.";
+    state.errorSteps = [];
+    state.errorRetry = true;
+    failures.forEach((failure) => console.error(failure.reason));
+  }
+
+  renderApp();
+}
+
+async function loadSearchIndex() {
+  if (searchIndexRequest) {
+    return;
+  }
+
+  // Content-hashed like the shards, so the HTTP cache may answer without revalidating.
+  searchIndexRequest = fetchJson(`${GENERATED_DIR}${state.manifest.search}`, "force-cache");
   try {
-    const response = await fetch(DATA_PATH, { cache: "no-store" });
+    state.searchIndex = await searchIndexRequest;
+  } catch (error) {
+    searchIndexRequest = null;
+    console.error(error);
+    return;
+  }
 
-    if (!response.ok) {
-      throw new Error(`Failed to load ${DATA_PATH}`);
-    }
+  renderSearchResults();
+}
+
+// Re-render for the current query, keeping the caret in the search box: a full
+// render replaces the input element the user is typing into.
+function renderSearchResults() {
+  const searchInput = appElement.querySelector("[data-search-input]");
+  const hadFocus = searchInput !== null && document.activeElement === searchInput;
+  const caret = searchInput?.selectionStart ?? state.searchQuery.length;
+
+  renderApp();
+
+  const matches = getSearchMatches();
+  if (matches) {
+    const visibleModel = applySearch(getResultsModel(), matches);
+    announceStatus(`${visibleModel.risks.length} risks and ${visibleModel.controls.length} controls match the search.`);
+  }
+
+  const renderedInput = appElement.querySelector("[data-search-input]");
+  if (hadFocus && renderedInput) {
+    renderedInput.focus();
+    renderedInput.setSelectionRange(caret, caret);
+  }
+}
 
-    state.data = await response.json();
+async function loadSiteData() {
+  try {
+    // The manifest is the only unhashed file, so it is the one revalidated on each visit.
+    state.manifest = await fetchJson(MANIFEST_PATH, "no-cache");
+    state.data = createBootstrapData(await fetchJson(`${GENERATED_DIR}${state.manifest.bootstrap}`, "force-cache"));
     state.loading = false;
     renderApp();
   } catch (error) {
+    state.errorTitle = "Generated site data is missing.";
     state.errorMessage =
       "Run `python3 scripts/build_persona_site_data.py` from the repository root before previewing the site locally.";
     state.loading = false;
@@ -744,6 +920,15 @@ appElement.addEventListener("click", (event) => {
     return;
   }
 
+  if (event.target.closest("[data-retry-shards]")) {
+    state.errorTitle = "";
+    state.errorMessage = "";
+    state.errorRetry = false;
+    renderApp();
+    loadResultShards();
+    return;
+  }
+
   if (event.target.closest("[data-reset]")) {
     resetSession();
     renderApp();
@@ -751,12 +936,22 @@ appElement.addEventListener("click", (event) => {
   }
 });
 
+appElement.addEventListener("input", (event) => {
+  const searchInput = event.target.closest("[data-search-input]");
+  if (searchInput) {
+    state.searchQuery = searchInput.value;
+    renderSearchResults();
+    loadSearchIndex();
+  }
+});
+
 appElement.addEventListener("change", (event) => {
   const questionInput = event.target.closest("[data-question-id]");
   if (questionInput) {
     const questionId = questionInput.dataset.questionId;
     state.answers[questionId] = questionInput.value;
     renderApp();
+    loadResultShards();
     const question = state.data?.questions.find((item) => item.id === questionId);
     if (question) {
       announceStatus(`Answer recorded: ${question.prompt}`);
@@ -781,6 +976,7 @@ appElement.addEventListener("change", (event) => {
     }
 
     renderApp();
+    loadResultShards();
     return;
   }
 
@@ -788,6 +984,7 @@ appElement.addEventListener("change", (event) => {
   if (includeInput) {
     state.personaOverrides[includeInput.dataset.includePersonaId] = includeInput.checked;
     renderApp();
+    loadResultShards();
   }
 });
 
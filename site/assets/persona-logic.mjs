@@ -14,8 +14,118 @@ export function dedupeInOrder(values) {
   return deduped;
 }
 
+// Lookups are built once per data set (or records array) and reused across renders.
+const questionMaps = new WeakMap();
+const recordLookups = new WeakMap();
+const relationIndexes = new WeakMap();
+
 function getQuestionMap(data) {
-  return new Map(data.questions.map((question) => [question.id, question]));
+  let questionMap = questionMaps.get(data.questions);
+  if (!questionMap) {
+    questionMap = new Map(data.questions.map((question) => [question.id, question]));
+    questionMaps.set(data.questions, questionMap);
+  }
+
+  return questionMap;
+}
+
+// Record arrays grow as shards load, so a lookup is rebuilt when its array has.
+function getRecordLookup(records) {
+  let lookup = recordLookups.get(records);
+  if (!lookup || lookup.size !== records.length) {
+    lookup = new Map(records.map((record) => [record.id, record]));
+    recordLookups.set(records, lookup);
+  }
+
+  return lookup;
+}
+
+// Masks use the layout of scripts/build_persona_site_data.py: bit i is bit i % 8
+// of byte i / 8.
+export function decodeMask(encoded) {
+  return Uint8Array.from(atob(encoded), (char) => char.charCodeAt(0));
+}
+
+function encodeOrdinals(ordinals, size) {
+  const mask = new Uint8Array(Math.ceil(size / 8));
+  for (const ordinal of ordinals) {
+    if (ordinal !== undefined) {
+      mask[ordinal >> 3] |= 1 << (ordinal & 7);
+    }
+  }
+
+  return mask;
+}
+
+function hasBit(mask, ordinal) {
+  return ordinal !== undefined && (mask[ordinal >> 3] & (1 << (ordinal & 7))) !== 0;
+}
+
+function unionMasks(masks, size) {
+  const union = new Uint8Array(Math.ceil(size / 8));
+  for (const mask of masks) {
+    for (let index = 0; index < union.length; index += 1) {
+      union[index] |= mask[index];
+    }
+  }
+
+  return union;
+}
+
+function idsInMask(ids, mask) {
+  return ids.filter((_, ordinal) => hasBit(mask, ordinal));
+}
+
+function toOrdinals(ids) {
+  return new Map(ids.map((id, ordinal) => [id, ordinal]));
+}
+
+function decodeRelations(relations) {
+  return {
+    personaOrdinals: toOrdinals(relations.personaIds),
+    personaCount: relations.personaIds.length,
+    riskIds: relations.riskIds,
+    controlIds: relations.controlIds,
+    personaRiskMasks: relations.personaRiskMasks.map(decodeMask),
+    personaControlMasks: relations.personaControlMasks.map(decodeMask),
+  };
+}
+
+// Data without precomputed relations: index the records in hand, in their order.
+function deriveRelations(data) {
+  const riskIds = dedupeInOrder([
+    ...data.risks.map((risk) => risk.id),
+    ...data.personas.flatMap((persona) => persona.riskIds),
+  ]);
+  const controlIds = dedupeInOrder([
+    ...data.controls.map((control) => control.id),
+    ...data.personas.flatMap((persona) => persona.controlIds),
+  ]);
+  const riskOrdinals = toOrdinals(riskIds);
+  const controlOrdinals = toOrdinals(controlIds);
+  const encodeIds = (ids, ordinals, size) => encodeOrdinals(ids.map((id) => ordinals.get(id)), size);
+
+  return {
+    personaOrdinals: toOrdinals(data.personas.map((persona) => persona.id)),
+    personaCount: data.personas.length,
+    riskIds,
+    controlIds,
+    personaRiskMasks: data.personas.map((persona) => encodeIds(persona.riskIds, riskOrdinals, riskIds.length)),
+    personaControlMasks: data.personas.map((persona) =>
+      encodeIds(persona.controlIds, controlOrdinals, controlIds.length),
+    ),
+    recordCount: data.risks.length + data.controls.length,
+  };
+}
+
+function getRelationIndex(data) {
+  let index = relationIndexes.get(data);
+  if (!index || (!data.relations && index.recordCount !== data.risks.length + data.controls.length)) {
+    index = data.relations ? decodeRelations(data.relations) : deriveRelations(data);
+    relationIndexes.set(data, index);
+  }
+
+  return index;
 }
 
 export function getSelectedPersonas(data, answers = {}, manualSelectedIds = [], personaOverrides = {}) {
@@ -23,12 +133,12 @@ export function getSelectedPersonas(data, answers = {}, manualSelectedIds = [],
   const questionMap = getQuestionMap(data);
 
   return data.personas
-    .filter((persona) => {
-      const matchedQuestionIds = persona.questionIds.filter((questionId) => answers[questionId] === "yes");
-      return matchedQuestionIds.length > 0 || manualSelection.has(persona.id);
-    })
-    .map((persona) => {
-      const matchedQuestionIds = persona.questionIds.filter((questionId) => answers[questionId] === "yes");
+    .map((persona) => ({
+      persona,
+      matchedQuestionIds: persona.questionIds.filter((questionId) => answers[questionId] === "yes"),
+    }))
+    .filter(({ persona, matchedQuestionIds }) => matchedQuestionIds.length > 0 || manualSelection.has(persona.id))
+    .map(({ persona, matchedQuestionIds }) => {
       const sourceType = matchedQuestionIds.length > 0 ? "answers" : "manual";
 
       return {
@@ -61,13 +171,28 @@ function groupItemsByCategory(items, categoryDefinitions) {
 export function buildResultsModel(data, answers = {}, manualSelectedIds = [], personaOverrides = {}) {
   const selectedPersonas = getSelectedPersonas(data, answers, manualSelectedIds, personaOverrides);
   const includedPersonas = selectedPersonas.filter((persona) => persona.included);
-  const includedPersonaIds = new Set(includedPersonas.map((persona) => persona.id));
-
-  const riskLookup = new Map(data.risks.map((risk) => [risk.id, risk]));
-  const controlLookup = new Map(data.controls.map((control) => [control.id, control]));
 
-  const riskIds = dedupeInOrder(includedPersonas.flatMap((persona) => persona.riskIds));
-  const controlIds = dedupeInOrder(includedPersonas.flatMap((persona) => persona.controlIds));
+  // Union the included personas' masks: each risk and control appears once, in
+  // framework order, without merging and deduplicating ID lists.
+  const index = getRelationIndex(data);
+  const includedOrdinals = includedPersonas
+    .map((persona) => index.personaOrdinals.get(persona.id))
+    .filter((ordinal) => ordinal !== undefined);
+  const includedPersonaMask = encodeOrdinals(includedOrdinals, index.personaCount);
+  const riskMask = unionMasks(
+    includedOrdinals.map((ordinal) => index.personaRiskMasks[ordinal]),
+    index.riskIds.length,
+  );
+  const controlMask = unionMasks(
+    includedOrdinals.map((ordinal) => index.personaControlMasks[ordinal]),
+    index.controlIds.length,
+  );
+  const riskIds = idsInMask(index.riskIds, riskMask);
+  const controlIds = idsInMask(index.controlIds, controlMask);
+  const includesPersona = (personaId) => hasBit(includedPersonaMask, index.personaOrdinals.get(personaId));
+
+  const riskLookup = getRecordLookup(data.risks);
+  const controlLookup = getRecordLookup(data.controls);
   const selectedRiskIdSet = new Set(riskIds);
   const selectedControlIdSet = new Set(controlIds);
 
@@ -76,7 +201,7 @@ export function buildResultsModel(data, answers = {}, manualSelectedIds = [], pe
     .filter(Boolean)
     .map((risk) => ({
       ...risk,
-      personaIds: risk.personaIds.filter((personaId) => includedPersonaIds.has(personaId)),
+      personaIds: risk.personaIds.filter(includesPersona),
       relatedControlIds: risk.controlIds.filter((controlId) => selectedControlIdSet.has(controlId)),
     }));
 
@@ -85,7 +210,7 @@ export function buildResultsModel(data, answers = {}, manualSelectedIds = [], pe
     .filter(Boolean)
     .map((control) => ({
       ...control,
-      personaIds: control.personaIds.filter((personaId) => includedPersonaIds.has(personaId)),
+      personaIds: control.personaIds.filter(includesPersona),
       relatedRiskIds: control.riskIds.filter((riskId) => selectedRiskIdSet.has(riskId)),
     }));
 
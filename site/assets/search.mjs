@@ -0,0 +1,93 @@
+// Queries are tokenized like the index terms in scripts/build_persona_site_data.py
+// (SEARCH_TOKEN_PATTERN and SEARCH_STOPWORDS).
+const TOKEN_PATTERN = /[a-z0-9]+/g;
+const STOPWORDS = new Set(
+  "a an and are as at be by for from in is it its of on or that the their this to with".split(" "),
+);
+const SEARCHED_RECORDS = [
+  ["risks", "riskIds"],
+  ["controls", "controlIds"],
+];
+
+export function tokenizeQuery(query) {
+  return [...new Set(query.toLowerCase().match(TOKEN_PATTERN) ?? [])].filter((token) => !STOPWORDS.has(token));
+}
+
+function firstTermAtOrAfter(terms, token) {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const middle = (low + high) >> 1;
+    if (terms[middle] < token) {
+      low = middle + 1;
+    } else {
+      high = middle;
+    }
+  }
+
+  return low;
+}
+
+// Sum the postings of every term starting with the token: "poison" also finds
+// "poisoning", so partly typed words match as the user types.
+function scoreToken(index, key, token) {
+  const scores = new Map();
+  for (let term = firstTermAtOrAfter(index.terms, token); index.terms[term]?.startsWith(token); term += 1) {
+    const postings = index[key][term];
+    for (let position = 0; position < postings.length; position += 2) {
+      const ordinal = postings[position];
+      scores.set(ordinal, (scores.get(ordinal) ?? 0) + postings[position + 1]);
+    }
+  }
+
+  return scores;
+}
+
+// Returns { risks, controls } Maps of record ID -> score for the records matching
+// every query word, or null when the query has no searchable words.
+export function searchIndex(index, relations, query) {
+  const tokens = tokenizeQuery(query);
+  if (!tokens.length) {
+    return null;
+  }
+
+  const matches = {};
+  for (const [key, idsField] of SEARCHED_RECORDS) {
+    let scores = null;
+    for (const token of tokens) {
+      const tokenScores = scoreToken(index, key, token);
+      scores = scores
+        ? new Map(
+            [...scores]
+              .filter(([ordinal]) => tokenScores.has(ordinal))
+              .map(([ordinal, score]) => [ordinal, score + tokenScores.get(ordinal)]),
+          )
+        : tokenScores;
+    }
+
+    matches[key] = new Map([...scores].map(([ordinal, score]) => [relations[idsField][ordinal], score]));
+  }
+
+  return matches;
+}
+
+function rankMatches(items, scores) {
+  return items.filter((item) => scores.has(item.id)).sort((left, right) => scores.get(right.id) - scores.get(left.id));
+}
+
+// Narrow a buildResultsModel() result to the search matches, best match first
+// within each category.
+export function applySearch(resultsModel, matches) {
+  const rankGroups = (groups, scores) =>
+    groups
+      .map((group) => ({ ...group, items: rankMatches(group.items, scores) }))
+      .filter((group) => group.items.length > 0);
+
+  return {
+    ...resultsModel,
+    risks: rankMatches(resultsModel.risks, matches.risks),
+    controls: rankMatches(resultsModel.controls, matches.controls),
+    riskGroups: rankGroups(resultsModel.riskGroups, matches.risks),
+    controlGroups: rankGroups(resultsModel.controlGroups, matches.controls),
+  };
+}
@@ -0,0 +1,49 @@
+// Record arrays that scripts/build_persona_site_data.py splits into per-category
+// shards, and the persona field that lists the IDs each one needs.
+const SHARDED_RECORDS = [
+  ["risks", "riskIds"],
+  ["controls", "controlIds"],
+];
+
+export function createBootstrapData(bootstrap) {
+  return {
+    ...bootstrap,
+    ...Object.fromEntries(SHARDED_RECORDS.map(([key]) => [key, []])),
+  };
+}
+
+export function findShardsForPersonas(manifest, personas, requestedPaths = new Set()) {
+  const shards = [];
+
+  for (const [key, idsField] of SHARDED_RECORDS) {
+    const wantedIds = new Set(personas.flatMap((persona) => persona[idsField]));
+
+    for (const shard of manifest.shards[key] ?? []) {
+      if (requestedPaths.has(shard.path) || !shard.ids.some((id) => wantedIds.has(id))) {
+        continue;
+      }
+
+      shards.push({ key, path: shard.path });
+    }
+  }
+
+  return shards;
+}
+
+// Summarize the shards the personas need, given the load state app.mjs records
+// per shard path ("pending", "loaded" or "failed"; unrequested shards have none).
+// Returns "failed" if any of them failed, "pending" while any has not arrived,
+// and "loaded" once all have.
+export function shardLoadStatus(manifest, personas, shardStates) {
+  const states = findShardsForPersonas(manifest, personas).map(({ path }) => shardStates.get(path));
+  if (states.includes("failed")) {
+    return "failed";
+  }
+
+  return states.every((shardState) => shardState === "loaded") ? "loaded" : "pending";
+}
+
+export function addShardRecords(data, key, records) {
+  const knownIds = new Set(data[key].map((record) => record.id));
+  data[key].push(...records.filter((record) => !knownIds.has(record.id)));
+}
@@ -1,7 +1,7 @@
 import test from "node:test";
 import assert from "node:assert/strict";
 
-import { buildResultsModel, dedupeInOrder, getSelectedPersonas } from "../assets/persona-logic.mjs";
+import { buildResultsModel, decodeMask, dedupeInOrder, getSelectedPersonas } from "../assets/persona-logic.mjs";
 
 function createFixture() {
   return {
@@ -127,6 +127,32 @@ function createFixture() {
   };
 }
 
+// Mirrors build_relation_index() in scripts/build_persona_site_data.py.
+function withRelations(fixture) {
+  const encode = (ordinals, size) => {
+    const mask = new Uint8Array(Math.ceil(size / 8));
+    ordinals.forEach((ordinal) => (mask[ordinal >> 3] |= 1 << (ordinal & 7)));
+    return btoa(String.fromCharCode(...mask));
+  };
+  const ids = (records) => records.map((record) => record.id);
+  const masks = (records, field, targetIds) =>
+    records.map((record) => encode(record[field].map((id) => targetIds.indexOf(id)), targetIds.length));
+  const [personaIds, riskIds, controlIds] = [ids(fixture.personas), ids(fixture.risks), ids(fixture.controls)];
+
+  return {
+    ...fixture,
+    relations: {
+      personaIds,
+      riskIds,
+      controlIds,
+      personaRiskMasks: masks(fixture.personas, "riskIds", riskIds),
+      personaControlMasks: masks(fixture.personas, "controlIds", controlIds),
+      riskPersonaMasks: masks(fixture.risks, "personaIds", personaIds),
+      controlPersonaMasks: masks(fixture.controls, "personaIds", personaIds),
+    },
+  };
+}
+
 test("getSelectedPersonas supports a single guided persona match", () => {
   const fixture = createFixture();
   const selection = getSelectedPersonas(fixture, { "provider-q1": "yes" });
@@ -264,3 +290,38 @@ test("buildResultsModel drops items whose category is not in categoryDefinitions
   );
   assert.equal(results.riskGroups.length, 0, "no known categories matched");
 });
+
+test("decodeMask reads bits least significant first", () => {
+  assert.deepEqual([...decodeMask("AQI=")], [0b00000001, 0b00000010]);
+  assert.deepEqual([...decodeMask("")], []);
+});
+
+test("buildResultsModel gives the same results from precomputed relations as from ID lists", () => {
+  const selections = [
+    [{ "provider-q1": "yes" }, ["personaModelServing"], {}],
+    [{}, ["personaModelServing", "personaGovernance"], {}],
+    [{ "provider-q1": "yes" }, ["personaGovernance"], { personaModelProvider: false }],
+    [{}, [], {}],
+  ];
+
+  for (const selection of selections) {
+    assert.deepEqual(
+      buildResultsModel(withRelations(createFixture()), ...selection),
+      buildResultsModel(createFixture(), ...selection),
+    );
+  }
+});
+
+test("buildResultsModel picks up records added after the first render", () => {
+  const fixture = withRelations(createFixture());
+  const risks = fixture.risks;
+  fixture.risks = [];
+
+  assert.deepEqual(buildResultsModel(fixture, {}, ["personaModelServing"]).risks, []);
+  fixture.risks.push(...risks);
+
+  assert.deepEqual(
+    buildResultsModel(fixture, {}, ["personaModelServing"]).risks.map((risk) => risk.id),
+    ["riskShared", "riskPromptInjection"],
+  );
+});
@@ -0,0 +1,76 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+
+import { applySearch, searchIndex, tokenizeQuery } from "../assets/search.mjs";
+
+// Shaped like build_search_index() output: sorted terms, and per record type one
+// flat [ordinal, score, ...] posting list per term.
+function createIndex() {
+  return {
+    terms: ["data", "injection", "poisoning", "prompt", "runtime", "training"],
+    risks: [[0, 9], [1, 8], [0, 8], [1, 9], [], [0, 1]],
+    controls: [[0, 2], [], [], [], [1, 8], [0, 8]],
+  };
+}
+
+const relations = {
+  riskIds: ["riskDataPoisoning", "riskPromptInjection"],
+  controlIds: ["controlTraining", "controlRuntime"],
+};
+
+test("tokenizeQuery lowercases, splits on punctuation and drops stopwords and repeats", () => {
+  assert.deepEqual(tokenizeQuery("Prompt-injection of the PROMPT"), ["prompt", "injection"]);
+  assert.deepEqual(tokenizeQuery("  the  "), []);
+});
+
+test("searchIndex returns null for a query without searchable words", () => {
+  assert.equal(searchIndex(createIndex(), relations, "of the"), null);
+});
+
+test("searchIndex matches terms by prefix and sums their scores", () => {
+  const matches = searchIndex(createIndex(), relations, "poison");
+
+  assert.deepEqual([...matches.risks], [["riskDataPoisoning", 8]]);
+  assert.deepEqual([...matches.controls], []);
+});
+
+test("searchIndex requires every query word to match", () => {
+  const matches = searchIndex(createIndex(), relations, "data train");
+
+  assert.deepEqual([...matches.risks], [["riskDataPoisoning", 10]]);
+  assert.deepEqual([...matches.controls], [["controlTraining", 10]]);
+});
+
+test("applySearch keeps matching results, best first, and drops emptied groups", () => {
+  const riskPromptInjection = { id: "riskPromptInjection", category: "risksRuntime" };
+  const riskDataPoisoning = { id: "riskDataPoisoning", category: "risksData" };
+  const controlTraining = { id: "controlTraining", category: "controlsData" };
+  const resultsModel = {
+    includedPersonas: [],
+    risks: [riskDataPoisoning, riskPromptInjection],
+    controls: [controlTraining],
+    riskGroups: [{ category: { id: "risksMixed" }, items: [riskDataPoisoning, riskPromptInjection] }],
+    controlGroups: [{ category: { id: "controlsData" }, items: [controlTraining] }],
+  };
+  const matches = {
+    risks: new Map([
+      ["riskDataPoisoning", 1],
+      ["riskPromptInjection", 9],
+    ]),
+    controls: new Map(),
+  };
+
+  const searched = applySearch(resultsModel, matches);
+
+  assert.deepEqual(
+    searched.risks.map((risk) => risk.id),
+    ["riskPromptInjection", "riskDataPoisoning"],
+  );
+  assert.deepEqual(
+    searched.riskGroups[0].items.map((risk) => risk.id),
+    ["riskPromptInjection", "riskDataPoisoning"],
+  );
+  assert.deepEqual(searched.controls, []);
+  assert.deepEqual(searched.controlGroups, []);
+  assert.equal(searched.includedPersonas, resultsModel.includedPersonas);
+});
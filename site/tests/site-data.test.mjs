@@ -0,0 +1,116 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+
+import {
+  addShardRecords,
+  createBootstrapData,
+  findShardsForPersonas,
+  shardLoadStatus,
+} from "../assets/site-data.mjs";
+
+function createManifest() {
+  return {
+    bootstrap: "persona-site-shards/bootstrap.aaaa.json",
+    shards: {
+      risks: [
+        { category: "risksData", path: "persona-site-shards/risks.risksData.1111.json", ids: ["riskDataPoisoning"] },
+        {
+          category: "risksRuntime",
+          path: "persona-site-shards/risks.risksRuntime.2222.json",
+          ids: ["riskPromptInjection", "riskShared"],
+        },
+      ],
+      controls: [
+        {
+          category: "controlsData",
+          path: "persona-site-shards/controls.controlsData.3333.json",
+          ids: ["controlTraining"],
+        },
+        {
+          category: "controlsApplication",
+          path: "persona-site-shards/controls.controlsApplication.4444.json",
+          ids: ["controlRuntime"],
+        },
+      ],
+    },
+  };
+}
+
+const servingPersona = { id: "personaModelServing", riskIds: ["riskPromptInjection"], controlIds: ["controlRuntime"] };
+const providerPersona = { id: "personaModelProvider", riskIds: ["riskDataPoisoning", "riskShared"], controlIds: [] };
+
+test("createBootstrapData starts every sharded record array empty", () => {
+  const bootstrap = { personas: [servingPersona], questions: [], riskCategories: [], controlCategories: [] };
+
+  const data = createBootstrapData(bootstrap);
+
+  assert.deepEqual(data.risks, []);
+  assert.deepEqual(data.controls, []);
+  assert.equal(data.personas, bootstrap.personas);
+});
+
+test("findShardsForPersonas returns only shards holding linked records, in manifest order", () => {
+  const shards = findShardsForPersonas(createManifest(), [servingPersona]);
+
+  assert.deepEqual(shards, [
+    { key: "risks", path: "persona-site-shards/risks.risksRuntime.2222.json" },
+    { key: "controls", path: "persona-site-shards/controls.controlsApplication.4444.json" },
+  ]);
+});
+
+test("findShardsForPersonas skips shards already requested", () => {
+  const requested = new Set(["persona-site-shards/risks.risksRuntime.2222.json"]);
+
+  const shards = findShardsForPersonas(createManifest(), [servingPersona, providerPersona], requested);
+
+  assert.deepEqual(
+    shards.map((shard) => shard.path),
+    ["persona-site-shards/risks.risksData.1111.json", "persona-site-shards/controls.controlsApplication.4444.json"],
+  );
+});
+
+test("findShardsForPersonas returns nothing without personas", () => {
+  assert.deepEqual(findShardsForPersonas(createManifest(), []), []);
+});
+
+test("shardLoadStatus is pending until every needed shard has loaded", () => {
+  const shardStates = new Map([["persona-site-shards/risks.risksRuntime.2222.json", "loaded"]]);
+
+  assert.equal(shardLoadStatus(createManifest(), [servingPersona], shardStates), "pending");
+
+  shardStates.set("persona-site-shards/controls.controlsApplication.4444.json", "pending");
+  assert.equal(shardLoadStatus(createManifest(), [servingPersona], shardStates), "pending");
+
+  shardStates.set("persona-site-shards/controls.controlsApplication.4444.json", "loaded");
+  assert.equal(shardLoadStatus(createManifest(), [servingPersona], shardStates), "loaded");
+});
+
+test("shardLoadStatus reports a failed needed shard even while others are pending", () => {
+  const shardStates = new Map([
+    ["persona-site-shards/risks.risksRuntime.2222.json", "pending"],
+    ["persona-site-shards/controls.controlsApplication.4444.json", "failed"],
+  ]);
+
+  assert.equal(shardLoadStatus(createManifest(), [servingPersona], shardStates), "failed");
+});
+
+test("shardLoadStatus ignores shards the personas do not need", () => {
+  const shardStates = new Map([
+    ["persona-site-shards/risks.risksRuntime.2222.json", "loaded"],
+    ["persona-site-shards/controls.controlsApplication.4444.json", "loaded"],
+    ["persona-site-shards/risks.risksData.1111.json", "failed"],
+  ]);
+
+  assert.equal(shardLoadStatus(createManifest(), [servingPersona], shardStates), "loaded");
+  assert.equal(shardLoadStatus(createManifest(), [], new Map()), "loaded");
+});
+
+test("addShardRecords appends records once", () => {
+  const data = createBootstrapData({ personas: [] });
+  const records = [{ id: "riskPromptInjection" }, { id: "riskShared" }];
+
+  addShardRecords(data, "risks", records);
+  addShardRecords(data, "risks", records);
+
+  assert.deepEqual(data.risks.map((risk) => risk.id), ["riskPromptInjection", "riskShared"]);
+});